@@ -1 +1 @@
-from .interfaces.EcosizerEngine import EcosizerEngine, get_oat_buckets, get_list_of_models, get_sizing_curve_plot, get_weather_stations, get_hpwh_output_capacity, get_annual_utility_comparison_graph
+from .interfaces.EcosizerEngine import EcosizerEngine, get_oat_buckets, get_list_of_models, get_sizing_curve_plot, get_weather_stations, get_hpwh_output_capacity, get_hpwh_capacity_table, get_annual_utility_comparison_graph
@@ -3,3 +3,6 @@ _RHO_CP: float = 8.353535
 
 # Unit conversion: 1 W = 3.412142 BTU/hr  (equivalently, 1 kW = 3.412142 kBTU/hr)
 _W_TO_KBTUH: float = 3.412142
+
+# Fractional tank heights (0 = bottom, 1 = top) recorded in every simulation step
+_TANK_NODE_FRACTS: tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
@@ -3,9 +3,16 @@ from __future__ import annotations
 import json
 import os
 import warnings
-from .Simulator import simulate_3day as _simulate_3day, simulate_annual as _simulate_annual
+from typing import TYPE_CHECKING
+from .Simulator import (
+    simulate_3day as _simulate_3day, simulate_annual as _simulate_annual,
+    simulate_iter as _simulate_iter, simulate_feasibility as _simulate_feasibility,
+)
 from ecoengine.objects.building.ClimateZone import ClimateZone as _ClimateZone
 
+if TYPE_CHECKING:
+    from ecoengine.objects.components.heating.CapacityTable import CapacityTable
+
 _MAPS_PATH    = os.path.join(os.path.dirname(__file__), "../data/preformanceMaps/maps.json")
 _WS_LOOKUP    = os.path.join(os.path.dirname(__file__), "../data/climate_data/WeatherStation_ClimateZone_Lookup.csv")
 
@@ -159,6 +166,7 @@ def get_hpwh_output_capacity(
     num_heaters: int = 1,
     return_as_kw: bool = True,
     defrost_derate: float = 0.0,
+    capacity_table: CapacityTable | None = None,
 ) -> float:
     """
     Return the output capacity of an HPWH model at the given operating conditions.
@@ -179,6 +187,10 @@ def get_hpwh_output_capacity(
         If True (default), return output in kW. If False, return in kBTU/hr.
     defrost_derate : float
         Fractional capacity reduction due to defrost [0.0–1.0]. Default 0.0.
+    capacity_table : CapacityTable | None
+        Prebuilt table (see ``get_hpwh_capacity_table``). When it holds the
+        model and the conditions are grid nodes, capacity is read from it
+        instead of loading the performance map.
 
     Returns
     -------
@@ -195,10 +207,17 @@ def get_hpwh_output_capacity(
     if not isinstance(num_heaters, int) or num_heaters < 1:
         raise ValueError("num_heaters must be an integer >= 1")
 
-    from ecoengine.objects.components.heating.PerformanceMap import PerformanceMap
-
-    perf_map = PerformanceMap.from_model_name(model)
-    capacity_kbtuh = perf_map.get_capacity_kbtuh(oat_f, outlet_water_temp_f, inlet_water_temp_f)
+    capacity_kbtuh = None
+    if capacity_table is not None and model in capacity_table:
+        try:
+            capacity_kbtuh, _, _ = capacity_table.lookup(model, oat_f, inlet_water_temp_f, outlet_water_temp_f)
+        except ValueError:
+            pass  # conditions off the table grid
+    if capacity_kbtuh is None:
+        from ecoengine.objects.components.heating.PerformanceMap import PerformanceMap
+
+        perf_map = PerformanceMap.from_model_name(model)
+        capacity_kbtuh = perf_map.get_capacity_kbtuh(oat_f, outlet_water_temp_f, inlet_water_temp_f)
     capacity_kbtuh *= num_heaters * (1.0 - defrost_derate)
 
     if return_as_kw:
@@ -206,6 +225,55 @@ def get_hpwh_output_capacity(
     return capacity_kbtuh
 
 
+def get_hpwh_capacity_table(
+    model_filter: dict | None = None,
+    oat_f: list[float] | None = None,
+    inlet_water_temp_f: list[float] | None = None,
+    outlet_water_temp_f: list[float] | None = None,
+    max_workers: int | None = None,
+) -> CapacityTable:
+    """
+    Build per-unit output capacity, power input and COP for many HPWH models
+    on one grid of operating conditions, in a single pass.
+
+    Save the result with ``CapacityTable.save`` and reload it with
+    ``CapacityTable.load`` to serve equipment-selection pages without
+    touching the performance maps; pass it to ``get_hpwh_output_capacity``
+    as ``capacity_table`` to answer on-grid queries from it.
+
+    Parameters
+    ----------
+    model_filter : dict | None
+        Keyword arguments for ``get_list_of_models()`` selecting the models
+        (e.g. ``{"multi_pass": True}``). None includes every model in the
+        performance-map database.
+    oat_f, inlet_water_temp_f, outlet_water_temp_f : list[float] | None
+        Strictly ascending grid axes [°F]. None uses the table defaults
+        (OAT -20–110, inlet 35–85, outlet 110–180, all in 5°F steps).
+    max_workers : int | None
+        Number of worker processes; None uses every CPU, 1 runs serially.
+
+    Returns
+    -------
+    CapacityTable
+    """
+    from ecoengine.objects.components.heating.CapacityTable import CapacityTable
+
+    model_names = None
+    if model_filter is not None:
+        model_names = [code for code, _ in get_list_of_models(**model_filter)]
+    axes = {
+        "oat_f":         oat_f,
+        "inlet_temp_f":  inlet_water_temp_f,
+        "outlet_temp_f": outlet_water_temp_f,
+    }
+    return CapacityTable.build(
+        model_names = model_names,
+        max_workers = max_workers,
+        **{k: v for k, v in axes.items() if v is not None},
+    )
+
+
 _MONTH_NAMES         = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']
 _ANNUAL_DURATION_MIN = 365 * 24 * 60
 
@@ -500,6 +568,7 @@ class EcosizerEngine:
         tm_off_temp_f: float | None = None,
         tm_off_time_hr: float = 0.5,
         tm_safety_factor: float = 1.75,
+        tm_exact_switching: bool = False,
         # Utility cost (optional)
         utility_cost_tracker=None,
         # Pre-sized system (optional — skip sizing when capacity and volume are known)
@@ -595,6 +664,10 @@ class EcosizerEngine:
             Max TM heater off-cycle duration [hr]. Default 0.5.
         tm_safety_factor : float
             TM capacity safety multiplier (> 1.0). Default 1.2.
+        tm_exact_switching : bool
+            For ``parallel_loop`` and ``swing_tank``: switch the TM heater at
+            the exact instants the TM tank crosses its trigger temperatures
+            within a timestep, instead of once per timestep. Default False.
         utility_cost_tracker : UtilityCostTracker, optional
             Attached to the building for annual cost estimates.
         storage_volume_storageT_gal : float, optional
@@ -657,6 +730,7 @@ class EcosizerEngine:
         self.tm_off_temp_f             = tm_off_temp_f if tm_off_temp_f is not None else supply_temp_f + 8.0
         self.tm_off_time_hr            = tm_off_time_hr
         self.tm_safety_factor          = tm_safety_factor
+        self.tm_exact_switching        = tm_exact_switching
         self.utility_cost_tracker           = utility_cost_tracker
         self.storage_volume_storageT_gal    = storage_volume_storageT_gal
         self.heating_capacity_kbtuh         = heating_capacity_kbtuh
@@ -844,6 +918,7 @@ class EcosizerEngine:
                     control_schedule           = control_schedule,
                     control_map                = control_map,
                     load_shift_fract_total_vol = ls_fract,
+                    tm_exact_switching         = self.tm_exact_switching,
                 )
 
         if self.schematic in ["swing_tank", "swingtank"]:
@@ -863,6 +938,7 @@ class EcosizerEngine:
                     control_schedule           = control_schedule,
                     control_map                = control_map,
                     load_shift_fract_total_vol = ls_fract,
+                    tm_exact_switching         = self.tm_exact_switching,
                 )
 
         if self.schematic in ["single_pass_rtp", "sprtp"]:
@@ -1052,6 +1128,7 @@ class EcosizerEngine:
                 num_tm_heaters=self.num_tm_heaters,
                 max_daily_run_hr=self.max_daily_run_hr,
                 defrost_factor=self.defrost_factor,
+                tm_exact_switching=self.tm_exact_switching,
             )
 
         if self.schematic in ["swing_tank", "swingtank"]:
@@ -1077,6 +1154,7 @@ class EcosizerEngine:
                 tm_safety_factor=self.tm_safety_factor,
                 max_daily_run_hr=self.max_daily_run_hr,
                 defrost_factor=self.defrost_factor,
+                tm_exact_switching=self.tm_exact_switching,
             )
             system.tm_storage_tank = MixedStorageTank(total_volume_gal=self.tm_storage_vol)
             system.tm_water_heater = self._build_tm_water_heater(tm_controls, force_electric_resistance = True)
@@ -1174,8 +1252,12 @@ class EcosizerEngine:
         Parameters
         ----------
         **sim_run_kwargs
-            Optional keyword arguments forwarded to SimulationRun.__init__(),
-            e.g. ``outlet_deficit_threshold_f=5.0``, ``outlet_deficit_max_min=10``.
+            Optional keyword arguments forwarded to ``Simulator.simulate_3day``:
+            ``num_days`` for a longer design run, ``steady_state=True`` to
+            stop once the days repeat and tile the repeating day, and
+            SimulationRun.__init__() arguments such as
+            ``outlet_deficit_threshold_f=5.0``, ``outlet_deficit_max_min=10``,
+            or ``channels="plot"`` to record only the outputs the plots use.
 
         Returns
         -------
@@ -1183,20 +1265,82 @@ class EcosizerEngine:
         """
         return _simulate_3day(self._dhw_system, self._building, **sim_run_kwargs)
 
-    def simulate_annual(self, **sim_run_kwargs):
+    def simulate_annual(self, timestep_min: int = 10, **sim_run_kwargs):
         """
-        Run a full annual simulation at 10-minute timesteps.
+        Run a full annual simulation, at 10-minute timesteps by default.
 
         Parameters
         ----------
+        timestep_min : int
+            Timestep in minutes; must divide an hour (e.g. 1 for peak-demand
+            analysis, 60 for quick estimates). Default 10.
         **sim_run_kwargs
-            Optional keyword arguments forwarded to SimulationRun.__init__().
+            Optional keyword arguments forwarded to SimulationRun.__init__(),
+            e.g. ``channels="cost"`` to record only heater power for energy
+            and utility cost (presets "full", "plot" and "cost").
 
         Returns
         -------
         SimulationRun
         """
-        return _simulate_annual(self._dhw_system, self._building, **sim_run_kwargs)
+        return _simulate_annual(self._dhw_system, self._building, timestep_min, **sim_run_kwargs)
+
+    def simulate_iter(
+        self,
+        duration: str | int = "annual",
+        chunk_steps: int = 1440,
+        timestep_min: int | None = None,
+        **sim_run_kwargs,
+    ):
+        """
+        Run a simulation and yield its timesteps in chunks instead of one SimulationRun.
+
+        Parameters
+        ----------
+        duration : str | int
+            '3day', 'annual' (default) or a duration in minutes, e.g.
+            ``2 * 525600`` for two years.
+        chunk_steps : int
+            Maximum number of timesteps per chunk. Default 1440.
+        timestep_min : int | None
+            Timestep in minutes overriding the duration's default; must
+            divide an hour.
+        **sim_run_kwargs
+            Optional keyword arguments forwarded to SimulationRun.__init__(),
+            e.g. ``channels="cost"``.
+
+        Returns
+        -------
+        Generator[np.ndarray, None, dict]
+            Structured arrays of timestep records; see ``Simulator.simulate_iter``.
+        """
+        return _simulate_iter(
+            self._dhw_system, self._building, duration,
+            chunk_steps=chunk_steps, timestep_min=timestep_min, **sim_run_kwargs,
+        )
+
+    def simulate_feasibility(self, duration: str | int = "3day", **kwargs) -> dict:
+        """
+        Check whether the system runs without outage or outlet deficit, without
+        recording the simulation.
+
+        Stops at the first failure, so failing configurations return quickly.
+
+        Parameters
+        ----------
+        duration : str | int
+            '3day' (default), 'annual' or a duration in minutes.
+        **kwargs
+            Optional keyword arguments forwarded to
+            ``Simulator.simulate_feasibility``, e.g. ``max_outage_min=30``.
+
+        Returns
+        -------
+        dict
+            'feasible', 'min_usable_volume_supplyT_gal', 'outage_min',
+            'deficit_min', 'first_failure_min' and 'num_steps_simulated'.
+        """
+        return _simulate_feasibility(self._dhw_system, self._building, duration, **kwargs)
 
     # ------------------------------------------------------------------
     # Output helpers
@@ -1277,7 +1421,12 @@ class EcosizerEngine:
         ImportError
             If ``plotly`` is not installed.
         """
-        sim_run = self.simulate_3day()
+        # Record only what the figure draws; the tank profile only with temperatures
+        channels = "plot" if include_temperatures else [
+            "dhw_demand_supplyT_gal", "usable_volume_supplyT_gal", "heater_output_kbtuh",
+            "inlet_water_temp_f", "heater_mode", "tm_tank_temp_f", "tm_heater_output_kbtuh",
+        ]
+        sim_run = self.simulate_3day(channels=channels)
         fig = sim_run.to_plotly(
             title                = title,
             filepath             = filepath,
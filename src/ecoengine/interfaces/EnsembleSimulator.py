@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ecoengine.constants.constants import _RHO_CP, _TANK_NODE_FRACTS
+from ecoengine.objects.building.Building import Building
+from ecoengine.objects.components.storage.StratifiedTank import StratifiedTank
+from ecoengine.objects.dhwsystems.DHWSystem import DHWSystem
+from ecoengine.objects.dhwsystems.rtp_systems.SinglePassRTPSystem import SinglePassRTPSystem
+from ecoengine.objects.simulation.SimulationRun import SimulationRun
+from .Simulator import _get_duration_and_timestep, _initialize_tanks
+
+if TYPE_CHECKING:
+    from ecoengine.objects.components.heating.WaterHeater import WaterHeater
+
+# simulate_step_into implementations the ensemble reproduces
+_ENSEMBLE_STEPS = (DHWSystem.simulate_step_into, SinglePassRTPSystem.simulate_step_into)
+
+
+def simulate_ensemble(
+    dhw_systems: list[DHWSystem],
+    building: Building,
+    duration: str | int = "3day",
+    timestep_min: int | None = None,
+    **sim_run_kwargs,
+) -> list[SimulationRun]:
+    """
+    Simulate many sized DHWSystems in the same Building in lockstep.
+
+    Meant for variants of one design that differ in storage volume, heating
+    capacity or aquastat settings. The building's demand, OAT and inlet
+    series are looked up once and shared. The tank states and heater states
+    of all systems are held as numpy arrays and advanced together each
+    timestep, with the Controls logic vectorized across every heater.
+
+    Each system's SimulationRun holds the same per-timestep records as
+    ``simulate(dhw_system, building, duration)``. Each system also ends in
+    the same tank and heater state. Draws that dip into a tank's transition
+    zone, which are rare, are solved one tank at a time by
+    ``StratifiedTank.draw``.
+
+    Parameters
+    ----------
+    dhw_systems : list[DHWSystem]
+        Sized systems with a StratifiedTank. Each must be a DHWSystem or a
+        SinglePassRTPSystem, or a subclass that keeps its ``simulate_step_into``.
+    building : Building
+        The building shared by every system.
+    duration : str | int
+        '3day' for a 3-day design-day simulation (1-minute steps),
+        'annual' for a full-year simulation (10-minute steps), or a custom
+        duration in minutes, as for ``simulate``.
+    timestep_min : int | None
+        Timestep in minutes overriding the duration's default, as for
+        ``simulate``.
+    **sim_run_kwargs
+        Forwarded to each SimulationRun.__init__().
+
+    Returns
+    -------
+    list[SimulationRun]
+        One run per system, in the order of ``dhw_systems``.
+
+    Raises
+    ------
+    ValueError
+        If a system's timestep is not simulated the DHWSystem or
+        SinglePassRTPSystem way, if its storage is not a StratifiedTank, if a
+        heater has no Controls for some hour, or if duration or timestep_min
+        is invalid.
+    """
+    for system in dhw_systems:
+        if not any(system._steps_with(step) for step in _ENSEMBLE_STEPS):
+            raise ValueError(f"{type(system).__name__} cannot be simulated in an ensemble.")
+        if not isinstance(system.storage_tank, StratifiedTank):
+            raise ValueError("Every system in an ensemble needs a StratifiedTank.")
+    duration_min, timestep_min = _get_duration_and_timestep(duration, timestep_min)
+    sim_runs = [SimulationRun(duration_min, timestep_min, **sim_run_kwargs) for _ in dhw_systems]
+    if not dhw_systems:
+        return sim_runs
+    num_steps = duration_min // timestep_min
+    n_sys     = len(dhw_systems)
+    tanks     = [system.storage_tank for system in dhw_systems]
+    heaters   = [wh for system in dhw_systems for wh in system.water_heaters]
+    owner     = np.array([n for n, system in enumerate(dhw_systems) for _ in system.water_heaters], dtype=np.intp)
+    for system in dhw_systems:
+        _initialize_tanks(system, building)
+
+    # Building inputs change only on the hour: look them up once per hour
+    n_hours     = math.ceil(num_steps * timestep_min / 60)
+    first_steps = [math.ceil(k * 60 / timestep_min) for k in range(n_hours)]
+    oat_f       = [building.get_oat_f(i, timestep_min) for i in first_steps]
+    inlet_f     = [building.get_inlet_water_temp_f(i, timestep_min) for i in first_steps]
+    use_avg     = np.array([any(wh.is_load_shifting() for wh in s.water_heaters) for s in dhw_systems])
+    demand_gal  = np.array([
+        [building.get_dhw_load_supplyT_gal(i, timestep_min, use_avg=avg) for i in first_steps]
+        for avg in (False, True)
+    ])
+    demand_gal  = demand_gal[use_avg.astype(np.intp)]          # (systems, hours)
+
+    # Per-system constants and per-hour-of-day settings
+    vol     = np.array([tank.total_volume_gal for tank in tanks])
+    slope   = np.array([tank.strat_slope for tank in tanks])
+    supply  = np.array([system.supply_temp_f for system in dhw_systems])
+    outlet_by_hour = np.array([[system._get_outlet_temp_f(h) for h in range(24)] for system in dhw_systems])
+    is_rtp  = np.array([isinstance(system, SinglePassRTPSystem) for system in dhw_systems])
+    flow    = np.array([system.return_flow_gpm if rtp else 0.0 for system, rtp in zip(dhw_systems, is_rtp)])
+    ret_f   = np.array([system.return_temp_f if rtp else 0.0 for system, rtp in zip(dhw_systems, is_rtp)])
+    modes   = [
+        [s.water_heaters[0].control_schedule[h] if s.water_heaters and s.water_heaters[0].control_schedule
+         else "normal" for h in range(24)]
+        for s in dhw_systems
+    ]
+
+    # Tank state: the StratifiedTank.snapshot() fields, one array each
+    delta, inter, tank_inlet, tank_outlet = (np.array(field, dtype=float) for field in zip(*(t.snapshot() for t in tanks)))
+
+    # Heater Controls by hour of day and output/power by hour of the run
+    on_fract, on_trig, off_fract, off_trig = _heater_controls(heaters)
+    on_pct, off_pct     = on_fract * 100.0, off_fract * 100.0
+    cap_kbtuh, power_kw = _heater_output_by_hour(heaters, oat_f, inlet_f, n_hours)
+    active   = np.array([wh.is_active() for wh in heaters], dtype=bool)
+    slope_wh, inter_wh  = slope[owner], inter[owner]
+    fract100 = np.array(_TANK_NODE_FRACTS) * 100.0
+    floor          = ((supply - inter) / slope - 100.0) * vol / 100.0
+    x_supply_shift = (supply - inter) / slope      # x_supply_pct + shift_pct
+    no_power       = np.full(n_sys, np.nan)
+
+    # Per-step records
+    rec_usable = np.empty((num_steps, n_sys))
+    rec_kbtuh  = np.empty((num_steps, n_sys))
+    rec_kw     = np.empty((num_steps, n_sys))
+    rec_temps  = np.empty((num_steps, n_sys, len(_TANK_NODE_FRACTS)))
+    num_recorded  = np.full(n_sys, num_steps)
+    outage_min    = np.zeros(n_sys, dtype=int)
+    deficit_min   = np.zeros(n_sys, dtype=int)
+    deficit_limit = supply - np.array([run.outlet_deficit_threshold_f for run in sim_runs])
+    deficit_max   = np.array([run.outlet_deficit_max_min for run in sim_runs])
+    running       = np.ones(n_sys, dtype=bool)
+    final_state: dict[int, tuple] = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k in range(n_hours):
+            # Everything but the tank and heater states is fixed for the hour
+            hour       = k % 24
+            outlet     = outlet_by_hour[:, hour]
+            outlet_col = outlet[:, None]
+            cold       = inlet_f[k]
+            demand     = demand_gal[:, k]
+            delta_max  = (outlet - inter) / slope * vol / 100.0
+            drawing    = (outlet > cold) & (demand > 0.0)
+            phys_gal   = demand * (supply - cold) / (outlet - cold)
+            x_draw_pct = np.maximum(0.0, 100.0 - np.minimum(phys_gal, vol) / vol * 100.0)
+            x_hot_shift = (outlet - inter) / slope     # x_hot_pct + shift_pct
+            recirc_gal = np.where(
+                is_rtp & (outlet > cold),
+                flow * timestep_min * _RHO_CP * (supply - ret_f) / 1000.0 * 1000.0 / (_RHO_CP * (outlet - cold)),
+                0.0,
+            )
+            cap_k, power_k = cap_kbtuh[:, k], power_kw[:, k]
+            has_power      = ~np.isnan(power_k)
+            on_pct_h, on_trig_h   = on_pct[:, hour], on_trig[:, hour]
+            off_pct_h, off_trig_h = off_pct[:, hour], off_trig[:, hour]
+
+            for i in range(first_steps[k], first_steps[k + 1] if k + 1 < n_hours else num_steps):
+                # Controls: each heater reads its sensors before heating
+                shift_pct = (delta / vol * 100.0)[owner]
+                lo, hi    = tank_inlet[owner], tank_outlet[owner]
+                t_on   = np.maximum(lo, np.minimum(hi, slope_wh * (on_pct_h + shift_pct) + inter_wh))
+                t_off  = np.maximum(lo, np.minimum(hi, slope_wh * (off_pct_h + shift_pct) + inter_wh))
+                active = np.where(active, ~(t_off >= off_trig_h), t_on < on_trig_h)
+
+                total_kbtuh = np.bincount(owner, np.where(active, cap_k, 0.0), minlength=n_sys)
+                powered     = active & has_power
+                total_kw    = no_power
+                if powered.any():
+                    total_kw = np.bincount(owner, np.where(powered, power_k, 0.0), minlength=n_sys)
+                    total_kw[np.bincount(owner, powered, minlength=n_sys) == 0] = np.nan
+
+                # StratifiedTank.heat()
+                heating  = (total_kbtuh > 0.0) & (outlet > tank_inlet)
+                v_heated = total_kbtuh * timestep_min / 60.0 * 1000.0 / (_RHO_CP * (outlet - tank_inlet))
+                delta    = np.where(heating, np.minimum(delta + v_heated, delta_max), delta)
+                tank_inlet, tank_outlet = np.full(n_sys, cold), outlet
+
+                # StratifiedTank.draw(). A draw no deeper than the hot zone
+                # takes the fast path; only the rest need the average draw
+                # temperature, and the rare transition-zone draws the tank's
+                # own solver
+                x_hot_pct = np.maximum(0.0, np.minimum(100.0, x_hot_shift - delta / vol * 100.0))
+                hot_draw  = drawing & (x_hot_pct <= x_draw_pct)
+                check     = drawing & ~hot_draw
+                if check.any():
+                    idx = np.flatnonzero(check)
+                    avg_temp = _average_draw_temp_f(phys_gal[idx], delta[idx], inter[idx], slope[idx], vol[idx], cold, outlet[idx])
+                    hot_draw[idx] = avg_temp >= outlet[idx] - 1e-6
+                delta = np.where(hot_draw, np.maximum(delta - phys_gal, floor), delta)
+                slow  = drawing & ~hot_draw
+                if slow.any():
+                    for n in np.flatnonzero(slow):
+                        tanks[n].restore((float(delta[n]), float(inter[n]), cold, float(outlet[n])))
+                        tanks[n].draw(float(demand[n]), cold, float(supply[n]), float(outlet[n]))
+                        delta[n] = tanks[n].snapshot()[0]
+
+                # SinglePassRTPSystem: StratifiedTank.add_recirc_return()
+                delta = delta - recirc_gal
+
+                # Records
+                shift_pct  = delta / vol * 100.0
+                usable_gal = (100.0 - np.maximum(0.0, np.minimum(100.0, x_supply_shift - shift_pct))) / 100.0 * vol
+                temps_f    = np.maximum(cold, np.minimum(outlet_col,
+                    slope[:, None] * (fract100 + shift_pct[:, None]) + inter[:, None]))
+                rec_usable[i] = usable_gal
+                rec_kbtuh[i]  = total_kbtuh
+                rec_kw[i]     = total_kw
+                rec_temps[i]  = temps_f
+
+                outage_min += timestep_min * (running & (usable_gal <= 0.0))
+                deficit_min = np.where(temps_f[:, -1] < deficit_limit, deficit_min + timestep_min, 0)
+                stop = running & (deficit_min > deficit_max)
+                if stop.any():
+                    for n in np.flatnonzero(stop):
+                        # SimulationRun.check_outlet_deficit halts this system's run
+                        running[n]      = False
+                        num_recorded[n] = i + 1
+                        final_state[n]  = ((float(delta[n]), float(inter[n]), cold, float(outlet[n])),
+                                           active[owner == n].copy())
+                    if not running.any():
+                        break
+            if not running.any():
+                break
+
+    for n, (system, sim_run) in enumerate(zip(dhw_systems, sim_runs)):
+        tank_state, heater_active = final_state.get(
+            n, ((float(delta[n]), float(inter[n]), float(tank_inlet[n]), float(tank_outlet[n])), active[owner == n])
+        )
+        system.storage_tank.restore(tank_state)
+        for wh, on in zip(system.water_heaters, heater_active):
+            if on:
+                wh.turn_on()
+            else:
+                wh.turn_off()
+
+        steps = num_recorded[n]
+        hours = np.arange(steps) * timestep_min // 60
+        sim_run.supply_temp_f = system.supply_temp_f
+        sim_run.record_timesteps(
+            num_steps                 = int(steps),
+            dhw_demand_supplyT_gal    = demand_gal[n, hours],
+            usable_volume_supplyT_gal = rec_usable[:steps, n],
+            heater_output_kbtuh       = rec_kbtuh[:steps, n],
+            heater_power_in_kw        = rec_kw[:steps, n],
+            oat_f                     = [oat_f[k] for k in hours],
+            inlet_water_temp_f        = [inlet_f[k] for k in hours],
+            tank_temps_f              = rec_temps[:steps, n].T,
+            mode                      = [modes[n][k % 24] for k in hours],
+        )
+        sim_run.record_outage(int(outage_min[n]))
+        sim_run.stopped_early = not bool(running[n])
+    return sim_runs
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _heater_controls(heaters: list[WaterHeater]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return each heater's ON sensor fraction, ON trigger, OFF sensor fraction
+    and OFF trigger by hour of day, as ``(heaters, 24)`` arrays.
+
+    Raises
+    ------
+    ValueError
+        If a heater has no Controls for some hour (as ``update_state`` would).
+    """
+    settings = np.empty((4, len(heaters), 24))
+    for j, wh in enumerate(heaters):
+        for hour in range(24):
+            controls = wh.get_controls_for_hour(hour)
+            if controls is None:
+                raise ValueError(f"No Controls configured for hour {hour}.")
+            settings[:, j, hour] = (
+                controls.on_sensor_fract, controls.on_trigger_t_f,
+                controls.off_sensor_fract, controls.off_trigger_t_f,
+            )
+    return settings[0], settings[1], settings[2], settings[3]
+
+
+def _heater_output_by_hour(
+    heaters: list[WaterHeater],
+    oat_f: list[float],
+    inlet_f: list[float],
+    n_hours: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return each heater's running output [kBTU/hr] and power [kW, NaN when
+    unavailable] for every hour of the run, as ``(heaters, hours)`` arrays.
+
+    Each distinct ``(oat, outlet, inlet)`` condition is looked up once per
+    heater, as in ``WaterHeater.precompute_output_and_power``.
+    """
+    cap_kbtuh = np.empty((len(heaters), n_hours))
+    power_kw  = np.empty((len(heaters), n_hours))
+    for j, wh in enumerate(heaters):
+        outlet_by_hour = [wh.get_outlet_temp_f(hour) for hour in range(24)]
+        lookups: dict[tuple, tuple[float, float | None]] = {}
+        for k in range(n_hours):
+            key   = (oat_f[k], outlet_by_hour[k % 24], inlet_f[k])
+            entry = lookups.get(key)
+            if entry is None:
+                entry = lookups[key] = wh.get_running_output_and_power(*key)
+            cap_kbtuh[j, k] = entry[0]
+            power_kw[j, k]  = np.nan if entry[1] is None else entry[1]
+    return cap_kbtuh, power_kw
+
+
+def _average_draw_temp_f(
+    draw_gal: np.ndarray,
+    delta_gal: np.ndarray,
+    strat_inter: np.ndarray,
+    strat_slope: np.ndarray,
+    total_volume_gal: np.ndarray,
+    inlet_temp_f: float,
+    outlet_temp_f: np.ndarray,
+) -> np.ndarray:
+    """Vectorized ``StratifiedTank.get_average_draw_temp_f`` for a set of tanks."""
+    draw_gal   = np.minimum(draw_gal, total_volume_gal)
+    shift_pct  = delta_gal / total_volume_gal * 100.0
+    x_draw_pct = np.maximum(0.0, 100.0 - draw_gal / total_volume_gal * 100.0)
+    x_cold_pct = np.maximum(0.0, np.minimum(100.0, (inlet_temp_f - strat_inter) / strat_slope - shift_pct))
+    x_hot_pct  = np.maximum(0.0, np.minimum(100.0, (outlet_temp_f - strat_inter) / strat_slope - shift_pct))
+
+    lo, hi = np.maximum(x_draw_pct, 0.0), np.minimum(100.0, x_cold_pct)
+    cold_integral = inlet_temp_f * np.maximum(0.0, hi - lo)
+
+    lo, hi = np.maximum(x_draw_pct, x_cold_pct), np.minimum(100.0, x_hot_pct)
+    trans_integral = np.where(
+        hi > lo,
+        strat_slope / 2.0 * ((hi + shift_pct) ** 2 - (lo + shift_pct) ** 2) + strat_inter * (hi - lo),
+        0.0,
+    )
+
+    lo = np.maximum(x_draw_pct, x_hot_pct)
+    hot_integral = outlet_temp_f * np.maximum(0.0, 100.0 - lo)
+
+    total_width = 100.0 - x_draw_pct
+    avg_temp    = (cold_integral + trans_integral + hot_integral) / total_width
+    return np.where((draw_gal <= 0.0) | (total_width <= 0.0), outlet_temp_f, avg_temp)
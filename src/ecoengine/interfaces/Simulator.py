@@ -1,23 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator
+
+import numpy as np
+
+from ecoengine.constants.constants import _RHO_CP
 from ecoengine.objects.simulation.SimulationRun import SimulationRun
+from ecoengine.objects.simulation.StepResult import StepResult
 from ecoengine.objects.building.Building import Building
 from ecoengine.objects.dhwsystems.DHWSystem import DHWSystem
 
+if TYPE_CHECKING:
+    from ecoengine.objects.components.storage.StorageTank import StorageTank
+    from ecoengine.objects.simulation.SimulationSink import SimulationSink
+
 THREE_DAY_DURATION_MIN = 3 * 24 * 60    # 4320 minutes
 ANNUAL_DURATION_MIN    = 365 * 24 * 60  # 525600 minutes
 THREE_DAY_TIMESTEP_MIN = 1
 ANNUAL_TIMESTEP_MIN    = 10
+DAY_DURATION_MIN       = 24 * 60        # 1440 minutes
+
+# "step" runs every timestep; "event" jumps between control and hour events
+_ENGINES = ("step", "event")
+# Named durations: (duration_min, default timestep_min)
+_DURATIONS = {
+    "3day":   (THREE_DAY_DURATION_MIN, THREE_DAY_TIMESTEP_MIN),
+    "annual": (ANNUAL_DURATION_MIN, ANNUAL_TIMESTEP_MIN),
+}
+# Tank heights the steady-state check averages the temperature profile over
+_ENERGY_FRACTS = tuple((i + 0.5) / 1000 for i in range(1000))
 
 
-def simulate(dhw_system: DHWSystem, building: Building, duration: str = "3day", **sim_run_kwargs) -> SimulationRun:
+def simulate(
+    dhw_system: DHWSystem,
+    building: Building,
+    duration: str | int = "3day",
+    engine: str = "step",
+    timestep_min: int | None = None,
+    **sim_run_kwargs,
+) -> SimulationRun:
     """
     Run a time-step simulation of a sized DHWSystem in a Building.
 
     At every timestep the simulator:
-      1. Delegates to DHWSystem.simulate_step() which queries the Building,
-         updates heater states, applies heating, and draws from the tank.
-      2. Records the returned per-step metrics into the SimulationRun.
+      1. Delegates to DHWSystem.simulate_step_into() which queries the Building,
+         updates heater states, applies heating, draws from the tank, and
+         writes its metrics into a StepResult reused for every step.
+      2. Records the StepResult into the SimulationRun.
       3. Checks for a DHW outage (usable tank volume <= 0).
 
+    The building's per-step inputs (``Building.precompute_timeseries``) and
+    heater capacity and power (``DHWSystem.precompute_heater_timeline``) are
+    computed for the whole run before the loop, so steps only index them.
+
+    With ``engine="event"`` the simulator instead asks the system to jump
+    over every span of timesteps in which only the tank charge changes
+    (``DHWSystem.simulate_until_event``) and steps one timestep at a time
+    only at events: a heater turning on or off, the hour changing, or an
+    outage. The SimulationRun holds exactly the same per-timestep records
+    as the stepped run. Systems that cannot jump are stepped throughout.
+
+    ``simulate_iter`` runs the same loop but yields the timesteps in chunks
+    instead of keeping the whole run in one SimulationRun.
+
+    ``channels`` (forwarded to SimulationRun) selects the recorded outputs.
+    Systems then report only the tank temperatures the run records: the
+    full node profile with ``tank_temps_f``, otherwise just the top node
+    for the outlet-deficit check.
+
     The storage tank is initialized before the loop at a charge level
     corresponding to the normal Controls on-aquastat fraction. If no Controls
     are present, the tank starts fully charged.
@@ -29,9 +79,23 @@ def simulate(dhw_system: DHWSystem, building: Building, duration: str = "3day",
         storage_tank must not be None).
     building : Building
         The building to simulate the system in.
-    duration : str
-        '3day' for a 3-day design-day simulation (1-minute steps) or
-        'annual' for a full-year simulation (10-minute steps).
+    duration : str | int
+        '3day' for a 3-day design-day simulation (1-minute steps),
+        'annual' for a full-year simulation (10-minute steps), or a custom
+        duration in minutes (10-minute steps by default), e.g.
+        ``3 * ANNUAL_DURATION_MIN`` for three years. Runs longer than a
+        year repeat the building's annual weather and load data.
+    engine : str
+        'step' (default) to simulate every timestep, or 'event' to jump
+        between events where the system supports it.
+    timestep_min : int | None
+        Timestep in minutes, overriding the duration's default. Must divide
+        an hour (1, 5, 10, 15, 60, ...) and the duration. 1-minute annual
+        runs hold 525,600 steps; see ``simulate_to_sinks`` and
+        ``AggregationPolicy`` to keep only the parts of such runs needed.
+    **sim_run_kwargs
+        Forwarded to SimulationRun.__init__(), e.g. ``channels="cost"`` to
+        record heater power only (presets "full", "plot" and "cost").
 
     Returns
     -------
@@ -41,115 +105,586 @@ def simulate(dhw_system: DHWSystem, building: Building, duration: str = "3day",
     Raises
     ------
     ValueError
-        If duration is not '3day' or 'annual'.
-    """
-    if duration == "3day":
-        duration_min  = THREE_DAY_DURATION_MIN
-        timestep_min  = THREE_DAY_TIMESTEP_MIN
-    elif duration == "annual":
-        duration_min  = ANNUAL_DURATION_MIN
-        timestep_min  = ANNUAL_TIMESTEP_MIN
-    else:
-        raise ValueError(f"duration must be '3day' or 'annual', got {duration!r}")
-
+        If duration is not '3day', 'annual' or a positive number of minutes,
+        timestep_min does not divide an hour and the duration, or engine is
+        not 'step' or 'event'.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"engine must be one of {_ENGINES}, got {engine!r}")
+    duration_min, timestep_min = _get_duration_and_timestep(duration, timestep_min)
     sim_run = SimulationRun(duration_min, timestep_min, **sim_run_kwargs)
+    for _ in _simulate_chunks(dhw_system, building, sim_run, sim_run.num_steps, sim_run.num_steps, engine):
+        pass
+    return sim_run
 
-    from ecoengine.objects.dhwsystems.recirc_systems.SwingSystem import SwingSystem
-    sim_run.show_tm_panel = isinstance(dhw_system, SwingSystem)
 
-    # Initialize storage tanks
-    inlet_temp_f    = building.get_design_inlet_water_temp_f() or 50.0
-    percent_useable = _initial_percent_useable(dhw_system)
-    if dhw_system.storage_tank is not None:
-        dhw_system.storage_tank.initialize(
-            storage_temp_f  = dhw_system.storage_temp_f,
-            cold_temp_f     = inlet_temp_f,
-            percent_useable = percent_useable, # TODO I don't think this is right
-        )
-    # Initialize TM tank if present (ParallelLoopSystem, SwingSystem)
-    tm_tank = getattr(dhw_system, "tm_storage_tank", None)
-    if tm_tank is not None:
-        tm_off_temp_f = getattr(dhw_system, "tm_off_temp_f", dhw_system.storage_temp_f)
-        tm_tank.initialize(
-            storage_temp_f  = tm_off_temp_f,
-            cold_temp_f     = inlet_temp_f,
-            percent_useable = 1.0,
-        )
+def simulate_iter(
+    dhw_system: DHWSystem,
+    building: Building,
+    duration: str | int = "3day",
+    engine: str = "step",
+    chunk_steps: int = 1440,
+    timestep_min: int | None = None,
+    **sim_run_kwargs,
+) -> Generator[np.ndarray, None, dict]:
+    """
+    Run the simulation of ``simulate`` and yield its timesteps in chunks.
 
-    sim_run.supply_temp_f = dhw_system.supply_temp_f
+    Each chunk is a numpy structured array of up to ``chunk_steps``
+    timesteps in the layout of ``SimulationRun.to_records``. Only one chunk
+    is held in memory at a time, so long runs can be written out or reduced
+    by sinks (``SimulationSink``) while the simulation continues. Chunks
+    stop early with the outlet-deficit stop condition, as ``simulate`` does.
+
+    The generator returns (as ``StopIteration.value``) a dict with
+    'successful', 'total_outage_min', 'stopped_early' and
+    'num_steps_recorded'; ``simulate_to_sinks`` collects it. Close the
+    generator when abandoning it early so the precomputed building and
+    heater timeseries are released.
+
+    Parameters
+    ----------
+    dhw_system : DHWSystem
+        A sized DHWSystem instance.
+    building : Building
+        The building to simulate the system in.
+    duration : str | int
+        '3day', 'annual' or minutes, as for ``simulate``.
+    engine : str
+        'step' or 'event', as for ``simulate``.
+    chunk_steps : int
+        Maximum number of timesteps per chunk. Default 1440 (one day at
+        1-minute steps).
+    timestep_min : int | None
+        Timestep in minutes, as for ``simulate``.
+    **sim_run_kwargs
+        Forwarded to SimulationRun.__init__(), e.g. ``channels="cost"``.
+
+    Returns
+    -------
+    Generator[np.ndarray, None, dict]
+
+    Raises
+    ------
+    ValueError
+        If duration, timestep_min or engine is invalid or ``chunk_steps`` < 1.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"engine must be one of {_ENGINES}, got {engine!r}")
+    if chunk_steps < 1:
+        raise ValueError(f"chunk_steps must be at least 1, got {chunk_steps}")
+    duration_min, timestep_min = _get_duration_and_timestep(duration, timestep_min)
     num_steps = duration_min // timestep_min
-    for i in range(num_steps):
-        step = dhw_system.simulate_step(
-            building          = building,
-            timestep_interval = i,
-            interval_min      = timestep_min,
-        )
-        sim_run.record_timestep(
-            dhw_demand_supplyT_gal    = step["demand_supplyT_gal"],
-            usable_volume_supplyT_gal = step["usable_volume_supplyT_gal"],
-            heater_output_kbtuh       = step["heater_output_kbtuh"],
-            heater_power_in_kw        = step["heater_power_in_kw"],
-            oat_f                     = step["oat_f"],
-            inlet_water_temp_f        = step["inlet_water_temp_f"],
-            tank_temps_f              = step["tank_temps_f"],
-            mode                      = step.get("mode", "normal"),
-            tm_tank_temp_f            = step.get("tm_tank_temp_f"),
-            tm_heater_output_kbtuh    = step.get("tm_heater_output_kbtuh"),
-            tm_heater_input_kw    = step.get("tm_heater_input_kw"),
-        )
+    # The chunk buffer is a SimulationRun sized for one chunk and cleared after each
+    chunk_run = SimulationRun(min(chunk_steps, num_steps) * timestep_min, timestep_min, **sim_run_kwargs)
+    return _iter_records(dhw_system, building, chunk_run, num_steps, chunk_steps, engine)
 
-        if step["usable_volume_supplyT_gal"] <= 0.0:
-            sim_run.record_outage(timestep_min)
 
-        # Check outlet-deficit stop condition. For systems where the TM/swing
-        # tank is the actual delivery point (e.g. SwingSystem), use its
-        # temperature; for all others fall back to the primary tank top.
-        delivery_temp_f = step.get("delivery_temp_f", step["tank_temps_f"][-1])
-        if sim_run.check_outlet_deficit(delivery_temp_f, dhw_system.supply_temp_f):
-            break
-    return sim_run
+def simulate_to_sinks(
+    dhw_system: DHWSystem,
+    building: Building,
+    sinks: Iterable[SimulationSink],
+    duration: str | int = "3day",
+    engine: str = "step",
+    chunk_steps: int = 1440,
+    timestep_min: int | None = None,
+    **sim_run_kwargs,
+) -> dict:
+    """
+    Run ``simulate_iter`` and feed every chunk to each of ``sinks``.
+
+    Each sink is opened with the run's timestep before the first chunk and
+    closed after the last one, also when the simulation raises.
+
+    Parameters
+    ----------
+    dhw_system : DHWSystem
+    building : Building
+    sinks : Iterable[SimulationSink]
+        E.g. ``[CSVSink("run.csv"), RunningTotalsSink()]``.
+    duration, engine, chunk_steps, timestep_min, **sim_run_kwargs
+        As for ``simulate_iter``.
 
+    Returns
+    -------
+    dict
+        The run summary returned by ``simulate_iter``.
+    """
+    sinks  = list(sinks)
+    chunks = simulate_iter(dhw_system, building, duration, engine, chunk_steps, timestep_min, **sim_run_kwargs)
+    _, timestep_min = _get_duration_and_timestep(duration, timestep_min)
+    for sink in sinks:
+        sink.open(timestep_min)
+    try:
+        while True:
+            try:
+                chunk = next(chunks)
+            except StopIteration as stop:
+                return stop.value
+            for sink in sinks:
+                sink.write(chunk)
+    finally:
+        chunks.close()
+        for sink in sinks:
+            sink.close()
 
-def simulate_3day(dhw_system: DHWSystem, building: Building, **sim_run_kwargs) -> SimulationRun:
+
+def simulate_3day(
+    dhw_system: DHWSystem,
+    building: Building,
+    num_days: int = 3,
+    steady_state: bool = False,
+    steady_state_tol: float | None = None,
+    engine: str = "step",
+    **sim_run_kwargs,
+) -> SimulationRun:
     """
-    Convenience wrapper: run a 3-day simulation at 1-minute timesteps.
+    Convenience wrapper: run a design-day simulation at 1-minute timesteps,
+    3 days long by default.
+
+    With ``steady_state=True`` the run stops simulating once the system
+    repeats itself from day to day, and tiles the day just simulated over
+    the remaining days, with its outage minutes. ``SimulationRun.steady_state_day``
+    records the day tiled. A day repeats when, at midnight, every heater is
+    in the same on/off state as at the previous midnight, the
+    outlet-deficit counter is the same, and the heat stored in each tank
+    differs by at most ``steady_state_tol``. This needs inputs that repeat
+    every day (a 24-hour load shape and design conditions, not hourly
+    weather data). Long design runs (``num_days``) then cost about as much
+    as the days before steady state; every day is still simulated when the
+    inputs do not repeat.
+
+    The midnight state rarely repeats exactly: trigger crossings fall
+    between timesteps, so each day's heating overshoots by a slightly
+    different amount and the state wanders within one timestep of heating
+    of the limit cycle. The default tolerance is therefore the heat the
+    heaters add in one timestep at full output, i.e. one timestep's shift
+    of the thermocline. The tiled days match the full simulation to about
+    that much heat per day: heater cycles start or stop up to a timestep
+    apart, and outage minutes can differ by a few minutes per day when the
+    tank runs out close to a trigger.
 
     Parameters
     ----------
     dhw_system : DHWSystem
     building : Building
+    num_days : int
+        Number of design days to simulate. Default 3.
+    steady_state : bool
+        If True, stop at the periodic steady state and tile it. Default False.
+    steady_state_tol : float | None
+        Largest difference in the heat stored in any tank between two
+        midnights still counted as steady [BTU]. None (default) uses one
+        timestep of heating at full output (``_one_step_heat_btu``).
+    engine : str
+        'step' or 'event', as for ``simulate``.
     **sim_run_kwargs
-        Forwarded to SimulationRun.__init__() (e.g. outlet_deficit_threshold_f).
+        Forwarded to SimulationRun.__init__() (e.g. outlet_deficit_threshold_f,
+        or channels="plot" to record only what SimulationRun.to_plotly draws).
 
     Returns
     -------
     SimulationRun
+
+    Raises
+    ------
+    ValueError
+        If num_days is less than 1 or engine is invalid.
     """
-    return simulate(dhw_system, building, duration="3day", **sim_run_kwargs)
+    if not isinstance(num_days, int) or num_days < 1:
+        raise ValueError(f"num_days must be a positive integer, got {num_days!r}")
+    duration_min = num_days * DAY_DURATION_MIN
+    if not steady_state:
+        return simulate(dhw_system, building, duration_min, engine, THREE_DAY_TIMESTEP_MIN, **sim_run_kwargs)
+    if engine not in _ENGINES:
+        raise ValueError(f"engine must be one of {_ENGINES}, got {engine!r}")
+
+    sim_run   = SimulationRun(duration_min, THREE_DAY_TIMESTEP_MIN, **sim_run_kwargs)
+    day_steps = DAY_DURATION_MIN // THREE_DAY_TIMESTEP_MIN
+    periodic  = _inputs_repeat_daily(dhw_system, building, sim_run.num_steps, THREE_DAY_TIMESTEP_MIN)
+    if steady_state_tol is None:
+        steady_state_tol = _one_step_heat_btu(dhw_system, building, THREE_DAY_TIMESTEP_MIN)
+    days      = _simulate_chunks(dhw_system, building, sim_run, sim_run.num_steps, day_steps, engine)
+    last_state = last_outage_min = None
+    try:
+        for day, _ in enumerate(days):
+            if not periodic or sim_run.stopped_early or day == num_days - 1:
+                continue
+            state = _midnight_state(dhw_system, sim_run)
+            if last_state is not None and _states_close(state, last_state, steady_state_tol):
+                remaining_days = num_days - day - 1
+                sim_run.record_outage((sim_run.outage_minutes - last_outage_min) * remaining_days)
+                sim_run.repeat_records(day_steps, remaining_days * day_steps)
+                sim_run.steady_state_day = day
+                break
+            last_state, last_outage_min = state, sim_run.outage_minutes
+    finally:
+        days.close()
+    return sim_run
 
 
-def simulate_annual(dhw_system: DHWSystem, building: Building, **sim_run_kwargs) -> SimulationRun:
+def simulate_annual(
+    dhw_system: DHWSystem,
+    building: Building,
+    timestep_min: int = ANNUAL_TIMESTEP_MIN,
+    **sim_run_kwargs,
+) -> SimulationRun:
     """
-    Convenience wrapper: run a full annual simulation at 10-minute timesteps.
+    Convenience wrapper: run a full annual simulation, at 10-minute timesteps by default.
 
     Parameters
     ----------
     dhw_system : DHWSystem
     building : Building
+    timestep_min : int
+        Timestep in minutes, e.g. 1 for peak-demand analysis or 60 for
+        quick estimates. Must divide an hour.
     **sim_run_kwargs
-        Forwarded to SimulationRun.__init__().
+        Forwarded to SimulationRun.__init__() (e.g. channels="cost" to record
+        only heater power for energy and utility cost).
 
     Returns
     -------
     SimulationRun
     """
-    return simulate(dhw_system, building, duration="annual", **sim_run_kwargs)
+    return simulate(dhw_system, building, duration="annual", timestep_min=timestep_min, **sim_run_kwargs)
+
+
+def simulate_feasibility(
+    dhw_system: DHWSystem,
+    building: Building,
+    duration: str | int = "3day",
+    engine: str = "step",
+    timestep_min: int | None = None,
+    max_outage_min: int = 0,
+    outlet_deficit_threshold_f: float = 5.0,
+    outlet_deficit_max_min: int = 10,
+) -> dict:
+    """
+    Run ``simulate``'s loop only to decide whether the system fails.
+
+    Nothing is recorded per step: the loop tracks the minimum usable volume,
+    outage and outlet-deficit minutes, and returns as soon as failure is
+    certain. The run fails when cumulative outage exceeds ``max_outage_min``
+    or the outlet deficit lasts longer than ``outlet_deficit_max_min``
+    consecutive minutes (``simulate``'s early-stop condition). Systems
+    report only the top tank node, and every step reuses one StepResult,
+    so stepping allocates nothing. Use it for sizing searches and to
+    validate sizing-curve points; ``simulate`` returns the same outcome
+    with full per-step records.
+
+    Parameters
+    ----------
+    dhw_system : DHWSystem
+        A sized DHWSystem instance.
+    building : Building
+        The building to simulate the system in.
+    duration : str | int
+        '3day', 'annual' or minutes, as for ``simulate``.
+    engine : str
+        'step' or 'event', as for ``simulate``.
+    timestep_min : int | None
+        Timestep in minutes, as for ``simulate``.
+    max_outage_min : int
+        Maximum allowable cumulative outage [minutes], as for
+        ``SimulationRun.is_successful``. Default 0 (no outages).
+    outlet_deficit_threshold_f : float
+        Degrees below supply temperature at which the delivered water is in
+        deficit. Default 5 °F.
+    outlet_deficit_max_min : int
+        Maximum consecutive minutes of outlet deficit. Default 10 minutes.
+
+    Returns
+    -------
+    dict
+        'feasible' (bool), 'min_usable_volume_supplyT_gal' (over the steps
+        simulated), 'outage_min', 'deficit_min' (total minutes in outlet
+        deficit), 'first_failure_min' (simulation minute of the step at
+        which the run failed, None if feasible) and 'num_steps_simulated'.
+
+    Raises
+    ------
+    ValueError
+        If duration, timestep_min or engine is invalid.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"engine must be one of {_ENGINES}, got {engine!r}")
+    duration_min, timestep_min = _get_duration_and_timestep(duration, timestep_min)
+    num_steps = duration_min // timestep_min
+
+    _initialize_tanks(dhw_system, building)
+    building.precompute_timeseries(num_steps, timestep_min)
+    step      = StepResult()
+    step.tank_fracts = (1.0,)
+    step_into = _get_step_into(dhw_system)
+    deficit_limit_f  = dhw_system.supply_temp_f - outlet_deficit_threshold_f
+    min_volume_gal   = float("inf")
+    outage_min       = 0
+    deficit_min      = 0
+    deficit_consec   = 0
+    first_failure_min: int | None = None
+    i = 0
+    try:
+        dhw_system.precompute_heater_timeline(building, num_steps, timestep_min)
+        while i < num_steps:
+            span = None
+            if engine == "event":
+                span = dhw_system.simulate_until_event(
+                    building, i, num_steps - i, timestep_min, tank_fracts=step.tank_fracts
+                )
+            if span is not None:
+                # A span ends before usable volume runs out, with the top
+                # node at supply temperature, so it clears any deficit
+                min_volume_gal = min(min_volume_gal, min(span["usable_volume_supplyT_gal"]))
+                deficit_consec = 0
+                i += span["num_steps"]
+                continue
+
+            step_into(building, i, timestep_min, step)
+            i += 1
+            if step.usable_volume_supplyT_gal < min_volume_gal:
+                min_volume_gal = step.usable_volume_supplyT_gal
+            if step.usable_volume_supplyT_gal <= 0.0:
+                outage_min += timestep_min
+            if step.get_delivery_temp_f() < deficit_limit_f:
+                deficit_min    += timestep_min
+                deficit_consec += timestep_min
+            else:
+                deficit_consec = 0
+            if outage_min > max_outage_min or deficit_consec > outlet_deficit_max_min:
+                first_failure_min = (i - 1) * timestep_min
+                break
+    finally:
+        dhw_system.clear_heater_timeline()
+        building.clear_timeseries()
+    return {
+        "feasible":                      first_failure_min is None,
+        "min_usable_volume_supplyT_gal": min_volume_gal,
+        "outage_min":                    outage_min,
+        "deficit_min":                   deficit_min,
+        "first_failure_min":             first_failure_min,
+        "num_steps_simulated":           i,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
+def _simulate_chunks(
+    dhw_system: DHWSystem,
+    building: Building,
+    sim_run: SimulationRun,
+    num_steps: int,
+    chunk_steps: int,
+    engine: str,
+) -> Iterator[None]:
+    """
+    Simulate ``num_steps`` timesteps into ``sim_run``, yielding each time
+    ``chunk_steps`` more steps have been recorded and when the run stops early.
+
+    ``simulate`` runs it as one chunk of the whole run; ``simulate_iter``
+    empties ``sim_run`` after each chunk. Event spans are cut at chunk ends.
+    """
+    from ecoengine.objects.dhwsystems.recirc_systems.SwingSystem import SwingSystem
+    sim_run.show_tm_panel = isinstance(dhw_system, SwingSystem)
+
+    _initialize_tanks(dhw_system, building)
+
+    sim_run.supply_temp_f = dhw_system.supply_temp_f
+    timestep_min = sim_run.timestep_min
+    # Demand, OAT, inlet temperature and heater capacity/power depend only on
+    # the step index, so compute them for the whole run before stepping
+    building.precompute_timeseries(num_steps, timestep_min)
+    step      = StepResult()
+    step.tank_fracts = sim_run.tank_fracts
+    step_into = _get_step_into(dhw_system)
+    try:
+        dhw_system.precompute_heater_timeline(building, num_steps, timestep_min)
+        i         = 0
+        chunk_end = min(chunk_steps, num_steps)
+        while i < num_steps:
+            span = None
+            stop = False
+            if engine == "event":
+                span = dhw_system.simulate_until_event(
+                    building, i, chunk_end - i, timestep_min, tank_fracts=step.tank_fracts
+                )
+            if span is not None:
+                sim_run.record_timesteps(
+                    num_steps                 = span["num_steps"],
+                    dhw_demand_supplyT_gal    = span["demand_supplyT_gal"],
+                    usable_volume_supplyT_gal = span["usable_volume_supplyT_gal"],
+                    heater_output_kbtuh       = span["heater_output_kbtuh"],
+                    heater_power_in_kw        = span["heater_power_in_kw"],
+                    oat_f                     = span["oat_f"],
+                    inlet_water_temp_f        = span["inlet_water_temp_f"],
+                    tank_temps_f              = span["tank_temps_f"],
+                    mode                      = span["mode"],
+                )
+                # A span ends before usable volume runs out, so its top
+                # node is at supply temperature and clears any deficit
+                sim_run.check_outlet_deficit(span["tank_temps_f"][-1][-1], dhw_system.supply_temp_f)
+                i += span["num_steps"]
+            else:
+                step_into(building, i, timestep_min, step)
+                sim_run.record_step(step)
+
+                if step.usable_volume_supplyT_gal <= 0.0:
+                    sim_run.record_outage(timestep_min)
+
+                # Check outlet-deficit stop condition. For systems where the TM/swing
+                # tank is the actual delivery point (e.g. SwingSystem), use its
+                # temperature; for all others fall back to the primary tank top.
+                stop = sim_run.check_outlet_deficit(step.get_delivery_temp_f(), dhw_system.supply_temp_f)
+                i += 1
+
+            if i == chunk_end or stop:
+                yield
+                if stop:
+                    break
+                chunk_end = min(i + chunk_steps, num_steps)
+    finally:
+        dhw_system.clear_heater_timeline()
+        building.clear_timeseries()
+
+
+def _iter_records(
+    dhw_system: DHWSystem,
+    building: Building,
+    chunk_run: SimulationRun,
+    num_steps: int,
+    chunk_steps: int,
+    engine: str,
+) -> Generator[np.ndarray, None, dict]:
+    """Generator behind ``simulate_iter``: yield ``chunk_run``'s records after each chunk."""
+    for _ in _simulate_chunks(dhw_system, building, chunk_run, num_steps, chunk_steps, engine):
+        records = chunk_run.to_records()
+        chunk_run.clear_records()
+        yield records
+    return {
+        "successful":         chunk_run.is_successful(),
+        "total_outage_min":   chunk_run.outage_minutes,
+        "stopped_early":      chunk_run.stopped_early,
+        "num_steps_recorded": chunk_run.first_step,
+    }
+
+
+def _inputs_repeat_daily(dhw_system: DHWSystem, building: Building, num_steps: int, timestep_min: int) -> bool:
+    """
+    Return True if the demand, OAT and inlet temperature of a ``num_steps``
+    run repeat every day, so the run repeats once the system state does.
+    """
+    use_avg   = any(wh.is_load_shifting() for wh in dhw_system.water_heaters)
+    series    = building.get_timeseries(num_steps, timestep_min, use_avg=use_avg)
+    day_steps = DAY_DURATION_MIN // timestep_min
+    for name in ("demand_supplyT_gal", "oat_f", "inlet_water_temp_f"):
+        days = series[name].reshape(-1, day_steps)
+        if not (days == days[0]).all():
+            return False
+    return True
+
+
+def _tank_heat_btu(tank: StorageTank) -> float:
+    """Heat stored in ``tank`` above 0 °F, from its temperature profile [BTU]."""
+    temps = tank.get_temperatures_at_fractions(_ENERGY_FRACTS)
+    return tank.total_volume_gal * _RHO_CP * sum(temps) / len(temps)
+
+
+def _midnight_state(dhw_system: DHWSystem, sim_run: SimulationRun) -> tuple:
+    """
+    Return the state the steady-state check compares between midnights:
+    ``(heater on/off states, outlet-deficit counter, heat stored per tank)``.
+    """
+    tanks = (dhw_system.storage_tank, getattr(dhw_system, "tm_storage_tank", None))
+    return (
+        tuple(wh.is_active() for wh in dhw_system._get_all_heaters()),
+        sim_run.outlet_deficit_consec_min,
+        tuple(_tank_heat_btu(tank) for tank in tanks if tank is not None),
+    )
+
+
+def _one_step_heat_btu(dhw_system: DHWSystem, building: Building, timestep_min: int) -> float:
+    """
+    Return the heat all of the system's heaters add in one timestep at full
+    output under the first timestep's conditions [BTU].
+    """
+    use_avg = any(wh.is_load_shifting() for wh in dhw_system.water_heaters)
+    series  = building.get_timeseries(1, timestep_min, use_avg=use_avg)
+    oat_f, inlet_f = float(series["oat_f"][0]), float(series["inlet_water_temp_f"][0])
+    kbtuh = 0.0
+    for wh in dhw_system._get_all_heaters():
+        cap = wh.get_capacity_kbtuh(oat_f, wh.get_outlet_temp_f(0), inlet_f)
+        if cap is not None and cap == cap:
+            kbtuh += cap
+    return kbtuh * 1000.0 * timestep_min / 60.0
+
+
+def _states_close(state: tuple, other: tuple, tol: float) -> bool:
+    """Return True if two nested state tuples match, floats to within ``tol``."""
+    if isinstance(state, tuple):
+        return len(state) == len(other) and all(_states_close(a, b, tol) for a, b in zip(state, other))
+    if isinstance(state, float):
+        return abs(state - other) <= tol
+    return state == other
+
+
+def _get_duration_and_timestep(duration: str | int, timestep_min: int | None = None) -> tuple[int, int]:
+    """
+    Return ``(duration_min, timestep_min)`` for a '3day', 'annual' or custom-length run.
+
+    A custom ``duration`` is a number of minutes and defaults to annual
+    (10-minute) timesteps. ``timestep_min`` overrides the default step.
+
+    Raises
+    ------
+    ValueError
+        If duration is not '3day', 'annual' or a positive integer, or
+        timestep_min is not a positive divisor of 60 that also divides the
+        duration.
+    """
+    if isinstance(duration, str):
+        if duration not in _DURATIONS:
+            raise ValueError(f"duration must be '3day', 'annual' or a number of minutes, got {duration!r}")
+        duration_min, default_timestep_min = _DURATIONS[duration]
+    elif isinstance(duration, int) and duration > 0:
+        duration_min, default_timestep_min = duration, ANNUAL_TIMESTEP_MIN
+    else:
+        raise ValueError(f"duration must be '3day', 'annual' or a number of minutes, got {duration!r}")
+    if timestep_min is None:
+        timestep_min = default_timestep_min
+    # Building inputs change on the hour, so steps must not straddle hours
+    if not isinstance(timestep_min, int) or timestep_min < 1 or 60 % timestep_min:
+        raise ValueError(f"timestep_min must divide 60 minutes, got {timestep_min!r}")
+    if duration_min % timestep_min:
+        raise ValueError(f"duration of {duration_min} minutes is not a whole number of {timestep_min}-minute steps")
+    return duration_min, timestep_min
+
+
+def _initialize_tanks(dhw_system: DHWSystem, building: Building) -> None:
+    """
+    Initialize the system's storage tank (and TM tank, if any) for the start
+    of a simulation, at the building's design inlet temperature.
+    """
+    inlet_temp_f    = building.get_design_inlet_water_temp_f() or 50.0
+    percent_useable = _initial_percent_useable(dhw_system)
+    if dhw_system.storage_tank is not None:
+        dhw_system.storage_tank.initialize(
+            storage_temp_f  = dhw_system.storage_temp_f,
+            cold_temp_f     = inlet_temp_f,
+            percent_useable = percent_useable, # TODO I don't think this is right
+        )
+    # Initialize TM tank if present (ParallelLoopSystem, SwingSystem)
+    tm_tank = getattr(dhw_system, "tm_storage_tank", None)
+    if tm_tank is not None:
+        tm_off_temp_f = getattr(dhw_system, "tm_off_temp_f", dhw_system.storage_temp_f)
+        tm_tank.initialize(
+            storage_temp_f  = tm_off_temp_f,
+            cold_temp_f     = inlet_temp_f,
+            percent_useable = 1.0,
+        )
+
+
 def _initial_percent_useable(dhw_system: DHWSystem) -> float:
     """
     Determine the initial tank charge level (fraction hot) from the system's
@@ -170,3 +705,16 @@ def _initial_percent_useable(dhw_system: DHWSystem) -> float:
         if ctrl is not None:
             return max(0.0, min(1.0, 1.0 - ctrl.on_sensor_fract))
     return 1.0
+
+
+def _get_step_into(dhw_system: DHWSystem):
+    """
+    Return ``dhw_system``'s ``simulate_step_into``, or an adapter filling the
+    StepResult from ``simulate_step`` for subclasses that only override that.
+    """
+    if type(dhw_system).simulate_step is DHWSystem.simulate_step:
+        return dhw_system.simulate_step_into
+
+    def step_into(building, timestep_interval, interval_min, out):
+        return out.update(dhw_system.simulate_step(building, timestep_interval, interval_min))
+    return step_into
@@ -3,8 +3,8 @@ from __future__ import annotations
 import json
 import numpy as np
 import importlib.resources as pkg_resources
-from typing import TYPE_CHECKING
-from ecoengine.objects.building.ClimateZone import ClimateZone
+from typing import TYPE_CHECKING, Sequence
+from ecoengine.objects.building.ClimateZone import ClimateZone, _HOURS_PER_YEAR
 
 if TYPE_CHECKING:
     from ecoengine.objects.building.UtilityCostTracker import UtilityCostTracker
@@ -52,6 +52,17 @@ def _validate_load_shape(load_shape: list[float], label: str = 'load shape') ->
     return
 
 
+def _to_shared_list(values: np.ndarray) -> list[float]:
+    """
+    Return ``values.tolist()`` with equal values sharing one float object.
+
+    Per-step inputs repeat every step of an hour, so long runs store one
+    pointer per step instead of one float object.
+    """
+    unique, inverse = np.unique(values, return_inverse=True)
+    return list(map(unique.tolist().__getitem__, inverse.tolist()))
+
+
 class Building:
     """
     Stores information about the building and surrounding environment where a
@@ -111,6 +122,8 @@ class Building:
         self.avg_load_shape  = np.array(avg_load_shape)
         self.utility_cost_tracker = utility_cost_tracker
         self.building_type = building_type
+        # Per-step inputs for the current simulation run (see precompute_timeseries)
+        self._timeseries: dict | None = None
 
     # ------------------------------------------------------------------
     # Factory
@@ -491,6 +504,9 @@ class Building:
         float
             Gallons of DHW load at supply temperature for this interval.
         """
+        ts = self._timeseries
+        if ts is not None and interval_min == ts["interval_min"] and 0 <= timestep_interval < ts["n_steps"]:
+            return ts["avg_demand_supplyT_gal" if use_avg else "demand_supplyT_gal"][timestep_interval % ts["period_steps"]]
         load_shape    = self.avg_load_shape if use_avg else self.peak_load_shape
         actual_minute = timestep_interval * interval_min
         # For 24-hour daily shapes, wrap within the day (memory-efficient: no tiling).
@@ -516,6 +532,9 @@ class Building:
         float
             Outdoor air temperature [°F].
         """
+        ts = self._timeseries
+        if ts is not None and interval_min == ts["interval_min"] and 0 <= timestep_interval < ts["n_steps"]:
+            return ts["oat_f"][timestep_interval % ts["period_steps"]]
         return self.climate_zone.get_oat_f(timestep_interval, interval_min)
 
     def get_inlet_water_temp_f(self, timestep_interval: int, interval_min: int = 1) -> float:
@@ -535,8 +554,122 @@ class Building:
         float
             Inlet water temperature [°F].
         """
+        ts = self._timeseries
+        if ts is not None and interval_min == ts["interval_min"] and 0 <= timestep_interval < ts["n_steps"]:
+            return ts["inlet_water_temp_f"][timestep_interval % ts["period_steps"]]
         return self.climate_zone.get_inlet_water_temp_f(timestep_interval, interval_min)
 
+    def get_timeseries(
+        self,
+        n_steps: int,
+        interval_min: int = 1,
+        use_avg: bool = False,
+        control_schedule: Sequence[str] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Return the per-step simulation inputs for a whole run as arrays.
+
+        Element ``i`` of each array equals the corresponding per-step query
+        (``get_dhw_load_supplyT_gal``, ``get_oat_f``,
+        ``get_inlet_water_temp_f``) at ``timestep_interval=i``.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of simulation intervals.
+        interval_min : int
+            Length of each interval in minutes.
+        use_avg : bool
+            If True, use avg_load_shape for the demand; otherwise peak_load_shape.
+        control_schedule : Sequence[str] | None
+            24-element schedule of control keys. When given, ``'mode'`` holds
+            the key for each interval's hour of day; otherwise ``'normal'``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Keys: 'demand_supplyT_gal', 'oat_f', 'inlet_water_temp_f',
+            'hour_of_day', 'mode'.
+        """
+        hour_of_day = (np.arange(n_steps) * interval_min // 60) % 24
+        mode        = (
+            np.asarray(control_schedule)[hour_of_day] if control_schedule
+            else np.full(n_steps, "normal")
+        )
+        return {
+            "demand_supplyT_gal": self._get_dhw_load_series(n_steps, interval_min, use_avg),
+            "oat_f":              self.climate_zone.get_oat_f_series(n_steps, interval_min),
+            "inlet_water_temp_f": self.climate_zone.get_inlet_water_temp_f_series(n_steps, interval_min),
+            "hour_of_day":        hour_of_day,
+            "mode":               mode,
+        }
+
+    def precompute_timeseries(self, n_steps: int, interval_min: int = 1) -> None:
+        """
+        Compute the per-step inputs of a run once, up front.
+
+        Until ``clear_timeseries`` is called, ``get_dhw_load_supplyT_gal``,
+        ``get_oat_f`` and ``get_inlet_water_temp_f`` return the stored value
+        for any of the first ``n_steps`` intervals of length ``interval_min``
+        instead of recomputing it. Values are identical to live queries.
+        Runs longer than a year store one year of inputs when they repeat
+        yearly (see ``get_input_period_steps``).
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of simulation intervals.
+        interval_min : int
+            Length of each interval in minutes.
+        """
+        period_steps = self.get_input_period_steps(n_steps, interval_min)
+        self._timeseries = {
+            "n_steps":                n_steps,
+            "period_steps":           period_steps,
+            "interval_min":           interval_min,
+            "demand_supplyT_gal":     _to_shared_list(self._get_dhw_load_series(period_steps, interval_min, False)),
+            "avg_demand_supplyT_gal": _to_shared_list(self._get_dhw_load_series(period_steps, interval_min, True)),
+            "oat_f":                  _to_shared_list(self.climate_zone.get_oat_f_series(period_steps, interval_min)),
+            "inlet_water_temp_f":     _to_shared_list(self.climate_zone.get_inlet_water_temp_f_series(period_steps, interval_min)),
+        }
+
+    def get_input_period_steps(self, n_steps: int, interval_min: int = 1) -> int:
+        """
+        Return how many leading intervals of an ``n_steps`` run determine all
+        of its per-step inputs.
+
+        Demand, OAT and inlet temperature repeat every year when the load
+        shapes and OAT data divide a year, so a longer run needs only its
+        first year; otherwise (and for runs of up to a year) ``n_steps``.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of simulation intervals.
+        interval_min : int
+            Length of each interval in minutes; must divide a year.
+
+        Returns
+        -------
+        int
+        """
+        year_steps = _HOURS_PER_YEAR * 60 // interval_min
+        if n_steps <= year_steps or (self.climate_zone is not None and not self.climate_zone.repeats_yearly()):
+            return n_steps
+        if any(_HOURS_PER_YEAR % len(shape) for shape in (self.peak_load_shape, self.avg_load_shape)):
+            return n_steps
+        return year_steps
+
+    def clear_timeseries(self) -> None:
+        """Drop the inputs stored by ``precompute_timeseries``; queries are computed live again."""
+        self._timeseries = None
+
+    def _get_dhw_load_series(self, n_steps: int, interval_min: int, use_avg: bool) -> np.ndarray:
+        """Vectorized ``get_dhw_load_supplyT_gal`` for intervals ``0 .. n_steps - 1``."""
+        load_shape = self.avg_load_shape if use_avg else self.peak_load_shape
+        hour_index = (np.arange(n_steps) * interval_min // 60) % len(load_shape)
+        return self.daily_dhw_use_supplyT_gal * load_shape[hour_index] * interval_min / 60
+
     def get_design_oat_f(self) -> float | None:
         """
         Return the design-day outdoor air temperature [°F].
@@ -3,6 +3,8 @@ from __future__ import annotations
 import csv
 import importlib.resources as pkg_resources
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # Module-level helpers
 # ---------------------------------------------------------------------------
@@ -10,6 +12,7 @@ import importlib.resources as pkg_resources
 # First day-of-year (0-indexed) for each month (0 = January, 11 = December).
 # Used to convert a day-of-year into a month index for inlet-water lookups.
 _MONTH_START_DAY = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+_HOURS_PER_YEAR  = 8760
 
 _CLIMATE_DATA_PKG = 'ecoengine.data.climate_data'
 
@@ -244,6 +247,69 @@ class ClimateZone:
         month         = _day_of_year_to_month(day_of_year)
         return self._inlet_water_temp_f_by_month[month]
 
+    def get_oat_f_series(self, n_steps: int, interval_min: int = 1) -> np.ndarray:
+        """
+        Return outdoor air temperature for steps ``0 .. n_steps - 1`` at once.
+
+        Element ``i`` equals ``get_oat_f(i, interval_min)``.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of simulation intervals.
+        interval_min : int
+            Length of each interval in minutes.
+
+        Returns
+        -------
+        np.ndarray
+            Outdoor air temperature for each interval [°F].
+        """
+        if self._constant_oat_f is not None:
+            return np.full(n_steps, self._constant_oat_f, dtype=float)
+        if self._oat_f_by_hour is None:
+            raise ValueError("This ClimateZone has no outdoor air temperature data.")
+        oat_f_by_hour = np.asarray(self._oat_f_by_hour, dtype=float)
+        hour_of_year  = (np.arange(n_steps) * interval_min // 60) % len(oat_f_by_hour)
+        return oat_f_by_hour[hour_of_year]
+
+    def repeats_yearly(self) -> bool:
+        """
+        Return True if OAT and inlet temperature repeat every 365 days.
+
+        Inlet temperatures are monthly and hourly OAT data wraps at its own
+        length, so this holds unless that length does not divide a year.
+        """
+        if self._constant_oat_f is not None or self._oat_f_by_hour is None:
+            return True
+        return _HOURS_PER_YEAR % len(self._oat_f_by_hour) == 0
+
+    def get_inlet_water_temp_f_series(self, n_steps: int, interval_min: int = 1) -> np.ndarray:
+        """
+        Return cold/inlet water temperature for steps ``0 .. n_steps - 1`` at once.
+
+        Element ``i`` equals ``get_inlet_water_temp_f(i, interval_min)``.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of simulation intervals.
+        interval_min : int
+            Length of each interval in minutes.
+
+        Returns
+        -------
+        np.ndarray
+            Inlet water temperature for each interval [°F].
+        """
+        if self._constant_inlet_water_temp_f is not None:
+            return np.full(n_steps, self._constant_inlet_water_temp_f, dtype=float)
+        if self._inlet_water_temp_f_by_month is None:
+            raise ValueError("This ClimateZone has no inlet water temperature data.")
+        day_of_year = (np.arange(n_steps) * interval_min // (60 * 24)) % 365
+        month       = np.searchsorted(_MONTH_START_DAY, day_of_year, side='right') - 1
+        return np.asarray(self._inlet_water_temp_f_by_month, dtype=float)[month]
+
     # ------------------------------------------------------------------
     # Design-condition queries (used during sizing, not simulation)
     # ------------------------------------------------------------------
@@ -567,7 +567,8 @@ class UtilityCostTracker:
         Parameters
         ----------
         step : int
-            0-based step index from the simulation.
+            0-based step index from the simulation. Steps past the first
+            year wrap to the same hour of the year.
         timestep_min : int
             Simulation timestep size [minutes] (e.g. 1, 10, or 60).
 
@@ -575,7 +576,7 @@ class UtilityCostTracker:
         -------
         float
         """
-        hour_of_year = math.floor(step / (60.0 / timestep_min))
+        hour_of_year = math.floor(step / (60.0 / timestep_min)) % _MONTH_HOUR_START[-1]
         if len(self.energy_charge_by_hour) == 8760:
             return self.energy_charge_by_hour[hour_of_year]
         period = self.demand_period_chart[hour_of_year]
@@ -594,7 +595,7 @@ class UtilityCostTracker:
         -------
         int
         """
-        hour_of_year = math.floor(step / (60.0 / timestep_min))
+        hour_of_year = math.floor(step / (60.0 / timestep_min)) % _MONTH_HOUR_START[-1]
         return self.demand_period_chart[hour_of_year]
 
     def get_demand_charge_for_period(self, period_key: int, max_kw: float) -> float:
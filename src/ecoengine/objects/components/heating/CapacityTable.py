@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ecoengine.constants.constants import _W_TO_KBTUH
+from ecoengine.objects.components.heating.PerformanceMap import PerformanceMap, _load_maps_json
+
+# Default condition grid [°F], wide enough for California design conditions
+_DEFAULT_OAT_F     = tuple(float(t) for t in range(-20, 115, 5))
+_DEFAULT_INLET_F   = tuple(float(t) for t in range(35, 90, 5))
+_DEFAULT_OUTLET_F  = tuple(float(t) for t in range(110, 185, 5))
+
+
+class CapacityTable:
+    """
+    Output capacity, power input and COP of many HPWH models on one shared
+    grid of operating conditions.
+
+    Built in a single pass over the equipment catalog: every model's map is
+    evaluated once on the whole ``(oat, inlet, outlet)`` grid through the
+    batch interface, with models spread over worker processes (map
+    interpolation holds the GIL, so threads would not help). Equipment
+    selection screens can then read any model's capacity without loading
+    its performance map.
+
+    Values are per unit (``num_units = 1``) at each map's own design
+    assumptions. Arrays have shape ``(n_models, n_oat, n_inlet, n_outlet)``;
+    outlet-independent maps (multi-pass, two-input) repeat along the last
+    axis.
+
+    Persistence
+    -----------
+    ``save`` writes an uncompressed ``.npz`` holding the model names, the
+    three axes and the capacity and power arrays in the table's dtype
+    (``float32`` by default). COP is derived on load rather than stored.
+    """
+
+    def __init__(
+        self,
+        model_names: list[str],
+        oat_f: np.ndarray,
+        inlet_temp_f: np.ndarray,
+        outlet_temp_f: np.ndarray,
+        capacity_kbtuh: np.ndarray,
+        power_in_kw: np.ndarray,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        model_names : list[str]
+            Model codes, one per leading-axis entry.
+        oat_f, inlet_temp_f, outlet_temp_f : np.ndarray
+            Strictly ascending grid axes [°F].
+        capacity_kbtuh : np.ndarray
+            Output capacity per unit [kBTU/hr], shape
+            ``(n_models, n_oat, n_inlet, n_outlet)``.
+        power_in_kw : np.ndarray
+            Power input per unit [kW], same shape as ``capacity_kbtuh``.
+        """
+        self.model_names    = list(model_names)
+        self.oat_f          = np.asarray(oat_f, dtype=float)
+        self.inlet_temp_f   = np.asarray(inlet_temp_f, dtype=float)
+        self.outlet_temp_f  = np.asarray(outlet_temp_f, dtype=float)
+        self.capacity_kbtuh = capacity_kbtuh
+        self.power_in_kw    = power_in_kw
+
+        expected = (len(self.model_names), self.oat_f.size, self.inlet_temp_f.size, self.outlet_temp_f.size)
+        if capacity_kbtuh.shape != expected or power_in_kw.shape != expected:
+            raise ValueError(
+                f"Table arrays must have shape {expected}, got "
+                f"{capacity_kbtuh.shape} and {power_in_kw.shape}."
+            )
+        self._index = {name: k for k, name in enumerate(self.model_names)}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        model_names: list[str] | None = None,
+        oat_f: list[float] | np.ndarray = _DEFAULT_OAT_F,
+        inlet_temp_f: list[float] | np.ndarray = _DEFAULT_INLET_F,
+        outlet_temp_f: list[float] | np.ndarray = _DEFAULT_OUTLET_F,
+        max_workers: int | None = None,
+        dtype: type = np.float32,
+    ) -> CapacityTable:
+        """
+        Evaluate every model on the full condition grid.
+
+        Parameters
+        ----------
+        model_names : list[str] | None
+            Model codes to include. None includes every model in
+            ``maps.json``; use ``get_list_of_models`` to apply its filters.
+        oat_f, inlet_temp_f, outlet_temp_f : list[float] | np.ndarray
+            Grid axes [°F]; each must be strictly ascending.
+        max_workers : int | None
+            Number of worker processes. None uses ``os.cpu_count()``; 1 (or a
+            single model) evaluates the models serially in this process.
+        dtype : type
+            Storage dtype of the capacity and power arrays.
+
+        Returns
+        -------
+        CapacityTable
+
+        Raises
+        ------
+        ValueError
+            If an axis is empty or not strictly ascending, or a model name
+            is not in the registry.
+        """
+        if model_names is None:
+            model_names = list(_load_maps_json())
+        axes = [np.asarray(ax, dtype=float) for ax in (oat_f, inlet_temp_f, outlet_temp_f)]
+        for ax in axes:
+            if ax.ndim != 1 or ax.size == 0 or np.any(np.diff(ax) <= 0):
+                raise ValueError("Grid axes must be non-empty and strictly ascending.")
+
+        shape          = (len(model_names),) + tuple(ax.size for ax in axes)
+        capacity_kbtuh = np.empty(shape, dtype=dtype)
+        power_in_kw    = np.empty(shape, dtype=dtype)
+        num_workers    = min(max_workers or os.cpu_count() or 1, len(model_names))
+        if num_workers <= 1:
+            results = (_evaluate_model(name, *axes) for name in model_names)
+        else:
+            n = len(model_names)
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                results = list(pool.map(
+                    _evaluate_model, model_names, [axes[0]] * n, [axes[1]] * n, [axes[2]] * n,
+                    chunksize=max(1, n // (4 * num_workers)),
+                ))
+        for k, (cap, pwr) in enumerate(results):
+            capacity_kbtuh[k] = cap
+            power_in_kw[k]    = pwr
+        return cls(model_names, *axes, capacity_kbtuh, power_in_kw)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Write the table to ``path`` as an uncompressed ``.npz`` archive."""
+        np.savez(
+            path,
+            model_names    = np.array(self.model_names),
+            oat_f          = self.oat_f,
+            inlet_temp_f   = self.inlet_temp_f,
+            outlet_temp_f  = self.outlet_temp_f,
+            capacity_kbtuh = self.capacity_kbtuh,
+            power_in_kw    = self.power_in_kw,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> CapacityTable:
+        """Read a table written by ``save``."""
+        with np.load(path) as data:
+            return cls(
+                data["model_names"].tolist(),
+                data["oat_f"],
+                data["inlet_temp_f"],
+                data["outlet_temp_f"],
+                data["capacity_kbtuh"],
+                data["power_in_kw"],
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        return self.capacity_kbtuh.nbytes + self.power_in_kw.nbytes
+
+    @property
+    def cop(self) -> np.ndarray:
+        """COP for every entry; NaN where power input is not positive."""
+        pwr_kbtuh = self.power_in_kw.astype(float) * _W_TO_KBTUH
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(pwr_kbtuh > 0, self.capacity_kbtuh / pwr_kbtuh, np.nan)
+
+    def __contains__(self, model_name: str) -> bool:
+        return model_name in self._index
+
+    def __len__(self) -> int:
+        return len(self.model_names)
+
+    def get_model_arrays(self, model_name: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(capacity_kbtuh, power_in_kw)`` of one model over the
+        whole grid, shape ``(n_oat, n_inlet, n_outlet)``.
+
+        Raises
+        ------
+        ValueError
+            If the model is not in the table.
+        """
+        k = self._model_index(model_name)
+        return self.capacity_kbtuh[k], self.power_in_kw[k]
+
+    def lookup(
+        self,
+        model_name: str,
+        oat_f: float,
+        inlet_temp_f: float,
+        outlet_temp_f: float,
+    ) -> tuple[float, float, float]:
+        """
+        Return ``(capacity_kbtuh, power_in_kw, cop)`` per unit at one grid node.
+
+        Raises
+        ------
+        ValueError
+            If the model is not in the table or a temperature is not a grid node.
+        """
+        k = self._model_index(model_name)
+        i = _node_index(self.oat_f, oat_f, "oat_f")
+        j = _node_index(self.inlet_temp_f, inlet_temp_f, "inlet_temp_f")
+        l = _node_index(self.outlet_temp_f, outlet_temp_f, "outlet_temp_f")
+        cap = float(self.capacity_kbtuh[k, i, j, l])
+        pwr = float(self.power_in_kw[k, i, j, l])
+        cop = cap / (pwr * _W_TO_KBTUH) if pwr > 0 else float("nan")
+        return cap, pwr, cop
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _model_index(self, model_name: str) -> int:
+        try:
+            return self._index[model_name]
+        except KeyError:
+            raise ValueError(f"Model '{model_name}' is not in the capacity table.") from None
+
+
+def _evaluate_model(
+    model_name: str,
+    oat_f: np.ndarray,
+    inlet_temp_f: np.ndarray,
+    outlet_temp_f: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-unit capacity and power of one model on the full grid (worker task)."""
+    oat, inlet, outlet = np.meshgrid(oat_f, inlet_temp_f, outlet_temp_f, indexing="ij")
+    cap, pwr = PerformanceMap.from_model_name(model_name).get_capacity_and_power_arrays(oat, outlet, inlet)
+    if pwr is None:
+        pwr = np.full(cap.shape, np.nan)
+    return cap, pwr
+
+
+def _node_index(axis: np.ndarray, value: float, name: str) -> int:
+    """Index of ``value`` on a grid axis; ValueError if it is not a node."""
+    i = int(np.searchsorted(axis, value))
+    for k in (i, i - 1):
+        if 0 <= k < axis.size and np.isclose(axis[k], value, rtol=0.0, atol=1e-9):
+            return k
+    raise ValueError(f"{name}={value} is not on the table grid.")
@@ -55,7 +55,7 @@ class Controls:
         self.off_trigger_t_f  = off_trigger_t_f
         self.outlet_temp_f    = outlet_temp_f
 
-    def should_turn_on(self, storage_tank: StorageTank) -> bool:
+    def should_turn_on(self, storage_tank: StorageTank, sensor_temp_f: float | None = None) -> bool:
         """
         Return True if the heater should turn on given the current tank state.
 
@@ -65,15 +65,20 @@ class Controls:
         Parameters
         ----------
         storage_tank : StorageTank
+        sensor_temp_f : float | None
+            Temperature at ``on_sensor_fract`` already read from the tank
+            (e.g. by a batched ``get_temperatures_at_fractions`` call).
+            None reads it from ``storage_tank``.
 
         Returns
         -------
         bool
         """
-        temp = storage_tank.get_temperature_at_fraction(self.on_sensor_fract)
-        return temp < self.on_trigger_t_f
+        if sensor_temp_f is None:
+            sensor_temp_f = storage_tank.get_temperature_at_fraction(self.on_sensor_fract)
+        return sensor_temp_f < self.on_trigger_t_f
 
-    def should_turn_off(self, storage_tank: StorageTank) -> bool:
+    def should_turn_off(self, storage_tank: StorageTank, sensor_temp_f: float | None = None) -> bool:
         """
         Return True if the heater should turn off given the current tank state.
 
@@ -83,10 +88,14 @@ class Controls:
         Parameters
         ----------
         storage_tank : StorageTank
+        sensor_temp_f : float | None
+            Temperature at ``off_sensor_fract`` already read from the tank.
+            None reads it from ``storage_tank``.
 
         Returns
         -------
         bool
         """
-        temp = storage_tank.get_temperature_at_fraction(self.off_sensor_fract)
-        return temp >= self.off_trigger_t_f
+        if sensor_temp_f is None:
+            sensor_temp_f = storage_tank.get_temperature_at_fraction(self.off_sensor_fract)
+        return sensor_temp_f >= self.off_trigger_t_f
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Callable
+
+import numpy as np
+
+
+class GridLookupTable:
+    """
+    Two-output lookup table on a regular grid, queried by multilinear
+    interpolation in constant time.
+
+    Used as the compiled-grid mode of ``PklPerformanceMap``: the map's
+    in-range lookup (interpolation plus nearest-grid-point recovery) is
+    sampled once onto evenly spaced nodes, and queries then only touch the
+    ``2**ndim`` nodes around them.
+
+    Node values may be NaN where the sampled function could not produce a
+    result; any query whose interpolation weights touch such a node returns
+    NaN, leaving the caller's last-resort policy to take over. Nodes with a
+    zero weight are skipped, so queries that land exactly on valid nodes or
+    cell faces are unaffected by NaN neighbours.
+    """
+
+    def __init__(
+        self,
+        lo: tuple[float, ...],
+        step: tuple[float, ...],
+        values: np.ndarray,
+        max_error: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        lo : tuple[float, ...]
+            Coordinate of the first node along each axis.
+        step : tuple[float, ...]
+            Node spacing along each axis (> 0).
+        values : np.ndarray
+            Node values, shape ``(*grid_shape, 2)``; each axis needs at least
+            two nodes.
+        max_error : dict[str, float] | None
+            Sampling error report produced by ``sample`` (see there).
+        """
+        self.lo        = tuple(float(x) for x in lo)
+        self.step      = tuple(float(x) for x in step)
+        self.values    = values
+        self.shape     = values.shape[:-1]
+        self.ndim      = len(self.shape)
+        self.hi        = tuple(l + s * (n - 1) for l, s, n in zip(self.lo, self.step, self.shape))
+        self.max_error = max_error or {}
+
+        # Flat node list and strides for the allocation-light scalar path
+        self._flat     = values.reshape(-1, 2).tolist()
+        self._strides  = tuple(int(np.prod(self.shape[k + 1:])) for k in range(self.ndim))
+        self._corners  = tuple(itertools.product((0, 1), repeat=self.ndim))
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def sample(
+        cls,
+        func: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
+        lo: tuple[float, ...],
+        hi: tuple[float, ...],
+        resolution: tuple[float, ...],
+    ) -> GridLookupTable:
+        """
+        Sample ``func`` onto a regular grid spanning ``[lo, hi]``.
+
+        Every axis gets ``ceil((hi - lo) / resolution) + 1`` nodes (at least
+        two), evenly spaced so that both ``lo`` and ``hi`` are nodes.
+
+        The interpolation error is then measured at every cell centre, the
+        point furthest from any node, over centres where both the table and
+        ``func`` are finite. ``max_error`` stores, per output, the largest
+        (``"output_max"`` / ``"input_max"``) and 99th-percentile
+        (``"output_p99"`` / ``"input_p99"``) absolute difference, and
+        ``"nan_mismatch"`` counts centres where only one of them is finite.
+        Discontinuities in ``func`` keep the maximum from shrinking with
+        resolution, so the percentile is the better guide for choosing it.
+
+        Parameters
+        ----------
+        func : Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]
+            Maps an ``(n, ndim)`` array of points to two length-``n`` arrays.
+        lo, hi : tuple[float, ...]
+            Grid extent along each axis.
+        resolution : tuple[float, ...]
+            Target node spacing along each axis (> 0).
+        """
+        axes = []
+        for a, b, res in zip(lo, hi, resolution):
+            if res <= 0:
+                raise ValueError("Grid resolution must be positive.")
+            n = max(2, math.ceil((b - a) / res) + 1)
+            axes.append(np.linspace(a, b, n) if b > a else a + np.arange(n, dtype=float))
+        step = tuple(ax[1] - ax[0] for ax in axes)
+
+        nodes  = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(axes))
+        out, inp = func(nodes)
+        values = np.stack((out, inp), axis=-1).reshape(tuple(len(ax) for ax in axes) + (2,))
+        table  = cls(tuple(ax[0] for ax in axes), step, values)
+
+        centres = np.stack(
+            np.meshgrid(*(0.5 * (ax[:-1] + ax[1:]) for ax in axes), indexing="ij"), axis=-1
+        ).reshape(-1, len(axes))
+        ref_out, ref_inp   = func(centres)
+        grid_out, grid_inp = table.lookup_array(centres)
+        ref_ok  = ~(np.isnan(ref_out) | np.isnan(ref_inp))
+        grid_ok = ~(np.isnan(grid_out) | np.isnan(grid_inp))
+        both    = ref_ok & grid_ok
+        err_out = np.abs(grid_out - ref_out)[both]
+        err_inp = np.abs(grid_inp - ref_inp)[both]
+        table.max_error = {
+            "output_max":   float(np.max(err_out, initial=0.0)),
+            "input_max":    float(np.max(err_inp, initial=0.0)),
+            "output_p99":   float(np.percentile(err_out, 99)) if err_out.size else 0.0,
+            "input_p99":    float(np.percentile(err_inp, 99)) if err_inp.size else 0.0,
+            "nan_mismatch": int(np.count_nonzero(ref_ok != grid_ok)),
+        }
+        return table
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def contains(self, coords: tuple[float, ...]) -> bool:
+        """Return True if the point lies inside the grid extent."""
+        for x, a, b in zip(coords, self.lo, self.hi):
+            if not a <= x <= b:
+                return False
+        return True
+
+    def contains_array(self, points: np.ndarray) -> np.ndarray:
+        """Vectorised ``contains`` for an ``(n, ndim)`` array of points."""
+        return np.all((points >= self.lo) & (points <= self.hi), axis=1)
+
+    def lookup(self, coords: tuple[float, ...]) -> tuple[float, float]:
+        """
+        Interpolate both outputs at one point inside the grid extent.
+        Returns NaNs if a contributing node is NaN.
+        """
+        base, frac = 0, []
+        for x, a, s, n, stride in zip(coords, self.lo, self.step, self.shape, self._strides):
+            t = (x - a) / s
+            i = min(int(t), n - 2)
+            base += i * stride
+            frac.append(t - i)
+
+        out = inp = 0.0
+        for corner in self._corners:
+            w, offset = 1.0, base
+            for c, f, stride in zip(corner, frac, self._strides):
+                if c:
+                    w *= f
+                    offset += stride
+                else:
+                    w *= 1.0 - f
+            if w != 0.0:
+                v_out, v_inp = self._flat[offset]
+                out += w * v_out
+                inp += w * v_inp
+        return out, inp
+
+    def lookup_array(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorised ``lookup`` for an ``(n, ndim)`` array of points inside the grid."""
+        t    = (points - np.asarray(self.lo)) / np.asarray(self.step)
+        idx  = np.minimum(t.astype(int), np.asarray(self.shape) - 2)
+        frac = t - idx
+        flat = self.values.reshape(-1, 2)
+        base = idx @ np.asarray(self._strides)
+
+        out = np.zeros(len(points))
+        inp = np.zeros(len(points))
+        for corner in self._corners:
+            w = np.ones(len(points))
+            offset = base.copy()
+            for k, c in enumerate(corner):
+                if c:
+                    w *= frac[:, k]
+                    offset += self._strides[k]
+                else:
+                    w *= 1.0 - frac[:, k]
+            v    = flat[offset]
+            used = w != 0.0
+            out += np.where(used, w * v[:, 0], 0.0)
+            inp += np.where(used, w * v[:, 1], 0.0)
+        return out, inp
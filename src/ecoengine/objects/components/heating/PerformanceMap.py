@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import os
 import pickle
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+
+import numpy as np
+from scipy.interpolate import LinearNDInterpolator
 
 from ecoengine.constants.constants import _W_TO_KBTUH
+from ecoengine.objects.components.heating.GridLookupTable import GridLookupTable
+from ecoengine.objects.components.heating.PerformanceMapCache import PerformanceMapCache
+from ecoengine.objects.components.heating.TriangulationInterpolator import TriangulationInterpolator
 
 # Absolute path to the performance maps data directory
 _DATA_DIR = os.path.normpath(
@@ -15,6 +24,40 @@ _DATA_DIR = os.path.normpath(
     )
 )
 
+_PKLS_DIR = os.path.join(_DATA_DIR, "pkls")
+
+
+def _default_compiled_dir() -> str:
+    """
+    Per-user directory the bundled pkl maps are compiled to on first use.
+
+    ``$ECOENGINE_CACHE_DIR`` if set, else ``ecoengine`` under
+    ``$XDG_CACHE_HOME`` (``~/.cache``). A subdirectory keyed on the bundled
+    pkl files keeps installs with different maps from sharing a store.
+    """
+    base = os.environ.get("ECOENGINE_CACHE_DIR")
+    if not base:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(cache_home, "ecoengine")
+    key = hashlib.sha1()
+    for name in sorted(os.listdir(_PKLS_DIR)):
+        if name.endswith(".pkl"):
+            key.update(f"{name}:{os.path.getsize(os.path.join(_PKLS_DIR, name))};".encode())
+    return os.path.join(base, "compiled_maps", key.hexdigest()[:12])
+
+
+_COMPILED_DIR = _default_compiled_dir()
+
+# Compiled map arrays, grouped by on-disk dtype. Each per-model array is stored
+# flattened inside ``maps_<dtype>.npy`` and located through ``index.json``.
+_COMPILED_FIELDS = {
+    "float64": ("points", "values", "equations", "transform", "min_bound", "max_bound"),
+    "int32":   ("simplices", "neighbors"),
+}
+
+# Default memory budget of the shared map-data cache (PerformanceMap.map_cache)
+_MAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Model names whose pkl interpolator takes only (inlet, OAT) — no outlet dimension
 _TWO_INPUT_PKL_NAMES = frozenset({
     "MODELS_SANCO2_C_SP",
@@ -32,6 +75,394 @@ def _load_maps_json() -> dict:
     return _load_maps_json._cache
 
 
+def _merge_interpolators(
+    output_interp: LinearNDInterpolator,
+    input_interp: LinearNDInterpolator,
+) -> LinearNDInterpolator:
+    """
+    Combine a capacity and a power-input interpolator built on the same points
+    into one interpolator whose values are ``[output_kw, input_kw]``.
+
+    The capacity interpolator's Delaunay triangulation is reused as-is, so the
+    merged interpolator answers both outputs with a single simplex search.
+
+    Raises
+    ------
+    ValueError
+        If the two interpolators were not built on the same data points.
+    """
+    if not np.array_equal(output_interp.points, input_interp.points):
+        raise ValueError(
+            "Capacity and power interpolators do not share the same data points "
+            "and cannot be merged."
+        )
+    n_pts  = len(output_interp.points)
+    values = np.column_stack((
+        np.asarray(output_interp.values, dtype=float).reshape(n_pts, -1)[:, 0],
+        np.asarray(input_interp.values,  dtype=float).reshape(n_pts, -1)[:, 0],
+    ))
+    return LinearNDInterpolator(output_interp.tri, values)
+
+
+def _load_pkl_interpolator(prefix: str, pkls_dir: str = _PKLS_DIR) -> LinearNDInterpolator:
+    """
+    Return the merged ``[output_kw, input_kw]`` interpolator for a pkl model.
+
+    Loads ``{prefix}_interpolator.pkl`` when it has been produced by
+    ``convert_pkl_interpolators``; otherwise merges the separate
+    ``_capacity_interpolator.pkl`` / ``_power_in_interpolator.pkl`` files in memory.
+    """
+    merged_path = os.path.join(pkls_dir, f"{prefix}_interpolator.pkl")
+    if os.path.exists(merged_path):
+        with open(merged_path, "rb") as f:
+            return pickle.load(f)
+    with open(os.path.join(pkls_dir, f"{prefix}_capacity_interpolator.pkl"), "rb") as f:
+        output_interp = pickle.load(f)
+    with open(os.path.join(pkls_dir, f"{prefix}_power_in_interpolator.pkl"), "rb") as f:
+        input_interp  = pickle.load(f)
+    return _merge_interpolators(output_interp, input_interp)
+
+
+def convert_pkl_interpolators(
+    pkls_dir: str = _PKLS_DIR,
+    remove_originals: bool = False,
+) -> list[str]:
+    """
+    Write a merged ``{prefix}_interpolator.pkl`` for every pkl model in ``pkls_dir``.
+
+    Each merged file holds one triangulation with a 2-column value array
+    (capacity, power input), replacing the pair of single-output files.
+
+    Parameters
+    ----------
+    pkls_dir : str
+        Directory holding the ``{prefix}_capacity_interpolator.pkl`` /
+        ``{prefix}_power_in_interpolator.pkl`` pairs. Defaults to the
+        package's bundled performance maps.
+    remove_originals : bool
+        If True, delete each pair of single-output files after its merged
+        file has been written.
+
+    Returns
+    -------
+    list[str]
+        The pkl prefixes that were converted.
+    """
+    suffix   = "_capacity_interpolator.pkl"
+    prefixes = sorted(f[: -len(suffix)] for f in os.listdir(pkls_dir) if f.endswith(suffix))
+    for prefix in prefixes:
+        merged = _load_pkl_interpolator(prefix, pkls_dir)
+        with open(os.path.join(pkls_dir, f"{prefix}_interpolator.pkl"), "wb") as f:
+            pickle.dump(merged, f, protocol=pickle.HIGHEST_PROTOCOL)
+        if remove_originals:
+            os.remove(os.path.join(pkls_dir, f"{prefix}_capacity_interpolator.pkl"))
+            os.remove(os.path.join(pkls_dir, f"{prefix}_power_in_interpolator.pkl"))
+    return prefixes
+
+
+def _to_builtin(obj: object) -> object:
+    """Recursively convert numpy scalars / arrays in a bounds structure to plain Python."""
+    if isinstance(obj, (list, tuple, np.ndarray)):
+        return [_to_builtin(x) for x in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def compile_performance_maps(
+    pkls_dir: str = _PKLS_DIR,
+    out_dir: str = _COMPILED_DIR,
+) -> list[str]:
+    """
+    Convert every pkl model in ``pkls_dir`` to the compiled, pickle-free format.
+
+    The compiled format is three files in ``out_dir``:
+
+    * ``maps_float64.npy`` / ``maps_int32.npy`` — the points, ``[output_kw,
+      input_kw]`` values and Delaunay arrays (simplices, neighbors, equations,
+      barycentric transforms, ...) of every model, flattened end to end.
+    * ``index.json`` — per-model offsets and shapes into those arrays, the
+      paraboloid parameters of the triangulation and the bounds structure
+      otherwise read from ``{prefix}_bounds.pkl``.
+
+    Both ``.npy`` files are opened with ``numpy.load(mmap_mode='r')`` at run
+    time, so processes loading maps share the same read-only pages. The files
+    are generated, not shipped: the default per-user directory is compiled
+    on first use (see ``_load_compiled_store``). Each file is written to a
+    temporary name and moved into place, ``index.json`` last, so a reader
+    never sees a partly written store; temporary files are removed if a
+    write fails.
+
+    Parameters
+    ----------
+    pkls_dir : str
+        Directory holding the ``{prefix}_bounds.pkl`` files and their
+        interpolator pkls. Defaults to the package's bundled performance maps.
+    out_dir : str
+        Directory the compiled files are written to (created if missing).
+        Defaults to the per-user cache directory (``_default_compiled_dir``).
+
+    Returns
+    -------
+    list[str]
+        The pkl prefixes that were compiled.
+    """
+    suffix   = "_bounds.pkl"
+    prefixes = sorted(f[: -len(suffix)] for f in os.listdir(pkls_dir) if f.endswith(suffix))
+
+    chunks = {dtype: [] for dtype in _COMPILED_FIELDS}
+    sizes  = {dtype: 0 for dtype in _COMPILED_FIELDS}
+    index  = {}
+    for prefix in prefixes:
+        interp = _load_pkl_interpolator(prefix, pkls_dir)
+        with open(os.path.join(pkls_dir, f"{prefix}{suffix}"), "rb") as f:
+            bounds = pickle.load(f)
+
+        tri    = interp.tri
+        arrays = {
+            "points":    tri.points,
+            "values":    interp.values,
+            "equations": tri.equations,
+            "transform": tri.transform,
+            "min_bound": tri.min_bound,
+            "max_bound": tri.max_bound,
+            "simplices": tri.simplices,
+            "neighbors": tri.neighbors,
+        }
+        layout = {}
+        for dtype, fields in _COMPILED_FIELDS.items():
+            for field in fields:
+                arr = np.ascontiguousarray(arrays[field], dtype=dtype)
+                layout[field] = [sizes[dtype], list(arr.shape)]
+                chunks[dtype].append(arr.ravel())
+                sizes[dtype] += arr.size
+
+        index[prefix] = {
+            "arrays":           layout,
+            "paraboloid_scale": float(tri.paraboloid_scale),
+            "paraboloid_shift": float(tri.paraboloid_shift),
+            "bounds":           _to_builtin(bounds),
+        }
+
+    os.makedirs(out_dir, exist_ok=True)
+    tmp_suffix = f".{os.getpid()}.tmp"
+    tmp_paths  = []
+    try:
+        for dtype, parts in chunks.items():
+            flat = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+            path = os.path.join(out_dir, f"maps_{dtype}.npy")
+            tmp_paths.append(path + tmp_suffix)
+            with open(path + tmp_suffix, "wb") as f:
+                np.save(f, flat)
+            os.replace(path + tmp_suffix, path)
+        path = os.path.join(out_dir, "index.json")
+        tmp_paths.append(path + tmp_suffix)
+        with open(path + tmp_suffix, "w") as f:
+            json.dump(index, f)
+        os.replace(path + tmp_suffix, path)
+    finally:
+        for tmp_path in tmp_paths:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return prefixes
+
+
+def _load_compiled_store(compiled_dir: str = _COMPILED_DIR) -> tuple[dict, dict] | None:
+    """
+    Return ``(index, arrays)`` for a compiled map directory, or None if it has
+    not been compiled. ``arrays`` maps dtype name to a read-only memory map.
+    Cached per directory after the first load.
+
+    The default directory is compiled from the bundled pkls the first time it
+    is needed. If that fails (e.g. the directory is not writable) the failure
+    is cached too, so the pkls are used directly from then on rather than
+    recompiling on every miss.
+    """
+    if not hasattr(_load_compiled_store, "_cache"):
+        _load_compiled_store._cache = {}
+    cache = _load_compiled_store._cache
+    if compiled_dir not in cache:
+        index_path = os.path.join(compiled_dir, "index.json")
+        if not os.path.exists(index_path):
+            if compiled_dir != _COMPILED_DIR:
+                return None
+            try:
+                compile_performance_maps(out_dir=compiled_dir)
+            except OSError:
+                cache[compiled_dir] = None
+                return None
+        with open(index_path) as f:
+            index = json.load(f)
+        arrays = {
+            dtype: np.load(os.path.join(compiled_dir, f"maps_{dtype}.npy"), mmap_mode="r")
+            for dtype in _COMPILED_FIELDS
+        }
+        cache[compiled_dir] = (index, arrays)
+    return cache[compiled_dir]
+
+
+def _load_compiled_map(
+    prefix: str,
+    compiled_dir: str = _COMPILED_DIR,
+) -> tuple[TriangulationInterpolator, list] | None:
+    """
+    Return ``(interpolator, bounds)`` for a pkl model from the compiled store,
+    or None if the model has not been compiled.
+
+    The interpolator reads the triangulation straight from the memory-mapped
+    arrays, so nothing is copied or re-triangulated, and its queries give
+    results identical to the original pkl interpolator.
+    """
+    store = _load_compiled_store(compiled_dir)
+    if store is None or prefix not in store[0]:
+        return None
+    index, arrays = store
+    entry = index[prefix]
+
+    views = {}
+    for dtype, fields in _COMPILED_FIELDS.items():
+        for field in fields:
+            offset, shape = entry["arrays"][field]
+            size = int(np.prod(shape))
+            views[field] = arrays[dtype][offset : offset + size].reshape(shape)
+
+    interp = TriangulationInterpolator(
+        views["points"], views["values"], views["simplices"], views["neighbors"],
+        views["equations"], views["transform"], views["min_bound"], views["max_bound"],
+        entry["paraboloid_scale"], entry["paraboloid_shift"],
+    )
+    return interp, entry["bounds"]
+
+
+def _broadcast_conditions(
+    oat_f: float | np.ndarray,
+    outlet_temp_f: float | np.ndarray,
+    inlet_temp_f: float | np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, tuple[int, ...]]:
+    """
+    Broadcast batch query inputs against each other and flatten them.
+
+    Returns ``(oat, outlet, inlet, shape)`` where each array is a 1-D float
+    array and ``shape`` is the broadcast shape the results are reshaped to.
+    ``inlet`` stays None when no inlet temperatures were supplied.
+    """
+    arrays = [np.asarray(oat_f, dtype=float), np.asarray(outlet_temp_f, dtype=float)]
+    if inlet_temp_f is not None:
+        arrays.append(np.asarray(inlet_temp_f, dtype=float))
+    arrays = np.broadcast_arrays(*arrays)
+    shape  = arrays[0].shape
+    flat   = [a.ravel() for a in arrays]
+    inlet  = flat[2] if inlet_temp_f is not None else None
+    return flat[0], flat[1], inlet, shape
+
+
+def _is_memory_mapped(arr: np.ndarray) -> bool:
+    """Return True if ``arr`` is, or is a view of, an ``np.memmap``."""
+    while isinstance(arr, np.ndarray):
+        if isinstance(arr, np.memmap):
+            return True
+        arr = arr.base
+    return False
+
+
+def _interpolator_nbytes(interp: LinearNDInterpolator | TriangulationInterpolator) -> int:
+    """
+    Memory an interpolator and its triangulation hold [bytes].
+
+    Arrays memory-mapped from the compiled store are not counted: their pages
+    live in the shared, reclaimable page cache, and dropping the interpolator
+    from ``map_cache`` would not free them.
+    """
+    if isinstance(interp, TriangulationInterpolator):
+        arrays = (interp.points, interp.values, interp.simplices, interp.neighbors,
+                  interp.equations, interp.transform)
+    else:
+        tri    = interp.tri
+        arrays = (interp.points, interp.values, tri.simplices, tri.neighbors,
+                  tri.equations, tri.transform)
+    return sum(a.nbytes for a in arrays if not _is_memory_mapped(a))
+
+
+
+def _load_map_data(model_name: str) -> tuple[tuple[type, MappingProxyType], int]:
+    """
+    Load the model-level (instance-independent) data behind a PerformanceMap.
+
+    Returns ``((map_cls, shared_kwargs), nbytes)`` as expected by
+    ``PerformanceMapCache.get``: ``map_cls(**shared_kwargs, ...)`` plus the
+    per-instance parameters builds the map, and ``nbytes`` is the entry's
+    size for the cache's memory budget.
+
+    Raises
+    ------
+    ValueError
+        If ``model_name`` is not found in the registry, or the registry
+        entry has neither pkl nor perfmap data.
+    """
+    registry = _load_maps_json()
+    if model_name not in registry:
+        raise ValueError(
+            f"Model '{model_name}' not found in the performance map registry. "
+            "Check maps.json for valid model names."
+        )
+
+    entry = registry[model_name]
+    secondary_hx = bool(entry.get("secondary_heat_exchanger", False))
+    hx_increase  = float(entry.get("hx_increase", 0.0))
+
+    # Two-input pkl: inlet + OAT only (no outlet dimension)
+    is_two_input_pkl = (
+        model_name in _TWO_INPUT_PKL_NAMES
+        or model_name.endswith("MP")
+        or "Lochinvar" in model_name
+    )
+    is_multipass = model_name.endswith("MP")
+
+    if "pkl_prefix" in entry:
+        prefix   = entry["pkl_prefix"]
+        compiled = _load_compiled_map(prefix)
+        if compiled is not None:
+            interp, bounds = compiled
+        else:
+            interp = _load_pkl_interpolator(prefix)
+            with open(os.path.join(_PKLS_DIR, f"{prefix}_bounds.pkl"), "rb") as f:
+                bounds = pickle.load(f)
+
+        unique_oats           = bounds[0]
+        inTs_and_outTs_by_oat = bounds[1]
+        inlet_min, inlet_max  = bounds[2]
+        default_out_high_kw, default_in_high_kw = bounds[3]
+        default_out_low_kw,  default_in_low_kw  = bounds[4]
+
+        shared = MappingProxyType({
+            "interpolator":          interp,
+            "unique_oats":           unique_oats,
+            "inTs_and_outTs_by_oat": inTs_and_outTs_by_oat,
+            "inlet_min":             inlet_min,
+            "inlet_max":             inlet_max,
+            "default_out_high_kw":   default_out_high_kw,
+            "default_in_high_kw":    default_in_high_kw,
+            "default_out_low_kw":    default_out_low_kw,
+            "default_in_low_kw":     default_in_low_kw,
+            "is_two_input":          is_two_input_pkl,
+            "secondary_hx":          secondary_hx,
+            "hx_increase":           hx_increase,
+        })
+        return (PklPerformanceMap, shared), _interpolator_nbytes(interp)
+
+    if "perfmap" in entry:
+        shared = MappingProxyType({
+            "perfmap":      entry["perfmap"],
+            "is_multipass": is_multipass,
+        })
+        return (HPWHsimPerformanceMap, shared), len(json.dumps(entry["perfmap"]))
+
+    raise ValueError(
+        f"Registry entry for '{model_name}' has neither 'pkl_prefix' nor "
+        "'perfmap' — cannot construct a PerformanceMap."
+    )
+
+
 class PerformanceMap:
     """
     Wraps HPWH performance map data to predict real-world heating capacity and
@@ -44,7 +475,7 @@ class PerformanceMap:
     * ``PerformanceMap.from_model_name(model_name, ...)``
         Loads the appropriate concrete subclass from the equipment model registry:
 
-        - ``PklPerformanceMap``    — pickle-based LinearND interpolator (lab data)
+        - ``PklPerformanceMap``    — LinearND interpolator over lab data (compiled or pkl)
         - ``HPWHsimPerformanceMap``— coefficient-based polynomial (HPWHsim model)
 
     * ``NominalPerformanceMap(nominal_capacity_kbtuh)``
@@ -60,6 +491,9 @@ class PerformanceMap:
       when not provided.
     """
 
+    # Process-wide LRU cache of the model-level map data, keyed by model name
+    map_cache = PerformanceMapCache(max_bytes=_MAP_CACHE_MAX_BYTES)
+
     def __init__(self, map_data: object, model_name: str = "") -> None:
         self.map_data   = map_data
         self.model_name = model_name
@@ -79,8 +513,15 @@ class PerformanceMap:
         """
         Load a PerformanceMap from the equipment model registry by name.
 
-        Returns a ``PklPerformanceMap`` when pickle interpolator files are
+        Returns a ``PklPerformanceMap`` when lab-data interpolator files are
         available for the model, otherwise an ``HPWHsimPerformanceMap``.
+        Lab-data maps are read from the compiled store (see
+        ``compile_performance_maps``; built on first use), else from the pkl
+        files.
+
+        The model-level data is loaded once and kept in ``map_cache``; every
+        returned instance is a lightweight view over it that only adds
+        ``num_units``, ``design_inlet_temp_f`` and ``nominal_capacity_kbtuh``.
 
         Parameters
         ----------
@@ -105,75 +546,13 @@ class PerformanceMap:
             If ``model_name`` is not found in the registry, or the registry
             entry has neither pkl nor perfmap data.
         """
-        registry = _load_maps_json()
-        if model_name not in registry:
-            raise ValueError(
-                f"Model '{model_name}' not found in the performance map registry. "
-                "Check maps.json for valid model names."
-            )
-
-        entry = registry[model_name]
-        secondary_hx = bool(entry.get("secondary_heat_exchanger", False))
-        hx_increase  = float(entry.get("hx_increase", 0.0))
-
-        # Two-input pkl: inlet + OAT only (no outlet dimension)
-        is_two_input_pkl = (
-            model_name in _TWO_INPUT_PKL_NAMES
-            or model_name.endswith("MP")
-            or "Lochinvar" in model_name
-        )
-        is_multipass = model_name.endswith("MP")
-
-        if "pkl_prefix" in entry:
-            prefix   = entry["pkl_prefix"]
-            pkls_dir = os.path.join(_DATA_DIR, "pkls")
-
-            with open(os.path.join(pkls_dir, f"{prefix}_capacity_interpolator.pkl"), "rb") as f:
-                output_interp = pickle.load(f)
-            with open(os.path.join(pkls_dir, f"{prefix}_power_in_interpolator.pkl"), "rb") as f:
-                input_interp  = pickle.load(f)
-            with open(os.path.join(pkls_dir, f"{prefix}_bounds.pkl"), "rb") as f:
-                bounds = pickle.load(f)
-
-            unique_oats           = bounds[0]
-            inTs_and_outTs_by_oat = bounds[1]
-            inlet_min, inlet_max  = bounds[2]
-            default_out_high_kw, default_in_high_kw = bounds[3]
-            default_out_low_kw,  default_in_low_kw  = bounds[4]
-
-            return PklPerformanceMap(
-                model_name            = model_name,
-                output_interpolator   = output_interp,
-                input_interpolator    = input_interp,
-                unique_oats           = unique_oats,
-                inTs_and_outTs_by_oat = inTs_and_outTs_by_oat,
-                inlet_min             = inlet_min,
-                inlet_max             = inlet_max,
-                default_out_high_kw   = default_out_high_kw,
-                default_in_high_kw    = default_in_high_kw,
-                default_out_low_kw    = default_out_low_kw,
-                default_in_low_kw     = default_in_low_kw,
-                num_units             = num_units,
-                is_two_input          = is_two_input_pkl,
-                secondary_hx          = secondary_hx,
-                hx_increase           = hx_increase,
-                nominal_capacity_kbtuh= nominal_capacity_kbtuh,
-                design_inlet_temp_f   = design_inlet_temp_f,
-            )
-
-        if "perfmap" in entry:
-            return HPWHsimPerformanceMap(
-                model_name             = model_name,
-                perfmap                = entry["perfmap"],
-                num_units              = num_units,
-                is_multipass           = is_multipass,
-                nominal_capacity_kbtuh = nominal_capacity_kbtuh,
-                design_inlet_temp_f    = design_inlet_temp_f,
-            )
-
-        raise ValueError(
-            f"Registry entry for '{model_name}' has neither 'pkl_prefix' nor "
-            "'perfmap' — cannot construct a PerformanceMap."
+        map_cls, shared = cls.map_cache.get(model_name, lambda: _load_map_data(model_name))
+        return map_cls(
+            model_name             = model_name,
+            num_units              = num_units,
+            nominal_capacity_kbtuh = nominal_capacity_kbtuh,
+            design_inlet_temp_f    = design_inlet_temp_f,
+            **shared,
         )
 
     # ------------------------------------------------------------------
@@ -205,16 +584,107 @@ class PerformanceMap:
         inlet_temp_f: float | None = None,
     ) -> float | None:
         """Return COP at the given conditions (None if power data is unavailable)."""
-        cap_kbtuh = self.get_capacity_kbtuh(oat_f, outlet_temp_f, inlet_temp_f)
-        pwr_kw    = self.get_power_in_kw(oat_f, outlet_temp_f, inlet_temp_f)
+        cap_kbtuh, pwr_kw = self.get_capacity_and_power(oat_f, outlet_temp_f, inlet_temp_f)
         if cap_kbtuh is None or pwr_kw is None or pwr_kw <= 0:
             return None
         return (cap_kbtuh / _W_TO_KBTUH) / pwr_kw
 
+    def get_capacity_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+    ) -> tuple[float | None, float | None]:
+        """
+        Return ``(capacity_kbtuh, power_in_kw)`` at the given conditions.
+
+        Concrete subclasses override this to answer both from a single
+        lookup; the default simply calls the two scalar queries.
+        """
+        return (
+            self.get_capacity_kbtuh(oat_f, outlet_temp_f, inlet_temp_f),
+            self.get_power_in_kw(oat_f, outlet_temp_f, inlet_temp_f),
+        )
+
     def is_within_operating_bounds(self, oat_f: float) -> bool:
         """Return True if the conditions are within the map's valid operating range."""
         pass
 
+    @property
+    def depends_on_outlet_temp(self) -> bool:
+        """
+        Return False only if results are known to ignore ``outlet_temp_f``.
+
+        Lets callers precompute lookups for heaters whose outlet temperature
+        is simulation state (e.g. a TM heater tracking its tank top).
+        """
+        return True
+
+    # ------------------------------------------------------------------
+    # Batch interface
+    # ------------------------------------------------------------------
+
+    def get_capacity_and_power_arrays(
+        self,
+        oat_f: float | np.ndarray,
+        outlet_temp_f: float | np.ndarray,
+        inlet_temp_f: float | np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Return heating output and power input for arrays of conditions.
+
+        Inputs are broadcast against each other, so any of them may be a
+        scalar.  This generic implementation loops over the scalar
+        interface; concrete subclasses override it with a vectorized path.
+
+        Parameters
+        ----------
+        oat_f : float | np.ndarray
+            Outdoor air temperatures [°F].
+        outlet_temp_f : float | np.ndarray
+            Outlet water temperatures [°F].
+        inlet_temp_f : float | np.ndarray | None
+            Inlet water temperatures [°F].  None uses the map's design inlet.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray | None]
+            ``(capacity_kbtuh, power_in_kw)`` with the broadcast shape of the
+            inputs.  ``power_in_kw`` is None when the map has no power data.
+        """
+        oat, outlet, inlet, shape = _broadcast_conditions(oat_f, outlet_temp_f, inlet_temp_f)
+        cap_kbtuh = np.empty(oat.size)
+        pwr_kw    = np.empty(oat.size)
+        has_power = True
+        for k in range(oat.size):
+            inlet_k = None if inlet is None else float(inlet[k])
+            cap     = self.get_capacity_kbtuh(float(oat[k]), float(outlet[k]), inlet_k)
+            pwr     = self.get_power_in_kw(float(oat[k]), float(outlet[k]), inlet_k)
+            cap_kbtuh[k] = np.nan if cap is None else cap
+            if pwr is None:
+                has_power = False
+            else:
+                pwr_kw[k] = pwr
+        return cap_kbtuh.reshape(shape), (pwr_kw.reshape(shape) if has_power else None)
+
+    def get_capacity_kbtuh_array(
+        self,
+        oat_f: float | np.ndarray,
+        outlet_temp_f: float | np.ndarray,
+        inlet_temp_f: float | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return heating output [kBTU/hr] for arrays of conditions."""
+        return self.get_capacity_and_power_arrays(oat_f, outlet_temp_f, inlet_temp_f)[0]
+
+    def get_power_in_kw_array(
+        self,
+        oat_f: float | np.ndarray,
+        outlet_temp_f: float | np.ndarray,
+        inlet_temp_f: float | np.ndarray | None = None,
+    ) -> np.ndarray | None:
+        """Return electrical power input [kW] for arrays of conditions."""
+        return self.get_capacity_and_power_arrays(oat_f, outlet_temp_f, inlet_temp_f)[1]
+
 
 # ---------------------------------------------------------------------------
 # NominalPerformanceMap — constant-output placeholder (do not change)
@@ -256,6 +726,10 @@ class PklPerformanceMap(PerformanceMap):
     """
     Performance map backed by scipy ``LinearNDInterpolator`` pickle files.
 
+    Capacity and power input share one triangulation: the interpolator's
+    values are ``[output_kw, input_kw]`` per unit, so a single simplex search
+    answers both.
+
     Single-pass models interpolate over (inlet_temp, outlet_temp, OAT).
     Multipass and certain named models use a two-input grid (inlet_temp, OAT).
 
@@ -266,13 +740,26 @@ class PklPerformanceMap(PerformanceMap):
       ``nominal_capacity_kbtuh / num_units`` (COP = 1).
     * NaN in range   → attempt to snap inlet/outlet to nearest valid grid
       point (``_force_closest``); if still NaN, assume COP = 1.5.
+
+    Snapping uses bisection over the (ascending) bounds lists instead of
+    linear scans, and ``fallback_counts`` records how often each fallback
+    (``electric_resistance``, ``force_closest``, ``last_resort``) was taken.
+
+    Compiled-grid mode
+    ------------------
+    ``use_grid(resolution_f)`` pre-samples the in-range lookup (interpolation
+    plus ``_force_closest`` recovery) onto a regular grid over the map's
+    (inlet, outlet, OAT) extent — (inlet, OAT) for two-input maps — and then
+    answers queries inside that extent by multilinear interpolation in
+    constant time. Queries outside the extent, and the OAT ≥ oat_max / ER
+    cases, still use the exact path. The sampled grid is model-level data
+    and is shared through ``PerformanceMap.map_cache``.
     """
 
     def __init__(
         self,
         model_name: str,
-        output_interpolator: object,
-        input_interpolator: object,
+        interpolator: LinearNDInterpolator,
         unique_oats: list[float],
         inTs_and_outTs_by_oat: list[list[tuple[float, list[float]]]],
         inlet_min: float,
@@ -289,8 +776,7 @@ class PklPerformanceMap(PerformanceMap):
         design_inlet_temp_f: float,
     ) -> None:
         super().__init__(map_data=None, model_name=model_name)
-        self._output_interp      = output_interpolator
-        self._input_interp       = input_interpolator
+        self._interp             = interpolator
         self._unique_oats        = unique_oats
         self._inTs_outTs         = inTs_and_outTs_by_oat
         self._inlet_min          = inlet_min
@@ -305,6 +791,24 @@ class PklPerformanceMap(PerformanceMap):
         self._hx_increase        = hx_increase
         self._nominal_kbtuh      = nominal_capacity_kbtuh
         self._design_inlet_f     = design_inlet_temp_f
+        self._grid: GridLookupTable | None = None
+
+        # Sorted snapping tables for _force_closest (bounds lists ascend)
+        n_oat   = len(unique_oats)
+        n_in    = max(len(row) for row in inTs_and_outTs_by_oat)
+        n_out   = max(len(outs) for row in inTs_and_outTs_by_oat for _, outs in row)
+        self._inlet_ts     = [[t_in for t_in, _ in row] for row in inTs_and_outTs_by_oat]
+        self._oats_arr     = np.asarray(unique_oats, dtype=float)
+        self._inlet_counts = np.array([len(row) for row in inTs_and_outTs_by_oat])
+        self._inlet_grid   = np.full((n_oat, n_in), np.inf)
+        self._outlet_grid  = np.full((n_oat, n_in, n_out), np.nan)
+        for i, row in enumerate(inTs_and_outTs_by_oat):
+            for j, (t_in, outs) in enumerate(row):
+                self._inlet_grid[i, j] = t_in
+                self._outlet_grid[i, j, : len(outs)] = outs
+
+        # How often each out-of-map fallback has been taken by this instance
+        self.fallback_counts = {"electric_resistance": 0, "force_closest": 0, "last_resort": 0}
 
     @property
     def oat_min(self) -> float:
@@ -333,48 +837,48 @@ class PklPerformanceMap(PerformanceMap):
     def _raw_query(
         self, inlet_t: float, outlet_t: float, oat_f: float
     ) -> tuple[float, float]:
-        """Call the interpolators. Returns (output_kw, input_kw) per unit."""
+        """Call the interpolator. Returns (output_kw, input_kw) per unit."""
         if self._is_two_input:
             arr = [[inlet_t, oat_f]]
         else:
             arr = [[inlet_t, outlet_t, oat_f]]
-        return (
-            float(self._output_interp(arr)[0][0]),
-            float(self._input_interp(arr)[0][0]),
-        )
+        out_kw, inp_kw = self._interp(arr)[0]
+        return float(out_kw), float(inp_kw)
 
     def _idx_nearest_oat(self, oat_f: float) -> int:
-        best, idx = abs(self._unique_oats[0] - oat_f), 0
-        for i in range(1, len(self._unique_oats)):
-            d = abs(self._unique_oats[i] - oat_f)
-            if d < best:
-                best, idx = d, i
-        return idx
+        """Index of the nearest map OAT (the lower one on ties)."""
+        oats = self._unique_oats
+        pos  = bisect_left(oats, oat_f)
+        if pos == 0:
+            return 0
+        if pos == len(oats):
+            return pos - 1
+        return pos if abs(oats[pos] - oat_f) < abs(oats[pos - 1] - oat_f) else pos - 1
 
     def _idx_nearest_inlet(self, oat_idx: int, inlet_t: float) -> int:
         """
         Find the index of the nearest available inlet temp that is >= inlet_t.
-        Returns -1 (last element) when none qualifies.
+        Returns -1 (last element) when none qualifies, or when the last
+        element itself is the nearest one.
         """
-        entries = self._inTs_outTs[oat_idx]
-        best    = abs(entries[-1][0] - inlet_t)
-        closest = -1
-        for i, (t_in, _) in enumerate(entries):
-            d = abs(t_in - inlet_t)
-            if d < best and t_in >= inlet_t:
-                best, closest = d, i
-        return closest
+        inlets = self._inlet_ts[oat_idx]
+        pos    = bisect_left(inlets, inlet_t)
+        if pos < len(inlets) and abs(inlets[pos] - inlet_t) < abs(inlets[-1] - inlet_t):
+            return pos
+        return -1
 
     def _nearest_outlet(self, oat_idx: int, inlet_idx: int, outlet_t: float) -> float:
         """Return the outlet temp in the bounds grid nearest to outlet_t."""
         outlets = self._inTs_outTs[oat_idx][inlet_idx][1]
-        best    = abs(self._unique_oats[0] - outlet_t)   # mirrors original init
-        best_i  = 0
-        for i, o in enumerate(outlets):
-            d = abs(o - outlet_t)
-            if d < best:
-                best, best_i = d, i
-        return outlets[best_i]
+        pos     = bisect_left(outlets, outlet_t)
+        best_i  = min(pos, len(outlets) - 1)
+        if pos > 0 and abs(outlets[pos - 1] - outlet_t) <= abs(outlets[best_i] - outlet_t):
+            best_i = pos - 1
+        # Mirrors original init: the first outlet is kept unless a candidate
+        # beats the distance between outlet_t and the lowest map OAT.
+        if abs(outlets[best_i] - outlet_t) < abs(self._unique_oats[0] - outlet_t):
+            return outlets[best_i]
+        return outlets[0]
 
     def _force_closest(
         self, inlet_t: float, outlet_t: float, oat_f: float
@@ -434,6 +938,17 @@ class PklPerformanceMap(PerformanceMap):
         if oat_f >= self.oat_max:
             return self._default_out_high_kw, self._default_in_high_kw
 
+        # Compiled grid: in-range lookup with the fallback policy baked in
+        if self._grid is not None:
+            coords = (inlet_t, oat_f) if self._is_two_input else (inlet_t, outlet_t, oat_f)
+            if self._grid.contains(coords):
+                out_kw, inp_kw = self._grid.lookup(coords)
+                if not (math.isnan(out_kw) or math.isnan(inp_kw)):
+                    return out_kw, inp_kw
+                self.fallback_counts["last_resort"] += 1
+                er = self._er_per_unit_kw()
+                return er, er / 1.5
+
         # Normal interpolation
         out_kw, inp_kw = self._raw_query(inlet_t, outlet_t, oat_f)
         if not (math.isnan(out_kw) or math.isnan(inp_kw)):
@@ -441,18 +956,250 @@ class PklPerformanceMap(PerformanceMap):
 
         # OAT below map minimum → Electric Resistance fallback (COP=1)
         if oat_f < self.oat_min:
+            self.fallback_counts["electric_resistance"] += 1
             er = self._er_per_unit_kw()
             return er, er
 
         # OAT in-range NaN → try snapping to nearest valid grid point
+        self.fallback_counts["force_closest"] += 1
         result = self._force_closest(inlet_t, outlet_t, oat_f)
         if result is not None:
             return result
 
         # Last resort: assume COP = 1.5
+        self.fallback_counts["last_resort"] += 1
         er  = self._er_per_unit_kw()
         return er, er / 1.5
 
+    # ------------------------------------------------------------------
+    # Internal helpers — batch path
+    # ------------------------------------------------------------------
+
+    def _resolve_temps_array(
+        self, outlet: np.ndarray, inlet: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Array counterpart of ``_resolve_temps``; returns (inlet, outlet)."""
+        if inlet is None:
+            inlet = np.full(outlet.shape, float(self._design_inlet_f))
+        if self._secondary_hx:
+            inlet  = inlet + self._hx_increase
+            outlet = outlet + self._hx_increase
+        return np.minimum(inlet, self._inlet_max), outlet
+
+    def _raw_query_array(
+        self, inlet_t: np.ndarray, outlet_t: np.ndarray, oat_f: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Call the interpolator once on all points. Returns per-unit kW arrays."""
+        if oat_f.size == 0:
+            return np.empty(0), np.empty(0)
+        if self._is_two_input:
+            pts = np.column_stack((inlet_t, oat_f))
+        else:
+            pts = np.column_stack((inlet_t, outlet_t, oat_f))
+        values = self._interp(pts)
+        return values[:, 0], values[:, 1]
+
+    def _force_closest_array(
+        self, inlet_t: np.ndarray, outlet_t: np.ndarray, oat_f: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array counterpart of ``_force_closest``.
+
+        Grid snapping is resolved for all points at once from the padded
+        snapping tables, then each snapping stage is evaluated with a single
+        interpolator call.  Points that cannot be recovered are returned as NaN.
+        """
+        n = oat_f.size
+
+        # Nearest map OAT (lower one on ties)
+        oats    = self._oats_arr
+        pos     = np.searchsorted(oats, oat_f)
+        lo      = np.clip(pos - 1, 0, oats.size - 1)
+        hi      = np.minimum(pos, oats.size - 1)
+        oat_idx = np.where(np.abs(oats[hi] - oat_f) < np.abs(oats[lo] - oat_f), hi, lo)
+
+        # Nearest inlet >= inlet_t, else the last one (rows padded with +inf)
+        inlets    = self._inlet_grid[oat_idx]
+        last      = self._inlet_counts[oat_idx] - 1
+        pos       = np.sum(inlets < inlet_t[:, None], axis=1)
+        cand      = np.minimum(pos, last)
+        take      = (pos <= last) & (
+            np.abs(inlets[np.arange(n), cand] - inlet_t)
+            < np.abs(inlets[np.arange(n), last] - inlet_t)
+        )
+        inlet_idx     = np.where(take, cand, last)
+        snapped_oat   = oats[oat_idx]
+        snapped_inlet = inlets[np.arange(n), inlet_idx]
+
+        out_kw, inp_kw = self._raw_query_array(snapped_inlet, outlet_t, snapped_oat)
+
+        # Try snapping outlet as well where the first stage is still NaN
+        retry = np.flatnonzero(np.isnan(out_kw) | np.isnan(inp_kw))
+        if retry.size:
+            outlets = self._outlet_grid[oat_idx[retry], inlet_idx[retry]]
+            dist    = np.abs(outlets - outlet_t[retry, None])
+            best    = np.argmin(np.where(np.isnan(dist), np.inf, dist), axis=1)
+            rows    = np.arange(retry.size)
+            keep    = dist[rows, best] < np.abs(oats[0] - outlet_t[retry])
+            snapped_outlet = np.where(keep, outlets[rows, best], outlets[:, 0])
+            s_inlet = snapped_inlet[retry]
+            out_t   = outlet_t[retry]
+            out_r, inp_r = self._raw_query_array(s_inlet, snapped_outlet, snapped_oat[retry])
+            adjust = (snapped_outlet < out_t) & (out_t > s_inlet) & ~np.isnan(out_r)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Proportional capacity adjustment for lower outlet temperature
+                adj = np.where(
+                    adjust,
+                    out_r * ((out_t - s_inlet) - (snapped_outlet - s_inlet)) / (out_t - s_inlet),
+                    0.0,
+                )
+            out_kw[retry] = out_r + adj
+            inp_kw[retry] = inp_r + adj
+        return out_kw, inp_kw
+
+    def _get_per_unit_kw_array(
+        self, oat_f: np.ndarray, inlet_t: np.ndarray, outlet_t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array counterpart of ``_get_per_unit_kw``. The out-of-bounds cases are
+        applied as masks in the same order as the scalar lookup.
+        """
+        out_kw = np.empty(oat_f.size)
+        inp_kw = np.empty(oat_f.size)
+
+        # OAT at or above map maximum → use default high-OAT values
+        high = oat_f >= self.oat_max
+        out_kw[high] = self._default_out_high_kw
+        inp_kw[high] = self._default_in_high_kw
+
+        rest = np.flatnonzero(~high)
+        er   = self._er_per_unit_kw()
+
+        # Compiled grid: in-range lookup with the fallback policy baked in
+        if self._grid is not None:
+            pts     = self._grid_points(inlet_t[rest], outlet_t[rest], oat_f[rest])
+            in_grid = self._grid.contains_array(pts)
+            idx     = rest[in_grid]
+            out_g, inp_g = self._grid.lookup_array(pts[in_grid])
+            failed  = np.isnan(out_g) | np.isnan(inp_g)
+            self.fallback_counts["last_resort"] += int(np.count_nonzero(failed))
+            out_kw[idx] = np.where(failed, er, out_g)
+            inp_kw[idx] = np.where(failed, er / 1.5, inp_g)
+            rest = rest[~in_grid]
+
+        # Normal interpolation
+        out_r, inp_r = self._raw_query_array(inlet_t[rest], outlet_t[rest], oat_f[rest])
+        nan = np.isnan(out_r) | np.isnan(inp_r)
+
+        # OAT below map minimum → Electric Resistance fallback (COP=1)
+        low = nan & (oat_f[rest] < self.oat_min)
+        out_r[low] = er
+        inp_r[low] = er
+        self.fallback_counts["electric_resistance"] += int(np.count_nonzero(low))
+
+        # OAT in-range NaN → snap to nearest valid grid point, else COP = 1.5
+        mid = np.flatnonzero(nan & ~low)
+        if mid.size:
+            idx = rest[mid]
+            out_f, inp_f = self._force_closest_array(inlet_t[idx], outlet_t[idx], oat_f[idx])
+            failed = np.isnan(out_f) | np.isnan(inp_f)
+            self.fallback_counts["force_closest"] += int(mid.size)
+            self.fallback_counts["last_resort"]   += int(np.count_nonzero(failed))
+            out_f[failed] = er
+            inp_f[failed] = er / 1.5
+            out_r[mid] = out_f
+            inp_r[mid] = inp_f
+
+        out_kw[rest] = out_r
+        inp_kw[rest] = inp_r
+        return out_kw, inp_kw
+
+    # ------------------------------------------------------------------
+    # Compiled-grid mode
+    # ------------------------------------------------------------------
+
+    def _grid_points(
+        self, inlet_t: np.ndarray, outlet_t: np.ndarray, oat_f: np.ndarray
+    ) -> np.ndarray:
+        """Stack resolved temperatures into grid coordinates (interpolator order)."""
+        if self._is_two_input:
+            return np.column_stack((inlet_t, oat_f))
+        return np.column_stack((inlet_t, outlet_t, oat_f))
+
+    def _in_range_kw_array(self, pts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Per-unit (output_kw, input_kw) for in-range OATs: interpolation, then
+        ``_force_closest`` recovery. Unrecoverable points stay NaN.
+        """
+        inlet_t  = pts[:, 0]
+        outlet_t = pts[:, 0] if self._is_two_input else pts[:, 1]
+        oat_f    = pts[:, -1]
+        out_kw, inp_kw = self._raw_query_array(inlet_t, outlet_t, oat_f)
+        nan = np.flatnonzero(np.isnan(out_kw) | np.isnan(inp_kw))
+        if nan.size:
+            out_kw[nan], inp_kw[nan] = self._force_closest_array(
+                inlet_t[nan], outlet_t[nan], oat_f[nan]
+            )
+        return out_kw, inp_kw
+
+    def _build_grid(self, resolution: tuple[float, ...]) -> tuple[GridLookupTable, int]:
+        """Sample the in-range lookup onto a grid; returns ``(table, nbytes)``."""
+        pts = np.asarray(self._interp.points)
+        lo  = [float(pts[:, 0].min())]
+        hi  = [min(float(pts[:, 0].max()), float(self._inlet_max))]
+        if not self._is_two_input:
+            lo.append(float(pts[:, 1].min()))
+            hi.append(float(pts[:, 1].max()))
+        lo.append(float(self.oat_min))
+        hi.append(float(self.oat_max))
+        table = GridLookupTable.sample(self._in_range_kw_array, tuple(lo), tuple(hi), resolution)
+        return table, table.nbytes
+
+    def use_grid(
+        self, resolution_f: float | tuple[float, ...] | None = 2.0
+    ) -> dict[str, float]:
+        """
+        Switch this map to compiled-grid mode (or back to exact mode).
+
+        Parameters
+        ----------
+        resolution_f : float | tuple[float, ...] | None
+            Target node spacing [°F], either one value for every axis or one
+            per axis in (inlet, outlet, OAT) order — (inlet, OAT) for
+            two-input maps. None turns grid mode off. Default 2 °F.
+
+        Returns
+        -------
+        dict[str, float]
+            The grid's sampling error versus the exact lookup, measured at
+            every cell centre (see ``GridLookupTable.sample``): largest and
+            99th-percentile absolute error of per-unit output and input
+            power [kW], and the number of centres where only one of the two
+            falls back to COP = 1.5. Empty when grid mode is turned off.
+        """
+        if resolution_f is None:
+            self._grid = None
+            return {}
+        ndim = 2 if self._is_two_input else 3
+        if np.ndim(resolution_f) == 0:
+            resolution = (float(resolution_f),) * ndim
+        else:
+            resolution = tuple(float(r) for r in resolution_f)
+            if len(resolution) != ndim:
+                raise ValueError(f"resolution_f needs {ndim} values for this map, got {len(resolution)}")
+
+        if self.model_name:
+            key = (self.model_name, "grid", resolution)
+            self._grid = PerformanceMap.map_cache.get(key, lambda: self._build_grid(resolution))
+        else:
+            self._grid = self._build_grid(resolution)[0]
+        return self._grid.max_error
+
+    @property
+    def grid_max_error(self) -> dict[str, float] | None:
+        """Sampling error report of the active grid (see ``use_grid``), or None."""
+        return self._grid.max_error if self._grid is not None else None
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -477,6 +1224,39 @@ class PklPerformanceMap(PerformanceMap):
         _, inp_kw     = self._get_per_unit_kw(oat_f, inlet, outlet)
         return inp_kw * self.num_units
 
+    def get_capacity_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+    ) -> tuple[float, float]:
+        inlet, outlet  = self._resolve_temps(outlet_temp_f, inlet_temp_f)
+        out_kw, inp_kw = self._get_per_unit_kw(oat_f, inlet, outlet)
+        return out_kw * self.num_units * _W_TO_KBTUH, inp_kw * self.num_units
+
+    def get_capacity_and_power_arrays(
+        self,
+        oat_f: float | np.ndarray,
+        outlet_temp_f: float | np.ndarray,
+        inlet_temp_f: float | np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if oat_f is None:
+            raise ValueError(
+                "oat_f is required for real performance maps. "
+                "Provide a ClimateZone with a design OAT when constructing the Building."
+            )
+        oat, outlet, inlet, shape = _broadcast_conditions(oat_f, outlet_temp_f, inlet_temp_f)
+        inlet, outlet  = self._resolve_temps_array(outlet, inlet)
+        out_kw, inp_kw = self._get_per_unit_kw_array(oat, inlet, outlet)
+        return (
+            (out_kw * self.num_units * _W_TO_KBTUH).reshape(shape),
+            (inp_kw * self.num_units).reshape(shape),
+        )
+
+    @property
+    def depends_on_outlet_temp(self) -> bool:
+        return not self._is_two_input
+
     def is_within_operating_bounds(self, oat_f: float) -> bool:
         return oat_f >= self.oat_min
 
@@ -522,6 +1302,15 @@ class HPWHsimPerformanceMap(PerformanceMap):
         self._nominal_kbtuh = nominal_capacity_kbtuh
         self._design_inlet_f = design_inlet_temp_f
 
+        # Compiled coefficient tables (entries ascend in T_F). Tuples serve the
+        # scalar path; the (n_coeffs, n_entries) arrays serve the batch path.
+        self._t_f       = [entry["T_F"] for entry in perfmap]
+        self._cop_c     = [tuple(entry["COP_coeffs"]) for entry in perfmap]
+        self._pwr_c     = [tuple(entry["inputPower_coeffs"]) for entry in perfmap]
+        self._t_f_arr   = np.asarray(self._t_f, dtype=float)
+        self._cop_c_arr = np.array(self._cop_c, dtype=float).T
+        self._pwr_c_arr = np.array(self._pwr_c, dtype=float).T
+
     @property
     def oat_min(self) -> float:
         return self._perfmap[0]["T_F"] if self._perfmap else float("-inf")
@@ -589,41 +1378,84 @@ class HPWHsimPerformanceMap(PerformanceMap):
 
         if len(perfmap) > 1:
             # --- Multi-entry: bracket OAT and quadratic in inlet_temp_f ---
-            i_prev, i_next = None, None
-            for i in range(len(perfmap)):
-                if oat_f < perfmap[i]["T_F"]:
-                    if i == 0:
-                        # Below minimum OAT → ER fallback
-                        er = self._er_per_unit_kbtuh()
-                        return er, er
-                    i_prev, i_next = i - 1, i
-                    break
-                if i == len(perfmap) - 1:
-                    # Above maximum OAT → extrapolate from last bracket pair
-                    i_prev, i_next = i - 1, i
-
-            COP_T1  = self._quad(perfmap[i_prev]["COP_coeffs"],          inlet_temp_f)
-            COP_T2  = self._quad(perfmap[i_next]["COP_coeffs"],          inlet_temp_f)
-            pwr_T1_W = self._quad(perfmap[i_prev]["inputPower_coeffs"],   inlet_temp_f)
-            pwr_T2_W = self._quad(perfmap[i_next]["inputPower_coeffs"],   inlet_temp_f)
-
-            T1, T2   = perfmap[i_prev]["T_F"], perfmap[i_next]["T_F"]
+            pos = bisect_right(self._t_f, oat_f)
+            if pos == 0:
+                # Below minimum OAT → ER fallback
+                er = self._er_per_unit_kbtuh()
+                return er, er
+            # Above maximum OAT → extrapolate from last bracket pair
+            i_next = min(pos, len(perfmap) - 1)
+            i_prev = i_next - 1
+
+            COP_T1   = self._quad(self._cop_c[i_prev], inlet_temp_f)
+            COP_T2   = self._quad(self._cop_c[i_next], inlet_temp_f)
+            pwr_T1_W = self._quad(self._pwr_c[i_prev], inlet_temp_f)
+            pwr_T2_W = self._quad(self._pwr_c[i_next], inlet_temp_f)
+
+            T1, T2   = self._t_f[i_prev], self._t_f[i_next]
             cop      = self._linear_interp(oat_f, T1, T2, COP_T1, COP_T2)
             input_kw = self._linear_interp(oat_f, T1, T2, pwr_T1_W / 1000.0, pwr_T2_W / 1000.0)
 
         else:
             # --- Single-entry: full regressed polynomial ---
             if self._is_multipass:
-                input_kw = self._poly6(perfmap[0]["inputPower_coeffs"], oat_f, inlet_temp_f)
-                cop      = self._poly6(perfmap[0]["COP_coeffs"],        oat_f, inlet_temp_f)
+                input_kw = self._poly6(self._pwr_c[0], oat_f, inlet_temp_f)
+                cop      = self._poly6(self._cop_c[0], oat_f, inlet_temp_f)
             else:
-                input_kw = self._poly11(perfmap[0]["inputPower_coeffs"], oat_f, outlet_t, inlet_temp_f)
-                cop      = self._poly11(perfmap[0]["COP_coeffs"],        oat_f, outlet_t, inlet_temp_f)
-
+                input_kw = self._poly11(self._pwr_c[0], oat_f, outlet_t, inlet_temp_f)
+                cop      = self._poly11(self._cop_c[0], oat_f, outlet_t, inlet_temp_f)
         output_kw = cop * input_kw
         # Convert kW to kBTU/hr
         return output_kw * _W_TO_KBTUH, input_kw * _W_TO_KBTUH
 
+    def _get_per_unit_kbtuh_array(
+        self, oat_f: np.ndarray, inlet_temp_f: np.ndarray, outlet_t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Array counterpart of ``_get_per_unit_kbtuh``."""
+        perfmap = self._perfmap
+
+        if not perfmap:
+            er = np.full(oat_f.size, self._er_per_unit_kbtuh())
+            return er, er.copy()
+
+        if len(perfmap) > 1:
+            # --- Multi-entry: bracket OAT and quadratic in inlet_temp_f ---
+            t_f    = self._t_f_arr
+            cop_c  = self._cop_c_arr
+            pwr_c  = self._pwr_c_arr
+            pos    = np.searchsorted(t_f, oat_f, side="right")
+            i_next = np.clip(pos, 1, len(perfmap) - 1)   # above maximum → last bracket pair
+            i_prev = i_next - 1
+
+            COP_T1   = self._quad(cop_c[:, i_prev], inlet_temp_f)
+            COP_T2   = self._quad(cop_c[:, i_next], inlet_temp_f)
+            pwr_T1_W = self._quad(pwr_c[:, i_prev], inlet_temp_f)
+            pwr_T2_W = self._quad(pwr_c[:, i_next], inlet_temp_f)
+
+            T1, T2   = t_f[i_prev], t_f[i_next]
+            cop      = self._linear_interp(oat_f, T1, T2, COP_T1, COP_T2)
+            input_kw = self._linear_interp(oat_f, T1, T2, pwr_T1_W / 1000.0, pwr_T2_W / 1000.0)
+
+            output_kbtuh = cop * input_kw * _W_TO_KBTUH
+            input_kbtuh  = input_kw * _W_TO_KBTUH
+
+            # Below minimum OAT → ER fallback
+            below = pos == 0
+            if below.any():
+                er = self._er_per_unit_kbtuh()
+                output_kbtuh[below] = er
+                input_kbtuh[below]  = er
+            return output_kbtuh, input_kbtuh
+
+        # --- Single-entry: full regressed polynomial ---
+        if self._is_multipass:
+            input_kw = self._poly6(self._pwr_c[0], oat_f, inlet_temp_f)
+            cop      = self._poly6(self._cop_c[0], oat_f, inlet_temp_f)
+        else:
+            input_kw = self._poly11(self._pwr_c[0], oat_f, outlet_t, inlet_temp_f)
+            cop      = self._poly11(self._cop_c[0], oat_f, outlet_t, inlet_temp_f)
+        return cop * input_kw * _W_TO_KBTUH, input_kw * _W_TO_KBTUH
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -648,5 +1480,75 @@ class HPWHsimPerformanceMap(PerformanceMap):
         _, inp_kbtuh = self._get_per_unit_kbtuh(oat_f, inlet_temp_f, outlet_temp_f)
         return inp_kbtuh / _W_TO_KBTUH * self.num_units
 
+    def get_capacity_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+    ) -> tuple[float, float]:
+        inlet_temp_f         = inlet_temp_f if inlet_temp_f is not None else self._design_inlet_f
+        out_kbtuh, inp_kbtuh = self._get_per_unit_kbtuh(oat_f, inlet_temp_f, outlet_temp_f)
+        return out_kbtuh * self.num_units, inp_kbtuh / _W_TO_KBTUH * self.num_units
+
+    def get_capacity_and_power_arrays(
+        self,
+        oat_f: float | np.ndarray,
+        outlet_temp_f: float | np.ndarray,
+        inlet_temp_f: float | np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if oat_f is None:
+            raise ValueError(
+                "oat_f is required for real performance maps. "
+                "Provide a ClimateZone with a design OAT when constructing the Building."
+            )
+        oat, outlet, inlet, shape = _broadcast_conditions(oat_f, outlet_temp_f, inlet_temp_f)
+        if inlet is None:
+            inlet = np.full(oat.shape, float(self._design_inlet_f))
+        out_kbtuh, inp_kbtuh = self._get_per_unit_kbtuh_array(oat, inlet, outlet)
+        return (
+            (out_kbtuh * self.num_units).reshape(shape),
+            (inp_kbtuh / _W_TO_KBTUH * self.num_units).reshape(shape),
+        )
+
+    @property
+    def depends_on_outlet_temp(self) -> bool:
+        # Only the single-entry single-pass polynomial takes outlet_T
+        return len(self._perfmap) == 1 and not self._is_multipass
+
     def is_within_operating_bounds(self, oat_f: float) -> bool:
         return oat_f >= self.oat_min
+
+
+# ---------------------------------------------------------------------------
+# Compiled-grid error report
+# ---------------------------------------------------------------------------
+
+def grid_error_report(
+    resolution_f: float | tuple[float, ...] = 2.0,
+    model_names: list[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Compile the grid of every lab-data model and report its sampling error.
+
+    Parameters
+    ----------
+    resolution_f : float | tuple[float, ...]
+        Node spacing passed to ``PklPerformanceMap.use_grid`` [°F]. A tuple
+        must match each model's dimensionality.
+    model_names : list[str] | None
+        Models to compile. Defaults to every ``maps.json`` entry with a
+        ``pkl_prefix``.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        ``use_grid`` error report keyed by model name.
+    """
+    if model_names is None:
+        model_names = [name for name, entry in _load_maps_json().items() if "pkl_prefix" in entry]
+    report = {}
+    for name in model_names:
+        perf_map = PerformanceMap.from_model_name(name)
+        if isinstance(perf_map, PklPerformanceMap):
+            report[name] = perf_map.use_grid(resolution_f)
+    return report
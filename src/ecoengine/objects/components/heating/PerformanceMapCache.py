@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class PerformanceMapCache:
+    """
+    Thread-safe, bounded LRU cache of immutable performance map data.
+
+    Entries are keyed by equipment model name. An entry is whatever the
+    loader returns — for lab-data models the shared interpolator and bounds,
+    for HPWHsim models the coefficient table — together with its size in
+    bytes. ``PerformanceMap`` instances are thin views over a cached entry
+    that only add per-instance parameters (``num_units``,
+    ``design_inlet_temp_f``, ``nominal_capacity_kbtuh``).
+
+    Eviction
+    --------
+    Least-recently-used entries are evicted whenever the summed entry size
+    exceeds ``max_bytes`` or the entry count exceeds ``max_entries``. An
+    entry larger than ``max_bytes`` on its own is returned but never stored.
+
+    Concurrency
+    -----------
+    Bookkeeping happens under one re-entrant lock, but loaders run outside
+    it: a miss marks its key as loading, and later callers asking for the
+    same key wait for that load instead of starting their own, so each
+    model is loaded exactly once while other keys stay available. If the
+    load fails, or its entry is too large to keep, a waiting caller loads
+    the key itself.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int | None = None) -> None:
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            Memory budget for all cached entries combined [bytes].
+        max_entries : int | None
+            Optional cap on the number of cached models. None means no cap.
+        """
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._loading: dict[Hashable, threading.Event] = {}
+        self._lock        = threading.RLock()
+        self._max_bytes   = int(max_bytes)
+        self._max_entries = max_entries
+        self._nbytes      = 0
+        self.hits         = 0
+        self.misses       = 0
+        self.evictions    = 0
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = int(value)
+            self._evict()
+
+    @property
+    def max_entries(self) -> int | None:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int | None) -> None:
+        with self._lock:
+            self._max_entries = value
+            self._evict()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable, loader: Callable[[], tuple[Any, int]]) -> Any:
+        """
+        Return the cached data for ``key``, loading it on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            Equipment model name, or a tuple extending it for data derived
+            from the model (e.g. a compiled lookup grid).
+        loader : Callable[[], tuple[Any, int]]
+            Called on a miss; returns ``(data, nbytes)``. Exceptions raised by
+            the loader propagate and nothing is cached.
+
+        Returns
+        -------
+        Any
+            The cached (or freshly loaded) data.
+        """
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key][0]
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    self.misses += 1
+                    break
+            loading.wait()
+
+        try:
+            data, nbytes = loader()
+            with self._lock:
+                if nbytes <= self._max_bytes:
+                    self._entries[key] = (data, nbytes)
+                    self._nbytes      += nbytes
+                    self._evict()
+            return data
+        finally:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Summed size of all cached entries [bytes]."""
+        return self._nbytes
+
+    def stats(self) -> dict[str, int | None]:
+        """Return a snapshot of the cache counters and current usage."""
+        with self._lock:
+            return {
+                "hits":        self.hits,
+                "misses":      self.misses,
+                "evictions":   self.evictions,
+                "entries":     len(self._entries),
+                "nbytes":      self._nbytes,
+                "max_bytes":   self._max_bytes,
+                "max_entries": self._max_entries,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes   = 0
+            self.hits      = 0
+            self.misses    = 0
+            self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until within budget (lock held)."""
+        while self._entries and (
+            self._nbytes > self._max_bytes
+            or (self._max_entries is not None and len(self._entries) > self._max_entries)
+        ):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes   -= nbytes
+            self.evictions += 1
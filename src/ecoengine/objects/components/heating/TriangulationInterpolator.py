@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Tolerances of scipy's LinearNDInterpolator simplex search
+_EPS       = 100 * np.finfo(float).eps
+_EPS_BROAD = math.sqrt(np.finfo(float).eps)
+
+# Widening of the simplex bounding boxes in the point-location grid, as a
+# fraction of the triangulation's largest extent
+_GRID_MARGIN = 1e-6
+
+# Points tested against their candidate simplices at a time
+_CHUNK_POINTS = 4096
+
+
+class TriangulationInterpolator:
+    """
+    Piecewise-linear interpolator over a stored Delaunay triangulation.
+
+    Used for compiled performance maps: the triangulation arrays are read
+    from the memory-mapped compiled store rather than unpickled. Results are
+    identical to scipy's ``LinearNDInterpolator`` on the same triangulation.
+    Each point is tested in numpy against the simplices whose bounding boxes
+    share its cell of a regular grid, with scipy's tolerances and
+    floating-point operations; the few points whose simplex depends on
+    scipy's walk (on a shared face, or next to a degenerate simplex) are
+    located with the same walk. Points outside the triangulation give NaN.
+
+    Only public ``scipy.spatial.Delaunay`` attributes are needed to build
+    one (see ``from_linear_nd``).
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        values: np.ndarray,
+        simplices: np.ndarray,
+        neighbors: np.ndarray,
+        equations: np.ndarray,
+        transform: np.ndarray,
+        min_bound: np.ndarray,
+        max_bound: np.ndarray,
+        paraboloid_scale: float,
+        paraboloid_shift: float,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        points : np.ndarray
+            Data points, shape ``(npoints, ndim)``.
+        values : np.ndarray
+            Values at the data points, shape ``(npoints, nvalues)``.
+        simplices, neighbors, equations, transform, min_bound, max_bound
+            The ``Delaunay`` arrays of the same names.
+        paraboloid_scale, paraboloid_shift : float
+            The ``Delaunay`` lifting parameters of the same names.
+
+        Arrays are held as plain ``np.ndarray`` views: memory-mapped arrays
+        stay mapped, without ``np.memmap``'s overhead on every indexing.
+        """
+        self.points           = np.asarray(points)
+        self.values           = np.asarray(values)
+        self.simplices        = np.asarray(simplices)
+        self.neighbors        = np.asarray(neighbors)
+        self.equations        = np.asarray(equations)
+        self.transform        = np.asarray(transform)
+        self.min_bound        = np.asarray(min_bound)
+        self.max_bound        = np.asarray(max_bound)
+        self.paraboloid_scale = float(paraboloid_scale)
+        self.paraboloid_shift = float(paraboloid_shift)
+        self.ndim             = points.shape[1]
+        self.nsimplex         = simplices.shape[0]
+        self._degenerate      = np.isnan(self.transform[:, 0, 0])
+        self._grid            = None
+
+    @classmethod
+    def from_linear_nd(cls, interp) -> TriangulationInterpolator:
+        """Build from a scipy ``LinearNDInterpolator`` with 2-D ``values``."""
+        tri = interp.tri
+        return cls(
+            tri.points, interp.values, tri.simplices, tri.neighbors, tri.equations,
+            tri.transform, tri.min_bound, tri.max_bound,
+            tri.paraboloid_scale, tri.paraboloid_shift,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the arrays held [bytes]."""
+        return sum(
+            np.asarray(a).nbytes
+            for a in (self.points, self.values, self.simplices, self.neighbors,
+                      self.equations, self.transform)
+        )
+
+    def __call__(self, xi) -> np.ndarray:
+        """
+        Interpolate at the points ``xi``, shape ``(n, ndim)``.
+
+        Returns
+        -------
+        np.ndarray
+            Shape ``(n, nvalues)``; NaN rows for points outside the triangulation.
+        """
+        xi  = np.asarray(xi, dtype=float).reshape(-1, self.ndim)
+        out = np.full((len(xi), self.values.shape[1]), np.nan)
+        isimplex, coords = self._locate(xi)
+        found = np.flatnonzero(isimplex >= 0)
+        if len(found):
+            c    = coords[found]
+            vals = self.values[self.simplices[isimplex[found]]]        # (n_found, ndim + 1, nvalues)
+            row  = np.zeros((len(found), self.values.shape[1]))
+            for j in range(self.ndim + 1):
+                row += c[:, j, None] * vals[:, j]
+            out[found] = row
+        return out
+
+    # ------------------------------------------------------------------
+    # Vectorized point location
+    # ------------------------------------------------------------------
+
+    def _locate(self, xi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(isimplex, coords)`` for the points ``xi``, as the walk in
+        ``_find_simplex`` would find them querying ``xi`` in order.
+
+        The candidate simplices of every point are tested at once. A point
+        inside exactly one simplex, which brute force also picks, is in that
+        simplex whatever simplex the walk starts from; a point inside none,
+        which brute force cannot place either, is outside. Only the remaining
+        points (on a shared face, or next to a degenerate simplex) depend on
+        the walk, and are located with it, starting from the simplex the walk
+        would have reached for the point before.
+        """
+        n        = len(xi)
+        isimplex = np.full(n, -1, dtype=np.intp)
+        coords   = np.full((n, self.ndim + 1), np.nan)
+        if n == 0 or self.nsimplex <= 0:
+            return isimplex, coords
+
+        if n == 1:
+            isimplex[0], c = self._locate_point(xi[0])
+            if c is not None:
+                coords[0] = c
+            return isimplex, coords
+
+        outside = ((xi < self.min_bound - _EPS) | (xi > self.max_bound + _EPS)).any(axis=1)
+        # 1: in one simplex (the walk ends there), 0: outside, -1: walk needed
+        resolved = np.zeros(n, dtype=np.int8)
+        inside   = np.flatnonzero(~outside)
+        begin, count = self._cells(xi[inside])
+        # Chunk points with similar numbers of candidates together
+        order = np.argsort(count, kind="stable")
+        for lo in range(0, len(order), _CHUNK_POINTS):
+            sel = order[lo : lo + _CHUNK_POINTS]
+            idx = inside[sel]
+            resolved[idx], isimplex[idx], coords[idx] = self._locate_chunk(xi[idx], begin[sel], count[sel])
+
+        # Walk the unresolved points in order, each from where the walk
+        # stopped for the point before: the last point in a single simplex,
+        # followed by any points after it that the walk also has to visit.
+        # ``isimplex`` and ``coords`` hold brute force's answer until then
+        last_single = np.maximum.accumulate(np.where(resolved == 1, np.arange(n), -1))
+        walked, start = -1, 0
+        for i in np.flatnonzero(resolved == -1).tolist():
+            anchor = int(last_single[i])
+            if anchor > walked:
+                walked, start = anchor, int(isimplex[anchor])
+            for k in range(walked + 1, i + 1):
+                bruteforce = (int(isimplex[k]), coords[k].tolist())
+                found, c, start = self._find_simplex(xi[k].tolist(), start, bruteforce)
+            isimplex[i] = found
+            coords[i]   = np.nan if c is None else c
+            walked = i
+        return isimplex, coords
+
+    def _locate_point(self, x: np.ndarray) -> tuple[int, np.ndarray | list[float] | None]:
+        """
+        ``_locate`` for a single point, with as few numpy calls as possible.
+
+        The point's candidates are tested as in ``_locate_chunk``, which
+        handles the point instead if it is not in exactly one or no simplex
+        even with brute force's extra leeway next to degenerate simplices.
+        """
+        ndim = self.ndim
+        xl   = x.tolist()
+        if self._is_fully_outside(xl):
+            return -1, None
+        if self._grid is None:
+            self._grid = self._build_grid()
+        origin, width, shape, offsets, members = self._grid
+        cell = 0
+        for xk, lo, w, size in zip(xl, origin.tolist(), width.tolist(), shape):
+            if math.isnan(xk):
+                return -1, None
+            cell = cell * size + min(max(int((xk - lo) // w), 0), size - 1)
+        cand = members[offsets[cell] : offsets[cell + 1]]
+
+        t     = self.transform[cand]                                    # (k, ndim + 1, ndim)
+        terms = t[:, :ndim] * (x - t[:, ndim])[:, None]                 # (k, ndim, ndim)
+        c     = terms[..., 0]
+        for j in range(1, ndim):
+            c = c + terms[..., j]
+        last = 1.0 - c[:, 0]
+        for i in range(1, ndim):
+            last = last - c[:, i]
+        upper  = (c <= 1 + _EPS).all(axis=1) & (last <= 1 + _EPS)
+        strict = np.flatnonzero(upper & (c >= -_EPS).all(axis=1) & (last >= -_EPS))
+        broad  = np.flatnonzero(upper & (c >= -_EPS_BROAD).all(axis=1) & (last >= -_EPS_BROAD))
+        # Brute force can only pick another simplex than the one holding the
+        # point if some candidate holds it with the extra leeway alone
+        if len(broad) == len(strict) <= 1:
+            if not len(strict):
+                return -1, None
+            k = int(strict[0])
+            return int(cand[k]), c[k].tolist() + [float(last[k])]
+
+        resolved, isimplex, coords = self._locate_chunk(x[None], offsets[cell : cell + 1], np.array([len(cand)]))
+        if resolved[0] == -1:
+            found, c, _ = self._find_simplex(xl, 0, (int(isimplex[0]), coords[0].tolist()))
+            return found, c
+        return int(isimplex[0]), coords[0]
+
+    def _locate_chunk(
+        self,
+        x: np.ndarray,
+        begin: np.ndarray,
+        count: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Test a chunk of points against their candidate simplices, the
+        ``count`` grid members from ``begin`` (see ``_cells``).
+
+        Returns ``(resolved, isimplex, coords)`` as used by ``_locate``:
+        ``resolved`` is 1 for a point in exactly one simplex, 0 for a point
+        in none, -1 otherwise; ``isimplex`` and ``coords`` give the simplex
+        brute force would find, which is the answer unless ``resolved`` is -1.
+        """
+        ndim   = self.ndim
+        slot   = np.arange(max(int(count.max()), 1))
+        usable = slot < count[:, None]                                  # (n, k)
+        cand   = self._grid[4][np.where(usable, begin[:, None] + slot, 0)]
+        t      = self.transform[cand]                                   # (n, k, ndim + 1, ndim)
+        terms  = t[..., :ndim, :] * (x[:, None, None, :] - t[..., ndim, None, :])
+        coords = np.empty(cand.shape + (ndim + 1,))
+        coords[..., :ndim] = 0.0
+        coords[..., ndim]  = 1.0
+        for j in range(ndim):
+            coords[..., :ndim] += terms[..., j]
+        for i in range(ndim):
+            coords[..., ndim] -= coords[..., i]
+        upper  = coords <= 1 + _EPS
+        strict = usable & ((coords >= -_EPS) & upper).all(axis=-1)
+        pos    = np.where(strict, cand, self.nsimplex).argmin(axis=1)
+        first  = np.where(strict.any(axis=1), cand[np.arange(len(x)), pos], self.nsimplex)
+        bruteforce = np.where(first < self.nsimplex, first, -1)
+
+        # Brute force instead returns a neighbour of a degenerate simplex
+        # before ``first`` that holds the point with leeway towards it; order
+        # such hits by (degenerate simplex, its neighbour slot) as it would.
+        # Only points in several simplices, or held by some candidate with
+        # the leeway alone, can get another answer than ``first``
+        count = strict.sum(axis=1)
+        broad = usable & ((coords >= -_EPS_BROAD) & upper).all(axis=-1)
+        rows  = np.flatnonzero((count > 1) | (broad & ~strict).any(axis=1))
+        if len(rows):
+            cand = cand[rows]
+            nbrs = self.neighbors[cand]                                 # (rows, k, ndim + 1)
+            pair = (
+                usable[rows, :, None] & self._degenerate[nbrs] & (nbrs != -1)
+                & (nbrs < first[rows, None, None])
+            )
+            lower   = np.where(nbrs[..., None, :] == nbrs[..., None], -_EPS_BROAD, -_EPS)
+            passing = pair & ((coords[rows, :, None] >= lower) & upper[rows, :, None]).all(axis=-1)
+            slot    = (self.neighbors[nbrs] == cand[..., None, None]).argmax(axis=-1)
+            key     = np.where(passing, nbrs * (ndim + 1) + slot, np.iinfo(np.intp).max).reshape(len(rows), -1)
+            pick    = key.argmin(axis=1)
+            hit     = key[np.arange(len(rows)), pick] < np.iinfo(np.intp).max
+            bruteforce[rows[hit]] = cand[hit, pick[hit] // (ndim + 1)]
+            pos[rows[hit]]        = pick[hit] // (ndim + 1)
+
+        single   = (count == 1) & (bruteforce == first)
+        resolved = np.where(single, 1, np.where((count == 0) & (bruteforce == -1), 0, -1)).astype(np.int8)
+        out      = np.where((bruteforce >= 0)[:, None], coords[np.arange(len(x)), pos], np.nan)
+        return resolved, bruteforce, out
+
+    def _cells(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(begin, count)``: where the candidate simplices of each
+        point start in the grid's member list, and how many there are.
+        """
+        if self._grid is None:
+            self._grid = self._build_grid()
+        origin, width, shape, offsets, _ = self._grid
+        cell = np.clip(np.nan_to_num((x - origin) // width), 0, np.asarray(shape) - 1).astype(np.intp)
+        cell = np.ravel_multi_index(cell.T, shape)
+        return offsets[cell], offsets[cell + 1] - offsets[cell]
+
+    def _build_grid(self) -> tuple[np.ndarray, np.ndarray, tuple[int, ...], np.ndarray, np.ndarray]:
+        """
+        Bucket the simplices into a uniform grid over the bounding box.
+
+        Each simplex is listed in every cell its bounding box overlaps,
+        widened by a margin well beyond what the search tolerances allow
+        a point outside a simplex to still count as inside it.
+        """
+        ndim     = self.ndim
+        lo_bound = np.asarray(self.min_bound, dtype=float)
+        extent   = np.asarray(self.max_bound, dtype=float) - lo_bound
+        margin   = _GRID_MARGIN * max(float(extent.max()), 1.0)
+        per_dim  = max(1, round(self.nsimplex ** (1.0 / ndim)))
+        shape    = tuple(per_dim if e > 0 else 1 for e in extent)
+        width    = np.where(extent > 0, extent / np.asarray(shape), 1.0)
+
+        # Degenerate simplices never hold a point themselves
+        simplex = np.flatnonzero(~self._degenerate)
+        corners = self.points[self.simplices[simplex]]                  # (nsimplex, ndim + 1, ndim)
+        first   = np.clip((corners.min(axis=1) - margin - lo_bound) // width, 0, np.asarray(shape) - 1)
+        last    = np.clip((corners.max(axis=1) + margin - lo_bound) // width, 0, np.asarray(shape) - 1)
+        first, span = first.astype(np.intp), (last - first).astype(np.intp) + 1
+        ncells  = span.prod(axis=1)
+        owner   = np.repeat(np.arange(len(simplex)), ncells)
+        local   = np.arange(len(owner)) - np.repeat(np.cumsum(ncells) - ncells, ncells)
+        cell    = np.zeros(len(owner), dtype=np.intp)
+        for d in range(ndim):
+            size  = span[owner, ndim - 1 - d]
+            coord = first[owner, ndim - 1 - d] + local % size
+            local //= size
+            cell += coord * int(np.prod(shape[ndim - d :]))
+        order   = np.lexsort((owner, cell))
+        offsets = np.searchsorted(cell[order], np.arange(int(np.prod(shape)) + 1))
+        return lo_bound, width, shape, offsets, simplex[owner[order]]
+
+    # ------------------------------------------------------------------
+    # Simplex search
+    # ------------------------------------------------------------------
+
+    def _is_fully_outside(self, x: list[float]) -> bool:
+        """Return True if ``x`` lies outside the triangulation's bounding box."""
+        return any(
+            xk < lo - _EPS or xk > hi + _EPS
+            for xk, lo, hi in zip(x, self.min_bound.tolist(), self.max_bound.tolist())
+        )
+
+    def _distplane(self, isimplex: int, z: list[float]) -> float:
+        """Return the lifted point's signed distance from simplex ``isimplex``'s facet plane."""
+        eq   = self.equations[isimplex].tolist()
+        dist = eq[self.ndim + 1]
+        for k in range(self.ndim + 1):
+            dist += eq[k] * z[k]
+        return dist
+
+    def _find_simplex(
+        self,
+        x: list[float],
+        start: int,
+        bruteforce: tuple[int, list[float]],
+    ) -> tuple[int, list[float] | None, int]:
+        """
+        Locate ``x``, walking from simplex ``start``.
+
+        ``bruteforce`` is ``(isimplex, barycentric coordinates)`` of the
+        brute-force search's answer for ``x`` (see ``_locate_chunk``), which
+        the walk falls back to.
+
+        Returns ``(isimplex, barycentric coordinates, next start)``, with
+        ``isimplex`` -1 outside the triangulation.
+        """
+        if self._is_fully_outside(x) or self.nsimplex <= 0:
+            return -1, None, start
+        ndim = self.ndim
+        isimplex = start if 0 <= start < self.nsimplex else 0
+
+        # Walk the lifted triangulation towards a facet visible from the point
+        z = list(x) + [0.0]
+        for xk in x:
+            z[ndim] += xk ** 2
+        z[ndim] *= self.paraboloid_scale
+        z[ndim] += self.paraboloid_shift
+        best_dist = self._distplane(isimplex, z)
+        changed   = True
+        while changed:
+            if best_dist > 0:
+                break
+            changed = False
+            # Neighbours are read from the current simplex, which may change mid-sweep
+            for k in range(ndim + 1):
+                ineigh = int(self.neighbors[isimplex, k])
+                if ineigh == -1:
+                    continue
+                dist = self._distplane(ineigh, z)
+                if dist > best_dist + _EPS * (1 + abs(best_dist)):
+                    isimplex  = ineigh
+                    best_dist = dist
+                    changed   = True
+        return self._find_simplex_directed(x, isimplex, bruteforce)
+
+    def _find_simplex_directed(
+        self,
+        x: list[float],
+        isimplex: int,
+        bruteforce: tuple[int, list[float]],
+    ) -> tuple[int, list[float] | None, int]:
+        """Hop towards ``x`` by barycentric coordinates, falling back to brute force."""
+        ndim = self.ndim
+        if not 0 <= isimplex < self.nsimplex:
+            isimplex = 0
+        c = None
+        for _ in range(1 + self.nsimplex // 4):
+            if isimplex == -1:
+                break
+            t = self.transform[isimplex].tolist()
+            c = [0.0] * (ndim + 1)
+            inside = 1
+            for k in range(ndim + 1):
+                if k == ndim:
+                    ck = 1.0
+                    for j in range(ndim):
+                        ck -= c[j]
+                else:
+                    ck = 0.0
+                    for j in range(ndim):
+                        ck += t[k][j] * (x[j] - t[ndim][j])
+                c[k] = ck
+                if ck < -_EPS:
+                    m = int(self.neighbors[isimplex, k])
+                    if m == -1:
+                        return -1, None, isimplex
+                    isimplex = m
+                    inside   = -1
+                    break
+                elif not ck <= 1 + _EPS:
+                    # Outside, or NaN for a degenerate simplex
+                    inside = 0
+            if inside == -1:
+                continue
+            if inside == 0:
+                isimplex, c = bruteforce
+            break
+        else:
+            isimplex, c = bruteforce
+        return isimplex, c, isimplex
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Mapping, Sequence
 
 from ecoengine.objects.components.heating.PerformanceMap import NominalPerformanceMap, PerformanceMap
 
@@ -42,8 +42,15 @@ class WaterHeater:
     * WaterHeater.from_model_name(model_name, control_schedule, control_map)
         Loads a PerformanceMap from the equipment model registry by name. Use
         this when the specific HPWH model is known.
+
+    Simulation state
+    ----------------
+    The on/off flag is the only state a simulation step changes;
+    ``snapshot()`` / ``restore()`` save and reset it alongside the tank's.
     """
 
+    __slots__ = ("performance_map", "control_schedule", "control_map", "fuel_type", "_active", "_timeline")
+
     def __init__(
         self,
         performance_map: PerformanceMap | None,
@@ -71,6 +78,7 @@ class WaterHeater:
         self.control_map      = control_map
         self.fuel_type        = fuel_type
         self._active          = False
+        self._timeline: list[tuple[float, float | None]] | None = None
 
     # ------------------------------------------------------------------
     # Factory constructors
@@ -178,6 +186,14 @@ class WaterHeater:
         """Deactivate this heater."""
         self._active = False
 
+    def snapshot(self) -> tuple[bool]:
+        """Return the heater's simulation state, ``(active,)``."""
+        return (self._active,)
+
+    def restore(self, state: tuple[bool]) -> None:
+        """Reset the simulation state to one returned by ``snapshot()``."""
+        (self._active,) = state
+
     def is_load_shifting(self) -> bool:
         """Return True if this heater has load-shift modes configured."""
         if self.control_map is None:
@@ -257,6 +273,33 @@ class WaterHeater:
             return self.performance_map.get_power_in_kw(oat_f, outlet_temp_f, inlet_temp_f)
         return None
 
+    def get_capacity_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+    ) -> tuple[float | None, float | None]:
+        """
+        Return heating capacity [kBTU/hr] and power input [kW] from a single
+        performance-map lookup.
+
+        Parameters
+        ----------
+        oat_f : float
+        outlet_temp_f : float
+        inlet_temp_f : float | None
+            Cold-water inlet temperature. Falls back to the performance map's
+            design_inlet_temp_f when not provided.
+
+        Returns
+        -------
+        tuple[float | None, float | None]
+            ``(capacity_kbtuh, power_in_kw)``; both None without a performance map.
+        """
+        if self.performance_map is not None:
+            return self.performance_map.get_capacity_and_power(oat_f, outlet_temp_f, inlet_temp_f)
+        return None, None
+
     def get_output_kbtuh(
         self,
         oat_f: float,
@@ -281,7 +324,137 @@ class WaterHeater:
             return 0.0
         cap = self.get_capacity_kbtuh(oat_f, outlet_temp_f, inlet_temp_f)
         return cap if cap is not None else 0.0
+
+    def get_output_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+        step: int | None = None,
+    ) -> tuple[float, float | None]:
+        """
+        Return this timestep's heating output and power input in one lookup.
+
+        Equivalent to calling ``get_output_kbtuh`` and, when active,
+        ``get_power_in_kw``; an inactive heater skips the lookup entirely.
+
+        Parameters
+        ----------
+        oat_f : float
+        outlet_temp_f : float
+        inlet_temp_f : float | None
+            Cold-water inlet temperature forwarded to the performance map.
+        step : int | None
+            Simulation step index. When a precomputed timeline is set (see
+            ``precompute_output_and_power``) its entry for this step is
+            returned and the conditions are not looked up again.
+
+        Returns
+        -------
+        tuple[float, float | None]
+            ``(output_kbtuh, power_in_kw)``: ``(0.0, None)`` when inactive.
+        """
+        if not self._active:
+            return 0.0, None
+        return self.get_running_output_and_power(oat_f, outlet_temp_f, inlet_temp_f, step)
+
+    def get_running_output_and_power(
+        self,
+        oat_f: float,
+        outlet_temp_f: float,
+        inlet_temp_f: float | None = None,
+        step: int | None = None,
+    ) -> tuple[float, float | None]:
+        """
+        Return the output and power this heater delivers while running,
+        whatever its current on/off state.
+
+        Used where a heater switches within a timestep, so the caller scales
+        the result by the time it actually runs. Arguments are as for
+        ``get_output_and_power``.
+
+        Returns
+        -------
+        tuple[float, float | None]
+            ``(output_kbtuh, power_in_kw)``.
+        """
+        if step is not None and self._timeline is not None:
+            return self._timeline[step % len(self._timeline)]
+        cap, pwr = self.get_capacity_and_power(oat_f, outlet_temp_f, inlet_temp_f)
+        return (cap if cap is not None else 0.0), pwr
     
+    # ------------------------------------------------------------------
+    # Precomputed timeline
+    # ------------------------------------------------------------------
+
+    def precompute_output_and_power(
+        self,
+        oat_f: Sequence[float | None],
+        outlet_temp_f: Sequence[float] | float,
+        inlet_temp_f: Sequence[float | None] | float | None = None,
+    ) -> int:
+        """
+        Look up capacity and power for every step of a run before it starts.
+
+        Each distinct ``(oat, outlet, inlet)`` tuple is looked up once through
+        ``get_capacity_and_power``, so timeline entries are identical to live
+        queries. Until ``clear_timeline`` is called,
+        ``get_output_and_power(..., step=i)`` returns entry ``i``, wrapping
+        around for steps past the end (inputs that repeat yearly).
+
+        Parameters
+        ----------
+        oat_f : Sequence[float | None]
+            Outdoor air temperature at each step [°F].
+        outlet_temp_f : Sequence[float] | float
+            Outlet temperature at each step, or one value for all steps [°F].
+        inlet_temp_f : Sequence[float | None] | float | None
+            Inlet temperature at each step, or one value for all steps [°F].
+            None uses the performance map's design inlet.
+
+        Returns
+        -------
+        int
+            Number of distinct lookups performed.
+
+        Raises
+        ------
+        ValueError
+            If a per-step sequence does not match the length of ``oat_f``, or
+            if the performance map rejects a condition. No timeline is set.
+        """
+        num_steps = len(oat_f)
+        outlets   = _per_step(outlet_temp_f, num_steps)
+        inlets    = _per_step(inlet_temp_f, num_steps)
+
+        lookups: dict[tuple, tuple[float, float | None]] = {}
+        timeline = []
+        for key in zip(oat_f, outlets, inlets):
+            entry = lookups.get(key)
+            if entry is None:
+                cap, pwr = self.get_capacity_and_power(*key)
+                entry = lookups[key] = ((cap if cap is not None else 0.0), pwr)
+            timeline.append(entry)
+        self._timeline = timeline
+        return len(lookups)
+
+    def depends_on_outlet_temp(self) -> bool:
+        """
+        Return True unless capacity and power are known to ignore the outlet
+        temperature (no map, a nominal map, or a map that says so).
+        """
+        if self.performance_map is None or isinstance(self.performance_map, NominalPerformanceMap):
+            return False
+        return self.performance_map.depends_on_outlet_temp
+
+    def has_timeline(self) -> bool:
+        """Return True if a precomputed timeline is set."""
+        return self._timeline is not None
+
+    def clear_timeline(self) -> None:
+        """Drop the precomputed timeline; queries go to the performance map again."""
+        self._timeline = None
+
     def get_outlet_temp_f(self, hour_of_day: int) -> float:
         """
         Look up the active Outlet Temperature for Controls for the given hour
@@ -302,7 +475,12 @@ class WaterHeater:
             raise ValueError(f"No Controls configured for hour {hour_of_day}.")
         return controls.outlet_temp_f
 
-    def update_state(self, storage_tank: StorageTank, hour_of_day: int) -> None:
+    def update_state(
+        self,
+        storage_tank: StorageTank,
+        hour_of_day: int,
+        sensor_temps_f: Mapping[float, float] | None = None,
+    ) -> None:
         """
         Look up the active Controls for the given hour, then update
         active/inactive state based on current tank condition.
@@ -316,6 +494,10 @@ class WaterHeater:
         hour_of_day : int
             Hour of the day (0-23), used to select the active Controls from
             the control schedule.
+        sensor_temps_f : Mapping[float, float] | None
+            Tank temperatures keyed by fractional height, read once for all
+            heaters on ``storage_tank``. Sensor heights missing from it are
+            read from the tank.
 
         Raises
         ------
@@ -325,9 +507,20 @@ class WaterHeater:
         controls = self.get_controls_for_hour(hour_of_day)
         if controls is None:
             raise ValueError(f"No Controls configured for hour {hour_of_day}.")
+        sensor_temps_f = sensor_temps_f or {}
         if self._active:
-            if controls.should_turn_off(storage_tank):
+            if controls.should_turn_off(storage_tank, sensor_temps_f.get(controls.off_sensor_fract)):
                 self.turn_off()
         else:
-            if controls.should_turn_on(storage_tank):
+            if controls.should_turn_on(storage_tank, sensor_temps_f.get(controls.on_sensor_fract)):
                 self.turn_on()
+
+
+def _per_step(value: Sequence[float | None] | float | None, num_steps: int) -> list:
+    """Broadcast a scalar to ``num_steps`` entries, or check a sequence's length."""
+    if value is None or isinstance(value, (int, float)):
+        return [value] * num_steps
+    values = list(value)
+    if len(values) != num_steps:
+        raise ValueError(f"Expected {num_steps} per-step values, got {len(values)}.")
+    return values
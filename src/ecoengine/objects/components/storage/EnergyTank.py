@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from typing import Iterable
+
 from .StorageTank import StorageTank
 from ecoengine.constants.constants import _RHO_CP
 
@@ -36,9 +39,13 @@ class EnergyTank(StorageTank):
     where s = shift_pct, dT = storage_temp_f − cold_temp_f,
     a = max(0, min(100, −s)), b = max(0, min(100, dT/strat_slope − s)).
 
-    The inverse (E → s) is computed by binary search in ``_shift_pct_from_energy()``.
+    I(s) is piecewise quadratic in s, so the inverse (E → s) is solved exactly
+    in ``_shift_pct_from_energy()`` and cached until the energy or the profile
+    parameters change.
     """
 
+    __slots__ = ("_cold_temp_f", "_storage_temp_f", "strat_slope", "_energy_btu", "_cold_pct", "_shift_cache")
+
     def __init__(
         self,
         total_volume_gal: float,
@@ -68,6 +75,8 @@ class EnergyTank(StorageTank):
         # the cold-water inlet pipe from all energy integrals.  Default 0.0
         # means the full tank height is usable.
         self._cold_pct: float = 0.0
+        # _shift_pct_from_energy() result and the state it was computed for
+        self._shift_cache: tuple[tuple, float] | None = None
 
     # ------------------------------------------------------------------
     # Energy ↔ shift_pct helpers
@@ -103,33 +112,79 @@ class EnergyTank(StorageTank):
 
     def _shift_pct_from_energy(self) -> float:
         """
-        Inverse mapping: return shift_pct for the current ``_energy_btu`` via
-        binary search on ``_energy_at_shift_pct``.
+        Inverse mapping: return shift_pct for the current ``_energy_btu``.
 
-        shift_pct ranges from −100 (fully cold) to x_ramp (fully hot).
-        30 iterations give sub-nanogallon precision on any physical tank.
+        shift_pct ranges from −100 (fully cold) to x_ramp (fully hot). The
+        result is cached and reused while ``_energy_btu``, the tank volume, the
+        cold / storage temperatures, ``strat_slope`` and ``_cold_pct`` are
+        unchanged.
+        """
+        key = (
+            self._energy_btu, self.total_volume_gal, self._cold_temp_f,
+            self._storage_temp_f, self.strat_slope, self._cold_pct,
+        )
+        cache = self._shift_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        shift_pct = self._solve_shift_pct()
+        self._shift_cache = (key, shift_pct)
+        return shift_pct
+
+    def _solve_shift_pct(self) -> float:
+        """
+        Solve ``_energy_at_shift_pct(s) = _energy_btu`` for s exactly.
+
+        The zone boundaries ``a`` and ``b`` are each either clamped (constant)
+        or sliding (``−s`` and ``x_ramp − s``), and switch between the two at
+        the breakpoints ``s = −100, −_cold_pct, x_ramp − 100, x_ramp −
+        _cold_pct``. Between breakpoints the integral is therefore a quadratic
+        ``A·s² + B·s + C``: the segment holding the target energy is found
+        from the (non-decreasing) integral at the breakpoints, then its
+        quadratic is solved.
         """
         dT = self._storage_temp_f - self._cold_temp_f
         if dT <= 0.0:
             return 0.0
-        E = max(0.0, min(self._energy_btu, self._max_energy_btu()))
+        e_max = self._max_energy_btu()
+        E = max(0.0, min(self._energy_btu, e_max))
         if E <= 0.0:
             return -100.0
-        if E >= self._max_energy_btu():
-            return dT / self.strat_slope
-        lo: float = -100.0
-        hi: float = dT / self.strat_slope
-        tol: float = 1e-6 * max(E, 1.0)
-        for _ in range(30):
-            mid = (lo + hi) * 0.5
-            e_mid = self._energy_at_shift_pct(mid)
-            if abs(e_mid - E) < tol:
+        x_ramp = dT / self.strat_slope
+        if E >= e_max:
+            return x_ramp
+
+        c      = self._cold_pct
+        scale  = _RHO_CP * self.total_volume_gal / 100.0
+        target = E / scale
+        breaks = sorted({-100.0, x_ramp} | {
+            s for s in (-c, x_ramp - 100.0, x_ramp - c) if -100.0 < s < x_ramp
+        })
+        s_lo = breaks[0]
+        for s_hi in breaks[1:]:
+            if self._energy_at_shift_pct(s_hi) / scale >= target:
                 break
-            if e_mid < E:
-                lo = mid
-            else:
-                hi = mid
-        return (lo + hi) * 0.5
+            s_lo = s_hi
+
+        # Boundary forms on this segment: bound = b0 + b1·s with b1 ∈ {0, −1}
+        s_mid  = 0.5 * (s_lo + s_hi)
+        a0, a1 = (-0.0, -1.0) if c < -s_mid < 100.0 else (max(c, min(100.0, -s_mid)), 0.0)
+        b0, b1 = (x_ramp, -1.0) if c < x_ramp - s_mid < 100.0 else (max(c, min(100.0, x_ramp - s_mid)), 0.0)
+        alpha, beta = a1 + 1.0, b1 + 1.0
+
+        # I(s) = k/2·[(b0 + β·s)² − (a0 + α·s)²] + dT·(100 − b0 − b1·s)
+        k  = self.strat_slope
+        A  = 0.5 * k * (beta * beta - alpha * alpha)
+        B  = k * (b0 * beta - a0 * alpha) - dT * b1
+        C  = 0.5 * k * (b0 * b0 - a0 * a0) + dT * (100.0 - b0) - target
+
+        if abs(A) < 1e-12:
+            s = -C / B if B != 0.0 else s_lo
+        else:
+            disc = max(0.0, B * B - 4.0 * A * C)
+            q    = -0.5 * (B + math.copysign(math.sqrt(disc), B))
+            roots = [q / A] + ([C / q] if q != 0.0 else [])
+            s = min(roots, key=lambda r: max(s_lo - r, r - s_hi, 0.0))
+        return max(s_lo, min(s_hi, s))
 
     # ------------------------------------------------------------------
     # Initialization
@@ -162,6 +217,14 @@ class EnergyTank(StorageTank):
         s_init = (percent_useable - 1.0) * 100.0
         self._energy_btu = self._energy_at_shift_pct(s_init)
 
+    def snapshot(self) -> tuple[float, float, float]:
+        """Return ``(energy_btu, cold_temp_f, storage_temp_f)``."""
+        return (self._energy_btu, self._cold_temp_f, self._storage_temp_f)
+
+    def restore(self, state: tuple[float, float, float]) -> None:
+        """Reset the thermal state to one returned by ``snapshot()``."""
+        self._energy_btu, self._cold_temp_f, self._storage_temp_f = state
+
     # ------------------------------------------------------------------
     # Temperature queries
     # ------------------------------------------------------------------
@@ -181,6 +244,19 @@ class EnergyTank(StorageTank):
         temp      = self.strat_slope * (x_pct + shift_pct) + self._cold_temp_f
         return max(self._cold_temp_f, min(self._storage_temp_f, temp))
 
+    def get_temperatures_at_fractions(self, fracts: Iterable[float]) -> list[float]:
+        """Batched ``get_temperature_at_fraction`` sharing one energy inversion."""
+        shift_pct = self._shift_pct_from_energy()
+        cold, hot = self._cold_temp_f, self._storage_temp_f
+        temps: list[float] = []
+        for f in fracts:
+            x_pct = f * 100.0
+            if x_pct < self._cold_pct:
+                temps.append(cold)
+            else:
+                temps.append(max(cold, min(hot, self.strat_slope * (x_pct + shift_pct) + cold)))
+        return temps
+
     def get_usable_volume_supplyT_gal(self, supply_temp_f: float) -> float:
         """Return gallons currently at or above ``supply_temp_f``."""
         shift_pct    = self._shift_pct_from_energy()
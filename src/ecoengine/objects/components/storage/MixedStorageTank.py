@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from typing import Iterable
+
 from .StorageTank import StorageTank
 from ecoengine.constants.constants import _RHO_CP
 
@@ -22,8 +25,13 @@ class MixedStorageTank(StorageTank):
     * ``draw()`` cools the tank proportionally to cold make-up water added.
     * ``add_recirc_return()`` applies a net temperature drop equal to the
       recirc heat loss for the timestep.
+    * ``advance()`` evolves the tank over any duration under constant heat,
+      loss and flow rates in closed form, optionally stopping exactly where
+      a control trigger temperature is crossed.
     """
 
+    __slots__ = ("_temperature_f", "_cold_temp_f")
+
     def __init__(self, total_volume_gal: float) -> None:
         """
         Parameters
@@ -33,6 +41,7 @@ class MixedStorageTank(StorageTank):
         """
         self.total_volume_gal = total_volume_gal
         self._temperature_f: float = 0.0   # set by initialize()
+        self._cold_temp_f: float   = 0.0   # set by initialize()
 
     # ------------------------------------------------------------------
     # Initialization
@@ -62,6 +71,14 @@ class MixedStorageTank(StorageTank):
         self._temperature_f = storage_temp_f
         self._cold_temp_f   = cold_temp_f
 
+    def snapshot(self) -> tuple[float, float]:
+        """Return ``(temperature_f, cold_temp_f)``."""
+        return (self._temperature_f, self._cold_temp_f)
+
+    def restore(self, state: tuple[float, float]) -> None:
+        """Reset the thermal state to one returned by ``snapshot()``."""
+        self._temperature_f, self._cold_temp_f = state
+
     # ------------------------------------------------------------------
     # Temperature queries
     # ------------------------------------------------------------------
@@ -70,6 +87,10 @@ class MixedStorageTank(StorageTank):
         """Return the uniform tank temperature (identical at all heights)."""
         return self._temperature_f
 
+    def get_temperatures_at_fractions(self, fracts: Iterable[float]) -> list[float]:
+        """Return the uniform tank temperature once per requested height."""
+        return [self._temperature_f for _ in fracts]
+
     def get_usable_volume_supplyT_gal(self, supply_temp_f: float) -> float:
         """Return full tank volume if at or above supply temperature, else 0."""
         return self.total_volume_gal if self._temperature_f >= supply_temp_f else 0.0
@@ -238,6 +259,129 @@ class MixedStorageTank(StorageTank):
         )
         self._temperature_f = total_energy / (self.total_volume_gal * _RHO_CP)
 
+    def advance(
+        self,
+        duration_min: float,
+        heat_kbtuh: float = 0.0,
+        recirc_flow_gpm: float = 0.0,
+        return_temp_f: float | None = None,
+        fixed_loss_kbtuh: float = 0.0,
+        inflow_gpm: float = 0.0,
+        inflow_temp_f: float | None = None,
+        stop_below_f: float | None = None,
+        stop_at_or_above_f: float | None = None,
+    ) -> float:
+        """
+        Evolve the tank for up to ``duration_min`` minutes under constant
+        rates, in closed form.
+
+        With recirc flow ``q_r`` returning at ``T_ret``, an inflow ``q_in`` at
+        ``T_in`` displacing tank water, heat input ``Q_heat`` and a fixed loss
+        ``Q_loss``, the uniform temperature obeys the linear ODE
+
+            V · dT/dt = q_r · (T_ret − T) + q_in · (T_in − T) + (Q_heat − Q_loss) / ρCp
+
+        whose solution is ``T(t) = T∞ + (T0 − T∞) · exp(−k·t)`` with
+        ``k = (q_r + q_in) / V``, or ``T0 + g·t`` when there is no flow.
+
+        The advance ends early at the first instant the temperature drops
+        below ``stop_below_f`` or reaches ``stop_at_or_above_f``, leaving the
+        tank exactly at that temperature; this is where a heater's ON / OFF
+        trigger would fire.
+
+        Parameters
+        ----------
+        duration_min : float
+            Maximum time to advance [minutes].
+        heat_kbtuh : float
+            Constant heat input [kBTU/hr].
+        recirc_flow_gpm : float
+            Recirculation flow through the tank [GPM].
+        return_temp_f : float | None
+            Recirc return temperature [°F]; required when ``recirc_flow_gpm > 0``.
+        fixed_loss_kbtuh : float
+            Constant heat loss [kBTU/hr] (see ``apply_fixed_heat_loss_kbtuh``).
+        inflow_gpm : float
+            Flow entering the tank and displacing an equal volume [GPM]
+            (see ``mix_primary_inflow``).
+        inflow_temp_f : float | None
+            Inflow temperature [°F]; required when ``inflow_gpm > 0``.
+        stop_below_f, stop_at_or_above_f : float | None
+            Trigger temperatures that end the advance early [°F].
+
+        Returns
+        -------
+        float
+            Minutes actually advanced: ``duration_min`` unless a trigger was
+            crossed first.
+
+        Raises
+        ------
+        ValueError
+            If a flow is given without its temperature, or a rate is negative.
+        """
+        if min(duration_min, heat_kbtuh, recirc_flow_gpm, fixed_loss_kbtuh, inflow_gpm) < 0.0:
+            raise ValueError("advance() durations and rates must be non-negative.")
+        if (recirc_flow_gpm > 0.0 and return_temp_f is None) or (inflow_gpm > 0.0 and inflow_temp_f is None):
+            raise ValueError("advance() needs a temperature for every non-zero flow.")
+
+        t0 = self._temperature_f
+        if (stop_below_f is not None and t0 < stop_below_f) or \
+                (stop_at_or_above_f is not None and t0 >= stop_at_or_above_f):
+            return 0.0
+
+        vol_rho_cp = self.total_volume_gal * _RHO_CP
+        k          = (recirc_flow_gpm + inflow_gpm) / self.total_volume_gal   # [1/min]
+        # Flow-independent heating rate and the flow-weighted source term [°F/min]
+        g          = (heat_kbtuh - fixed_loss_kbtuh) * 1000.0 / 60.0 / vol_rho_cp
+        source     = g
+        if recirc_flow_gpm > 0.0:
+            source += recirc_flow_gpm * return_temp_f / self.total_volume_gal
+        if inflow_gpm > 0.0:
+            source += inflow_gpm * inflow_temp_f / self.total_volume_gal
+        t_inf = source / k if k > 0.0 else None
+
+        stop_min = duration_min
+        stop_f   = None
+        for target_f, falling in ((stop_below_f, True), (stop_at_or_above_f, False)):
+            if target_f is None:
+                continue
+            t_cross = self._minutes_to_reach(t0, target_f, falling, k, t_inf, g)
+            if t_cross is not None and t_cross < stop_min:
+                stop_min, stop_f = t_cross, target_f
+
+        if stop_f is not None:
+            self._temperature_f = stop_f
+        elif t_inf is not None:
+            self._temperature_f = t_inf + (t0 - t_inf) * math.exp(-k * stop_min)
+        else:
+            self._temperature_f = t0 + g * stop_min
+        return stop_min
+
+    @staticmethod
+    def _minutes_to_reach(
+        t0: float,
+        target_f: float,
+        falling: bool,
+        k: float,
+        t_inf: float | None,
+        g: float,
+    ) -> float | None:
+        """
+        Time for the ``advance()`` trajectory to reach ``target_f`` moving in
+        the given direction, or None if it never does.
+        """
+        if t_inf is None:
+            if (g < 0.0) if falling else (g > 0.0):
+                return (target_f - t0) / g
+            return None
+        # Exponential approach: reachable only strictly between T0 and T∞
+        if falling and not t_inf < target_f <= t0:
+            return None
+        if not falling and not t0 <= target_f < t_inf:
+            return None
+        return -math.log((target_f - t_inf) / (t0 - t_inf)) / k
+
     def get_average_draw_temp_f(self, draw_gal: float) -> float:
         """Return the uniform tank temperature (fully mixed — no stratification)."""
         return self._temperature_f
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from .EnergyTank import EnergyTank, _DEFAULT_STRAT_SLOPE
 from ecoengine.constants.constants import _RHO_CP
 
@@ -44,6 +46,11 @@ class SlugOverlayTank(EnergyTank):
     When the slug is inactive all methods delegate directly to the base EnergyTank.
     """
 
+    __slots__ = (
+        "_supply_temp_f", "percent_useable", "_max_usable_vol_gal",
+        "_slug_active", "_slug_vol_gal", "_slug_temp_f", "_slug_top_pct", "_original_slug_vol_gal",
+    )
+
     def __init__(
         self,
         total_volume_gal: float,
@@ -80,6 +87,7 @@ class SlugOverlayTank(EnergyTank):
         self._slug_vol_gal: float       = 0.0
         self._slug_temp_f: float        = cold_temp_f
         self._slug_top_pct: float       = self._cold_pct
+        self._original_slug_vol_gal: float = 0.0
 
     # ------------------------------------------------------------------
     # Initialization
@@ -122,6 +130,24 @@ class SlugOverlayTank(EnergyTank):
             self._max_energy_btu(),
         ))
 
+    def snapshot(self) -> tuple:
+        """
+        Return the EnergyTank state followed by ``(slug_active, slug_vol_gal,
+        slug_temp_f, slug_top_pct, original_slug_vol_gal)``.
+        """
+        return super().snapshot() + (
+            self._slug_active, self._slug_vol_gal, self._slug_temp_f,
+            self._slug_top_pct, self._original_slug_vol_gal,
+        )
+
+    def restore(self, state: tuple) -> None:
+        """Reset the tank and slug state to one returned by ``snapshot()``."""
+        super().restore(state[:-5])
+        (
+            self._slug_active, self._slug_vol_gal, self._slug_temp_f,
+            self._slug_top_pct, self._original_slug_vol_gal,
+        ) = state[-5:]
+
     # ------------------------------------------------------------------
     # Slug lifecycle
     # ------------------------------------------------------------------
@@ -297,6 +323,32 @@ class SlugOverlayTank(EnergyTank):
         fract_minus_slug_vol = fract - (total_slug_growth_gal/self.total_volume_gal)
         return super().get_temperature_at_fraction(fract_minus_slug_vol)
 
+    def get_temperatures_at_fractions(self, fracts: Iterable[float]) -> list[float]:
+        """
+        Batched ``get_temperature_at_fraction``: heights above the slug are
+        shifted by the slug growth and evaluated in one base-profile call.
+        """
+        if not self._slug_active:
+            return super().get_temperatures_at_fractions(fracts)
+        slug_t       = max(self._cold_temp_f, min(self._storage_temp_f, self._slug_temp_f))
+        growth_fract = (self._slug_vol_gal - self._original_slug_vol_gal) / self.total_volume_gal
+        temps: list[float] = []
+        above: list[int]   = []   # indices of heights above the slug
+        for f in fracts:
+            x_pct = f * 100.0
+            if x_pct < self._cold_pct:
+                temps.append(self._cold_temp_f)
+            elif x_pct <= self._slug_top_pct:
+                temps.append(slug_t)
+            else:
+                above.append(len(temps))
+                temps.append(f - growth_fract)
+        if above:
+            base_temps = super().get_temperatures_at_fractions([temps[i] for i in above])
+            for i, t in zip(above, base_temps):
+                temps[i] = t
+        return temps
+
     def get_usable_volume_supplyT_gal(self, supply_temp_f: float) -> float:
         """
         Return gallons currently at or above ``supply_temp_f``.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 # ---------------------------------------------------------------------------
@@ -16,8 +17,15 @@ class StorageTank(ABC):
 
     Every subclass must expose ``total_volume_gal`` as a plain attribute and
     implement the five simulation methods listed below.
+
+    Tanks use ``__slots__`` and expose their evolving thermal state through
+    ``snapshot()`` / ``restore()``: a small immutable tuple that a trial
+    simulation can branch from (or ship to a worker process) instead of
+    rebuilding or deep-copying the tank.
     """
 
+    __slots__ = ("total_volume_gal",)
+
     total_volume_gal: float
 
     @abstractmethod
@@ -29,6 +37,19 @@ class StorageTank(ABC):
     ) -> None:
         """Set initial tank thermal state before a simulation begins."""
 
+    @abstractmethod
+    def snapshot(self) -> tuple:
+        """
+        Return the tank's thermal state as an immutable tuple.
+
+        Only state changed by ``initialize()`` and the simulation methods is
+        captured; construction parameters such as the volume are not.
+        """
+
+    @abstractmethod
+    def restore(self, state: tuple) -> None:
+        """Reset the thermal state to one returned by ``snapshot()``."""
+
     @abstractmethod
     def get_temperature_at_fraction(self, fract: float) -> float:
         """
@@ -36,6 +57,17 @@ class StorageTank(ABC):
         Used by Controls to decide whether to fire the heater.
         """
 
+    def get_temperatures_at_fractions(self, fracts: Iterable[float]) -> list[float]:
+        """
+        Return water temperatures at several fractional tank heights.
+
+        Equals ``[get_temperature_at_fraction(f) for f in fracts]``. Subclasses
+        override it to evaluate the profile terms shared by every height once
+        per call; simulation steps use it for the recorded tank profile and
+        the control sensor readings.
+        """
+        return [self.get_temperature_at_fraction(f) for f in fracts]
+
     @abstractmethod
     def get_usable_volume_supplyT_gal(self, supply_temp_f: float) -> float:
         """Return gallons currently at or above supply temperature."""
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import math
+from typing import Iterable, Mapping
+
+import numpy as np
+
 from .StorageTank import StorageTank
 from ecoengine.constants.constants import _RHO_CP
 
 _DEFAULT_STRAT_SLOPE: float = 2.8
 
+# Solvers for the physical draw volume when a draw reaches the transition zone
+_DRAW_METHODS = ("analytic", "bisection")
+
 
 class StratifiedTank(StorageTank):
     """
@@ -34,10 +42,13 @@ class StratifiedTank(StorageTank):
       the top, the thermocline falls (more hot water available).
     """
 
+    __slots__ = ("strat_slope", "draw_method", "_delta_gal", "_strat_inter", "_inlet_temp_f", "_outlet_temp_f")
+
     def __init__(
         self,
         total_volume_gal: float,
         strat_slope: float = _DEFAULT_STRAT_SLOPE,
+        draw_method: str = "analytic",
     ) -> None:
         """
         Parameters
@@ -50,9 +61,16 @@ class StratifiedTank(StorageTank):
             mean a sharper thermocline (better stratification). Defaults to
             2.8, calibrated for a standard 12-node tank. DHWSystem subclasses
             that model different schematics may set a different value here.
+        draw_method : str
+            How ``draw()`` solves for the physical draw volume once a draw
+            dips into the transition zone: ``"analytic"`` (closed form,
+            default) or ``"bisection"`` (iterative reference solver).
         """
+        if draw_method not in _DRAW_METHODS:
+            raise ValueError(f"draw_method must be one of {_DRAW_METHODS}, got {draw_method!r}")
         self.total_volume_gal = total_volume_gal
         self.strat_slope      = strat_slope
+        self.draw_method      = draw_method
 
         # Internal state — set by initialize()
         self._delta_gal:    float = 0.0
@@ -97,6 +115,14 @@ class StratifiedTank(StorageTank):
         x_cold_pct = (1.0 - percent_useable) * 100.0
         self._strat_inter = cold_temp_f - self.strat_slope * x_cold_pct
 
+    def snapshot(self) -> tuple[float, float, float, float]:
+        """Return ``(delta_gal, strat_inter, inlet_temp_f, outlet_temp_f)``."""
+        return (self._delta_gal, self._strat_inter, self._inlet_temp_f, self._outlet_temp_f)
+
+    def restore(self, state: tuple[float, float, float, float]) -> None:
+        """Reset the thermal state to one returned by ``snapshot()``."""
+        self._delta_gal, self._strat_inter, self._inlet_temp_f, self._outlet_temp_f = state
+
     # ------------------------------------------------------------------
     # Temperature queries
     # ------------------------------------------------------------------
@@ -120,6 +146,14 @@ class StratifiedTank(StorageTank):
         temp      = self.strat_slope * (x_pct + shift_pct) + self._strat_inter
         return max(self._inlet_temp_f, min(self._outlet_temp_f, temp))
 
+    def get_temperatures_at_fractions(self, fracts: Iterable[float]) -> list[float]:
+        """Batched ``get_temperature_at_fraction`` sharing one thermocline shift."""
+        shift_pct = self._delta_gal / self.total_volume_gal * 100.0
+        slope     = self.strat_slope
+        inter     = self._strat_inter
+        lo, hi    = self._inlet_temp_f, self._outlet_temp_f
+        return [max(lo, min(hi, slope * (f * 100.0 + shift_pct) + inter)) for f in fracts]
+
     def get_usable_volume_supplyT_gal(self, supply_temp_f: float) -> float:
         """
         Return gallons of water currently at or above supply temperature.
@@ -183,8 +217,9 @@ class StratifiedTank(StorageTank):
 
         When the hot zone is partially depleted, the drawn block dips into the
         transition zone and its average temperature falls below ``outlet_temp_f``.
-        In that case, ``get_average_draw_temp_f`` is used to binary-search for
-        the physical volume whose actual supply-temp yield equals the demand.
+        The supply-temp yield of the block is then piecewise quadratic in its
+        volume, and the volume whose yield equals the demand is solved in
+        closed form (or by bisection with ``draw_method="bisection"``).
 
         If even drawing the full tank cannot satisfy the demand (true outage),
         the entire tank volume is drawn and the caller detects the shortfall via
@@ -224,16 +259,76 @@ class StratifiedTank(StorageTank):
             return
 
         # Slow path: draw dips into the transition / cold zone.
-        # Binary-search for draw_gal where supply-temp yield equals demand.
+        # Solve for draw_gal where supply-temp yield equals demand.
         #   yield(draw_gal) = draw_gal × (avg_temp(draw_gal) − cold) / supply_delta
-        lo = physical_vol
-        hi = self.total_volume_gal
+        if self.draw_method == "bisection":
+            draw_gal = self._solve_draw_gal_bisection(volume_supplyT_gal, physical_vol, supply_delta)
+        else:
+            draw_gal = self._solve_draw_gal_analytic(volume_supplyT_gal, supply_delta)
+
+        self._delta_gal -= min(draw_gal, self.total_volume_gal)
+        self._delta_gal = max(self._delta_gal, self._delta_gal_floor(supply_temp_f))
+
+    def _solve_draw_gal_analytic(self, volume_supplyT_gal: float, supply_delta: float) -> float:
+        """
+        Physical gallons whose supply-temp yield equals ``volume_supplyT_gal``,
+        solved in closed form. Returns the full tank volume if even that
+        cannot meet the demand.
+
+        Measured by depth p from the top (in percent of the tank), the
+        temperature excess over cold water is ``outlet - cold`` down to the
+        hot boundary ``p_hot``, falls linearly at ``strat_slope`` per percent
+        down to the cold boundary ``p_cold``, and is zero below. Its integral
+        is therefore linear, then quadratic, then constant in p.
+        """
+        cold      = self._inlet_temp_f
+        shift_pct = self._delta_gal / self.total_volume_gal * 100.0
+        x_cold_pct = max(0.0, min(100.0, (cold - self._strat_inter) / self.strat_slope - shift_pct))
+        x_hot_pct  = max(0.0, min(100.0,
+            (self._outlet_temp_f - self._strat_inter) / self.strat_slope - shift_pct))
+        p_hot, p_cold = 100.0 - x_hot_pct, 100.0 - x_cold_pct
+
+        # Demand as a temperature-excess integral [°F · percent of tank]
+        target = volume_supplyT_gal * supply_delta / self.total_volume_gal * 100.0
+
+        # Hot zone
+        hot_excess = self._outlet_temp_f - cold
+        if target <= hot_excess * p_hot:
+            return target / hot_excess * self.total_volume_gal / 100.0
+
+        # Transition zone: excess(p) = g_hot − strat_slope·(p − p_hot), so the
+        # integral over [p_hot, p_hot + t] is g_hot·t − strat_slope·t²/2
+        remaining = target - hot_excess * p_hot
+        width     = p_cold - p_hot
+        g_hot     = self.strat_slope * (x_hot_pct + shift_pct) + self._strat_inter - cold
+        if width <= 0.0 or remaining > g_hot * width - 0.5 * self.strat_slope * width * width:
+            return self.total_volume_gal
+
+        # Smaller root of strat_slope/2·t² − g_hot·t + remaining = 0, in the
+        # cancellation-free form
+        disc = max(0.0, g_hot * g_hot - 2.0 * self.strat_slope * remaining)
+        t    = 2.0 * remaining / (g_hot + math.sqrt(disc))
+        return (p_hot + min(t, width)) * self.total_volume_gal / 100.0
+
+    def _solve_draw_gal_bisection(
+        self,
+        volume_supplyT_gal: float,
+        lo: float,
+        supply_delta: float,
+    ) -> float:
+        """
+        Reference solver for ``_solve_draw_gal_analytic``: bisects on
+        ``get_average_draw_temp_f`` between ``lo`` (the all-hot estimate) and
+        the full tank volume, to within 1e-6 gal.
+        """
+        cold = self._inlet_temp_f
+        hi   = self.total_volume_gal
 
         for _ in range(52):
             mid = (lo + hi) * 0.5
             avg_t = self.get_average_draw_temp_f(mid)
-            if avg_t > cold_temp_f:
-                yield_mid = mid * (avg_t - cold_temp_f) / supply_delta
+            if avg_t > cold:
+                yield_mid = mid * (avg_t - cold) / supply_delta
             else:
                 yield_mid = 0.0
             if yield_mid < volume_supplyT_gal:
@@ -242,9 +337,7 @@ class StratifiedTank(StorageTank):
                 hi = mid
             if hi - lo < 1e-6:
                 break
-
-        self._delta_gal -= min((lo + hi) * 0.5, self.total_volume_gal)
-        self._delta_gal = max(self._delta_gal, self._delta_gal_floor(supply_temp_f))
+        return (lo + hi) * 0.5
 
     def heat(
         self,
@@ -412,6 +505,169 @@ class StratifiedTank(StorageTank):
             self._delta_gal -= gal
             self._delta_gal = max(self._delta_gal, self._delta_gal_floor(supply_temp_f))
 
+    def advance_steps(
+        self,
+        max_steps: int,
+        duration_min: float,
+        heat_kbtuh: float,
+        outlet_temp_f: float,
+        draw_supplyT_gal: float,
+        cold_temp_f: float,
+        supply_temp_f: float,
+        fracts: Iterable[float],
+        stop_below: Mapping[float, float] | None = None,
+        stop_at_or_above: Mapping[float, float] | None = None,
+    ) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Apply up to ``max_steps`` identical ``heat()`` + ``draw()`` timesteps
+        in one jump, stopping before the first step where that would no
+        longer be a constant shift of ``_delta_gal``.
+
+        While the heat is below the fully-hot cap, the draw stays within the
+        hot zone and the tank keeps usable water above the floor, every step
+        moves ``_delta_gal`` by the same amount, so the number of steps until
+        one of those limits, or a sensor condition, is reached is solved for
+        directly. The caller takes the step where that happens the usual way.
+        The states passed through are still added up one step at a time, so
+        they are bit-identical to those of the stepped run.
+
+        Parameters
+        ----------
+        max_steps : int
+            Maximum number of timesteps to advance.
+        duration_min : float
+            Length of each timestep [minutes].
+        heat_kbtuh : float
+            Heating rate applied in every step [kBTU/hr], as passed to ``heat()``.
+        outlet_temp_f : float
+            Heater outlet temperature [°F], as passed to ``heat()`` and ``draw()``.
+        draw_supplyT_gal : float
+            Demand drawn in every step [supply-temperature gal].
+        cold_temp_f : float
+            Incoming cold water temperature [°F].
+        supply_temp_f : float
+            System supply (delivery) temperature [°F].
+        fracts : Iterable[float]
+            Fractional heights at which to report temperatures after each step.
+        stop_below : Mapping[float, float] | None
+            ``{fract: temp_f}``: stop before a step that starts with the tank
+            below ``temp_f`` at height ``fract`` (a heater turning on).
+        stop_at_or_above : Mapping[float, float] | None
+            ``{fract: temp_f}``: stop before a step that starts with the tank
+            at or above ``temp_f`` at height ``fract`` (a heater turning off).
+
+        Returns
+        -------
+        tuple[int, np.ndarray, np.ndarray]
+            ``(num_steps, usable_volume_supplyT_gal, temps_f)``: the steps
+            taken, the usable volume after each step, and the temperatures at
+            ``fracts`` after each step (shape ``(num_steps, len(fracts))``).
+            No steps are taken unless the tank's inlet and outlet temperatures
+            already equal ``cold_temp_f`` and ``outlet_temp_f`` (the previous
+            step ran with the same inputs) and ``outlet_temp_f >= supply_temp_f``.
+        """
+        fract_pct = np.asarray(list(fracts), dtype=float) * 100.0
+        stop_below       = stop_below or {}
+        stop_at_or_above = stop_at_or_above or {}
+        no_steps = (0, np.empty(0), np.empty((0, len(fract_pct))))
+        if (
+            max_steps <= 0
+            or cold_temp_f != self._inlet_temp_f
+            or outlet_temp_f != self._outlet_temp_f
+            or outlet_temp_f < supply_temp_f
+            or outlet_temp_f <= cold_temp_f
+        ):
+            return no_steps
+
+        vol   = self.total_volume_gal
+        slope = self.strat_slope
+        inter = self._strat_inter
+        heat_gal = 0.0
+        if heat_kbtuh > 0.0:
+            heat_gal = heat_kbtuh * duration_min / 60.0 * 1000.0 / (_RHO_CP * (outlet_temp_f - cold_temp_f))
+        draw_gal = 0.0
+        if draw_supplyT_gal > 0.0:
+            draw_gal = draw_supplyT_gal * (supply_temp_f - cold_temp_f) / (outlet_temp_f - cold_temp_f)
+        step_gal = heat_gal - draw_gal
+
+        delta_gal_max = (outlet_temp_f - inter) / slope * vol / 100.0
+        floor_outlet  = self._delta_gal_floor(outlet_temp_f)
+        floor_supply  = self._delta_gal_floor(supply_temp_f)
+
+        def _sensor_gal(fract: float, temp_f: float) -> float:
+            # _delta_gal at which the ramp reaches temp_f at height fract
+            return ((temp_f - inter) / slope - fract * 100.0) * vol / 100.0
+
+        def _temp_at(fract: float, shift_pct: float) -> float:
+            return max(cold_temp_f, min(outlet_temp_f, slope * (fract * 100.0 + shift_pct) + inter))
+
+        def _steps_normally(delta_gal: float) -> bool:
+            # True if a step starting at delta_gal heats below the cap, draws
+            # only hot water, leaves usable water and trips no sensor
+            after_heat = delta_gal + heat_gal
+            after_draw = after_heat - draw_gal
+            if heat_gal > 0.0 and after_heat > delta_gal_max:
+                return False
+            if (draw_gal > 0.0 and after_draw < floor_outlet) or after_draw <= floor_supply:
+                return False
+            shift_pct = delta_gal / vol * 100.0
+            if any(_temp_at(fract, shift_pct) < temp_f for fract, temp_f in stop_below.items()):
+                return False
+            return not any(_temp_at(fract, shift_pct) >= temp_f for fract, temp_f in stop_at_or_above.items())
+
+        delta_0 = self._delta_gal
+
+        def _trajectory(num: int) -> np.ndarray:
+            # _delta_gal after each of num steps, added up one heat() and one
+            # draw() at a time like the stepped run (a closed form such as
+            # delta_0 + k * step_gal rounds differently)
+            moves = np.empty(2 * num + 1)
+            moves[0]    = delta_0
+            moves[1::2] = heat_gal
+            moves[2::2] = -draw_gal
+            return np.add.accumulate(moves)[2::2]
+
+        if not _steps_normally(delta_0):
+            return no_steps
+
+        # Every limit is a threshold on _delta_gal (sensors set outside
+        # (cold, outlet] never trip, being held there by the profile clamp);
+        # the first one ahead of delta_0 in the direction of travel ends the run
+        limits = [floor_supply - step_gal]
+        if heat_gal > 0.0:
+            limits.append(delta_gal_max - heat_gal)
+        if draw_gal > 0.0:
+            limits.append(floor_outlet - step_gal)
+        limits += [
+            _sensor_gal(fract, temp_f)
+            for sensors in (stop_below, stop_at_or_above)
+            for fract, temp_f in sensors.items()
+            if cold_temp_f < temp_f <= outlet_temp_f
+        ]
+        num_steps = max_steps
+        if step_gal != 0.0:
+            ahead = [(limit - delta_0) / step_gal for limit in limits]
+            ahead = [steps for steps in ahead if steps > 0.0]
+            if ahead:
+                num_steps = min(max_steps, max(1, math.ceil(min(ahead))))
+        # The closed form can be off by a step at a threshold; settle on the
+        # exact check, against the values the stepped run would reach
+        delta_gal = _trajectory(min(max_steps, num_steps + 1))
+        while num_steps > 1 and not _steps_normally(delta_gal[num_steps - 2]):
+            num_steps -= 1
+        while num_steps < max_steps and _steps_normally(delta_gal[num_steps - 1]):
+            num_steps += 1
+            if num_steps >= len(delta_gal) and num_steps < max_steps:
+                delta_gal = _trajectory(min(max_steps, 2 * num_steps))
+
+        delta_gal = delta_gal[:num_steps]
+        self._delta_gal = float(delta_gal[-1])
+        shift_pct = delta_gal / vol * 100.0
+        temps_f   = np.minimum(np.maximum(slope * (fract_pct + shift_pct[:, None]) + inter, cold_temp_f), outlet_temp_f)
+        x_supply_pct = np.minimum(np.maximum((supply_temp_f - inter) / slope - shift_pct, 0.0), 100.0)
+        usable_gal   = (100.0 - x_supply_pct) / 100.0 * vol
+        return num_steps, usable_gal, temps_f
+
     # ------------------------------------------------------------------
     # Sizing support
     # ------------------------------------------------------------------
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import math
 import warnings
 import numpy as np
 from statistics import NormalDist
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from ecoengine.objects.components.heating.WaterHeater import WaterHeater
 from ecoengine.objects.components.heating.Controls import Controls
 from ecoengine.objects.components.storage.StorageTank import StorageTank
 from ecoengine.objects.components.storage.StratifiedTank import StratifiedTank
-from ecoengine.constants.constants import _RHO_CP
+from ecoengine.constants.constants import _RHO_CP, _TANK_NODE_FRACTS
+from ecoengine.objects.simulation.StepResult import StepResult
 
 if TYPE_CHECKING:
     from ecoengine.objects.building.Building import Building
@@ -1621,9 +1623,44 @@ class DHWSystem:
         interval_min: int = 1,
         mode: str = "normal",
     ) -> dict:
+        """
+        Execute one simulation timestep and return its metrics as a dict.
+
+        Convenience wrapper around ``simulate_step_into`` with a fresh
+        StepResult; the simulator uses ``simulate_step_into`` directly.
+        Subclasses customize the step by overriding ``simulate_step_into``.
+
+        Parameters
+        ----------
+        building : Building
+        timestep_interval : int
+            Current simulation interval index from the start of the simulation.
+        interval_min : int
+            Length of each interval in minutes.
+        mode : str
+            Ignored — operating mode is determined automatically by each
+            WaterHeater's control_schedule for the current hour.
+
+        Returns
+        -------
+        dict
+            Keys: 'demand_supplyT_gal', 'usable_volume_supplyT_gal',
+            'heater_output_kbtuh', 'heater_power_in_kw', 'oat_f',
+            'inlet_water_temp_f', 'tank_temps_f', 'mode', plus any optional
+            StepResult field the system set (e.g. 'tm_tank_temp_f').
+        """
+        return self.simulate_step_into(building, timestep_interval, interval_min, StepResult()).to_dict()
+
+    def simulate_step_into(
+        self,
+        building: Building,
+        timestep_interval: int,
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Execute one simulation timestep: query controls, apply heating,
-        draw DHW from tank. Returns per-step metrics.
+        draw DHW from tank. Writes per-step metrics into ``out``.
 
         Order of operations
         -------------------
@@ -1632,7 +1669,7 @@ class DHWSystem:
         3. Update each WaterHeater's on/off state via its Controls.
         4. Sum heating output from all active heaters; apply to storage tank.
         5. Draw DHW from tank to meet demand.
-        6. Return per-step metrics dict.
+        6. Write per-step metrics into ``out``.
 
         Parameters
         ----------
@@ -1641,16 +1678,13 @@ class DHWSystem:
             Current simulation interval index from the start of the simulation.
         interval_min : int
             Length of each interval in minutes.
-        mode : str
-            Ignored — operating mode is determined automatically by each
-            WaterHeater's control_schedule for the current hour.
+        out : StepResult
+            Reused result holder; its ``_STEP_FIELDS`` are overwritten.
 
         Returns
         -------
-        dict
-            Keys: 'demand_supplyT_gal', 'usable_volume_supplyT_gal',
-            'heater_output_kbtuh', 'heater_power_in_kw', 'oat_f',
-            'inlet_water_temp_f', 'tank_temps_f'.
+        StepResult
+            ``out``.
         """
         use_avg = any(wh.is_load_shifting() for wh in self.water_heaters)
         demand_supplyT_gal = building.get_dhw_load_supplyT_gal(
@@ -1677,21 +1711,13 @@ class DHWSystem:
 
         if self.storage_tank is not None:
             # Update on/off state for each heater based on current tank condition
-            for wh in self.water_heaters:
-                wh.update_state(self.storage_tank, hour_of_day)
+            self._update_heater_states(self.storage_tank, hour_of_day)
 
             # Apply heating from all active heaters to the tank
-            top_temp_f     = self.storage_tank.get_temperature_at_fraction(1.0)
-            total_kbtuh    = sum(
-                wh.get_output_kbtuh(oat_f, wh.get_outlet_temp_f(hour_of_day), inlet_temp_f)
-                for wh in self.water_heaters
+            total_kbtuh, active_kws = self._get_heater_output_and_power(
+                oat_f, inlet_temp_f, hour_of_day, step=timestep_interval
             )
             total_kw: float | None = None
-            active_kws = [
-                wh.get_power_in_kw(oat_f, wh.get_outlet_temp_f(hour_of_day), inlet_temp_f)
-                for wh in self.water_heaters
-                if wh.is_active()
-            ]
             if any(kw is not None for kw in active_kws):
                 total_kw = sum(kw or 0.0 for kw in active_kws)
 
@@ -1705,27 +1731,305 @@ class DHWSystem:
             usable_vol_gal = self.storage_tank.get_usable_volume_supplyT_gal(
                 self.supply_temp_f
             )
-            tank_temps_f = [
-                self.storage_tank.get_temperature_at_fraction(f)
-                for f in (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
-            ]
+            tank_temps_f = self.storage_tank.get_temperatures_at_fractions(out.tank_fracts)
         else:
             total_kbtuh    = 0.0
             total_kw       = None
             usable_vol_gal = 0.0
-            tank_temps_f   = [0.0] * 6
+            tank_temps_f   = [0.0] * len(out.tank_fracts)
+
+        out.demand_supplyT_gal        = demand_supplyT_gal
+        out.usable_volume_supplyT_gal = usable_vol_gal
+        out.heater_output_kbtuh       = total_kbtuh
+        out.heater_power_in_kw        = total_kw
+        out.oat_f                     = oat_f
+        out.inlet_water_temp_f        = inlet_temp_f
+        out.tank_temps_f              = tank_temps_f
+        out.mode                      = mode
+        return out
+
+    def _steps_with(self, simulate_step_into) -> bool:
+        """Return True if this system steps with ``simulate_step_into`` and does not override ``simulate_step``."""
+        cls = type(self)
+        return cls.simulate_step is DHWSystem.simulate_step and cls.simulate_step_into is simulate_step_into
+
+    def simulate_until_event(
+        self,
+        building: Building,
+        timestep_interval: int,
+        max_steps: int,
+        interval_min: int = 1,
+        tank_fracts: Sequence[float] = _TANK_NODE_FRACTS,
+    ) -> dict | None:
+        """
+        Jump over the timesteps from ``timestep_interval`` up to the next
+        event, producing the same results as calling ``simulate_step`` for
+        each of them.
+
+        Building inputs change only on the hour, so within an hour every step
+        applies the same heat and draw to the tank. For a StratifiedTank that
+        moves its thermocline by a constant amount per step until an event:
+        a heater's ON or OFF sensor crossing its trigger, the hot zone no
+        longer covering a draw, the tank filling, or usable volume running
+        out. ``StratifiedTank.advance_steps`` solves for that step; the step
+        with the event itself (and the first step of each hour) is left to
+        ``simulate_step``.
+
+        Parameters
+        ----------
+        building : Building
+        timestep_interval : int
+            Index of the first interval to simulate.
+        max_steps : int
+            Maximum number of intervals to advance.
+        interval_min : int
+            Length of each interval in minutes.
+        tank_fracts : Sequence[float]
+            Tank fractions to report in 'tank_temps_f', as
+            ``StepResult.tank_fracts``. Defaults to _TANK_NODE_FRACTS.
+
+        Returns
+        -------
+        dict | None
+            ``simulate_step``'s keys plus 'num_steps', the number of
+            intervals advanced. 'usable_volume_supplyT_gal' holds one value
+            per interval and 'tank_temps_f' one such list per tank node
+            (indexed ``[node_idx][step]``); the other values apply to every
+            interval. None when no interval can be jumped over, including
+            for systems that override ``simulate_step_into`` or store water
+            in anything but a StratifiedTank; step with ``simulate_step_into``
+            instead.
+        """
+        if not self._steps_with(DHWSystem.simulate_step_into) or not isinstance(self.storage_tank, StratifiedTank):
+            return None
+        minute   = timestep_interval * interval_min
+        hour_end = -(-(minute // 60 + 1) * 60 // interval_min)   # first interval of the next hour
+        max_steps = min(max_steps, hour_end - timestep_interval)
+        hour_of_day = (minute // 60) % 24
+
+        # Each heater keeps its state until its own trigger is reached
+        stop_below:       dict[float, float] = {}
+        stop_at_or_above: dict[float, float] = {}
+        for wh in self.water_heaters:
+            controls = wh.get_controls_for_hour(hour_of_day)
+            if controls is None:
+                return None
+            if wh.is_active():
+                fract = controls.off_sensor_fract
+                stop_at_or_above[fract] = min(stop_at_or_above.get(fract, math.inf), controls.off_trigger_t_f)
+            else:
+                fract = controls.on_sensor_fract
+                stop_below[fract] = max(stop_below.get(fract, -math.inf), controls.on_trigger_t_f)
+
+        use_avg = any(wh.is_load_shifting() for wh in self.water_heaters)
+        demand_supplyT_gal = building.get_dhw_load_supplyT_gal(
+            timestep_interval, interval_min, use_avg=use_avg
+        )
+        oat_f         = building.get_oat_f(timestep_interval, interval_min)
+        inlet_temp_f  = building.get_inlet_water_temp_f(timestep_interval, interval_min)
+        outlet_temp_f = self._get_outlet_temp_f(hour_of_day)
+        total_kbtuh, active_kws = self._get_heater_output_and_power(
+            oat_f, inlet_temp_f, hour_of_day, step=timestep_interval
+        )
+
+        num_steps, usable_vol_gal, tank_temps_f = self.storage_tank.advance_steps(
+            max_steps, interval_min, total_kbtuh, outlet_temp_f, demand_supplyT_gal,
+            inlet_temp_f, self.supply_temp_f, tank_fracts,
+            stop_below=stop_below, stop_at_or_above=stop_at_or_above,
+        )
+        if num_steps == 0:
+            return None
 
+        total_kw: float | None = None
+        if any(kw is not None for kw in active_kws):
+            total_kw = sum(kw or 0.0 for kw in active_kws)
+        mode = (
+            self.water_heaters[0].control_schedule[hour_of_day]
+            if self.water_heaters and self.water_heaters[0].control_schedule
+            else "normal"
+        )
         return {
+            "num_steps":                 num_steps,
             "demand_supplyT_gal":        demand_supplyT_gal,
-            "usable_volume_supplyT_gal": usable_vol_gal,
+            "usable_volume_supplyT_gal": usable_vol_gal.tolist(),
             "heater_output_kbtuh":       total_kbtuh,
             "heater_power_in_kw":        total_kw,
             "oat_f":                     oat_f,
             "inlet_water_temp_f":        inlet_temp_f,
-            "tank_temps_f":              tank_temps_f,
+            "tank_temps_f":              tank_temps_f.T.tolist(),
             "mode":                      mode,
         }
 
+    def _update_heater_states(self, storage_tank: StorageTank, hour_of_day: int) -> None:
+        """
+        Update the on/off state of every water heater on ``storage_tank``.
+
+        The ON and OFF sensor heights of all heaters' active Controls are read
+        in one ``get_temperatures_at_fractions`` call and shared between the
+        heaters, which each decide from those readings.
+
+        Parameters
+        ----------
+        storage_tank : StorageTank
+            Tank the heaters' sensors are in.
+        hour_of_day : int
+            Hour of the day (0-23), used to select each heater's Controls.
+        """
+        sensor_fracts: set[float] = set()
+        for wh in self.water_heaters:
+            controls = wh.get_controls_for_hour(hour_of_day)
+            if controls is not None:
+                sensor_fracts.add(controls.on_sensor_fract)
+                sensor_fracts.add(controls.off_sensor_fract)
+        fracts         = sorted(sensor_fracts)
+        sensor_temps_f = dict(zip(fracts, storage_tank.get_temperatures_at_fractions(fracts)))
+        for wh in self.water_heaters:
+            wh.update_state(storage_tank, hour_of_day, sensor_temps_f)
+
+    def _get_heater_output_and_power(
+        self,
+        oat_f: float,
+        inlet_temp_f: float | None,
+        hour_of_day: int,
+        step: int | None = None,
+    ) -> tuple[float, list[float | None]]:
+        """
+        Return the summed heating output of all water heaters and the power
+        input of each active heater, using one performance-map lookup per
+        active heater.
+
+        Parameters
+        ----------
+        oat_f : float
+            Outdoor air temperature [°F].
+        inlet_temp_f : float | None
+            Cold-water inlet temperature [°F]; None uses each map's design inlet.
+        hour_of_day : int
+            Hour of the day (0-23), used to select each heater's outlet temperature.
+        step : int | None
+            Simulation step index; heaters with a precomputed timeline read
+            their entry for this step instead of querying their map.
+
+        Returns
+        -------
+        tuple[float, list[float | None]]
+            ``(total_kbtuh, active_kws)``: total output [kBTU/hr] and the
+            power input [kW] of each active heater (None if unavailable).
+        """
+        total_kbtuh = 0.0
+        active_kws: list[float | None] = []
+        for wh in self.water_heaters:
+            kbtuh, kw = wh.get_output_and_power(
+                oat_f, wh.get_outlet_temp_f(hour_of_day), inlet_temp_f, step=step
+            )
+            total_kbtuh += kbtuh
+            if wh.is_active():
+                active_kws.append(kw)
+        return total_kbtuh, active_kws
+
+    def snapshot(self) -> tuple:
+        """
+        Return the simulation state of the system as an immutable tuple.
+
+        The state is that of the storage tank, the TM tank (if any) and every
+        heater including the TM heater, as returned by their ``snapshot()``;
+        components the system does not have are None.
+        """
+        tm_tank = getattr(self, "tm_storage_tank", None)
+        tanks   = (self.storage_tank, tm_tank)
+        return (
+            tuple(None if tank is None else tank.snapshot() for tank in tanks),
+            tuple(wh.snapshot() for wh in self._get_all_heaters()),
+        )
+
+    def restore(self, state: tuple) -> None:
+        """Reset the simulation state to one returned by ``snapshot()``."""
+        tank_states, heater_states = state
+        for tank, tank_state in zip((self.storage_tank, getattr(self, "tm_storage_tank", None)), tank_states):
+            if tank is not None:
+                tank.restore(tank_state)
+        for wh, heater_state in zip(self._get_all_heaters(), heater_states):
+            wh.restore(heater_state)
+
+    def _get_all_heaters(self) -> list[WaterHeater]:
+        """Return the primary heaters followed by the TM heater, if any."""
+        tm_water_heater = getattr(self, "tm_water_heater", None)
+        return self.water_heaters + ([tm_water_heater] if tm_water_heater is not None else [])
+
+    def precompute_heater_timeline(
+        self,
+        building: Building,
+        num_steps: int,
+        interval_min: int = 1,
+    ) -> None:
+        """
+        Look up every heater's capacity and power for a whole run up front.
+
+        OAT, inlet temperature and hour of day are known for every step before
+        the run starts, so each heater's performance-map lookups can be done
+        once per distinct condition and ``simulate_step`` only indexes the
+        result. Heaters whose lookup conditions depend on simulation state
+        (see ``_get_heater_timeline_conditions``) keep querying their map.
+        Call ``clear_heater_timeline`` once the run is over. Runs longer than
+        a year with yearly repeating inputs store one year of lookups
+        (``Building.get_input_period_steps``).
+
+        Parameters
+        ----------
+        building : Building
+        num_steps : int
+            Number of timesteps in the run.
+        interval_min : int
+            Length of each interval in minutes.
+        """
+        series = building.get_timeseries(building.get_input_period_steps(num_steps, interval_min), interval_min)
+        oats   = series["oat_f"].tolist()
+        inlets = series["inlet_water_temp_f"].tolist()
+        hours  = series["hour_of_day"].tolist()
+        for wh, outlets, inlet_temps in self._get_heater_timeline_conditions(oats, inlets, hours):
+            try:
+                wh.precompute_output_and_power(oats, outlets, inlet_temps)
+            except ValueError:
+                # e.g. a real map without OAT data: stay live so the error is
+                # raised only if the heater actually runs, as before
+                wh.clear_timeline()
+
+    def clear_heater_timeline(self) -> None:
+        """Drop all precomputed heater timelines set by ``precompute_heater_timeline``."""
+        for wh in self._get_all_heaters():
+            wh.clear_timeline()
+
+    def _get_heater_timeline_conditions(
+        self,
+        oats: list[float | None],
+        inlets: list[float | None],
+        hours: list[int],
+    ) -> list[tuple[WaterHeater, list[float] | float, list[float | None] | float | None]]:
+        """
+        Return ``(heater, outlet_temps, inlet_temps)`` for each heater whose
+        lookups ``simulate_step`` makes from per-step inputs alone.
+
+        Matches ``_get_heater_output_and_power``: the outlet follows each
+        heater's control schedule and the inlet is the building's. Heaters
+        without Controls are left out. Subclasses override this to change
+        the inlet or to add a TM heater.
+
+        Parameters
+        ----------
+        oats, inlets : list[float | None]
+            Outdoor air and inlet water temperature at each step [°F].
+        hours : list[int]
+            Hour of the day at each step.
+        """
+        conditions = []
+        for wh in self.water_heaters:
+            try:
+                outlet_by_hour = [wh.get_outlet_temp_f(hour) for hour in range(24)]
+            except ValueError:
+                continue
+            conditions.append((wh, [outlet_by_hour[hour] for hour in hours], inlets))
+        return conditions
+
     def _get_outlet_temp_f(self, hour_of_day: int) -> float:
         """
         Return the maximum outlet temperature among all water heaters' active
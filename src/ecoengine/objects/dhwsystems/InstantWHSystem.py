@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ecoengine.constants.constants import _RHO_CP, _W_TO_KBTUH
 from .DHWSystem import DHWSystem
 
+if TYPE_CHECKING:
+    from ecoengine.objects.simulation.StepResult import StepResult
+
 
 class InstantWHSystem(DHWSystem):
     """
@@ -90,13 +95,13 @@ class InstantWHSystem(DHWSystem):
     # Simulation
     # ------------------------------------------------------------------
 
-    def simulate_step(
+    def simulate_step_into(
         self,
         building,
         timestep_interval: int,
-        interval_min: int = 1,
-        mode: str = "normal",
-    ) -> dict:
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Serve demand instantly each timestep — no tank draw or charge cycle.
 
@@ -115,13 +120,12 @@ class InstantWHSystem(DHWSystem):
             / self.defrost_factor / 1000.0
         )
 
-        return {
-            "demand_supplyT_gal":        demand_supplyT_gal,
-            "usable_volume_supplyT_gal": 0.0,
-            "heater_output_kbtuh":       capacity_kbtuh,
-            "heater_power_in_kw":        capacity_kbtuh / _W_TO_KBTUH,  # COP of 1.0
-            "oat_f":                     oat_f,
-            "inlet_water_temp_f":        inlet_temp_f,
-            "tank_temps_f":              [self.supply_temp_f] * 6,
-            "mode":                      "normal",
-        }
+        out.demand_supplyT_gal        = demand_supplyT_gal
+        out.usable_volume_supplyT_gal = 0.0
+        out.heater_output_kbtuh       = capacity_kbtuh
+        out.heater_power_in_kw        = capacity_kbtuh / _W_TO_KBTUH  # COP of 1.0
+        out.oat_f                     = oat_f
+        out.inlet_water_temp_f        = inlet_temp_f
+        out.tank_temps_f              = [self.supply_temp_f] * len(out.tank_fracts)
+        out.mode                      = "normal"
+        return out
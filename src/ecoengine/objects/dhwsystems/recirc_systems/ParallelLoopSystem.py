@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ecoengine.objects.components.heating.Controls import Controls
 from ecoengine.objects.components.heating.WaterHeater import WaterHeater
 from ecoengine.objects.components.storage.StorageTank import StorageTank
@@ -9,6 +11,9 @@ from .RecircSystem import RecircSystem
 from ecoengine.constants.constants import _RHO_CP
 from ecoengine.objects.building.Building import Building
 
+if TYPE_CHECKING:
+    from ecoengine.objects.simulation.StepResult import StepResult
+
 # Minimum recommended TM heater run time per cycle [hr].
 # Below this, short cycling risk is high (mirrors original constant).
 _TM_MIN_RUNTIME_HR: float = 20.0 / 60.0   # 20 minutes
@@ -56,6 +61,7 @@ class ParallelLoopSystem(RecircSystem):
         num_tm_heaters: int = 1,
         max_daily_run_hr: float = 24.0,
         defrost_factor: float = 1.0,
+        tm_exact_switching: bool = False,
     ):
         """
         Parameters
@@ -96,6 +102,9 @@ class ParallelLoopSystem(RecircSystem):
             Maximum hours the primary heating system may run per day.
         defrost_factor : float
             Fraction of rated capacity available after defrost (0–1).
+        tm_exact_switching : bool
+            Switch the TM heater at the exact trigger crossings within a
+            timestep instead of once per timestep. Default False.
         """
         super().__init__(
             water_heaters,
@@ -106,6 +115,7 @@ class ParallelLoopSystem(RecircSystem):
             return_flow_gpm,
             max_daily_run_hr=max_daily_run_hr,
             defrost_factor=defrost_factor,
+            tm_exact_switching=tm_exact_switching,
         )
         self.tm_on_temp_f    = tm_on_temp_f
         self.tm_off_temp_f   = tm_off_temp_f
@@ -142,6 +152,7 @@ class ParallelLoopSystem(RecircSystem):
         control_map=None,
         strat_slope: float = 2.8,
         load_shift_fract_total_vol: float = 1.0,
+        tm_exact_switching: bool = False,
     ) -> ParallelLoopSystem:
         """
         Size the system for the given building, then build it.
@@ -174,6 +185,9 @@ class ParallelLoopSystem(RecircSystem):
         control_schedule : list[str] | None
         control_map : dict[str, Controls] | None
         strat_slope : float
+        tm_exact_switching : bool
+            Switch the TM heater at the exact trigger crossings within a
+            timestep instead of once per timestep. Default False.
 
         Returns
         -------
@@ -193,6 +207,7 @@ class ParallelLoopSystem(RecircSystem):
             num_tm_heaters=num_tm_heaters,
             max_daily_run_hr=max_daily_run_hr,
             defrost_factor=defrost_factor,
+            tm_exact_switching=tm_exact_switching,
         )
         system.size(
             building,
@@ -333,19 +348,19 @@ class ParallelLoopSystem(RecircSystem):
     # Simulation
     # ------------------------------------------------------------------
 
-    def simulate_step(
+    def simulate_step_into(
         self,
         building : Building,
         timestep_interval: int,
-        interval_min: int = 1,
-        mode: str = "normal",
-    ) -> dict:
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Execute one simulation timestep for the parallel loop system.
 
-        Delegates the entire primary system step to DHWSystem.simulate_step()
+        Delegates the entire primary system step to DHWSystem.simulate_step_into()
         via super(), then layers on the TM system (recirc loss → heater response)
-        and merges the energy outputs into the returned dict.
+        and writes the TM outputs into ``out``.
 
         Primary system (via super())
         -----------------------------
@@ -358,6 +373,11 @@ class ParallelLoopSystem(RecircSystem):
         4. Apply recirc loop heat loss to MixedStorageTank via add_recirc_return().
         5. Update TM WaterHeater state; heat TM tank if active.
 
+        With ``tm_exact_switching``, steps 4-5 instead advance the tank under
+        recirc loss and TM heating in closed form, switching the TM heater at
+        the exact on/off trigger crossings (``_advance_tm_tank``), and report
+        the TM output and power averaged over the timestep.
+
         The recirc loop connects only to the TM tank — the primary StratifiedTank
         receives no recirc return flow.
 
@@ -366,53 +386,90 @@ class ParallelLoopSystem(RecircSystem):
         building : Building
         timestep_interval : int
         interval_min : int
-        mode : str
-            Ignored — operating mode determined by each heater's control schedule.
+        out : StepResult
 
         Returns
         -------
-        dict
-            Same keys as DHWSystem.simulate_step(). heater_output_kbtuh and
-            heater_power_in_kw include both primary and TM heater contributions.
+        StepResult
+            ``out``, with the primary fields of DHWSystem.simulate_step_into()
+            and the TM fields set. heater_output_kbtuh and heater_power_in_kw
+            are primary-only.
         """
         # Run primary system: super() → RecircSystem → DHWSystem
-        step = super().simulate_step(building, timestep_interval, interval_min, mode)
+        super().simulate_step_into(building, timestep_interval, interval_min, out)
 
         # ------------------------------------------------------------------
         # TM system — recirc loss applied first, then heater responds
         # ------------------------------------------------------------------
         hour_of_day = (timestep_interval * interval_min // 60) % 24
-        oat_f       = step["oat_f"]
-
-        self.tm_storage_tank.add_recirc_return(
-            self.return_flow_gpm, self.return_temp_f, interval_min
-        )
+        oat_f       = out.oat_f
+
+        if self.tm_exact_switching:
+            # Recirc loss and heating evolve together over the step
+            tm_top_temp_f   = self.tm_storage_tank.get_temperature_at_fraction(1.0)
+            tm_inlet_temp_f = (self.tm_off_temp_f + self.tm_on_temp_f) / 2.0
+            tm_cap_kbtuh, tm_kw_per_unit = self.tm_water_heater.get_running_output_and_power(
+                oat_f, tm_top_temp_f, tm_inlet_temp_f, step=timestep_interval
+            )
+            tm_on_min = self._advance_tm_tank(
+                self.tm_storage_tank, self.tm_water_heater, hour_of_day, interval_min,
+                tm_cap_kbtuh * self.num_tm_heaters,
+                max_temp_f      = self.tm_off_temp_f,
+                recirc_flow_gpm = self.return_flow_gpm,
+                return_temp_f   = self.return_temp_f,
+            )
+            tm_on_fract = tm_on_min / interval_min
+            tm_kbtuh    = tm_cap_kbtuh * self.num_tm_heaters * tm_on_fract
+            tm_kw       = (
+                tm_kw_per_unit * self.num_tm_heaters * tm_on_fract
+                if tm_kw_per_unit is not None and tm_on_min > 0.0 else None
+            )
+        else:
+            self.tm_storage_tank.add_recirc_return(
+                self.return_flow_gpm, self.return_temp_f, interval_min
+            )
 
-        self.tm_water_heater.update_state(self.tm_storage_tank, hour_of_day)
+            self.tm_water_heater.update_state(self.tm_storage_tank, hour_of_day)
 
-        tm_top_temp_f   = self.tm_storage_tank.get_temperature_at_fraction(1.0)
-        tm_inlet_temp_f = (self.tm_off_temp_f + self.tm_on_temp_f) / 2.0
-        tm_kbtuh        = self.tm_water_heater.get_output_kbtuh(oat_f, tm_top_temp_f, tm_inlet_temp_f) * self.num_tm_heaters
-        tm_kw_per_unit  = (
-            self.tm_water_heater.get_power_in_kw(oat_f, tm_top_temp_f, tm_inlet_temp_f)
-            if self.tm_water_heater.is_active()
-            else None
-        )
-        tm_kw = tm_kw_per_unit * self.num_tm_heaters if tm_kw_per_unit is not None else None
-        self.tm_storage_tank.heat(tm_kbtuh, interval_min, self.tm_off_temp_f)
+            tm_top_temp_f   = self.tm_storage_tank.get_temperature_at_fraction(1.0)
+            tm_inlet_temp_f = (self.tm_off_temp_f + self.tm_on_temp_f) / 2.0
+            tm_kbtuh, tm_kw_per_unit = self.tm_water_heater.get_output_and_power(
+                oat_f, tm_top_temp_f, tm_inlet_temp_f, step=timestep_interval
+            )
+            tm_kbtuh        = tm_kbtuh * self.num_tm_heaters
+            tm_kw = tm_kw_per_unit * self.num_tm_heaters if tm_kw_per_unit is not None else None
+            self.tm_storage_tank.heat(tm_kbtuh, interval_min, self.tm_off_temp_f)
 
         # ------------------------------------------------------------------
-        # Merge TM outputs into primary step dict
+        # Merge TM outputs into the primary step result
         # ------------------------------------------------------------------
         # heater_output_kbtuh stays PRIMARY-ONLY (used for gal/hr plot in top chart).
         # TM thermal output is tracked separately in tm_heater_output_kbtuh.
         # heater_power_in_kw merges both so get_total_energy_kwh() is accurate.
         # if tm_kw is not None:
-        #     step["heater_power_in_kw"] = (step["heater_power_in_kw"] or 0.0) + tm_kw
+        #     out.heater_power_in_kw = (out.heater_power_in_kw or 0.0) + tm_kw
 
         # TM panel data (consumed by SimulationRun for the TM subplot)
-        step["tm_tank_temp_f"]         = self.tm_storage_tank.get_temperature_at_fraction(0.5)
-        step["tm_heater_output_kbtuh"] = tm_kbtuh
-        step["tm_heater_input_kw"]     = tm_kw
-        print(f'{step["tm_heater_input_kw"]}, {step["tm_tank_temp_f"] }, {step["tm_heater_output_kbtuh"]}')
-        return step
+        out.tm_tank_temp_f         = self.tm_storage_tank.get_temperature_at_fraction(0.5)
+        out.tm_heater_output_kbtuh = tm_kbtuh
+        out.tm_heater_input_kw     = tm_kw
+        return out
+
+    def _get_heater_timeline_conditions(
+        self,
+        oats: list[float | None],
+        inlets: list[float | None],
+        hours: list[int],
+    ) -> list[tuple]:
+        """
+        Add the TM heater to the primary heaters' timeline conditions.
+
+        The TM heater is queried at the TM tank top temperature, which is
+        simulation state, so it is only precomputed when its map ignores the
+        outlet temperature; its inlet is the fixed TM aquastat midpoint.
+        """
+        conditions = super()._get_heater_timeline_conditions(oats, inlets, hours)
+        if self.tm_water_heater is not None and not self.tm_water_heater.depends_on_outlet_temp():
+            tm_inlet_temp_f = (self.tm_off_temp_f + self.tm_on_temp_f) / 2.0
+            conditions.append((self.tm_water_heater, self.tm_off_temp_f, tm_inlet_temp_f))
+        return conditions
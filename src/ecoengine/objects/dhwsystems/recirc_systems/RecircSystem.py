@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from ..DHWSystem import DHWSystem
 from ecoengine.constants.constants import _RHO_CP
 
+if TYPE_CHECKING:
+    from ecoengine.objects.components.heating.WaterHeater import WaterHeater
+    from ecoengine.objects.components.storage.MixedStorageTank import MixedStorageTank
+    from ecoengine.objects.simulation.StepResult import StepResult
+
 
 class RecircSystem(DHWSystem):
     """
@@ -22,6 +31,7 @@ class RecircSystem(DHWSystem):
         return_flow_gpm,
         max_daily_run_hr: float = 24.0,
         defrost_factor: float = 1.0,
+        tm_exact_switching: bool = False,
     ):
         """
         Parameters
@@ -40,6 +50,11 @@ class RecircSystem(DHWSystem):
             Maximum hours the primary heating system may run per day.
         defrost_factor : float
             Fraction of rated capacity available after defrost cycles (0–1).
+        tm_exact_switching : bool
+            Switch the temperature-maintenance heater at the exact instants
+            the TM tank crosses its trigger temperatures within a timestep
+            (``_advance_tm_tank``), instead of updating it once per timestep.
+            Default False.
         """
         super().__init__(
             water_heaters,
@@ -51,6 +66,7 @@ class RecircSystem(DHWSystem):
         )
         self.return_temp_f   = return_temp_f
         self.return_flow_gpm = return_flow_gpm
+        self.tm_exact_switching = tm_exact_switching
 
     def get_recirc_loss_kbtuh(self) -> float:
         """
@@ -83,6 +99,84 @@ class RecircSystem(DHWSystem):
         """
         return self.get_recirc_loss_kbtuh() * 24.0
 
-    def simulate_step(self, building, timestep_interval, interval_min=1, mode="normal"):
-        """Delegate to DHWSystem.simulate_step() via super()."""
-        return super().simulate_step(building, timestep_interval, interval_min, mode)
+    def simulate_step_into(self, building, timestep_interval, interval_min, out: StepResult) -> StepResult:
+        """Delegate to DHWSystem.simulate_step_into() via super()."""
+        return super().simulate_step_into(building, timestep_interval, interval_min, out)
+
+    def _advance_tm_tank(
+        self,
+        tm_tank: MixedStorageTank,
+        tm_heater: WaterHeater,
+        hour_of_day: int,
+        duration_min: float,
+        heat_kbtuh: float,
+        max_temp_f: float | None = None,
+        **rates: float,
+    ) -> float:
+        """
+        Run a temperature-maintenance tank and its heater for one timestep.
+
+        The tank is advanced in closed form (``MixedStorageTank.advance``)
+        under the given loss / flow ``rates``. The heater switches on and off
+        at the exact instants the tank crosses its Controls' trigger
+        temperatures, rather than once per timestep. The heater also shuts
+        off when the tank reaches ``max_temp_f``, the hottest water it can
+        deliver.
+
+        Parameters
+        ----------
+        tm_tank : MixedStorageTank
+        tm_heater : WaterHeater
+            Heater on ``tm_tank``; its on/off state is updated in place.
+        hour_of_day : int
+            Hour of the day (0-23), used to select the heater's Controls.
+        duration_min : float
+            Timestep length [minutes].
+        heat_kbtuh : float
+            Heater output while running [kBTU/hr].
+        max_temp_f : float | None
+            Heater outlet temperature cap [°F]. None means no cap.
+        **rates
+            Constant loss and flow terms forwarded to ``advance()``.
+
+        Returns
+        -------
+        float
+            Minutes the heater ran during the timestep.
+        """
+        controls = tm_heater.get_controls_for_hour(hour_of_day)
+        if controls is None:
+            raise ValueError(f"No Controls configured for hour {hour_of_day}.")
+        heat_until_f = controls.off_trigger_t_f
+        if max_temp_f is not None:
+            heat_until_f = min(heat_until_f, max_temp_f)
+        on_min     = 0.0
+        remaining  = duration_min
+        last_empty = False
+        while remaining > 0.0:
+            active = tm_heater.is_active()
+            if active:
+                dt = tm_tank.advance(remaining, heat_kbtuh, stop_at_or_above_f=heat_until_f, **rates)
+                on_min += dt
+            else:
+                dt = tm_tank.advance(remaining, stop_below_f=controls.on_trigger_t_f, **rates)
+            remaining -= dt
+            if remaining <= 0.0:
+                break
+            if dt == 0.0 and last_empty:
+                # Both triggers hold at once (no deadband): keep the current
+                # state for the rest of the timestep instead of chattering,
+                # unless the tank is already at the outlet cap.
+                if active and max_temp_f is not None and tm_tank.get_temperature_at_fraction(0.5) >= max_temp_f:
+                    tm_heater.turn_off()
+                    active = False
+                tm_tank.advance(remaining, heat_kbtuh if active else 0.0, **rates)
+                on_min += remaining if active else 0.0
+                break
+            # A trigger was crossed: switch the heater and carry on from there
+            if active:
+                tm_heater.turn_off()
+            else:
+                tm_heater.turn_on()
+            last_empty = dt == 0.0
+        return on_min
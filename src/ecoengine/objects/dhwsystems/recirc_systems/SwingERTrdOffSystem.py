@@ -23,7 +23,7 @@ class SwingERTrdOffSystem(SwingSystem):
     temperature during peak demand events.
 
     This class is identical to SwingSystem in all simulation behaviour —
-    ``simulate_step()`` is fully inherited without override.  The only
+    ``simulate_step_into()`` is fully inherited without override.  The only
     runtime difference is that the ``tm_water_heater`` carries a higher
     ``nominal_capacity_kbtuh``: the base temperature-maintenance capacity
     (sized to handle recirc losses) plus the ER addition (sized to close the
@@ -13,6 +13,7 @@ from ecoengine.constants.constants import _RHO_CP, _W_TO_KBTUH
 
 if TYPE_CHECKING:
     from ecoengine.objects.building.Building import Building
+    from ecoengine.objects.simulation.StepResult import StepResult
 
 # Swing tank TM sizing table [gallons].
 # Volume is the smallest entry >= recirc_loss_btuhr / (100 W/gal * 3.412142 BTU/hr/W).
@@ -79,6 +80,7 @@ class SwingSystem(RecircSystem):
         tm_safety_factor: float = 1.2,
         max_daily_run_hr: float = 24.0,
         defrost_factor: float = 1.0,
+        tm_exact_switching: bool = False,
     ):
         super().__init__(
             water_heaters,
@@ -89,6 +91,7 @@ class SwingSystem(RecircSystem):
             return_flow_gpm,
             max_daily_run_hr=max_daily_run_hr,
             defrost_factor=defrost_factor,
+            tm_exact_switching=tm_exact_switching,
         )
         if tm_safety_factor <= 1.0:
             raise ValueError(
@@ -128,6 +131,7 @@ class SwingSystem(RecircSystem):
         control_map: dict[str, Controls] | None = None,
         strat_slope: float = 2.8,
         load_shift_fract_total_vol: float = 1.0,
+        tm_exact_switching: bool = False,
     ) -> SwingSystem:
         system = cls(
             water_heaters=[],
@@ -139,6 +143,7 @@ class SwingSystem(RecircSystem):
             tm_safety_factor=tm_safety_factor,
             max_daily_run_hr=max_daily_run_hr,
             defrost_factor=defrost_factor,
+            tm_exact_switching=tm_exact_switching,
         )
         system.size(
             building,
@@ -879,13 +884,13 @@ class SwingSystem(RecircSystem):
     # Simulation
     # ------------------------------------------------------------------
 
-    def simulate_step(
+    def simulate_step_into(
         self,
         building : Building,
         timestep_interval: int,
-        interval_min: int = 1,
-        mode: str = "normal",
-    ) -> dict:
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Execute one simulation timestep for the swing tank system.
 
@@ -908,21 +913,21 @@ class SwingSystem(RecircSystem):
         8. Draw the computed physical volume from the primary storage tank.
         9. Determine usable volume: 0 if swing tank is below supply temperature,
            otherwise derived from the primary tank's stratification profile.
-        10. Merge primary and TM energy outputs and return per-step metrics.
+        10. Merge primary and TM energy outputs and write per-step metrics into ``out``.
 
         Parameters
         ----------
         building : Building
         timestep_interval : int
         interval_min : int
-        mode : str
-            Ignored — operating mode is determined by each heater's control schedule.
+        out : StepResult
 
         Returns
         -------
-        dict
-            Same keys as DHWSystem.simulate_step(). ``heater_output_kbtuh`` and
-            ``heater_power_in_kw`` include both primary and TM heater contributions.
+        StepResult
+            ``out``, with the fields of DHWSystem.simulate_step_into() plus the
+            TM fields and ``delivery_temp_f``. ``heater_output_kbtuh`` is
+            primary-only.
         """
         # --- 1. Building data ---
         use_avg = any(wh.is_load_shifting() for wh in self.water_heaters)
@@ -939,18 +944,11 @@ class SwingSystem(RecircSystem):
             else "normal"
         )
         # --- 2. Primary heater: update state and heat primary tank ---
-        for wh in self.water_heaters:
-            wh.update_state(self.storage_tank, hour_of_day)
+        self._update_heater_states(self.storage_tank, hour_of_day)
 
-        top_temp_f    = self.storage_tank.get_temperature_at_fraction(1.0)
-        primary_kbtuh = sum(
-            wh.get_output_kbtuh(oat_f, wh.get_outlet_temp_f(hour_of_day), inlet_temp_f) for wh in self.water_heaters
+        primary_kbtuh, primary_kw_list = self._get_heater_output_and_power(
+            oat_f, inlet_temp_f, hour_of_day, step=timestep_interval
         )
-        primary_kw_list = [
-            wh.get_power_in_kw(oat_f, wh.get_outlet_temp_f(hour_of_day), inlet_temp_f)
-            for wh in self.water_heaters
-            if wh.is_active()
-        ]
         primary_kw: float | None = (
             sum(kw or 0.0 for kw in primary_kw_list) if primary_kw_list else None
         )
@@ -971,25 +969,44 @@ class SwingSystem(RecircSystem):
         # --- 4. Average feed temperature from primary stratification profile ---
         feed_temp_f = self.storage_tank.get_average_draw_temp_f(hw_swing_gal)
 
-        # --- 5. Mix primary inflow into swing tank ---
-        self.tm_storage_tank.mix_primary_inflow(hw_swing_gal, feed_temp_f)
-
-        # --- 6. Recirculation heat loss (fixed rate, consistent with sizing formula) ---
-        self.tm_storage_tank.apply_fixed_heat_loss_kbtuh(
-            self.get_recirc_loss_kbtuh(), interval_min
-        )
-        # --- 7. TM element: update state and heat swing tank ---
-        self.tm_water_heater.update_state(self.tm_storage_tank, hour_of_day)
-        tm_top_t    = self.tm_storage_tank.get_temperature_at_fraction(1.0)
-        tm_kbtuh    = self.tm_water_heater.get_output_kbtuh(oat_f, tm_top_t)
-        tm_kw_val   = (
-            self.tm_water_heater.get_power_in_kw(oat_f, tm_top_t)
-            if self.tm_water_heater.is_active()
-            else None
-        )
-        tm_ctrl = self.tm_water_heater.get_controls_for_hour(hour_of_day)
+        tm_ctrl     = self.tm_water_heater.get_controls_for_hour(hour_of_day)
         tm_outlet_f = tm_ctrl.outlet_temp_f if tm_ctrl is not None else self.tm_off_temp_f
-        self.tm_storage_tank.heat(tm_kbtuh, interval_min, tm_outlet_f)
+        if self.tm_exact_switching:
+            # --- 5-7. Primary inflow, recirculation heat loss (fixed rate, consistent
+            # with sizing formula) and TM element evolve the swing tank together;
+            # the element switches at the exact trigger crossings ---
+            tm_top_t    = self.tm_storage_tank.get_temperature_at_fraction(1.0)
+            tm_cap_kbtuh, tm_kw_running = self.tm_water_heater.get_running_output_and_power(
+                oat_f, tm_top_t, step=timestep_interval
+            )
+            tm_on_min = self._advance_tm_tank(
+                self.tm_storage_tank, self.tm_water_heater, hour_of_day, interval_min, tm_cap_kbtuh,
+                max_temp_f       = tm_outlet_f,
+                inflow_gpm       = hw_swing_gal / interval_min,
+                inflow_temp_f    = feed_temp_f,
+                fixed_loss_kbtuh = self.get_recirc_loss_kbtuh(),
+            )
+            tm_on_fract = tm_on_min / interval_min
+            tm_kbtuh    = tm_cap_kbtuh * tm_on_fract
+            tm_kw_val   = (
+                tm_kw_running * tm_on_fract
+                if tm_kw_running is not None and tm_on_min > 0.0 else None
+            )
+        else:
+            # --- 5. Mix primary inflow into swing tank ---
+            self.tm_storage_tank.mix_primary_inflow(hw_swing_gal, feed_temp_f)
+
+            # --- 6. Recirculation heat loss (fixed rate, consistent with sizing formula) ---
+            self.tm_storage_tank.apply_fixed_heat_loss_kbtuh(
+                self.get_recirc_loss_kbtuh(), interval_min
+            )
+            # --- 7. TM element: update state and heat swing tank ---
+            self.tm_water_heater.update_state(self.tm_storage_tank, hour_of_day)
+            tm_top_t    = self.tm_storage_tank.get_temperature_at_fraction(1.0)
+            tm_kbtuh, tm_kw_val = self.tm_water_heater.get_output_and_power(
+                oat_f, tm_top_t, step=timestep_interval
+            )
+            self.tm_storage_tank.heat(tm_kbtuh, interval_min, tm_outlet_f)
         # --- 8. Draw computed volume from primary storage ---
         self.storage_tank.draw_physical_gal(hw_swing_gal, inlet_temp_f, self.supply_temp_f)
 
@@ -1002,10 +1019,7 @@ class SwingSystem(RecircSystem):
             )
 
         # --- 10. Tank temperature profile (primary stratified tank) ---
-        tank_temps_f = [
-            self.storage_tank.get_temperature_at_fraction(f)
-            for f in (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
-        ]
+        tank_temps_f = self.storage_tank.get_temperatures_at_fractions(out.tank_fracts)
         # --- 11. Merge primary + TM outputs ---
         # heater_output_kbtuh stays PRIMARY-ONLY (used for gal/hr plot in top chart).
         # heater_power_in_kw merges both so get_total_energy_kwh() is accurate.
@@ -1014,20 +1028,37 @@ class SwingSystem(RecircSystem):
         else:
             total_kw = None
         swing_mid_temp_f = self.tm_storage_tank.get_temperature_at_fraction(0.5)
-        return {
-            "demand_supplyT_gal":        demand_supplyT_gal,
-            "usable_volume_supplyT_gal": usable_vol_gal,
-            "heater_output_kbtuh":       primary_kbtuh,
-            "heater_power_in_kw":        total_kw,
-            "oat_f":                     oat_f,
-            "inlet_water_temp_f":        inlet_temp_f,
-            "tank_temps_f":              tank_temps_f,
-            "mode":                      step_mode,
-            # Swing tank is the actual delivery point — use its temperature for
-            # the outlet-deficit stop condition instead of the primary tank top.
-            "delivery_temp_f":           swing_mid_temp_f,
-            # TM panel data (consumed by SimulationRun for the swing-tank subplot)
-            "tm_tank_temp_f":            swing_mid_temp_f,
-            "tm_heater_output_kbtuh":    tm_kbtuh,
-            "tm_heater_input_kw":        tm_kbtuh / _W_TO_KBTUH, # assume COP of 1
-        }
+        out.demand_supplyT_gal        = demand_supplyT_gal
+        out.usable_volume_supplyT_gal = usable_vol_gal
+        out.heater_output_kbtuh       = primary_kbtuh
+        out.heater_power_in_kw        = total_kw
+        out.oat_f                     = oat_f
+        out.inlet_water_temp_f        = inlet_temp_f
+        out.tank_temps_f              = tank_temps_f
+        out.mode                      = step_mode
+        # Swing tank is the actual delivery point — use its temperature for
+        # the outlet-deficit stop condition instead of the primary tank top.
+        out.delivery_temp_f           = swing_mid_temp_f
+        # TM panel data (consumed by SimulationRun for the swing-tank subplot)
+        out.tm_tank_temp_f            = swing_mid_temp_f
+        out.tm_heater_output_kbtuh    = tm_kbtuh
+        out.tm_heater_input_kw        = tm_kbtuh / _W_TO_KBTUH # assume COP of 1
+        return out
+
+    def _get_heater_timeline_conditions(
+        self,
+        oats: list[float | None],
+        inlets: list[float | None],
+        hours: list[int],
+    ) -> list[tuple]:
+        """
+        Add the TM heater to the primary heaters' timeline conditions.
+
+        The TM heater is queried at the swing tank top temperature, which is
+        simulation state, so it is only precomputed when its map ignores the
+        outlet temperature; its inlet is the map's design inlet.
+        """
+        conditions = super()._get_heater_timeline_conditions(oats, inlets, hours)
+        if self.tm_water_heater is not None and not self.tm_water_heater.depends_on_outlet_temp():
+            conditions.append((self.tm_water_heater, self.tm_off_temp_f, None))
+        return conditions
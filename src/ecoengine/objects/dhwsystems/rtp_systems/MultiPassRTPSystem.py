@@ -8,6 +8,7 @@ from ecoengine.objects.components.storage.SlugOverlayTank import SlugOverlayTank
 from ecoengine.constants.constants import _RHO_CP
 from .RTPSystem import RTPSystem
 from ..utils import mixing_valve_behavior
+from ecoengine.objects.simulation.StepResult import StepResult
 
 _MPRTP_STRAT_SLOPE: float = 0.8
 _MPRTP_MAX_DAILY_RUN_HR: float = 14.0
@@ -145,32 +146,37 @@ class MultiPassRTPSystem(RTPSystem):
         inlet_temp_f    = building.get_design_inlet_water_temp_f() or 50.0
         ctrl = control_map.get("normal") or next(iter(control_map.values()), None)
         starting_percent_usable = max(0.0, min(1.0, 1.0 - ctrl.on_sensor_fract))
+        system.storage_tank.initialize(
+            storage_temp_f  = system.storage_temp_f,
+            cold_temp_f     = inlet_temp_f,
+            percent_useable = starting_percent_usable
+        )
+        # Every trial day starts from the same charged tank
+        start_state = system.storage_tank.snapshot()
+        step = StepResult()
         for _ in range(capacity_boost_iterations):
-            system.storage_tank.initialize(
-                storage_temp_f  = system.storage_temp_f,
-                cold_temp_f     = inlet_temp_f,
-                percent_useable = starting_percent_usable
-            )
+            system.storage_tank.restore(start_state)
             minutes = 24 * 60 * capacity_boost_trial_days
             deficit_minutes = 0
             min_tank_outlet_f = supply_temp_f
             heater_on = False
             start_heat_min = 0
             for i in range(minutes):
-                step = system.simulate_step(
+                system.simulate_step_into(
                     building          = building,
                     timestep_interval = i,
                     interval_min      = 1,
+                    out               = step,
                 )
-                if step["heater_output_kbtuh"] > 0 and not heater_on:
+                if step.heater_output_kbtuh > 0 and not heater_on:
                     heater_on = True
                     start_heat_min = i
-                elif step["heater_output_kbtuh"] <= 0 and heater_on:
+                elif step.heater_output_kbtuh <= 0 and heater_on:
                     heater_on = False
 
-                if step["usable_volume_supplyT_gal"] <= 0.0:
+                if step.usable_volume_supplyT_gal <= 0.0:
                     # Outage
-                    tank_outlet_f = step["tank_temps_f"][-1]
+                    tank_outlet_f = step.tank_temps_f[-1]
                     if tank_outlet_f < min_tank_outlet_f:
                         deficit_minutes = i - start_heat_min
                         min_tank_outlet_f = tank_outlet_f
@@ -511,13 +517,13 @@ class MultiPassRTPSystem(RTPSystem):
     # Simulation
     # ------------------------------------------------------------------
 
-    def simulate_step(
+    def simulate_step_into(
         self,
         building,
         timestep_interval: int,
-        interval_min: int = 1,
-        mode: str = "normal",
-    ) -> dict:
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Run one simulation timestep for a multi-pass RTP system.
 
@@ -532,19 +538,19 @@ class MultiPassRTPSystem(RTPSystem):
         5. Apply heating and demand via the mixing valve (heating: redirect
            draw and heater output to the slug; not heating: draw physical
            gallons from the tank via mixing_valve_behavior).
-        6. Return per-step metrics.
+        6. Write per-step metrics into ``out``.
 
         Parameters
         ----------
         building : Building
         timestep_interval : int
         interval_min : int
-        mode : str
-            Ignored; operating mode is set by the control schedule.
+        out : StepResult
 
         Returns
         -------
-        dict
+        StepResult
+            ``out``.
         """
         tank: SlugOverlayTank = self.storage_tank
 
@@ -571,8 +577,7 @@ class MultiPassRTPSystem(RTPSystem):
         # Standard aquastat logic applies: while heating the off-sensor sits inside
         # the fully-mixed slug zone, so get_temperature_at_fraction returns
         # slug_temp_f.  The heater turns off when slug_temp_f >= off_trigger_t_f.
-        for wh in self.water_heaters:
-            wh.update_state(tank, hour_of_day)
+        self._update_heater_states(tank, hour_of_day)
 
         is_heating = any(wh.is_active() for wh in self.water_heaters)
 
@@ -585,14 +590,9 @@ class MultiPassRTPSystem(RTPSystem):
 
         # --- Heating capacity ---
         top_temp_f  = tank.get_temperature_at_fraction(1.0)
-        total_kbtuh = sum(
-            wh.get_output_kbtuh(oat_f, wh.get_outlet_temp_f(hour_of_day)) for wh in self.water_heaters
+        total_kbtuh, active_kws = self._get_heater_output_and_power(
+            oat_f, None, hour_of_day, step=timestep_interval
         )
-        active_kws  = [
-            wh.get_power_in_kw(oat_f, wh.get_outlet_temp_f(hour_of_day))
-            for wh in self.water_heaters
-            if wh.is_active()
-        ]
         total_kw: float | None = (
             sum(kw or 0.0 for kw in active_kws)
             if any(kw is not None for kw in active_kws)
@@ -624,23 +624,31 @@ class MultiPassRTPSystem(RTPSystem):
             )
 
         usable_vol_gal = tank.get_usable_volume_supplyT_gal(self.supply_temp_f)
-        tank_temps_f   = [
-            tank.get_temperature_at_fraction(f)
-            for f in (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
-        ]
+        tank_temps_f   = tank.get_temperatures_at_fractions(out.tank_fracts)
         # During slug heating top_temp_f may be at cold_temp_f (EnergyTank drained
         # into slug), which would falsely trip the outlet-deficit early-stop.  The
         # system is working normally while the heater is on, so suppress the check.
         delivery_temp_f = self.supply_temp_f if is_heating else top_temp_f
 
-        return {
-            "demand_supplyT_gal":        demand_supplyT_gal,
-            "usable_volume_supplyT_gal": usable_vol_gal,
-            "heater_output_kbtuh":       total_kbtuh,
-            "heater_power_in_kw":        total_kw,
-            "oat_f":                     top_temp_f,
-            "inlet_water_temp_f":        inlet_water_temp_f,
-            "tank_temps_f":              tank_temps_f,
-            "mode":                      mode,
-            "delivery_temp_f":           delivery_temp_f,
-        }
+        out.demand_supplyT_gal        = demand_supplyT_gal
+        out.usable_volume_supplyT_gal = usable_vol_gal
+        out.heater_output_kbtuh       = total_kbtuh
+        out.heater_power_in_kw        = total_kw
+        out.oat_f                     = top_temp_f
+        out.inlet_water_temp_f        = inlet_water_temp_f
+        out.tank_temps_f              = tank_temps_f
+        out.mode                      = mode
+        out.delivery_temp_f           = delivery_temp_f
+        return out
+
+    def _get_heater_timeline_conditions(
+        self,
+        oats: list[float | None],
+        inlets: list[float | None],
+        hours: list[int],
+    ) -> list[tuple]:
+        """Multi-pass heaters are queried at their map's design inlet."""
+        return [
+            (wh, outlets, None)
+            for wh, outlets, _ in super()._get_heater_timeline_conditions(oats, inlets, hours)
+        ]
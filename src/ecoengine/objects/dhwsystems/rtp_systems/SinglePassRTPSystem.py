@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ecoengine.objects.components.heating.Controls import Controls
 from ecoengine.objects.components.heating.WaterHeater import WaterHeater
 from ecoengine.objects.components.storage.StratifiedTank import StratifiedTank
 from ecoengine.constants.constants import _RHO_CP
 from .RTPSystem import RTPSystem
 
+if TYPE_CHECKING:
+    from ecoengine.objects.simulation.StepResult import StepResult
+
 _SPRTP_STRAT_SLOPE: float = 1.7
 
 
@@ -323,33 +328,30 @@ class SinglePassRTPSystem(RTPSystem):
     # Simulation
     # ------------------------------------------------------------------
 
-    def simulate_step(
+    def simulate_step_into(
         self,
         building,
         timestep_interval: int,
-        interval_min: int = 1,
-        mode: str = "normal",
-    ) -> dict:
+        interval_min: int,
+        out: StepResult,
+    ) -> StepResult:
         """
         Run one timestep for a single-pass RTP system.
 
         Delegates the DHW draw and heater logic to the base class, then
         applies recirculation losses to the storage tank.  The recirc
         return flow cools the bottom of the tank every minute, reducing
-        usable volume.  The returned dict is updated to reflect post-recirc
+        usable volume.  ``out`` is updated to reflect post-recirc
         tank state.
         """
-        step = super().simulate_step(building, timestep_interval, interval_min, mode)
+        super().simulate_step_into(building, timestep_interval, interval_min, out)
         if self.storage_tank is not None:
             self.storage_tank.add_recirc_return(
                 self.return_flow_gpm, self.return_temp_f, interval_min,
                 supply_temp_f=self.supply_temp_f,
             )
-            step["usable_volume_supplyT_gal"] = (
+            out.usable_volume_supplyT_gal = (
                 self.storage_tank.get_usable_volume_supplyT_gal(self.supply_temp_f)
             )
-            step["tank_temps_f"] = [
-                self.storage_tank.get_temperature_at_fraction(f)
-                for f in (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
-            ]
-        return step
+            out.tank_temps_f = self.storage_tank.get_temperatures_at_fractions(out.tank_fracts)
+        return out
@@ -1,4 +1,14 @@
-from ecoengine.constants.constants import _RHO_CP
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+from ecoengine.constants.constants import _RHO_CP, _TANK_NODE_FRACTS
+
+if TYPE_CHECKING:
+    from ecoengine.objects.simulation.StepResult import StepResult
 
 _ANNUAL_DURATION_MIN = 365 * 24 * 60   # 525600
 _DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
@@ -11,15 +21,103 @@ del _d
 
 
 def _step_to_month(step: int, timestep_min: int) -> int:
-    """Return 0-based calendar month for simulation step *step*."""
-    hour = step * timestep_min // 60
+    """Return 0-based calendar month for simulation step *step*, wrapping yearly."""
+    hour = (step * timestep_min // 60) % _MONTH_HOUR_START_SR[-1]
     for m in range(11, -1, -1):
         if hour >= _MONTH_HOUR_START_SR[m]:
             return m
     return 0
 
-# Tank temperature nodes: fractional heights from bottom (0) to top (1)
-_TANK_NODE_FRACTS = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+def _channel_values(value):
+    """Return a value assignable into a float channel buffer; None becomes NaN."""
+    if value is None:
+        return np.nan
+    if isinstance(value, (int, float, np.generic, np.ndarray)):
+        return value
+    return [np.nan if v is None else v for v in value]
+
+# Per-timestep float channels, recorded on every step; columns of SimulationRun._step_values
+_STEP_CHANNELS = (
+    "dhw_demand_supplyT_gal", "usable_volume_supplyT_gal", "heater_output_kbtuh",
+    "heater_power_in_kw", "oat_f", "inlet_water_temp_f",
+)
+# StepResult field holding each _STEP_CHANNELS entry
+_STEP_FIELD = {
+    "dhw_demand_supplyT_gal": "demand_supplyT_gal", "usable_volume_supplyT_gal": "usable_volume_supplyT_gal",
+    "heater_output_kbtuh": "heater_output_kbtuh", "heater_power_in_kw": "heater_power_in_kw",
+    "oat_f": "oat_f", "inlet_water_temp_f": "inlet_water_temp_f",
+}
+# TM (swing tank) channels, recorded only on steps that provide a value
+_TM_CHANNELS = ("tm_tank_temp_f", "tm_heater_output_kbtuh", "tm_heater_input_kw")
+# Standard control modes; heater_mode codes index into SimulationRun.mode_names
+_MODE_NAMES = ("normal", "loadUp", "shed")
+_CHANNEL_DTYPES = ("float64", "float32")
+# Field type of heater_mode in SimulationRun.to_records; longer mode names are truncated
+_MODE_FIELD_DTYPE = "U16"
+
+_ALL_CHANNELS = _STEP_CHANNELS + ("heater_mode", "tank_temps_f") + _TM_CHANNELS
+# Named channel selections for SimulationRun(channels=...):
+#   "full" — every channel
+#   "plot" — the channels to_plotly draws
+#   "cost" — heater power only, for energy, peak demand and utility cost
+_CHANNEL_PRESETS: dict[str, tuple[str, ...]] = {
+    "full": _ALL_CHANNELS,
+    "plot": tuple(c for c in _ALL_CHANNELS if c not in ("heater_power_in_kw", "tm_heater_input_kw")),
+    "cost": ("heater_power_in_kw", "tm_heater_input_kw"),
+}
+
+def _resolve_channels(channels: str | Iterable[str]) -> tuple[str, ...]:
+    """Return the channels selected by a preset name or channel names, in _ALL_CHANNELS order."""
+    if isinstance(channels, str):
+        if channels not in _CHANNEL_PRESETS:
+            raise ValueError(f"channels preset must be one of {tuple(_CHANNEL_PRESETS)}, got {channels!r}")
+        return _CHANNEL_PRESETS[channels]
+    channels = set(channels)
+    unknown  = channels.difference(_ALL_CHANNELS)
+    if unknown:
+        raise ValueError(f"Unknown SimulationRun channels {sorted(unknown)}; expected names from {_ALL_CHANNELS}")
+    return tuple(c for c in _ALL_CHANNELS if c in channels)
+
+class _ChannelList(list):
+    """
+    Read-only list of a SimulationRun channel's values.
+
+    Channel properties build a fresh list from the run's buffers on every
+    access, so mutating one in place would silently change only that copy.
+    Mutating methods raise instead; assign the whole channel
+    (``run.oat_f = values``) or take a copy (``list(run.oat_f)``).
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "SimulationRun channel lists are read-only copies; assign the whole "
+            "channel (run.<channel> = values) or copy it with list()."
+        )
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __imul__ = _read_only
+
+    def __iadd__(self, other):
+        # ``run.<channel> += values`` assigns a new, longer list through the setter
+        return list(self) + list(other)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+
+def _channel_property(channel: str, doc: str) -> property:
+    """Return a property exposing SimulationRun channel ``channel`` as a read-only list."""
+    if channel == "tank_temps_f":
+        getter = lambda self: _ChannelList(_ChannelList(row) for row in self._get_list(channel))
+    else:
+        getter = lambda self: _ChannelList(self._get_list(channel))
+    return property(
+        getter,
+        lambda self, values: self._set_list(channel, values),
+        doc=doc,
+    )
+
+# Tank temperature nodes: labels and colors for _TANK_NODE_FRACTS
 _TANK_NODE_LABELS = ["Tank 0% (bottom)", "Tank 20%", "Tank 40%", "Tank 60%", "Tank 80%", "Tank 100% (top)"]
 # Blue→red gradient avoiding CSS 'blue' (#0000FF) and 'red' (#FF0000)
 _TANK_NODE_COLORS = ["#003f88", "#0077b6", "#00b4d8", "#f4a261", "#e76f51", "#9b2226"]
@@ -32,6 +130,18 @@ class SimulationRun:
     Stores time-series data (energy use, tank volume, DHW demand, capacity) and
     provides methods to assess whether the system successfully met demand and to
     compute summary metrics for visualization and cost/emissions comparisons.
+
+    The time series are held in numpy buffers preallocated for ``num_steps``
+    timesteps: a (steps × channels) float matrix, a uint8 array of control-mode
+    codes and a (steps × nodes) tank temperature matrix. The per-channel attributes
+    (``oat_f``, ``heater_mode``, ``tank_temps_f``, ...) return read-only lists
+    of the recorded steps, copied on each access, and may be assigned to as a
+    whole; in-place changes such as ``run.oat_f.append(x)`` raise TypeError.
+    ``get_array`` returns the underlying arrays.
+
+    ``channels`` limits which of these are recorded. Unrecorded channels read
+    as empty, and ``tank_fracts`` tells the simulator which tank node
+    temperatures are still needed so systems can skip the rest.
     """
 
     def __init__(
@@ -40,6 +150,8 @@ class SimulationRun:
         timestep_min: int,
         outlet_deficit_threshold_f: float = 5.0,
         outlet_deficit_max_min: int = 10,
+        dtype: str = "float64",
+        channels: str | Iterable[str] = "full",
     ) -> None:
         """
         Parameters
@@ -54,29 +166,54 @@ class SimulationRun:
         outlet_deficit_max_min : int
             Maximum consecutive minutes of outlet deficit before the simulation
             is halted early. Default 10 minutes.
+        dtype : str
+            Storage type of the float channels, ``"float64"`` (default) or
+            ``"float32"`` to halve the memory of long runs.
+        channels : str | Iterable[str]
+            Channels to record: a preset — ``"full"`` (default, every channel),
+            ``"plot"`` (what to_plotly draws) or ``"cost"`` (heater power
+            only) — or an iterable of channel names such as
+            ``["heater_power_in_kw", "tank_temps_f"]``.
+
+        Raises
+        ------
+        ValueError
+            If ``dtype`` is unsupported or ``channels`` names an unknown
+            preset or channel.
         """
+        if np.dtype(dtype).name not in _CHANNEL_DTYPES:
+            raise ValueError(f"dtype must be one of {_CHANNEL_DTYPES}, got {dtype!r}")
         self.duration_min  = duration_min
         self.timestep_min  = timestep_min
         self.num_steps     = duration_min // timestep_min
-
-        # Per-timestep lists (appended by record_timestep)
-        self.dhw_demand_supplyT_gal:    list[float] = []
-        self.usable_volume_supplyT_gal: list[float] = []
-        self.heater_output_kbtuh:       list[float] = []
-        self.heater_power_in_kw:        list[float | None] = []
-        self.oat_f:                     list[float] = []
-        self.inlet_water_temp_f:        list[float] = []
-        self.heater_mode:               list[str]   = []   # "normal", "shed", "loadUp", etc.
-
-        # Tank temperature nodes — one list per fractional height
-        # Indexed as: tank_temps_f[node_idx][timestep]
+        self.dtype         = np.dtype(dtype)
+        self.channels      = _resolve_channels(channels)
+
+        # Per-timestep buffers (filled by record_timestep / record_timesteps):
+        # one row per timestep, one column per recorded _STEP_CHANNELS entry.
+        # heater_power_in_kw stores None as NaN. Unrecorded channels get no rows.
+        self._num_recorded = 0
+        self.first_step    = 0   # simulation step of the first record; advanced by clear_records
+        self._capacity     = self.num_steps
+        self._assigned_lengths: dict[str, int] = {}   # channels replaced via attribute assignment
+        step_channels      = [c for c in _STEP_CHANNELS if c in self.channels]
+        self._step_column  = {name: col for col, name in enumerate(step_channels)}
+        self._step_getter  = attrgetter(*(_STEP_FIELD[c] for c in step_channels)) if step_channels else None
+        self._step_select  = [_STEP_CHANNELS.index(c) for c in step_channels]
+        self._step_values  = np.empty((self._rows(*step_channels), len(step_channels)),
+                                      dtype=self.dtype)
+        # Tank temperature nodes — one column per fractional height
+        # Indexed as: _tank_temps[timestep, node_idx]
         # node_idx 0 = bottom (0%), 5 = top (100%)
-        self.tank_temps_f: list[list[float]] = [[] for _ in _TANK_NODE_FRACTS]
+        self._tank_temps = np.empty((self._rows("tank_temps_f"), len(_TANK_NODE_FRACTS)), dtype=self.dtype)
+        self._mode_codes = np.empty(self._rows("heater_mode"), dtype=np.uint8)
+        self.mode_names: list[str] = list(_MODE_NAMES)   # "normal", "shed", "loadUp", etc.
 
-        # TM (swing tank) per-timestep data — only populated for SwingSystem runs
-        self.tm_tank_temp_f:           list[float] = []
-        self.tm_heater_output_kbtuh:   list[float] = []
-        self.tm_heater_input_kw:   list[float] = []
+        # TM (swing tank) per-timestep data — only populated for SwingSystem runs,
+        # so these buffers are allocated on first use
+        self._tm_channels: dict[str, np.ndarray] = {}
+        self._tm_recorded: dict[str, int] = {name: 0 for name in _TM_CHANNELS}
+        self._tm_names = tuple(c for c in _TM_CHANNELS if c in self.channels)
 
         # Cumulative outage counter [minutes]
         self.outage_minutes: int = 0
@@ -85,6 +222,8 @@ class SimulationRun:
         self.supply_temp_f: float | None = None
         # True only for SwingSystem / SwingERTrdOffSystem — enables the TM subplot
         self.show_tm_panel: bool = False
+        # Day whose records were repeated to the end of the run (Simulator.simulate_3day with steady_state)
+        self.steady_state_day: int | None = None
 
         # Outlet deficit stop condition
         self.outlet_deficit_threshold_f   = outlet_deficit_threshold_f
@@ -92,6 +231,162 @@ class SimulationRun:
         self._outlet_deficit_consec_min   = 0   # internal consecutive-minute counter
         self.stopped_early: bool          = False
 
+    # ------------------------------------------------------------------
+    # List-like accessors
+    # ------------------------------------------------------------------
+
+    dhw_demand_supplyT_gal    = _channel_property("dhw_demand_supplyT_gal",
+                                                  "Hot water drawn each timestep at supply temperature [gallons].")
+    usable_volume_supplyT_gal = _channel_property("usable_volume_supplyT_gal",
+                                                  "Gallons at or above supply temperature after each timestep.")
+    heater_output_kbtuh       = _channel_property("heater_output_kbtuh",
+                                                  "Heat delivered by active heaters each timestep [kBTU/hr].")
+    heater_power_in_kw        = _channel_property("heater_power_in_kw",
+                                                  "Electrical power of active heaters each timestep [kW]; None without power data.")
+    oat_f                     = _channel_property("oat_f", "Outdoor air temperature each timestep [°F].")
+    inlet_water_temp_f        = _channel_property("inlet_water_temp_f", "Cold water inlet temperature each timestep [°F].")
+    heater_mode               = _channel_property("heater_mode",
+                                                  'Control mode each timestep ("normal", "shed", "loadUp", etc.).')
+    tank_temps_f              = _channel_property("tank_temps_f",
+                                                  "Tank node temperatures [°F], indexed as tank_temps_f[node_idx][timestep].")
+    tm_tank_temp_f            = _channel_property("tm_tank_temp_f",
+                                                  "TM (swing) tank temperature on each step that reported one [°F].")
+    tm_heater_output_kbtuh    = _channel_property("tm_heater_output_kbtuh",
+                                                  "TM element heat output on each step that reported one [kBTU/hr].")
+    tm_heater_input_kw        = _channel_property("tm_heater_input_kw",
+                                                  "TM element electrical power on each step that reported one [kW].")
+
+    @property
+    def tank_fracts(self) -> tuple[float, ...]:
+        """
+        Tank fractions whose temperatures the systems should report each step.
+
+        All of _TANK_NODE_FRACTS when ``tank_temps_f`` is recorded, otherwise
+        only the top (1.0), still needed for the outlet-deficit check.
+        """
+        return _TANK_NODE_FRACTS if "tank_temps_f" in self.channels else (1.0,)
+
+    @property
+    def outlet_deficit_consec_min(self) -> int:
+        """Minutes the outlet has been in deficit, up to the last recorded timestep (see ``check_outlet_deficit``)."""
+        return self._outlet_deficit_consec_min
+
+    def _rows(self, *channels: str) -> int:
+        """Return the buffer rows to preallocate: ``num_steps`` if any of ``channels`` is recorded, else 0."""
+        return self.num_steps if any(c in self.channels for c in channels) else 0
+
+    def _get_list(self, channel: str) -> list:
+        """Return the recorded values of ``channel`` as plain Python values."""
+        values = self.get_array(channel)
+        if channel == "heater_power_in_kw":
+            return [None if kw != kw else kw for kw in values.tolist()]
+        if channel == "heater_mode":
+            return [self.mode_names[code] for code in values.tolist()]
+        if channel == "tank_temps_f":
+            return values.T.tolist()
+        return values.tolist()
+
+    def _set_list(self, channel: str, values: Sequence) -> None:
+        """
+        Replace the recorded values of ``channel``, e.g. to build a run by hand.
+
+        The channel keeps its own length afterwards, independent of the
+        number of recorded timesteps.
+        """
+        if channel not in self.channels:
+            raise ValueError(f"Channel {channel!r} is not recorded by this SimulationRun (channels={self.channels})")
+        if channel == "heater_mode":
+            array = np.array([self._mode_code(m) for m in values], dtype=np.uint8)
+        elif channel == "tank_temps_f":
+            array = np.array(np.transpose(values), dtype=self.dtype).reshape(-1, len(_TANK_NODE_FRACTS))
+        else:
+            array = np.array(_channel_values(values), dtype=self.dtype)
+        if channel in self._tm_recorded:
+            self._tm_channels[channel] = array
+            self._tm_recorded[channel] = len(array)
+            return
+        self._reserve(len(array) - self._num_recorded)
+        if channel == "heater_mode":
+            self._mode_codes[:len(array)] = array
+        elif channel == "tank_temps_f":
+            self._tank_temps[:len(array)] = array
+        else:
+            self._step_values[:len(array), self._step_column[channel]] = array
+        self._assigned_lengths[channel] = len(array)
+
+    def get_array(self, channel: str) -> np.ndarray:
+        """
+        Return the recorded values of one channel as a read-only numpy array.
+
+        Parameters
+        ----------
+        channel : str
+            Any per-timestep attribute name. ``"tank_temps_f"`` returns the
+            (steps × nodes) temperature matrix, ``"heater_mode"`` the uint8
+            codes into ``mode_names`` and ``"heater_power_in_kw"`` holds NaN
+            where no power data was recorded.
+
+        Returns
+        -------
+        np.ndarray
+            A view of the recorded part of the buffer; empty for a channel
+            not in ``channels``.
+        """
+        num_recorded = self._assigned_lengths.get(channel, self._num_recorded)
+        if channel not in _ALL_CHANNELS:
+            raise ValueError(f"Unknown SimulationRun channel {channel!r}")
+        if channel in _STEP_FIELD:
+            col    = self._step_column.get(channel)
+            values = np.empty(0, dtype=self.dtype) if col is None else self._step_values[:num_recorded, col]
+        elif channel == "tank_temps_f":
+            values = self._tank_temps[:num_recorded]
+        elif channel == "heater_mode":
+            values = self._mode_codes[:num_recorded]
+        else:
+            values = self._tm_channels.get(channel, np.empty(0, dtype=self.dtype))[:self._tm_recorded[channel]]
+        values = values.view()
+        values.flags.writeable = False
+        return values
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _reserve(self, num_steps: int) -> int:
+        """Grow the step buffers if needed to append ``num_steps`` more steps; return the write index."""
+        start    = self._num_recorded
+        capacity = self._capacity
+        if start + num_steps > capacity:
+            capacity = self._capacity = max(start + num_steps, 2 * capacity)
+            if len(self._step_values):
+                self._step_values = np.resize(self._step_values, (capacity, self._step_values.shape[1]))
+            if len(self._tank_temps):
+                self._tank_temps = np.resize(self._tank_temps, (capacity, self._tank_temps.shape[1]))
+            if len(self._mode_codes):
+                self._mode_codes = np.resize(self._mode_codes, capacity)
+        return start
+
+    def _mode_code(self, mode: str) -> int:
+        """Return the uint8 code of control mode ``mode``, registering new modes."""
+        try:
+            return self.mode_names.index(mode)
+        except ValueError:
+            if len(self.mode_names) > np.iinfo(np.uint8).max:
+                raise ValueError("SimulationRun supports at most 256 distinct control modes")
+            self.mode_names.append(mode)
+            return len(self.mode_names) - 1
+
+    def _record_tm(self, channel: str, value: float) -> None:
+        """Append one value to the TM channel ``channel``."""
+        buf = self._tm_channels.get(channel)
+        idx = self._tm_recorded[channel]
+        if buf is None:
+            buf = self._tm_channels[channel] = np.empty(self.num_steps, dtype=self.dtype)
+        if idx >= len(buf):
+            buf = self._tm_channels[channel] = np.resize(buf, max(idx + 1, 2 * len(buf)))
+        buf[idx] = value
+        self._tm_recorded[channel] = idx + 1
+
     def record_timestep(
         self,
         dhw_demand_supplyT_gal: float,
@@ -126,7 +421,7 @@ class SimulationRun:
             Cold water inlet temperature this timestep [°F].
         tank_temps_f : list[float]
             Temperatures at each tank node (6 values, bottom to top) [°F].
-            Must have the same length as _TANK_NODE_FRACTS.
+            Must have the same length as _TANK_NODE_FRACTS when recorded.
         tm_tank_temp_f : float | None
             Current temperature of the TM (swing) tank [°F]. Only provided
             by SwingSystem; None for all other system types.
@@ -137,21 +432,210 @@ class SimulationRun:
             Electrical power consumed by TM element [kW]. None when no
             real performance map is available (e.g. NominalPerformanceMap).
         """
-        self.dhw_demand_supplyT_gal.append(dhw_demand_supplyT_gal)
-        self.usable_volume_supplyT_gal.append(usable_volume_supplyT_gal)
-        self.heater_output_kbtuh.append(heater_output_kbtuh)
-        self.heater_power_in_kw.append(heater_power_in_kw)
-        self.oat_f.append(oat_f)
-        self.inlet_water_temp_f.append(inlet_water_temp_f)
-        self.heater_mode.append(mode)
-        for node_idx, temp in enumerate(tank_temps_f):
-            self.tank_temps_f[node_idx].append(temp)
-        if tm_tank_temp_f is not None:
-            self.tm_tank_temp_f.append(tm_tank_temp_f)
-        if tm_heater_output_kbtuh is not None:
-            self.tm_heater_output_kbtuh.append(tm_heater_output_kbtuh)
-        if tm_heater_input_kw is not None:
-            self.tm_heater_input_kw.append(tm_heater_input_kw)
+        i = self._num_recorded
+        if i >= self._capacity:
+            self._reserve(1)
+        values = (
+            dhw_demand_supplyT_gal, usable_volume_supplyT_gal, heater_output_kbtuh,
+            np.nan if heater_power_in_kw is None else heater_power_in_kw,
+            oat_f, inlet_water_temp_f,
+        )
+        if self._step_select:
+            self._step_values[i] = [values[col] for col in self._step_select]
+        if len(self._tank_temps):
+            self._tank_temps[i] = tank_temps_f
+        if len(self._mode_codes):
+            self._mode_codes[i] = self._mode_code(mode)
+        self._num_recorded  = i + 1
+        tm_values = {
+            "tm_tank_temp_f":         tm_tank_temp_f,
+            "tm_heater_output_kbtuh": tm_heater_output_kbtuh,
+            "tm_heater_input_kw":     tm_heater_input_kw,
+        }
+        for name in self._tm_names:
+            if tm_values[name] is not None:
+                self._record_tm(name, tm_values[name])
+
+    def record_step(self, step: StepResult) -> None:
+        """
+        Append one timestep from a StepResult filled by ``DHWSystem.simulate_step_into``.
+
+        Equivalent to ``record_timestep`` with the StepResult's fields.
+        Only the recorded channels are read.
+
+        Parameters
+        ----------
+        step : StepResult
+        """
+        i = self._num_recorded
+        if i >= self._capacity:
+            self._reserve(1)
+        if self._step_getter is not None:
+            # None heater power is stored as NaN by the float buffer
+            self._step_values[i] = self._step_getter(step)
+        if len(self._tank_temps):
+            self._tank_temps[i] = step.tank_temps_f
+        if len(self._mode_codes):
+            self._mode_codes[i] = self._mode_code(step.mode)
+        self._num_recorded  = i + 1
+        for name in self._tm_names:
+            value = getattr(step, name)
+            if value is not None:
+                self._record_tm(name, value)
+
+    def record_timesteps(
+        self,
+        num_steps: int,
+        dhw_demand_supplyT_gal: float | Sequence[float],
+        usable_volume_supplyT_gal: float | Sequence[float],
+        heater_output_kbtuh: float | Sequence[float],
+        heater_power_in_kw: float | None | Sequence[float | None],
+        oat_f: float | Sequence[float],
+        inlet_water_temp_f: float | Sequence[float],
+        tank_temps_f: Sequence[Sequence[float]],
+        mode: str | Sequence[str] = "normal",
+    ) -> None:
+        """
+        Append ``num_steps`` consecutive timesteps at once.
+
+        Equivalent to ``num_steps`` calls to ``record_timestep``. Each channel
+        is either one value shared by every step (as for a span the
+        event-driven simulator jumps over) or a sequence or array of
+        ``num_steps`` per-step values.
+
+        Parameters
+        ----------
+        num_steps : int
+            Number of timesteps to append.
+        dhw_demand_supplyT_gal, usable_volume_supplyT_gal, heater_output_kbtuh, heater_power_in_kw, oat_f, inlet_water_temp_f, mode
+            Values as for ``record_timestep``, shared or per step. Power
+            arrays may use NaN for None.
+        tank_temps_f : Sequence[Sequence[float]]
+            Temperatures indexed ``[node_idx][step]``, one sequence of
+            ``num_steps`` entries per node in _TANK_NODE_FRACTS [°F]. Ignored
+            unless ``tank_temps_f`` is recorded.
+        """
+        start = self._reserve(num_steps)
+        end   = start + num_steps
+        values = (
+            dhw_demand_supplyT_gal, usable_volume_supplyT_gal, heater_output_kbtuh,
+            heater_power_in_kw, oat_f, inlet_water_temp_f,
+        )
+        for col, src in enumerate(self._step_select):
+            self._step_values[start:end, col] = _channel_values(values[src])
+        if len(self._tank_temps):
+            self._tank_temps[start:end] = np.transpose(tank_temps_f)
+        if len(self._mode_codes):
+            if isinstance(mode, str):
+                self._mode_codes[start:end] = self._mode_code(mode)
+            else:
+                self._mode_codes[start:end] = [self._mode_code(m) for m in mode]
+        self._num_recorded = end
+
+    def repeat_records(self, period_steps: int, num_steps: int) -> None:
+        """
+        Append ``num_steps`` timesteps repeating the last ``period_steps`` recorded ones.
+
+        Used to extend a run once the system has settled into a periodic
+        steady state (see ``Simulator.simulate_3day``). Outage minutes are
+        not counted; the caller adds those of the repeated steps.
+
+        Parameters
+        ----------
+        period_steps : int
+            Number of trailing timesteps forming one period.
+        num_steps : int
+            Number of timesteps to append; need not be a whole number of periods.
+
+        Raises
+        ------
+        ValueError
+            If fewer than ``period_steps`` timesteps are recorded, or a TM
+            channel was recorded on only some of them.
+        """
+        start = self._num_recorded
+        if not 0 < period_steps <= start:
+            raise ValueError(f"period_steps must be between 1 and the {start} recorded timesteps, got {period_steps}")
+        for name, count in self._tm_recorded.items():
+            if count not in (0, start):
+                raise ValueError(f"TM channel {name!r} is recorded on {count} of {start} timesteps and cannot be repeated")
+        source = start - period_steps + np.arange(num_steps) % period_steps
+        end    = self._reserve(num_steps) + num_steps
+        for buf in (self._step_values, self._tank_temps, self._mode_codes):
+            if len(buf):
+                buf[start:end] = buf[source]
+        self._num_recorded = end
+        for name, count in self._tm_recorded.items():
+            if count:
+                buf = self._tm_channels[name]
+                if len(buf) < end:
+                    buf = self._tm_channels[name] = np.resize(buf, end)
+                buf[start:end] = buf[source]
+                self._tm_recorded[name] = end
+
+    def clear_records(self) -> None:
+        """
+        Drop the recorded timesteps so the buffers can be refilled.
+
+        ``first_step`` advances past the dropped steps; outage minutes, the
+        outlet-deficit counter and ``stopped_early`` carry over, so a run
+        can be recorded one chunk at a time (see ``Simulator.simulate_iter``).
+        """
+        self.first_step   += self._num_recorded
+        self._num_recorded = 0
+        self._assigned_lengths.clear()
+        for name in self._tm_recorded:
+            self._tm_recorded[name] = 0
+
+    def to_records(self) -> np.ndarray:
+        """
+        Return the recorded timesteps as a numpy structured array, one record per step.
+
+        Fields, for the recorded channels only: ``timestep`` and ``time_min``
+        (counted from the start of the simulation), the float channels of
+        ``record_timestep``, ``heater_mode`` (str, up to 16 characters),
+        ``tank_temp_0pct`` ... ``tank_temp_100pct`` and the TM channels,
+        NaN where no value was recorded (e.g. ``heater_power_in_kw`` without
+        power data, TM channels for systems without a TM tank).
+
+        Returns
+        -------
+        np.ndarray
+
+        Raises
+        ------
+        ValueError
+            If a TM channel was recorded on only some of the timesteps, so
+            its values cannot be aligned with them.
+        """
+        n      = self._num_recorded
+        fields = [("timestep", np.int64), ("time_min", np.int64)]
+        fields += [(c, self.dtype) for c in _STEP_CHANNELS if c in self.channels]
+        if "heater_mode" in self.channels:
+            fields.append(("heater_mode", _MODE_FIELD_DTYPE))
+        if "tank_temps_f" in self.channels:
+            fields += [(f"tank_temp_{int(f*100)}pct", self.dtype) for f in _TANK_NODE_FRACTS]
+        fields += [(c, self.dtype) for c in self._tm_names]
+
+        records = np.empty(n, dtype=fields)
+        records["timestep"] = np.arange(self.first_step, self.first_step + n)
+        records["time_min"] = records["timestep"] * self.timestep_min
+        for c, col in self._step_column.items():
+            records[c] = self._step_values[:n, col]
+        if "heater_mode" in self.channels:
+            records["heater_mode"] = np.array(self.mode_names, dtype=_MODE_FIELD_DTYPE)[self._mode_codes[:n]]
+        if "tank_temps_f" in self.channels:
+            for node, f in enumerate(_TANK_NODE_FRACTS):
+                records[f"tank_temp_{int(f*100)}pct"] = self._tank_temps[:n, node]
+        for c in self._tm_names:
+            count = self._tm_recorded[c]
+            if count == 0:
+                records[c] = np.nan
+            elif count == n:
+                records[c] = self._tm_channels[c][:n]
+            else:
+                raise ValueError(f"{c} was recorded on {count} of {n} timesteps and cannot be aligned with them")
+        return records
 
     def check_outlet_deficit(self, top_tank_temp_f: float, supply_temp_f: float) -> bool:
         """
@@ -226,23 +710,27 @@ class SimulationRun:
         if self.is_successful():
             return "Simulation succeeded: no DHW outage detected."
 
-        outage_steps = [
-            i for i, v in enumerate(self.usable_volume_supplyT_gal) if v <= 0.0
-        ]
-        if not outage_steps:
+        outage_steps = np.flatnonzero(self.get_array("usable_volume_supplyT_gal") <= 0.0)
+        if not len(outage_steps):
             return (
                 f"Simulation failed: system was undersized. "
                 f"DHW outage occurred for {self.outage_minutes} minutes."
             )
 
-        first_step = outage_steps[0]
+        first_step = int(outage_steps[0])
         day = (first_step * self.timestep_min) // (24 * 60) + 1
         # For swing systems the delivery point is the swing tank, not the primary top.
-        if self.show_tm_panel and self.tm_tank_temp_f:
-            delivery_temps = self.tm_tank_temp_f
+        if self.show_tm_panel and self._tm_recorded["tm_tank_temp_f"]:
+            delivery_temps = self.get_array("tm_tank_temp_f")
         else:
-            delivery_temps = self.tank_temps_f[5]
-        avg_delivery_temp = sum(delivery_temps[i] for i in outage_steps) / len(outage_steps)
+            delivery_temps = self.get_array("tank_temps_f")[:, 5]
+        if len(delivery_temps) <= outage_steps[-1]:
+            # Delivery temperatures were not recorded (see ``channels``)
+            return (
+                f"Simulation failed: system was undersized. "
+                f"DHW outage occurred for {self.outage_minutes} minutes on day {day} of the simulation."
+            )
+        avg_delivery_temp = float(np.mean(delivery_temps[outage_steps]))
 
         return (
             f"Simulation failed: system was undersized. "
@@ -263,8 +751,8 @@ class SimulationRun:
         float
         """
         hours_per_step = self.timestep_min / 60.0
-        primary_kwh = sum((p or 0.0) * hours_per_step for p in self.heater_power_in_kw)
-        tm_kwh = sum((p or 0.0) * hours_per_step for p in self.tm_heater_input_kw)
+        primary_kwh = float(np.nansum(self.get_array("heater_power_in_kw"), dtype=np.float64)) * hours_per_step
+        tm_kwh = float(np.sum(self.get_array("tm_heater_input_kw"), dtype=np.float64)) * hours_per_step
         return primary_kwh + tm_kwh
 
     def get_peak_demand_kw(self) -> float:
@@ -275,8 +763,9 @@ class SimulationRun:
         -------
         float
         """
-        non_none = [p for p in self.heater_power_in_kw if p is not None]
-        return max(non_none) if non_none else 0.0
+        power_kw = self.get_array("heater_power_in_kw")
+        power_kw = power_kw[~np.isnan(power_kw)]
+        return float(power_kw.max()) if len(power_kw) else 0.0
 
     def get_summary(self) -> dict:
         """
@@ -293,7 +782,7 @@ class SimulationRun:
             "total_outage_min":    self.outage_minutes,
             "total_energy_kwh":    self.get_total_energy_kwh(),
             "peak_demand_kw":      self.get_peak_demand_kw(),
-            "num_steps_recorded":  len(self.dhw_demand_supplyT_gal),
+            "num_steps_recorded":  self._num_recorded,
             "stopped_early":       self.stopped_early,
         }
 
@@ -303,7 +792,8 @@ class SimulationRun:
 
         Columns: timestep, time_min, dhw_demand_supplyT_gal,
         usable_volume_supplyT_gal, heater_output_kbtuh, heater_power_in_kw,
-        oat_f, inlet_water_temp_f, tank_temp_0pct, tank_temp_20pct, ..., tank_temp_100pct.
+        oat_f, inlet_water_temp_f, tank_temp_0pct, tank_temp_20pct, ..., tank_temp_100pct,
+        leaving out channels this run does not record.
 
         Parameters
         ----------
@@ -311,29 +801,17 @@ class SimulationRun:
             Destination file path (e.g. ``'simulation_output.csv'``).
         """
         import csv as _csv
-        n = len(self.dhw_demand_supplyT_gal)
-        tank_col_names = [f"tank_temp_{int(f*100)}pct" for f in _TANK_NODE_FRACTS]
+        n = self._num_recorded
+        col_names = [c for c in _STEP_CHANNELS if c in self.channels]
+        columns   = [self._get_list(c) for c in col_names]
+        if "tank_temps_f" in self.channels:
+            col_names += [f"tank_temp_{int(f*100)}pct" for f in _TANK_NODE_FRACTS]
+            columns   += self.tank_temps_f
         with open(filepath, "w", newline="") as f:
             writer = _csv.writer(f)
-            writer.writerow([
-                "timestep", "time_min",
-                "dhw_demand_supplyT_gal", "usable_volume_supplyT_gal",
-                "heater_output_kbtuh", "heater_power_in_kw",
-                "oat_f", "inlet_water_temp_f",
-                *tank_col_names,
-            ])
+            writer.writerow(["timestep", "time_min", *col_names])
             for i in range(n):
-                writer.writerow([
-                    i,
-                    i * self.timestep_min,
-                    self.dhw_demand_supplyT_gal[i],
-                    self.usable_volume_supplyT_gal[i],
-                    self.heater_output_kbtuh[i],
-                    self.heater_power_in_kw[i],
-                    self.oat_f[i],
-                    self.inlet_water_temp_f[i],
-                    *(self.tank_temps_f[node][i] for node in range(len(_TANK_NODE_FRACTS))),
-                ])
+                writer.writerow([i, i * self.timestep_min, *(column[i] for column in columns)])
 
     def to_plotly(
         self,
@@ -387,7 +865,7 @@ class SimulationRun:
                 "Install it with: pip install plotly"
             )
 
-        time_min = [i * self.timestep_min for i in range(len(self.dhw_demand_supplyT_gal))]
+        time_min = [i * self.timestep_min for i in range(self._num_recorded)]
         has_tm = self.show_tm_panel
 
         if has_tm:
@@ -410,7 +888,7 @@ class SimulationRun:
                        name="Usable Volume (gal at or above Supply Temp)", line=dict(color="green", width=1.5)),
             secondary_y=False, **({} if not has_tm else {"row": 1, "col": 1}),
         )
-        hourly_demand = [v * steps_per_hour for v in self.dhw_demand_supplyT_gal]
+        hourly_demand = (self.get_array("dhw_demand_supplyT_gal") * steps_per_hour).tolist()
         fig.add_trace(
             go.Scatter(x=time_min, y=hourly_demand,
                        name="DHW Demand (gal/hr at Supply Temp)", line=dict(color="blue", width=1)),
@@ -418,13 +896,10 @@ class SimulationRun:
         )
 
         if self.supply_temp_f is not None:
-            heater_gph = [
-                kbtuh * 1000.0
-                / (_RHO_CP * max(1.0, self.supply_temp_f - inlet_t))
-                for kbtuh, inlet_t in zip(
-                    self.heater_output_kbtuh, self.inlet_water_temp_f
-                )
-            ]
+            heater_gph = (
+                self.get_array("heater_output_kbtuh") * 1000.0
+                / (_RHO_CP * np.maximum(1.0, self.supply_temp_f - self.get_array("inlet_water_temp_f")))
+            ).tolist()
             fig.add_trace(
                 go.Scatter(x=time_min, y=heater_gph,
                            name="Heater Generation (gal/hr at Supply Temperature)", line=dict(color="red", width=1)),
@@ -460,7 +935,7 @@ class SimulationRun:
 
         # --- Row 2: TM (swing) tank panel ---
         if has_tm:
-            tm_time = [i * self.timestep_min for i in range(len(self.tm_tank_temp_f))]
+            tm_time = [i * self.timestep_min for i in range(self._tm_recorded["tm_tank_temp_f"])]
             # Left Y2: TM heater output [kBTU/hr]
             fig.add_trace(
                 go.Scatter(x=tm_time, y=self.tm_heater_output_kbtuh,
@@ -478,17 +953,18 @@ class SimulationRun:
             )
 
         # --- Load-shift shading: blue=shed, green=loadUp ---
-        if self.heater_mode:
+        heater_mode = self.heater_mode
+        if heater_mode:
             _LS_COLORS = {"shed": "rgba(0,0,255,0.2)", "loadUp": "rgba(0,200,0,0.2)"}
             _LS_LEGEND_ADDED: set[str] = set()
             i = 0
-            n = len(self.heater_mode)
+            n = len(heater_mode)
             while i < n:
-                m = self.heater_mode[i]
+                m = heater_mode[i]
                 if m in _LS_COLORS:
                     # Find end of this contiguous block
                     j = i + 1
-                    while j < n and self.heater_mode[j] == m:
+                    while j < n and heater_mode[j] == m:
                         j += 1
                     x0 = time_min[i]
                     x1 = time_min[j - 1] + self.timestep_min
@@ -543,6 +1019,19 @@ class SimulationRun:
 
         return fig
 
+    def _total_power_kw(self, include_tm: bool) -> np.ndarray:
+        """
+        Return per-step heater power [kW] as float64, with missing power data as 0.
+
+        When ``include_tm`` is True, TM heater power is added on the steps
+        that recorded it.
+        """
+        power_kw = np.nan_to_num(self.get_array("heater_power_in_kw").astype(np.float64), nan=0.0)
+        if include_tm:
+            tm_kw = self.get_array("tm_heater_input_kw")[:len(power_kw)]
+            power_kw[:len(tm_kw)] += tm_kw
+        return power_kw
+
     def get_annual_utility_cost(self, uc) -> float:
         """
         Compute total annual utility cost from this simulation run.
@@ -563,10 +1052,7 @@ class SimulationRun:
         energy_cost = 0.0
         max_kw_by_period: dict[int, float] = {}
 
-        for i, kw_raw in enumerate(self.heater_power_in_kw):
-            kw = kw_raw or 0.0
-            if self.tm_heater_input_kw and i < len(self.tm_heater_input_kw):
-                kw += self.tm_heater_input_kw[i] or 0.0
+        for i, kw in enumerate(self._total_power_kw(include_tm=True).tolist()):
             rate = uc.get_energy_charge_at_step(i, self.timestep_min)
             energy_cost += kw * hours_per_step * rate
 
@@ -599,8 +1085,7 @@ class SimulationRun:
         energy_by_month = [0.0] * 12
         max_kw_by_period: dict[int, float] = {}
 
-        for i, kw_raw in enumerate(self.heater_power_in_kw):
-            kw   = kw_raw or 0.0
+        for i, kw in enumerate(self._total_power_kw(include_tm=False).tolist()):
             rate = uc.get_energy_charge_at_step(i, self.timestep_min)
             energy_by_month[_step_to_month(i, self.timestep_min)] += (
                 kw * hours_per_step * rate
@@ -640,10 +1125,7 @@ class SimulationRun:
         energy_off_peak     = [0.0] * 12
         max_kw_by_period: dict[int, float] = {}
 
-        for i, kw_raw in enumerate(self.heater_power_in_kw):
-            kw = kw_raw or 0.0
-            if self.tm_heater_input_kw and i < len(self.tm_heater_input_kw):
-                kw += self.tm_heater_input_kw[i] or 0.0
+        for i, kw in enumerate(self._total_power_kw(include_tm=True).tolist()):
             period = uc.get_demand_period_at_step(i, self.timestep_min)
             rate   = uc.get_energy_charge_at_step(i, self.timestep_min)
             month  = _step_to_month(i, self.timestep_min)
@@ -692,12 +1174,10 @@ class SimulationRun:
 
         hours_per_step = self.timestep_min / 60.0
         steps_per_day  = 24 * 60 // self.timestep_min
+        power_kw = self._total_power_kw(include_tm=False)
         step = 0
         for month_idx, days in enumerate(_DAYS_IN_MONTH):
             n_steps = days * steps_per_day
-            monthly[month_idx] = sum(
-                (self.heater_power_in_kw[i] or 0.0) * hours_per_step
-                for i in range(step, min(step + n_steps, len(self.heater_power_in_kw)))
-            )
+            monthly[month_idx] = float(np.sum(power_kw[step:step + n_steps])) * hours_per_step
             step += n_steps
         return monthly
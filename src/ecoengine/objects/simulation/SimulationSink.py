@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import csv
+from typing import IO, Sequence
+
+import numpy as np
+
+# Downsampling periods of DownsampleSink [minutes]
+_PERIOD_MIN = {"hourly": 60, "daily": 24 * 60}
+# Statistics DownsampleSink can compute per period
+_STATS = ("min", "mean", "max")
+
+
+class SimulationSink:
+    """
+    Consumer of the timestep chunks yielded by ``Simulator.simulate_iter``.
+
+    Each chunk is a numpy structured array in the layout of
+    ``SimulationRun.to_records``. ``Simulator.simulate_to_sinks`` calls
+    ``open`` once with the run's timestep, ``write`` for every chunk in
+    order and ``close`` at the end; subclasses override what they need.
+    """
+
+    def open(self, timestep_min: int) -> None:
+        """Start a run with timesteps of ``timestep_min`` minutes."""
+        self.timestep_min = timestep_min
+
+    def write(self, chunk: np.ndarray) -> None:
+        """Consume the next chunk of timestep records."""
+
+    def close(self) -> None:
+        """Finish the run, flushing any buffered output."""
+
+
+class CSVSink(SimulationSink):
+    """
+    Write the timestep records to a CSV file as they arrive.
+
+    The header row holds the record field names; NaN values (e.g. heater
+    power without power data) are written as empty cells.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """
+        Parameters
+        ----------
+        filepath : str
+            Destination file path (e.g. ``'simulation_output.csv'``).
+        """
+        self.filepath = filepath
+        self._file: IO | None = None
+        self._writer = None
+
+    def write(self, chunk: np.ndarray) -> None:
+        if self._file is None:
+            self._file = open(self.filepath, "w", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(chunk.dtype.names)
+        self._writer.writerows(
+            ["" if value != value else value for value in row] for row in chunk.tolist()
+        )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class NpySink(SimulationSink):
+    """
+    Append the timestep records to a ``.npy`` file of one structured array.
+
+    Records are written as they arrive and the array header is rewritten
+    with the final length on ``close``, so ``np.load(filepath)`` returns the
+    whole run, or memory-maps it with ``mmap_mode="r"``.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """
+        Parameters
+        ----------
+        filepath : str
+            Destination file path (e.g. ``'simulation_output.npy'``).
+        """
+        self.filepath = filepath
+        self._file: IO | None = None
+        self._dtype: np.dtype | None = None
+        self._num_records = 0
+
+    def _write_header(self) -> int:
+        """Write the array header for the records so far at the file start; return its length."""
+        self._file.seek(0)
+        np.lib.format.write_array_header_1_0(self._file, {
+            "descr":         np.lib.format.dtype_to_descr(self._dtype),
+            "fortran_order": False,
+            "shape":         (self._num_records,),
+        })
+        return self._file.tell()
+
+    def write(self, chunk: np.ndarray) -> None:
+        if self._file is None:
+            self._file  = open(self.filepath, "wb")
+            self._dtype = chunk.dtype
+            self._header_len = self._write_header()
+        elif chunk.dtype != self._dtype:
+            raise ValueError(f"NpySink got records of dtype {chunk.dtype}, expected {self._dtype}")
+        self._file.write(np.ascontiguousarray(chunk).tobytes())
+        self._num_records += len(chunk)
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        # numpy pads the header so the length field can grow in place
+        if self._write_header() != self._header_len:
+            raise ValueError(f"Could not rewrite the .npy header of {self.filepath!r} in place")
+        self._file.close()
+        self._file = None
+
+
+class RunningTotalsSink(SimulationSink):
+    """
+    Accumulate run totals without keeping the records.
+
+    Matches the SimulationRun metrics of a full run: ``total_energy_kwh``
+    (``get_total_energy_kwh``), ``peak_demand_kw`` (``get_peak_demand_kw``)
+    and ``outage_minutes``, the time with no usable volume at supply
+    temperature. Energy and peak need ``heater_power_in_kw`` (plus
+    ``tm_heater_input_kw`` for TM systems) and outages
+    ``usable_volume_supplyT_gal`` in the records.
+    """
+
+    def __init__(self) -> None:
+        self.timestep_min = 1
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the totals."""
+        self.num_steps:        int   = 0
+        self.total_energy_kwh: float = 0.0
+        self.peak_demand_kw:   float = 0.0
+        self.outage_minutes:   int   = 0
+
+    def open(self, timestep_min: int) -> None:
+        super().open(timestep_min)
+        self.reset()
+
+    def write(self, chunk: np.ndarray) -> None:
+        hours_per_step = self.timestep_min / 60.0
+        names = chunk.dtype.names
+        self.num_steps += len(chunk)
+        if "heater_power_in_kw" in names:
+            power_kw = chunk["heater_power_in_kw"]
+            self.total_energy_kwh += float(np.nansum(power_kw, dtype=np.float64)) * hours_per_step
+            power_kw = power_kw[~np.isnan(power_kw)]
+            if len(power_kw):
+                self.peak_demand_kw = max(self.peak_demand_kw, float(power_kw.max()))
+        if "tm_heater_input_kw" in names:
+            self.total_energy_kwh += float(np.nansum(chunk["tm_heater_input_kw"], dtype=np.float64)) * hours_per_step
+        if "usable_volume_supplyT_gal" in names:
+            self.outage_minutes += int(np.count_nonzero(chunk["usable_volume_supplyT_gal"] <= 0.0)) * self.timestep_min
+
+
+class DownsampleSink(SimulationSink):
+    """
+    Reduce the timestep records to hourly or daily statistics.
+
+    Each output record holds ``period`` (hour or day index), ``time_min``
+    (start of the period) and, for every float field, its statistics over
+    the period's timesteps, ignoring NaN (NaN when a field has no values in
+    the period). With the default ``stats=("mean",)`` the means keep the
+    field names; otherwise each statistic gets its own field, e.g.
+    ``heater_power_in_kw_max``. Periods are completed as the chunks arrive
+    and passed on to ``sink`` (e.g. a CSVSink), or collected for
+    ``to_records``.
+    """
+
+    def __init__(
+        self,
+        period: str = "hourly",
+        sink: SimulationSink | None = None,
+        stats: Sequence[str] = ("mean",),
+    ) -> None:
+        """
+        Parameters
+        ----------
+        period : str
+            'hourly' or 'daily'.
+        sink : SimulationSink | None
+            Sink receiving the downsampled records. Default None, which
+            keeps them for ``to_records``.
+        stats : Sequence[str]
+            Statistics to compute, any of 'min', 'mean' and 'max'.
+            Default ('mean',).
+        """
+        if period not in _PERIOD_MIN:
+            raise ValueError(f"period must be one of {tuple(_PERIOD_MIN)}, got {period!r}")
+        unknown = set(stats).difference(_STATS)
+        if unknown or not stats:
+            raise ValueError(f"stats must be a non-empty selection of {_STATS}, got {stats!r}")
+        self.period_min = _PERIOD_MIN[period]
+        self.sink       = sink
+        self.stats      = tuple(stat for stat in _STATS if stat in stats)
+        self._chunks:  list[np.ndarray] = []
+        self._fields:  list[str] | None = None
+        self._pending: tuple | None = None   # open period: id, sums, counts, mins, maxs
+
+    def open(self, timestep_min: int) -> None:
+        super().open(timestep_min)
+        self._chunks.clear()
+        self._fields  = None
+        self._pending = None
+        if self.sink is not None:
+            self.sink.open(self.period_min)
+
+    def write(self, chunk: np.ndarray) -> None:
+        if not len(chunk):
+            return
+        if self._fields is None:
+            self._fields = [
+                name for name in chunk.dtype.names
+                if chunk.dtype[name].kind == "f"
+            ]
+        values = np.column_stack([chunk[name] for name in self._fields]).astype(np.float64)
+        valid  = ~np.isnan(values)
+        period = chunk["time_min"] // self.period_min
+        starts = np.flatnonzero(np.r_[True, period[1:] != period[:-1]])
+        ids    = period[starts]
+        sums   = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+        counts = np.add.reduceat(valid.astype(np.int64), starts, axis=0)
+        # fmin / fmax skip NaN unless every value is NaN
+        mins   = np.fmin.reduceat(values, starts, axis=0)
+        maxs   = np.fmax.reduceat(values, starts, axis=0)
+
+        if self._pending is not None:
+            pending_id, *pending = self._pending
+            if pending_id == ids[0]:
+                sums[0]   += pending[0]
+                counts[0] += pending[1]
+                mins[0]    = np.fmin(mins[0], pending[2])
+                maxs[0]    = np.fmax(maxs[0], pending[3])
+            else:
+                self._emit(np.array([pending_id]), *(acc[None] for acc in pending))
+        # The last period may continue in the next chunk
+        self._emit(ids[:-1], sums[:-1], counts[:-1], mins[:-1], maxs[:-1])
+        self._pending = (ids[-1], sums[-1], counts[-1], mins[-1], maxs[-1])
+
+    def _emit(self, ids: np.ndarray, sums: np.ndarray, counts: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> None:
+        """Pass the completed periods ``ids`` on as records of their statistics."""
+        if not len(ids):
+            return
+        by_stat = {
+            "min":  mins,
+            "mean": np.divide(sums, counts, out=np.full(sums.shape, np.nan), where=counts > 0),
+            "max":  maxs,
+        }
+        suffixed = self.stats != ("mean",)
+        fields   = [("period", np.int64), ("time_min", np.int64)]
+        fields  += [
+            (f"{name}_{stat}" if suffixed else name, np.float64)
+            for name in self._fields for stat in self.stats
+        ]
+        records = np.empty(len(ids), dtype=fields)
+        records["period"]   = ids
+        records["time_min"] = ids * self.period_min
+        for col, name in enumerate(self._fields):
+            for stat in self.stats:
+                records[f"{name}_{stat}" if suffixed else name] = by_stat[stat][:, col]
+        if self.sink is not None:
+            self.sink.write(records)
+        else:
+            self._chunks.append(records)
+
+    def close(self) -> None:
+        if self._pending is not None:
+            pending_id, *pending = self._pending
+            self._emit(np.array([pending_id]), *(acc[None] for acc in pending))
+            self._pending = None
+        if self.sink is not None:
+            self.sink.close()
+
+    def to_records(self) -> np.ndarray:
+        """
+        Return the downsampled records collected so far (without a ``sink``).
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if not self._chunks:
+            return np.empty(0, dtype=[("period", np.int64), ("time_min", np.int64)])
+        return np.concatenate(self._chunks)
+
+
+class AggregationPolicy(SimulationSink):
+    """
+    Keep full timestep resolution only where it is needed and hourly (or
+    daily) min/mean/max statistics everywhere else.
+
+    Full-resolution records are kept for each fixed ``windows`` entry and
+    for the worst block of ``worst_window_days`` days, the block with the
+    highest (or lowest) value of ``worst_window_by``, e.g. the week with the
+    peak heater power. Memory stays bounded by the windows: a 1-minute
+    annual run keeps 8,760 hourly records plus about 10,080 records per
+    week-long window instead of 525,600.
+
+    After ``close``, ``summary`` holds the statistics (see DownsampleSink
+    with ``stats=("min", "mean", "max")``), ``windows`` one record array per
+    fixed window and ``worst_window`` the worst block's records (None
+    without ``worst_window_by``), scored by ``worst_window_score``.
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[tuple[int, int]] = (),
+        worst_window_by: str | None = None,
+        worst_window_days: int = 7,
+        worst_window_stat: str = "max",
+        period: str = "hourly",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        windows : Sequence[tuple[int, int]]
+            ``(start_min, end_min)`` spans of simulation time, counted from
+            the start of the run, to keep at full resolution.
+        worst_window_by : str | None
+            Record field scoring each block, e.g. ``"heater_power_in_kw"``.
+            Default None (no worst window).
+        worst_window_days : int
+            Length of the scored blocks, which start every
+            ``worst_window_days`` days from the start of the run. Default 7.
+        worst_window_stat : str
+            'max' (default) keeps the block with the highest value of
+            ``worst_window_by``; 'min' the block with the lowest, e.g. for
+            ``usable_volume_supplyT_gal``.
+        period : str
+            'hourly' (default) or 'daily' statistics.
+        """
+        if worst_window_stat not in ("min", "max"):
+            raise ValueError(f"worst_window_stat must be 'min' or 'max', got {worst_window_stat!r}")
+        if worst_window_days < 1:
+            raise ValueError(f"worst_window_days must be at least 1, got {worst_window_days}")
+        for start_min, end_min in windows:
+            if not 0 <= start_min < end_min:
+                raise ValueError(f"window ({start_min}, {end_min}) must satisfy 0 <= start_min < end_min")
+        self.window_spans      = list(windows)
+        self.worst_window_by   = worst_window_by
+        self.worst_window_min  = worst_window_days * _PERIOD_MIN["daily"]
+        self.worst_window_stat = worst_window_stat
+        self._downsample       = DownsampleSink(period, stats=_STATS)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop the records and scores of a previous run."""
+        self.summary:            np.ndarray | None = None
+        self.windows:            list[np.ndarray] = []
+        self.worst_window:       np.ndarray | None = None
+        self.worst_window_score: float | None = None
+        self._window_parts: list[list[np.ndarray]] = [[] for _ in self.window_spans]
+        self._block_id:     int | None = None
+        self._block_parts:  list[np.ndarray] = []
+        self._dtype:        np.dtype | None = None
+
+    def open(self, timestep_min: int) -> None:
+        super().open(timestep_min)
+        self._reset()
+        self._downsample.open(timestep_min)
+
+    def write(self, chunk: np.ndarray) -> None:
+        self._downsample.write(chunk)
+        self._dtype = chunk.dtype
+        time_min    = chunk["time_min"]
+        for parts, (start_min, end_min) in zip(self._window_parts, self.window_spans):
+            in_window = (time_min >= start_min) & (time_min < end_min)
+            if in_window.any():
+                parts.append(chunk[in_window])
+        if self.worst_window_by is None:
+            return
+        blocks = time_min // self.worst_window_min
+        starts = np.flatnonzero(np.r_[True, blocks[1:] != blocks[:-1]])
+        for start, stop in zip(starts, np.r_[starts[1:], len(chunk)]):
+            if blocks[start] != self._block_id:
+                self._finish_block()
+                self._block_id = int(blocks[start])
+            self._block_parts.append(chunk[start:stop])
+
+    def _finish_block(self) -> None:
+        """Score the block collected so far and keep it if it is the worst yet."""
+        if not self._block_parts:
+            return
+        block = np.concatenate(self._block_parts)
+        self._block_parts = []
+        values = block[self.worst_window_by]
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        score = float(values.max() if self.worst_window_stat == "max" else values.min())
+        if (
+            self.worst_window_score is None
+            or (score > self.worst_window_score if self.worst_window_stat == "max" else score < self.worst_window_score)
+        ):
+            self.worst_window       = block
+            self.worst_window_score = score
+
+    def close(self) -> None:
+        self._finish_block()
+        self._downsample.close()
+        self.summary = self._downsample.to_records()
+        self.windows = [
+            np.concatenate(parts) if parts else np.empty(0, dtype=self._dtype)
+            for parts in self._window_parts
+        ]
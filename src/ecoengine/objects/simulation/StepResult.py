@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+from ecoengine.constants.constants import _TANK_NODE_FRACTS
+
+# Outputs every system writes on every step
+_STEP_FIELDS = (
+    "demand_supplyT_gal", "usable_volume_supplyT_gal", "heater_output_kbtuh",
+    "heater_power_in_kw", "oat_f", "inlet_water_temp_f", "tank_temps_f", "mode",
+)
+# Outputs only some systems write (swing / parallel-loop TM tanks, delivery-point override)
+_OPTIONAL_FIELDS = ("tm_tank_temp_f", "tm_heater_output_kbtuh", "tm_heater_input_kw", "delivery_temp_f")
+
+
+class StepResult:
+    """
+    Reusable holder for one simulation timestep's outputs.
+
+    ``DHWSystem.simulate_step_into`` overwrites the fields of a StepResult
+    the simulator allocates once per run, and ``SimulationRun.record_step``
+    copies them into the run's buffers, so stepping builds no per-step
+    result dict. The fields match the keys of ``DHWSystem.simulate_step``.
+
+    Systems set every field in ``_STEP_FIELDS`` on every step. The optional
+    fields keep their ``None`` default unless the system reports them:
+    the TM (swing) tank channels and ``delivery_temp_f``, the temperature
+    checked for outlet deficit when it is not the primary tank top.
+
+    ``tank_fracts`` is an input rather than an output: the tank fractions
+    systems report in ``tank_temps_f``. The simulator narrows it to the top
+    node when the run does not record the temperature profile.
+    """
+
+    __slots__ = _STEP_FIELDS + _OPTIONAL_FIELDS + ("tank_fracts",)
+
+    def __init__(self) -> None:
+        self.demand_supplyT_gal:        float = 0.0
+        self.usable_volume_supplyT_gal: float = 0.0
+        self.heater_output_kbtuh:       float = 0.0
+        self.heater_power_in_kw:        float | None = None
+        self.oat_f:                     float = 0.0
+        self.inlet_water_temp_f:        float = 0.0
+        self.tank_temps_f:              Sequence[float] = ()
+        self.mode:                      str = "normal"
+        self.tm_tank_temp_f:            float | None = None
+        self.tm_heater_output_kbtuh:    float | None = None
+        self.tm_heater_input_kw:        float | None = None
+        self.delivery_temp_f:           float | None = None
+        self.tank_fracts:               Sequence[float] = _TANK_NODE_FRACTS
+
+    def get_delivery_temp_f(self) -> float:
+        """Return the delivered water temperature: ``delivery_temp_f`` or the primary tank top [°F]."""
+        if self.delivery_temp_f is not None:
+            return self.delivery_temp_f
+        return self.tank_temps_f[-1]
+
+    def update(self, step: Mapping) -> StepResult:
+        """
+        Overwrite all fields from a ``simulate_step``-style dict.
+
+        Missing keys fall back to the defaults (``"normal"`` mode, ``None``
+        optional fields). Returns ``self``.
+        """
+        for name in _STEP_FIELDS[:-1]:
+            setattr(self, name, step[name])
+        self.mode = step.get("mode", "normal")
+        for name in _OPTIONAL_FIELDS:
+            setattr(self, name, step.get(name))
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Return the fields as a ``simulate_step``-style dict.
+
+        Optional fields are included only when set.
+        """
+        step = {name: getattr(self, name) for name in _STEP_FIELDS}
+        for name in _OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                step[name] = value
+        return step
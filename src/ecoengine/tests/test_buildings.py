@@ -593,6 +593,79 @@ def test_dhw_load_use_avg_differs_from_peak():
     assert avg_load  == pytest.approx(daily * building.avg_load_shape[9]  / 60, rel=1e-9)
 
 
+# ===========================================================================
+# Whole-run timeseries
+# ===========================================================================
+
+@pytest.mark.parametrize("n_steps, interval_min", [(4320, 1), (52560, 10)])
+def test_timeseries_matches_per_step_queries(n_steps, interval_min):
+    building = Building.from_building_type('apartment', 100, ClimateZone.from_zone_id(1))
+    series   = building.get_timeseries(n_steps, interval_min, use_avg=True)
+    steps    = range(0, n_steps, 37)
+    assert series["demand_supplyT_gal"][steps].tolist() == [
+        building.get_dhw_load_supplyT_gal(i, interval_min, use_avg=True) for i in steps
+    ]
+    assert series["oat_f"][steps].tolist() == [building.get_oat_f(i, interval_min) for i in steps]
+    assert series["inlet_water_temp_f"][steps].tolist() == [
+        building.get_inlet_water_temp_f(i, interval_min) for i in steps
+    ]
+    assert series["hour_of_day"][steps].tolist() == [(i * interval_min // 60) % 24 for i in steps]
+
+
+def test_timeseries_design_conditions_and_mode():
+    building = Building.from_building_type('motel', 20, None)
+    building.climate_zone = ClimateZone.from_design_conditions(35.0, 50.0)
+    schedule = ["normal"] * 16 + ["shed"] * 4 + ["normal"] * 4
+    series   = building.get_timeseries(120, 10, control_schedule=schedule)
+    assert set(series["oat_f"]) == {35.0}
+    assert set(series["inlet_water_temp_f"]) == {50.0}
+    assert series["mode"][96] == "shed" and series["mode"][95] == "normal"
+    assert set(building.get_timeseries(3)["mode"]) == {"normal"}
+
+
+def test_timeseries_without_oat_data_raises():
+    building = Building.from_building_type('motel', 20, None, design_inlet_water_temp_f=50.0)
+    with pytest.raises(ValueError):
+        building.get_timeseries(10)
+
+
+def test_precomputed_timeseries_used_until_cleared():
+    building = Building.from_building_type('apartment', 100, ClimateZone.from_zone_id(1))
+    live     = [building.get_dhw_load_supplyT_gal(i, 10) for i in range(200)]
+    building.precompute_timeseries(100, 10)
+    assert [building.get_dhw_load_supplyT_gal(i, 10) for i in range(200)] == live
+    # Mutating the cached inputs shows they are returned while set
+    building._timeseries["oat_f"][5] = -1.0
+    assert building.get_oat_f(5, 10) == -1.0
+    assert building.get_oat_f(5, 1) == building.climate_zone.get_oat_f(5, 1)
+    building.clear_timeseries()
+    assert building.get_oat_f(5, 10) == building.climate_zone.get_oat_f(5, 10)
+
+
+def test_input_period_steps():
+    building = Building.from_building_type('apartment', 100, ClimateZone.from_zone_id(1))
+    assert building.get_input_period_steps(4320, 1) == 4320
+    assert building.get_input_period_steps(2 * 8760, 60) == 8760
+    assert building.get_input_period_steps(3 * 52560, 10) == 52560
+    design = Building.from_building_type('motel', 20, ClimateZone.from_design_conditions(35.0, 50.0))
+    assert design.get_input_period_steps(2 * 8760, 60) == 8760
+    # Load shapes that do not divide a year keep the whole run
+    design.avg_load_shape = np.full(7 * 24, 1.0 / (7 * 24))
+    assert design.get_input_period_steps(2 * 8760, 60) == 2 * 8760
+
+
+def test_precomputed_multi_year_timeseries_repeats_first_year():
+    building = Building.from_building_type('apartment', 100, ClimateZone.from_zone_id(1))
+    steps    = [0, 37, 8759, 8760, 8797, 2 * 8760 - 1]
+    live_oat = [building.get_oat_f(i, 60) for i in steps]
+    building.precompute_timeseries(2 * 8760, 60)
+    assert building._timeseries["period_steps"] == 8760
+    assert len(building._timeseries["oat_f"]) == 8760
+    assert [building.get_oat_f(i, 60) for i in steps] == live_oat
+    assert building.get_oat_f(8760 + 37, 60) == building.get_oat_f(37, 60)
+    assert building.get_dhw_load_supplyT_gal(8760 + 5, 60) == building.get_dhw_load_supplyT_gal(5, 60)
+
+
 # ===========================================================================
 # Validation errors for Building.from_building_type
 # Originally: test_invalid_building_parameter_errors (subset applicable to Building)
@@ -12,8 +12,18 @@ Tests cover:
 - size() guard: raises when no design inlet temp available
 - NominalPerformanceMap: constant-capacity placeholder
 - WaterHeater factory methods: from_nominal_capacity, from_model_name
+- Precomputed heater timeline: per-step lookups match live queries
+- Batched sensor readings: shared tank query drives the same heater states
+- TM tank advance: heater switches at exact trigger crossings within a step (opt-in)
+- Event-driven simulation: jumps between events reproduce the stepped run
+- Ensemble simulation: lockstep runs of many systems match individual runs
+- SimulationRun recorder: preallocated columnar buffers behind list accessors
+- Step protocol: simulate_step_into fills a reused StepResult
 """
 
+import copy
+import json
+import pickle
 import warnings
 import pytest
 import numpy as np
@@ -23,11 +33,23 @@ from ecoengine.objects.building.ClimateZone import ClimateZone
 from ecoengine.objects.dhwsystems.DHWSystem import DHWSystem, _get_peak_indices
 from ecoengine.constants.constants import _RHO_CP
 from ecoengine.objects.components.heating.WaterHeater import WaterHeater
-from ecoengine.objects.components.heating.PerformanceMap import NominalPerformanceMap
+from ecoengine.objects.components.heating.PerformanceMap import NominalPerformanceMap, PerformanceMap
 from ecoengine.objects.components.heating.Controls import Controls
 from ecoengine.objects.components.storage.StorageTank import StorageTank
 from ecoengine.objects.components.storage.StratifiedTank import StratifiedTank
+from ecoengine.objects.components.storage.MixedStorageTank import MixedStorageTank
+from ecoengine.objects.dhwsystems.recirc_systems.RecircSystem import RecircSystem
 from ecoengine.objects.dhwsystems.rtp_systems.SinglePassRTPSystem import SinglePassRTPSystem
+from ecoengine.interfaces.Simulator import (
+    simulate, simulate_3day, simulate_feasibility, simulate_iter, simulate_to_sinks,
+)
+from ecoengine.interfaces.EnsembleSimulator import simulate_ensemble
+from ecoengine.interfaces.EcosizerEngine import EcosizerEngine
+from ecoengine.objects.simulation.SimulationRun import SimulationRun
+from ecoengine.objects.simulation.StepResult import StepResult
+from ecoengine.objects.simulation.SimulationSink import (
+    AggregationPolicy, CSVSink, DownsampleSink, NpySink, RunningTotalsSink,
+)
 
 
 # ===========================================================================
@@ -185,11 +207,767 @@ class TestWaterHeaterFactories:
         assert wh.control_schedule is basic_schedule
         assert wh.control_map is basic_control_map
 
+    def test_output_and_power_inactive_skips_lookup(self, basic_schedule, basic_control_map):
+        wh = WaterHeater.from_model_name("MODELS_ColmacCxV_5_C_SP", basic_schedule, basic_control_map)
+        wh.turn_off()
+        assert wh.get_output_and_power(47.0, 150.0, 50.0) == (0.0, None)
+
+    def test_output_and_power_matches_separate_queries(self, basic_schedule, basic_control_map):
+        wh = WaterHeater.from_model_name("MODELS_ColmacCxV_5_C_SP", basic_schedule, basic_control_map)
+        wh.turn_on()
+        kbtuh, kw = wh.get_output_and_power(47.0, 150.0, 50.0)
+        assert kbtuh == pytest.approx(wh.get_output_kbtuh(47.0, 150.0, 50.0))
+        assert kw    == pytest.approx(wh.get_power_in_kw(47.0, 150.0, 50.0))
+
+    def test_output_and_power_nominal_has_no_power(self, basic_schedule, basic_control_map):
+        wh = WaterHeater.from_nominal_capacity(40.0, basic_schedule, basic_control_map)
+        wh.turn_on()
+        assert wh.get_output_and_power(35.0, 120.0) == (pytest.approx(40.0), None)
+
+
+# ===========================================================================
+# Precomputed heater timeline
+# ===========================================================================
+
+class TestHeaterTimeline:
+    OATS    = [5.0, 5.0, 35.0, 47.0, 47.0, 67.0, 90.0, 35.0]
+    OUTLETS = [150.0, 150.0, 140.0, 150.0, 150.0, 120.0, 150.0, 140.0]
+    INLETS  = [50.0, 50.0, 60.0, 50.0, 50.0, 75.0, 50.0, 60.0]
+
+    @pytest.fixture
+    def wh(self, basic_schedule, basic_control_map):
+        return WaterHeater.from_model_name("MODELS_ColmacCxV_5_C_SP", basic_schedule, basic_control_map)
+
+    def test_timeline_matches_live_queries(self, wh):
+        wh.turn_on()
+        n_lookups = wh.precompute_output_and_power(self.OATS, self.OUTLETS, self.INLETS)
+        assert n_lookups == 5
+        for i, cond in enumerate(zip(self.OATS, self.OUTLETS, self.INLETS)):
+            assert wh.get_output_and_power(*cond, step=i) == wh.get_output_and_power(*cond)
+
+    def test_scalar_conditions_broadcast(self, wh):
+        wh.turn_on()
+        assert wh.precompute_output_and_power(self.OATS, 150.0, None) == 5
+        assert wh.get_output_and_power(0.0, 0.0, step=3) == wh.get_output_and_power(47.0, 150.0)
+
+    def test_inactive_heater_ignores_timeline(self, wh):
+        wh.precompute_output_and_power(self.OATS, self.OUTLETS, self.INLETS)
+        assert wh.get_output_and_power(47.0, 150.0, 50.0, step=3) == (0.0, None)
+
+    def test_snapshot_restores_on_off_state(self, wh):
+        state = wh.snapshot()
+        wh.turn_on()
+        assert wh.snapshot() == (True,)
+        wh.restore(state)
+        assert not wh.is_active()
+
+    def test_clear_timeline(self, wh):
+        wh.turn_on()
+        wh.precompute_output_and_power(self.OATS, self.OUTLETS, self.INLETS)
+        assert wh.has_timeline()
+        wh.clear_timeline()
+        assert not wh.has_timeline()
+        assert wh.get_output_and_power(67.0, 120.0, 75.0, step=0) == wh.get_output_and_power(67.0, 120.0, 75.0)
+
+    def test_length_mismatch_raises(self, wh):
+        with pytest.raises(ValueError):
+            wh.precompute_output_and_power(self.OATS, self.OUTLETS[:3], self.INLETS)
+        assert not wh.has_timeline()
+
+    @pytest.mark.parametrize("model_name, expected", [
+        ("MODELS_ColmacCxV_5_C_SP", True),
+        ("MODELS_ColmacCxV_5_C_MP", False),
+        ("MODELS_SANCO2_43_R_SP",   False),
+    ])
+    def test_depends_on_outlet_temp(self, model_name, expected):
+        wh = WaterHeater.from_model_name(model_name, None, None)
+        assert wh.depends_on_outlet_temp() is expected
+
+    def test_nominal_heater_does_not_depend_on_outlet_temp(self):
+        assert WaterHeater.from_nominal_capacity(40.0, None, None).depends_on_outlet_temp() is False
+
+    def test_simulation_matches_live_lookups(self, sized_system_with_controls, building_with_zone, monkeypatch):
+        system = sized_system_with_controls
+        system.water_heaters[0].performance_map = PerformanceMap.from_model_name(
+            "MODELS_ColmacCxV_5_C_SP", num_units=2
+        )
+        live_system = copy.deepcopy(system)
+
+        run = simulate(system, building_with_zone, "3day")
+        assert not system.water_heaters[0].has_timeline()
+
+        monkeypatch.setattr(live_system, "precompute_heater_timeline", lambda *args: None)
+        live_run = simulate(live_system, building_with_zone, "3day")
+        assert run.heater_output_kbtuh == live_run.heater_output_kbtuh
+        assert run.heater_power_in_kw  == live_run.heater_power_in_kw
+
+    def test_annual_timeline_covers_every_step(self, sized_system_with_controls, building_with_zone):
+        system = sized_system_with_controls
+        wh     = system.water_heaters[0]
+        system.precompute_heater_timeline(building_with_zone, 365 * 24 * 6, 10)
+        wh.turn_on()
+        assert wh.get_output_and_power(35.0, STORAGE_T, INLET_T, step=365 * 24 * 6 - 1) == \
+            wh.get_output_and_power(35.0, STORAGE_T, INLET_T)
+        system.clear_heater_timeline()
+        assert not wh.has_timeline()
+
+
+class TestBatchedSensorReadings:
+
+    def test_controls_use_supplied_sensor_temp(self):
+        tank     = StratifiedTank(total_volume_gal=100.0)
+        tank.initialize(storage_temp_f=STORAGE_T, cold_temp_f=INLET_T, percent_useable=1.0)
+        controls = make_controls(0.5, 0.2)
+        assert not controls.should_turn_on(tank)
+        assert controls.should_turn_on(tank, sensor_temp_f=controls.on_trigger_t_f - 1.0)
+        assert not controls.should_turn_off(tank, sensor_temp_f=controls.off_trigger_t_f - 1.0)
+
+    @pytest.mark.parametrize("active", [False, True])
+    def test_batched_heater_update_matches_per_heater(self, sized_system_with_controls, active):
+        system = sized_system_with_controls
+        system.water_heaters = [copy.deepcopy(system.water_heaters[0]) for _ in range(3)]
+        system.storage_tank.initialize(STORAGE_T, INLET_T, 0.5)
+        for wh in system.water_heaters:
+            if active:
+                wh.turn_on()
+        reference = copy.deepcopy(system)
+
+        for hour in range(24):
+            system._update_heater_states(system.storage_tank, hour)
+            for wh in reference.water_heaters:
+                wh.update_state(reference.storage_tank, hour)
+            assert [wh.is_active() for wh in system.water_heaters] == \
+                [wh.is_active() for wh in reference.water_heaters]
+
+
+class TestAdvanceTMTank:
+
+    @staticmethod
+    def _tm(on_trigger_t_f: float = 125.0, off_trigger_t_f: float = 135.0):
+        tank = MixedStorageTank(total_volume_gal=80.0)
+        tank.initialize(storage_temp_f=130.0, cold_temp_f=INLET_T, percent_useable=1.0)
+        controls = Controls(0.5, on_trigger_t_f, 0.5, off_trigger_t_f, off_trigger_t_f)
+        heater   = WaterHeater.from_nominal_capacity(40.0, ["normal"] * 24, {"normal": controls})
+        system   = RecircSystem([], None, SUPPLY_T, STORAGE_T, 115.0, 3.0)
+        return system, tank, heater
+
+    def test_energy_balance_with_exact_switching(self):
+        system, tank, heater = self._tm()
+        on_min = system._advance_tm_tank(tank, heater, 0, 600.0, 40.0, fixed_loss_kbtuh=15.0)
+        assert 0.0 < on_min < 600.0
+        net_kbtu = 40.0 * on_min / 60.0 - 15.0 * 600.0 / 60.0
+        assert tank.get_temperature_at_fraction(0.5) == pytest.approx(
+            130.0 + net_kbtu * 1000.0 / (80.0 * _RHO_CP), abs=1e-9
+        )
+        assert 125.0 <= tank.get_temperature_at_fraction(0.5) <= 135.0
+
+    def test_heater_stays_off_above_on_trigger(self):
+        system, tank, heater = self._tm()
+        assert system._advance_tm_tank(tank, heater, 0, 1.0, 40.0, recirc_flow_gpm=3.0, return_temp_f=115.0) == 0.0
+        assert not heater.is_active()
+
+    def test_no_deadband_does_not_chatter(self):
+        system, tank, heater = self._tm(on_trigger_t_f=135.0, off_trigger_t_f=125.0)
+        on_min = system._advance_tm_tank(tank, heater, 0, 10.0, 40.0, recirc_flow_gpm=3.0, return_temp_f=115.0)
+        assert on_min == 10.0
+        assert heater.is_active()
+
+    def test_heater_stops_at_outlet_cap(self):
+        system, tank, heater = self._tm()
+        heater.turn_on()
+        on_min = system._advance_tm_tank(tank, heater, 0, 20.0, 40.0, max_temp_f=132.0, fixed_loss_kbtuh=5.0)
+        assert 0.0 < on_min < 20.0
+        assert 125.0 < tank.get_temperature_at_fraction(0.5) < 132.0
+        assert not heater.is_active()
+
+    @staticmethod
+    def _recirc_run(schematic: str, exact: bool):
+        engine = EcosizerEngine(
+            building_type="multi_family", magnitude=100, supply_temp_f=125.0, storage_temp_f=150.0,
+            gpdpp=25.0, schematic=schematic, zip_code_or_climate_zone="94110",
+            hpwh_model="MODELS_ColmacCxV_5_C_SP", num_heaters=2, storage_volume_storageT_gal=500,
+            tm_storage_vol=80, tm_capacity_kbtuh=20, return_flow_gpm=3, return_temp_f=115,
+            tm_on_temp_f=125, tm_off_temp_f=135, tm_exact_switching=exact,
+        )
+        return engine._dhw_system, engine.simulate_3day()
+
+    def test_per_step_update_is_default(self):
+        system, _ = self._recirc_run("parallel_loop", exact=False)
+        assert system.tm_exact_switching is False
+
+    @pytest.mark.parametrize("schematic", ["parallel_loop", "swing_tank"])
+    def test_exact_switching_matches_per_step_energy(self, schematic):
+        _, per_step = self._recirc_run(schematic, exact=False)
+        _, exact    = self._recirc_run(schematic, exact=True)
+        assert sum(exact.tm_heater_output_kbtuh) == pytest.approx(sum(per_step.tm_heater_output_kbtuh), rel=0.01)
+        if schematic == "parallel_loop":
+            assert 125.0 <= min(exact.tm_tank_temp_f) and max(exact.tm_tank_temp_f) <= 135.0
+
 
 # ===========================================================================
 # _get_peak_indices
 # ===========================================================================
 
+class TestEventEngine:
+
+    @staticmethod
+    def _ls_system(building):
+        return DHWSystem.from_size(
+            building=building,
+            supply_temp_f=SUPPLY_T,
+            storage_temp_f=STORAGE_T,
+            control_schedule=make_ls_schedule([16, 17, 18, 19, 20], 3),
+            control_map=make_ls_control_map(0.5, 0.2, 0.8),
+        )
+
+    @staticmethod
+    def _assert_same_records(system, building, duration):
+        stepped = simulate(copy.deepcopy(system), building, duration)
+        jumped  = simulate(copy.deepcopy(system), building, duration, engine="event")
+
+        assert jumped.outage_minutes == stepped.outage_minutes
+        for name in (
+            "heater_mode", "heater_power_in_kw", "dhw_demand_supplyT_gal",
+            "usable_volume_supplyT_gal", "heater_output_kbtuh",
+        ):
+            assert list(getattr(jumped, name)) == list(getattr(stepped, name)), name
+        assert [list(node) for node in jumped.tank_temps_f] == [list(node) for node in stepped.tank_temps_f]
+
+    @pytest.mark.parametrize("load_shift", [False, True], ids=["normal", "load_shift"])
+    def test_matches_stepped_run(self, sized_system_with_controls, building_with_zone, load_shift):
+        system = self._ls_system(building_with_zone) if load_shift else sized_system_with_controls
+        self._assert_same_records(system, building_with_zone, "3day")
+
+    def test_matches_stepped_run_annual(self):
+        engine = EcosizerEngine(
+            building_type="multi_family", magnitude=100, supply_temp_f=120.0, storage_temp_f=150.0,
+            gpdpp=25.0, schematic="primary_no_recirc", zip_code_or_climate_zone=5,
+            hpwh_model="MODELS_ColmacCxA_15_C_SP", num_heaters=2,
+        )
+        self._assert_same_records(engine._dhw_system, engine._building, "annual")
+
+    def test_jumps_between_events(self, sized_system_with_controls, building_with_zone):
+        system = sized_system_with_controls
+        system.storage_tank.initialize(STORAGE_T, INLET_T, 0.8)
+        span = system.simulate_until_event(building_with_zone, 0, 4320, 1)
+        assert 1 <= span["num_steps"] <= 60
+        assert len(span["usable_volume_supplyT_gal"]) == span["num_steps"]
+        assert [len(node) for node in span["tank_temps_f"]] == [span["num_steps"]] * 6
+
+    def test_other_tanks_are_stepped(self, sized_system_with_controls, building_with_zone):
+        system = sized_system_with_controls
+        system.storage_tank = MixedStorageTank(total_volume_gal=100.0)
+        system.storage_tank.initialize(STORAGE_T, INLET_T, 1.0)
+        assert system.simulate_until_event(building_with_zone, 0, 4320, 1) is None
+
+    def test_unknown_engine_raises(self, sized_system, building_with_zone):
+        with pytest.raises(ValueError):
+            simulate(sized_system, building_with_zone, "3day", engine="adaptive")
+
+
+class TestEnsembleSimulation:
+
+    RECORDS = (
+        "dhw_demand_supplyT_gal", "usable_volume_supplyT_gal", "heater_output_kbtuh",
+        "heater_power_in_kw", "oat_f", "inlet_water_temp_f", "heater_mode", "tank_temps_f",
+        "outage_minutes", "stopped_early",
+    )
+
+    @staticmethod
+    def _variants(system, building):
+        sprtp = SinglePassRTPSystem.from_size(
+            building, SUPPLY_T, STORAGE_T, return_temp_f=110.0, return_flow_gpm=3.0,
+            control_schedule=["normal"] * 24, control_map=make_control_map((0.6, 0.2)),
+        )
+        variants = [sprtp]
+        for volume_scale, on_fract in [(1.0, 0.8), (0.5, 0.8), (1.5, 0.6), (0.15, 0.8)]:
+            variant = copy.deepcopy(system)
+            variant.storage_tank.total_volume_gal *= volume_scale
+            variant.water_heaters[0].control_map = make_control_map((on_fract, 0.0))
+            variants.append(variant)
+        # Undersized: recirc losses drain the tank below supply temperature
+        # and the outlet-deficit check halts this one early
+        undersized = copy.deepcopy(sprtp)
+        undersized.water_heaters = [WaterHeater.from_nominal_capacity(5.0, ["normal"] * 24, make_control_map((0.6, 0.2)))]
+        return variants + [undersized]
+
+    def test_matches_individual_runs(self, sized_system_with_controls, building_with_zone):
+        variants = self._variants(sized_system_with_controls, building_with_zone)
+        expected = [copy.deepcopy(v) for v in variants]
+        stepped  = [simulate(v, building_with_zone, "3day", outlet_deficit_threshold_f=0.0) for v in expected]
+        runs     = simulate_ensemble(variants, building_with_zone, "3day", outlet_deficit_threshold_f=0.0)
+
+        assert any(run.stopped_early for run in stepped)
+        for run, reference in zip(runs, stepped):
+            for name in self.RECORDS:
+                assert getattr(run, name) == getattr(reference, name)
+        for variant, reference in zip(variants, expected):
+            assert variant.storage_tank.snapshot() == reference.storage_tank.snapshot()
+            assert variant.water_heaters[0].is_active() == reference.water_heaters[0].is_active()
+
+    def test_load_shifting_and_multiple_heaters(self, building_with_zone):
+        system = TestEventEngine._ls_system(building_with_zone)
+        system.water_heaters.append(copy.deepcopy(system.water_heaters[0]))
+        system.water_heaters[1].control_map = make_ls_control_map(0.6, 0.3, 0.9)
+        reference = simulate(copy.deepcopy(system), building_with_zone, "3day")
+        run, = simulate_ensemble([system], building_with_zone, "3day")
+        assert run.heater_output_kbtuh == reference.heater_output_kbtuh
+        assert run.tank_temps_f == reference.tank_temps_f
+
+    def test_unsupported_system_raises(self, sized_system_with_controls, building_with_zone):
+        system = sized_system_with_controls
+        system.storage_tank = MixedStorageTank(total_volume_gal=100.0)
+        with pytest.raises(ValueError):
+            simulate_ensemble([system], building_with_zone, "3day")
+
+    def test_empty_ensemble(self, building_with_zone):
+        assert simulate_ensemble([], building_with_zone, "annual") == []
+
+
+class TestSimulationRunRecorder:
+
+    @staticmethod
+    def _record(run, step, power_kw=None, mode="normal", **tm):
+        run.record_timestep(
+            float(step), 50.0 - step, 10.0, power_kw, 60.0, 50.0,
+            [120.0 + node + step for node in range(6)], mode, **tm,
+        )
+
+    def test_buffers_are_preallocated(self):
+        run = SimulationRun(60, 1)
+        assert run.get_array("oat_f").shape == (0,)
+        assert run._step_values.shape == (60, 6)
+        assert run._tank_temps.shape == (60, 6)
+        assert run._mode_codes.dtype == np.uint8
+
+    def test_list_accessors_round_trip(self):
+        run = SimulationRun(3, 1)
+        self._record(run, 0, power_kw=None)
+        self._record(run, 1, power_kw=2.5, mode="shed")
+        assert run.dhw_demand_supplyT_gal == [0.0, 1.0]
+        assert run.heater_power_in_kw == [None, 2.5]
+        assert run.heater_mode == ["normal", "shed"]
+        assert run.tank_temps_f[5] == [125.0, 126.0]
+        assert run.get_array("tank_temps_f").shape == (2, 6)
+        assert run.tm_tank_temp_f == []
+
+    def test_channel_lists_are_read_only(self):
+        run = SimulationRun(3, 1)
+        self._record(run, 0)
+        self._record(run, 1)
+        with pytest.raises(TypeError, match="read-only"):
+            run.dhw_demand_supplyT_gal.append(2.0)
+        with pytest.raises(TypeError, match="read-only"):
+            run.heater_mode[0] = "shed"
+        with pytest.raises(TypeError, match="read-only"):
+            run.tank_temps_f[0][0] = 0.0
+        assert run.dhw_demand_supplyT_gal == [0.0, 1.0]
+        run.dhw_demand_supplyT_gal += [2.0]
+        assert run.dhw_demand_supplyT_gal == [0.0, 1.0, 2.0]
+        assert pickle.loads(pickle.dumps(run.dhw_demand_supplyT_gal)) == [0.0, 1.0, 2.0]
+        assert json.loads(json.dumps(run.tank_temps_f))[5] == [125.0, 126.0]
+
+    def test_record_timesteps_matches_single_steps(self):
+        single, batched = SimulationRun(4, 1), SimulationRun(4, 1)
+        for step in range(4):
+            self._record(single, step, power_kw=None if step % 2 else 1.0, mode="normal" if step < 2 else "loadUp")
+        batched.record_timesteps(
+            4, np.arange(4.0), [50.0, 49.0, 48.0, 47.0], 10.0, np.array([1.0, np.nan, 1.0, np.nan]), 60.0, 50.0,
+            [[120.0 + node + step for step in range(4)] for node in range(6)], ["normal", "normal", "loadUp", "loadUp"],
+        )
+        for name in TestEnsembleSimulation.RECORDS:
+            assert getattr(batched, name) == getattr(single, name)
+
+    def test_new_modes_and_growth(self):
+        run = SimulationRun(1, 1)
+        for step in range(3):
+            self._record(run, step, mode="critical", tm_tank_temp_f=130.0)
+        assert run.heater_mode == ["critical"] * 3
+        assert run.get_array("heater_mode").tolist() == [3] * 3
+        assert run.tm_tank_temp_f == [130.0] * 3
+        assert run.get_summary()["num_steps_recorded"] == 3
+
+    def test_float32_channels(self):
+        run = SimulationRun(2, 1, dtype="float32")
+        self._record(run, 0, power_kw=0.1)
+        assert run.get_array("heater_power_in_kw").dtype == np.float32
+        assert run.heater_power_in_kw[0] == pytest.approx(0.1)
+
+    def test_unsupported_dtype_raises(self):
+        with pytest.raises(ValueError):
+            SimulationRun(2, 1, dtype="int32")
+
+    def test_arrays_are_read_only(self):
+        run = SimulationRun(2, 1)
+        self._record(run, 0)
+        with pytest.raises(ValueError):
+            run.get_array("oat_f")[0] = 0.0
+
+    def test_energy_and_peak_skip_missing_power(self):
+        run = SimulationRun(180, 60)
+        for step, kw in enumerate([None, 2.0, 4.0]):
+            self._record(run, step, power_kw=kw, tm_heater_input_kw=1.0)
+        assert run.get_total_energy_kwh() == pytest.approx(9.0)
+        assert run.get_peak_demand_kw() == 4.0
+
+    def test_repeat_records(self):
+        run = SimulationRun(2, 1)
+        for step in range(3):
+            self._record(run, step, mode="shed" if step == 2 else "normal", tm_tank_temp_f=130.0 + step)
+        run.repeat_records(2, 5)
+        assert run.dhw_demand_supplyT_gal == [0.0, 1.0, 2.0, 1.0, 2.0, 1.0, 2.0, 1.0]
+        assert run.heater_mode == ["normal", "normal", "shed"] + ["normal", "shed"] * 2 + ["normal"]
+        assert run.tank_temps_f[0][3:] == [121.0, 122.0, 121.0, 122.0, 121.0]
+        assert run.tm_tank_temp_f[3:] == [131.0, 132.0, 131.0, 132.0, 131.0]
+        with pytest.raises(ValueError):
+            run.repeat_records(9, 1)
+
+    def test_repeat_records_requires_aligned_tm_channels(self):
+        run = SimulationRun(2, 1)
+        self._record(run, 0, tm_tank_temp_f=130.0)
+        self._record(run, 1)
+        with pytest.raises(ValueError):
+            run.repeat_records(1, 1)
+
+
+class _CustomModeSystem(DHWSystem):
+    """Subclass that still customizes the dict-returning simulate_step."""
+
+    def simulate_step(self, building, timestep_interval, interval_min=1, mode="normal"):
+        step = super().simulate_step(building, timestep_interval, interval_min, mode)
+        step["mode"] = "custom"
+        return step
+
+
+class TestStepProtocol:
+
+    def test_simulate_step_matches_step_into(self, sized_system_with_controls, building_with_zone):
+        stepped = copy.deepcopy(sized_system_with_controls)
+        out     = StepResult()
+        for system in (sized_system_with_controls, stepped):
+            system.storage_tank.initialize(STORAGE_T, INLET_T, 0.6)
+        for i in range(0, 600, 7):
+            step = sized_system_with_controls.simulate_step(building_with_zone, i, 1)
+            assert stepped.simulate_step_into(building_with_zone, i, 1, out) is out
+            assert out.to_dict() == step
+        assert set(step) == {
+            "demand_supplyT_gal", "usable_volume_supplyT_gal", "heater_output_kbtuh", "heater_power_in_kw",
+            "oat_f", "inlet_water_temp_f", "tank_temps_f", "mode",
+        }
+
+    def test_update_round_trip(self):
+        step = StepResult().update({
+            "demand_supplyT_gal": 1.0, "usable_volume_supplyT_gal": 2.0, "heater_output_kbtuh": 3.0,
+            "heater_power_in_kw": None, "oat_f": 4.0, "inlet_water_temp_f": 5.0,
+            "tank_temps_f": [6.0] * 6, "tm_tank_temp_f": 7.0,
+        })
+        assert step.mode == "normal"
+        assert step.get_delivery_temp_f() == 6.0
+        assert step.to_dict()["tm_tank_temp_f"] == 7.0
+        assert "delivery_temp_f" not in step.to_dict()
+
+    def test_dict_override_is_still_simulated(self, building_with_zone, basic_schedule, basic_control_map):
+        system = _CustomModeSystem.from_size(
+            building=building_with_zone, supply_temp_f=SUPPLY_T, storage_temp_f=STORAGE_T,
+            control_schedule=basic_schedule, control_map=basic_control_map,
+        )
+        assert system.simulate_until_event(building_with_zone, 0, 10, 1) is None
+        run = simulate(system, building_with_zone, "3day", engine="event")
+        assert set(run.heater_mode) == {"custom"}
+        with pytest.raises(ValueError):
+            simulate_ensemble([system], building_with_zone, "3day")
+
+
+class TestChannelSelection:
+
+    @pytest.mark.parametrize("engine", ["step", "event"])
+    def test_cost_preset_matches_full_run(self, sized_system_with_controls, building_with_zone, engine):
+        full = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day", engine=engine)
+        cost = simulate(sized_system_with_controls, building_with_zone, "3day", engine=engine, channels="cost")
+        assert cost.channels == ("heater_power_in_kw", "tm_heater_input_kw")
+        assert cost.heater_power_in_kw == full.heater_power_in_kw
+        assert cost.get_summary() == full.get_summary()
+        assert cost.oat_f == [] and cost.heater_mode == []
+        assert cost.get_array("tank_temps_f").shape == (0, 6)
+
+    def test_top_node_only_without_tank_temps(self, sized_system_with_controls, building_with_zone):
+        top_only = copy.deepcopy(sized_system_with_controls)
+        full, top = StepResult(), StepResult()
+        top.tank_fracts = SimulationRun(1, 1, channels="cost").tank_fracts
+        for system in (sized_system_with_controls, top_only):
+            system.storage_tank.initialize(STORAGE_T, INLET_T, 0.6)
+        for i in range(0, 300, 7):
+            sized_system_with_controls.simulate_step_into(building_with_zone, i, 1, full)
+            top_only.simulate_step_into(building_with_zone, i, 1, top)
+            assert list(top.tank_temps_f) == [full.tank_temps_f[-1]]
+            assert top.get_delivery_temp_f() == full.get_delivery_temp_f()
+
+    def test_channel_names(self, tmp_path):
+        run = SimulationRun(2, 1, channels=["tank_temps_f", "oat_f"])
+        assert run.channels == ("oat_f", "tank_temps_f")
+        TestSimulationRunRecorder._record(run, 0)
+        assert run.oat_f == [60.0]
+        assert run.tank_temps_f[0] == [120.0]
+        run.to_csv(tmp_path / "run.csv")
+        header = (tmp_path / "run.csv").read_text().splitlines()[0].split(",")
+        assert header[:3] == ["timestep", "time_min", "oat_f"]
+        assert len(header) == 9
+        with pytest.raises(ValueError):
+            run.heater_power_in_kw = [1.0]
+
+    @pytest.mark.parametrize("channels", ["minimal", ["oat_f", "tank_temp"]])
+    def test_unknown_channels_raise(self, channels):
+        with pytest.raises(ValueError):
+            SimulationRun(2, 1, channels=channels)
+
+
+class TestSimulationStreaming:
+
+    @pytest.mark.parametrize("engine", ["step", "event"])
+    def test_chunks_match_simulate(self, sized_system_with_controls, building_with_zone, engine):
+        run    = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day", engine=engine)
+        chunks = simulate_iter(sized_system_with_controls, building_with_zone, "3day", engine=engine, chunk_steps=1000)
+        records = list(chunks)
+        assert [len(r) for r in records] == [1000, 1000, 1000, 1000, 320]
+        records = np.concatenate(records)
+        assert records["timestep"].tolist() == list(range(4320))
+        assert records["heater_mode"].tolist() == run.heater_mode
+        assert records["tank_temp_100pct"].tolist() == pytest.approx(run.tank_temps_f[5], abs=1e-9)
+        for name in ("usable_volume_supplyT_gal", "heater_output_kbtuh", "oat_f"):
+            assert records[name].tolist() == pytest.approx(getattr(run, name), abs=1e-9)
+
+    def test_stops_early_with_summary(self, sized_system_with_controls, building_with_zone):
+        system = TestEnsembleSimulation._variants(sized_system_with_controls, building_with_zone)[-1]
+        run    = simulate(copy.deepcopy(system), building_with_zone, "3day", outlet_deficit_threshold_f=0.0)
+        chunks = simulate_iter(system, building_with_zone, "3day", chunk_steps=500, outlet_deficit_threshold_f=0.0)
+        num_records = 0
+        while True:
+            try:
+                num_records += len(next(chunks))
+            except StopIteration as stop:
+                summary = stop.value
+                break
+        assert run.stopped_early and summary["stopped_early"]
+        assert num_records == summary["num_steps_recorded"] == run.get_summary()["num_steps_recorded"]
+        assert summary["total_outage_min"] == run.outage_minutes
+
+    def test_sinks_match_simulation_run(self, sized_system_with_controls, building_with_zone, tmp_path):
+        run      = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        totals   = RunningTotalsSink()
+        hourly   = DownsampleSink("hourly")
+        daily    = DownsampleSink("daily", sink=CSVSink(tmp_path / "daily.csv"))
+        summary  = simulate_to_sinks(
+            sized_system_with_controls, building_with_zone,
+            [totals, hourly, daily, NpySink(tmp_path / "run.npy"), CSVSink(tmp_path / "run.csv")],
+            "3day", chunk_steps=97,
+        )
+        assert summary["num_steps_recorded"] == totals.num_steps == 4320
+        assert totals.total_energy_kwh == pytest.approx(run.get_total_energy_kwh())
+        assert totals.peak_demand_kw == run.get_peak_demand_kw()
+        assert totals.outage_minutes == run.outage_minutes
+
+        records = np.load(tmp_path / "run.npy")
+        assert records["dhw_demand_supplyT_gal"].tolist() == run.dhw_demand_supplyT_gal
+        assert len((tmp_path / "run.csv").read_text().splitlines()) == 4321
+        assert len((tmp_path / "daily.csv").read_text().splitlines()) == 4
+
+        hours = hourly.to_records()
+        assert hours["period"].tolist() == list(range(72))
+        assert hours["oat_f"].tolist() == pytest.approx(np.reshape(run.oat_f, (72, 60)).mean(axis=1).tolist())
+
+    def test_invalid_chunk_steps_raises(self, sized_system, building_with_zone):
+        with pytest.raises(ValueError):
+            simulate_iter(sized_system, building_with_zone, "3day", chunk_steps=0)
+
+
+class TestSimulationDurations:
+
+    def test_int_duration_matches_named_duration(self, sized_system_with_controls, building_with_zone):
+        named  = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        custom = simulate(sized_system_with_controls, building_with_zone, 4320, timestep_min=1)
+        assert custom.timestep_min == 1 and len(custom.heater_mode) == 4320
+        assert custom.usable_volume_supplyT_gal == named.usable_volume_supplyT_gal
+        assert custom.heater_mode == named.heater_mode
+
+    def test_hourly_multi_year_run(self, sized_system_with_controls, building_with_zone):
+        run = simulate(sized_system_with_controls, building_with_zone, 2 * 525600, timestep_min=60)
+        assert run.timestep_min == 60 and len(run.oat_f) == 2 * 8760
+        assert run.oat_f[8760:] == run.oat_f[:8760]
+        assert run.dhw_demand_supplyT_gal[8760:] == run.dhw_demand_supplyT_gal[:8760]
+
+    @pytest.mark.parametrize("duration, timestep_min", [("3day", 7), ("annual", 0), (100, 30), (0, 1), ("week", 1)])
+    def test_invalid_duration_or_timestep_raises(self, sized_system, building_with_zone, duration, timestep_min):
+        with pytest.raises(ValueError):
+            simulate(sized_system, building_with_zone, duration, timestep_min=timestep_min)
+
+    def test_downsample_stats(self, sized_system_with_controls, building_with_zone):
+        run    = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        hourly = DownsampleSink("hourly", stats=("min", "mean", "max"))
+        simulate_to_sinks(sized_system_with_controls, building_with_zone, [hourly], "3day", chunk_steps=250)
+        hours = hourly.to_records()
+        oat   = np.reshape(run.oat_f, (72, 60))
+        assert hours["oat_f_min"].tolist() == oat.min(axis=1).tolist()
+        assert hours["oat_f_max"].tolist() == oat.max(axis=1).tolist()
+        assert hours["oat_f_mean"].tolist() == pytest.approx(oat.mean(axis=1).tolist())
+
+    def test_invalid_downsample_stat_raises(self):
+        with pytest.raises(ValueError):
+            DownsampleSink("hourly", stats=("median",))
+
+
+class TestAggregationPolicy:
+
+    def test_summary_windows_and_worst_window(self, sized_system_with_controls, building_with_zone):
+        run    = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        policy = AggregationPolicy(
+            windows=[(60, 180)], worst_window_by="heater_output_kbtuh", worst_window_days=1,
+        )
+        simulate_to_sinks(sized_system_with_controls, building_with_zone, [policy], "3day", chunk_steps=700)
+
+        volume = np.reshape(run.usable_volume_supplyT_gal, (72, 60))
+        assert len(policy.summary) == 72
+        assert policy.summary["usable_volume_supplyT_gal_min"].tolist() == volume.min(axis=1).tolist()
+        assert policy.summary["usable_volume_supplyT_gal_max"].tolist() == volume.max(axis=1).tolist()
+
+        window, = policy.windows
+        assert window["timestep"].tolist() == list(range(60, 180))
+        assert window["oat_f"].tolist() == run.oat_f[60:180]
+
+        output = np.reshape(run.heater_output_kbtuh, (3, 1440))
+        worst  = int(np.argmax(output.max(axis=1)))
+        assert policy.worst_window_score == output.max()
+        assert policy.worst_window["timestep"].tolist() == list(range(worst * 1440, (worst + 1) * 1440))
+
+    def test_min_worst_window_and_reuse(self, sized_system_with_controls, building_with_zone):
+        run    = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        policy = AggregationPolicy(worst_window_by="usable_volume_supplyT_gal", worst_window_stat="min")
+        for _ in range(2):
+            simulate_to_sinks(copy.deepcopy(sized_system_with_controls), building_with_zone, [policy], "3day")
+            assert policy.windows == []
+            assert policy.worst_window_score == min(run.usable_volume_supplyT_gal)
+            assert len(policy.worst_window) == 4320
+
+    @pytest.mark.parametrize("kwargs", [
+        {"worst_window_stat": "mean"}, {"worst_window_days": 0}, {"windows": [(100, 50)]},
+    ])
+    def test_invalid_arguments_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            AggregationPolicy(**kwargs)
+
+
+class TestSimulationFeasibility:
+
+    @pytest.mark.parametrize("engine", ["step", "event"])
+    def test_matches_simulate(self, sized_system_with_controls, building_with_zone, engine):
+        variants = TestEnsembleSimulation._variants(sized_system_with_controls, building_with_zone)
+        for variant in variants:
+            run    = simulate(copy.deepcopy(variant), building_with_zone, "3day", outlet_deficit_threshold_f=0.0)
+            result = simulate_feasibility(
+                variant, building_with_zone, "3day", engine=engine,
+                max_outage_min=10**6, outlet_deficit_threshold_f=0.0,
+            )
+            assert result["feasible"] == (not run.stopped_early)
+            assert result["num_steps_simulated"] == run.get_summary()["num_steps_recorded"]
+            assert result["outage_min"] == run.outage_minutes
+            assert result["min_usable_volume_supplyT_gal"] == pytest.approx(min(run.usable_volume_supplyT_gal))
+            if run.stopped_early:
+                assert result["first_failure_min"] == (result["num_steps_simulated"] - 1) * run.timestep_min
+                assert result["deficit_min"] > run.outlet_deficit_max_min
+            else:
+                assert result["first_failure_min"] is None
+
+    def test_returns_at_first_outage(self, sized_system_with_controls, building_with_zone):
+        system = copy.deepcopy(sized_system_with_controls)
+        system.storage_tank.total_volume_gal *= 0.15
+        run    = simulate(copy.deepcopy(system), building_with_zone, "3day", outlet_deficit_max_min=10**6)
+        first  = next(i for i, vol in enumerate(run.usable_volume_supplyT_gal) if vol <= 0.0)
+        result = simulate_feasibility(system, building_with_zone, "3day", outlet_deficit_max_min=10**6)
+        assert not result["feasible"]
+        assert result["first_failure_min"] == first
+        assert result["num_steps_simulated"] == first + 1
+        assert result["outage_min"] == 1
+        # Allowing the run's whole outage makes it feasible
+        result = simulate_feasibility(
+            system, building_with_zone, "3day", max_outage_min=run.outage_minutes, outlet_deficit_max_min=10**6,
+        )
+        assert result["feasible"] and result["outage_min"] == run.outage_minutes
+
+    def test_invalid_engine_raises(self, sized_system, building_with_zone):
+        with pytest.raises(ValueError):
+            simulate_feasibility(sized_system, building_with_zone, "3day", engine="fast")
+
+
+class TestDesignDaySteadyState:
+
+    @pytest.mark.parametrize("engine", ["step", "event"])
+    def test_tiled_run_matches_full_run(self, sized_system_with_controls, building_with_zone, engine):
+        variants  = TestEnsembleSimulation._variants(sized_system_with_controls, building_with_zone)
+        converged = 0
+        for variant in variants:
+            full = simulate_3day(copy.deepcopy(variant), building_with_zone, num_days=4, engine=engine)
+            run  = simulate_3day(variant, building_with_zone, num_days=4, steady_state=True,
+                                 steady_state_tol=1e-6, engine=engine)
+            converged += run.steady_state_day is not None
+            assert run.outage_minutes == full.outage_minutes
+            assert run.heater_mode == full.heater_mode
+            for name in ("usable_volume_supplyT_gal", "heater_power_in_kw", "tank_temps_f", "tm_tank_temp_f"):
+                np.testing.assert_allclose(run.get_array(name), full.get_array(name), atol=1e-6)
+        assert converged
+
+    def test_deficit_band_load_shift_converges(self):
+        # Trigger overshoot differs from day to day, so the midnight state
+        # never repeats exactly; the default tolerance (one timestep of
+        # heating) still finds the limit cycle.
+        engine = EcosizerEngine(
+            building_type="multi_family", magnitude=100, supply_temp_f=125.0, storage_temp_f=150.0,
+            gpdpp=25.0, schematic="primary_no_recirc",
+            zip_code_or_climate_zone={"design_oat_f": 35, "design_inlet_water_temp_f": 50},
+            hpwh_model="MODELS_ColmacCxV_5_C_SP", num_heaters=2, storage_volume_storageT_gal=600,
+            aquastat_fract=0.5, off_sensor_fract=0.2,
+            load_shift_schedule=[1] * 16 + [0] * 5 + [1] * 3, load_up_hours=3,
+            shed_aquastat_fract=0.8, shed_off_sensor_fract=0.4,
+            load_up_aquastat_fract=0.3, load_up_off_sensor_fract=0.15,
+        )
+        system, building = engine._dhw_system, engine._building
+        full  = simulate_3day(copy.deepcopy(system), building, num_days=6)
+        exact = simulate_3day(copy.deepcopy(system), building, num_days=6, steady_state=True, steady_state_tol=1e-6)
+        run   = simulate_3day(system, building, num_days=6, steady_state=True)
+        assert exact.steady_state_day is None
+        assert run.steady_state_day is not None
+        assert run.outage_minutes == full.outage_minutes
+        assert np.nansum(run.get_array("heater_output_kbtuh")) == pytest.approx(
+            np.nansum(full.get_array("heater_output_kbtuh")), rel=1e-3
+        )
+
+    def test_weather_data_is_simulated_in_full(self, sized_system_with_controls):
+        building = Building.from_building_type('multi_family', 100, ClimateZone.from_zone_id(1), gpdpp=25)
+        full = simulate_3day(copy.deepcopy(sized_system_with_controls), building)
+        run  = simulate_3day(sized_system_with_controls, building, steady_state=True)
+        assert run.steady_state_day is None
+        assert run.usable_volume_supplyT_gal == full.usable_volume_supplyT_gal
+
+    def test_default_matches_3day_duration(self, sized_system_with_controls, building_with_zone):
+        named = simulate(copy.deepcopy(sized_system_with_controls), building_with_zone, "3day")
+        run   = simulate_3day(sized_system_with_controls, building_with_zone)
+        assert run.steady_state_day is None
+        assert run.usable_volume_supplyT_gal == named.usable_volume_supplyT_gal
+
+    @pytest.mark.parametrize("num_days", [0, 1.5])
+    def test_invalid_num_days_raises(self, sized_system, building_with_zone, num_days):
+        with pytest.raises(ValueError):
+            simulate_3day(sized_system, building_with_zone, num_days=num_days, steady_state=True)
+
+    def test_system_snapshot_round_trip(self, sized_system_with_controls, building_with_zone):
+        system = sized_system_with_controls
+        simulate_3day(system, building_with_zone)
+        state  = system.snapshot()
+        for i in range(30):
+            system.simulate_step(building_with_zone, 600 + i)
+        assert system.snapshot() != state
+        system.restore(state)
+        assert system.snapshot() == state
+
+
 class TestGetPeakIndices:
     def test_single_transition(self):
         assert _get_peak_indices(np.array([1.0, 1.0, 1.0, -1.0, -1.0])) == [3]
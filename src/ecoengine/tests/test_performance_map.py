@@ -9,14 +9,40 @@ Models used:
   PklPerformanceMap (2-input MP) : MODELS_ColmacCxV_5_C_MP
   HPWHsimPerformanceMap (multi-entry SP): MODELS_SANCO2_43_R_SP
   HPWHsimPerformanceMap (multi-entry MP): MODELS_AOSmithHPTS50_R_MP
+
+Batch (array) queries are checked point-by-point against the scalar API, and
+the compiled map store is checked against the original pkl interpolators.
+The catalog-wide capacity table is checked against per-model scalar queries.
 """
+import os
+import pickle
+import shutil
+import threading
+import time
+
+import numpy as np
 import pytest
 from ecoengine.objects.components.heating.PerformanceMap import (
     HPWHsimPerformanceMap,
     NominalPerformanceMap,
     PerformanceMap,
     PklPerformanceMap,
+    _PKLS_DIR,
+    _load_compiled_map,
+    _load_maps_json,
+    _interpolator_nbytes,
+    _load_compiled_store,
+    _load_pkl_interpolator,
+    compile_performance_maps,
+    convert_pkl_interpolators,
+    grid_error_report,
 )
+from ecoengine.interfaces.EcosizerEngine import get_hpwh_capacity_table, get_hpwh_output_capacity, get_list_of_models
+from ecoengine.objects.components.heating.CapacityTable import CapacityTable
+from ecoengine.objects.components.heating.GridLookupTable import GridLookupTable
+from ecoengine.objects.components.heating.PerformanceMapCache import PerformanceMapCache
+from ecoengine.objects.components.heating.TriangulationInterpolator import TriangulationInterpolator
+from ecoengine.objects.components.heating import PerformanceMap as PM
 
 
 # ---------------------------------------------------------------------------
@@ -283,3 +309,703 @@ class TestHPWHsimMultiEntrySP:
         pwr = sp.get_power_in_kw(47.0, 140.0, inlet_temp_f=50.0)
         cop = (cap / 3.412142) / pwr
         assert cop > 1.0
+
+
+# ---------------------------------------------------------------------------
+# Shared-triangulation interpolator (capacity + power in one)
+# ---------------------------------------------------------------------------
+
+class TestMergedInterpolator:
+    PREFIX = "Colmac_CxA10_Multi_Pass"
+
+    def _originals(self, pkls_dir=_PKLS_DIR):
+        with open(os.path.join(pkls_dir, f"{self.PREFIX}_capacity_interpolator.pkl"), "rb") as f:
+            cap = pickle.load(f)
+        with open(os.path.join(pkls_dir, f"{self.PREFIX}_power_in_interpolator.pkl"), "rb") as f:
+            pwr = pickle.load(f)
+        return cap, pwr
+
+    def test_merged_matches_separate_interpolators(self):
+        cap, pwr = self._originals()
+        merged   = _load_pkl_interpolator(self.PREFIX)
+        pts      = np.column_stack((np.linspace(45.0, 90.0, 25), np.linspace(-5.0, 95.0, 25)))
+        values   = merged(pts)
+        assert values.shape == (25, 2)
+        np.testing.assert_array_equal(values[:, 0], cap(pts)[:, 0])
+        np.testing.assert_array_equal(values[:, 1], pwr(pts)[:, 0])
+
+    def test_converter_writes_merged_file(self, tmp_path):
+        for kind in ("capacity", "power_in"):
+            name = f"{self.PREFIX}_{kind}_interpolator.pkl"
+            shutil.copy(os.path.join(_PKLS_DIR, name), tmp_path / name)
+
+        converted = convert_pkl_interpolators(str(tmp_path), remove_originals=True)
+
+        assert converted == [self.PREFIX]
+        assert sorted(os.listdir(tmp_path)) == [f"{self.PREFIX}_interpolator.pkl"]
+        merged = _load_pkl_interpolator(self.PREFIX, str(tmp_path))
+        cap, _ = self._originals()
+        np.testing.assert_array_equal(merged.values[:, 0], cap.values[:, 0])
+
+
+# ---------------------------------------------------------------------------
+# Compiled (memory-mapped) map store
+# ---------------------------------------------------------------------------
+
+class TestCompiledMaps:
+    @staticmethod
+    def _grid(interp):
+        lo, hi = interp.points.min(axis=0), interp.points.max(axis=0)
+        axes   = [np.linspace(a - 5.0, b + 5.0, 9) for a, b in zip(lo, hi)]
+        grid   = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(lo))
+        return np.vstack((grid, interp.points))
+
+    @staticmethod
+    def _bounds(prefix, pkls_dir=_PKLS_DIR):
+        with open(os.path.join(pkls_dir, f"{prefix}_bounds.pkl"), "rb") as f:
+            return pickle.load(f)
+
+    @pytest.mark.parametrize("prefix", ["Colmac_CxV5_Single_Pass", "Colmac_CxA10_Multi_Pass"])
+    def test_compiled_matches_pkl(self, prefix):
+        interp, bounds = _load_compiled_map(prefix)
+        original       = _load_pkl_interpolator(prefix)
+        pts            = self._grid(original)
+        np.testing.assert_array_equal(interp(pts), original(pts))
+        assert bounds == self._bounds(prefix)
+
+    def test_arrays_are_read_only_memory_maps(self):
+        _, arrays = _load_compiled_store()
+        assert all(isinstance(a, np.memmap) for a in arrays.values())
+        interp, _ = _load_compiled_map("Colmac_CxV5_Single_Pass")
+        assert not interp.values.flags.writeable
+        assert not interp.simplices.flags.writeable
+
+    def test_factory_uses_compiled_store(self):
+        pm = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP")
+        assert not pm._interp.values.flags.writeable
+
+    def test_missing_model_or_store_returns_none(self, tmp_path):
+        assert _load_compiled_map("not_a_prefix") is None
+        assert _load_compiled_map("Colmac_CxV5_Single_Pass", str(tmp_path)) is None
+
+    def test_default_store_compiled_on_first_use(self, tmp_path, monkeypatch):
+        out_dir = str(tmp_path / "compiled")
+        monkeypatch.setattr(PM, "_COMPILED_DIR", out_dir)
+        monkeypatch.setattr(_load_compiled_store, "_cache", {})
+        interp, _ = _load_compiled_map("Colmac_CxV5_Single_Pass", out_dir)
+        assert sorted(os.listdir(out_dir)) == ["index.json", "maps_float64.npy", "maps_int32.npy"]
+        original = _load_pkl_interpolator("Colmac_CxV5_Single_Pass")
+        pts      = self._grid(original)
+        np.testing.assert_array_equal(interp(pts), original(pts))
+
+    def test_unwritable_default_store_compiles_once(self, tmp_path, monkeypatch):
+        calls = []
+        def fail(*args, **kwargs):
+            calls.append(kwargs)
+            raise PermissionError("read-only")
+        monkeypatch.setattr(PM, "_COMPILED_DIR", str(tmp_path))
+        monkeypatch.setattr(PM, "compile_performance_maps", fail)
+        monkeypatch.setattr(_load_compiled_store, "_cache", {})
+        assert _load_compiled_store(str(tmp_path)) is None
+        assert _load_compiled_map("Colmac_CxV5_Single_Pass", str(tmp_path)) is None
+        assert len(calls) == 1
+
+    def test_failed_compile_leaves_no_temp_files(self, tmp_path, monkeypatch):
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        pkls_dir = tmp_path / "pkls"
+        pkls_dir.mkdir()
+        out_dir  = tmp_path / "compiled"
+        monkeypatch.setattr(PM.json, "dump", fail)
+        with pytest.raises(OSError):
+            compile_performance_maps(str(pkls_dir), str(out_dir))
+        assert sorted(os.listdir(out_dir)) == ["maps_float64.npy", "maps_int32.npy"]
+
+    def test_default_store_is_per_user(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ECOENGINE_CACHE_DIR", str(tmp_path))
+        assert PM._default_compiled_dir().startswith(str(tmp_path))
+        monkeypatch.delenv("ECOENGINE_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert PM._default_compiled_dir().startswith(os.path.join(str(tmp_path), "ecoengine"))
+        assert not PM._COMPILED_DIR.startswith(PM._DATA_DIR)
+
+    def test_triangulation_matches_scipy_at_random_points(self):
+        original = _load_pkl_interpolator("Colmac_CxV5_Single_Pass")
+        interp   = TriangulationInterpolator.from_linear_nd(original)
+        lo, hi   = original.points.min(axis=0), original.points.max(axis=0)
+        rng      = np.random.default_rng(0)
+        pts      = np.vstack((rng.uniform(lo - 3.0, hi + 3.0, (300, len(lo))),
+                              np.round(rng.uniform(lo, hi, (200, len(lo))))))
+        np.testing.assert_array_equal(interp(pts), original(pts))
+
+    def test_triangulation_matches_scipy_on_shared_faces(self):
+        # Edge midpoints and data points lie in several simplices, where the
+        # answer depends on scipy's walk and so on the order of the queries
+        original = _load_pkl_interpolator("Colmac_CxA15_Single_Pass")
+        interp   = TriangulationInterpolator.from_linear_nd(original)
+        simplex  = original.tri.simplices
+        mids     = (original.points[simplex[:, 0]] + original.points[simplex[:, 1]]) / 2
+        pts      = np.vstack((mids, original.points))[np.random.default_rng(0).permutation(len(mids) + len(original.points))]
+        np.testing.assert_array_equal(interp(pts), original(pts))
+        for p in pts[:50]:
+            np.testing.assert_array_equal(interp(p[None]), original(p[None]))
+
+    def test_triangulation_not_slower_than_scipy(self):
+        original = _load_pkl_interpolator("Colmac_CxA15_Single_Pass")
+        interp   = TriangulationInterpolator.from_linear_nd(original)
+        lo, hi   = original.points.min(axis=0), original.points.max(axis=0)
+        pts      = np.random.default_rng(0).uniform(lo - 3.0, hi + 3.0, (20000, len(lo)))
+        interp(pts[:10])
+
+        def elapsed(f, batch):
+            start = time.perf_counter()
+            if batch:
+                f(pts)
+            else:
+                for p in pts[:2000]:
+                    f(p[None])
+            return time.perf_counter() - start
+
+        for batch in (True, False):
+            ours  = min(elapsed(interp, batch) for _ in range(3))
+            scipy = min(elapsed(original, batch) for _ in range(3))
+            assert ours < 1.5 * scipy, f"batch={batch}: {ours:.3f} s vs scipy {scipy:.3f} s"
+
+    def test_compile_to_directory(self, tmp_path):
+        prefix   = "Colmac_CxA10_Multi_Pass"
+        pkls_dir = tmp_path / "pkls"
+        pkls_dir.mkdir()
+        for kind in ("capacity_interpolator", "power_in_interpolator", "bounds"):
+            name = f"{prefix}_{kind}.pkl"
+            shutil.copy(os.path.join(_PKLS_DIR, name), pkls_dir / name)
+
+        out_dir  = str(tmp_path / "compiled")
+        compiled = compile_performance_maps(str(pkls_dir), out_dir)
+
+        assert compiled == [prefix]
+        assert sorted(os.listdir(out_dir)) == ["index.json", "maps_float64.npy", "maps_int32.npy"]
+        interp, bounds = _load_compiled_map(prefix, out_dir)
+        original       = _load_pkl_interpolator(prefix)
+        pts            = self._grid(original)
+        np.testing.assert_array_equal(interp(pts), original(pts))
+        assert bounds == self._bounds(prefix)
+
+
+# ---------------------------------------------------------------------------
+# Shared map-data cache
+# ---------------------------------------------------------------------------
+
+class TestPerformanceMapCache:
+    @staticmethod
+    def _loader(value, nbytes, calls=None):
+        def load():
+            if calls is not None:
+                calls.append(value)
+            return value, nbytes
+        return load
+
+    def test_hit_and_miss_counters(self):
+        cache = PerformanceMapCache(max_bytes=100)
+        calls = []
+        assert cache.get("a", self._loader("A", 10, calls)) == "A"
+        assert cache.get("a", self._loader("other", 10, calls)) == "A"
+        assert calls == ["A"]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"], stats["nbytes"]) == (1, 1, 1, 10)
+
+    def test_evicts_least_recently_used_over_byte_budget(self):
+        cache = PerformanceMapCache(max_bytes=25)
+        cache.get("a", self._loader("A", 10))
+        cache.get("b", self._loader("B", 10))
+        cache.get("a", self._loader("A", 10))     # refresh "a"
+        cache.get("c", self._loader("C", 10))     # evicts "b"
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.evictions == 1
+        assert cache.nbytes == 20
+
+    def test_evicts_over_entry_cap(self):
+        cache = PerformanceMapCache(max_bytes=1000, max_entries=2)
+        for key in "abc":
+            cache.get(key, self._loader(key, 1))
+        assert len(cache) == 2 and "a" not in cache
+        cache.max_entries = 1
+        assert len(cache) == 1 and "c" in cache
+        assert cache.evictions == 2
+
+    def test_oversized_entry_is_returned_but_not_stored(self):
+        cache = PerformanceMapCache(max_bytes=5)
+        assert cache.get("big", self._loader("BIG", 50)) == "BIG"
+        assert len(cache) == 0 and cache.evictions == 0
+
+    def test_loader_error_propagates_and_is_not_cached(self):
+        cache = PerformanceMapCache(max_bytes=100)
+
+        def fail():
+            raise ValueError("bad model")
+
+        with pytest.raises(ValueError):
+            cache.get("x", fail)
+        assert "x" not in cache and cache.misses == 1
+
+    def test_concurrent_misses_load_once(self):
+        cache = PerformanceMapCache(max_bytes=100)
+        calls = []
+
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.01)
+            return object(), 1
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("k", slow_load)))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert cache.hits == 7 and cache.misses == 1
+
+    def test_slow_load_does_not_block_other_keys(self):
+        cache   = PerformanceMapCache(max_bytes=100)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked_load():
+            started.set()
+            release.wait(5.0)
+            return "slow", 1
+
+        thread = threading.Thread(target=lambda: cache.get("slow", blocked_load))
+        thread.start()
+        started.wait(5.0)
+        try:
+            assert cache.get("fast", self._loader("fast", 1)) == "fast"
+            assert "slow" not in cache
+        finally:
+            release.set()
+            thread.join()
+        assert cache.get("slow", self._loader("other", 1)) == "slow"
+
+    def test_waiter_loads_after_failed_load(self):
+        cache   = PerformanceMapCache(max_bytes=100)
+        started = threading.Event()
+        release = threading.Event()
+        errors  = []
+
+        def failing_load():
+            started.set()
+            release.wait(5.0)
+            raise OSError("unreadable")
+
+        def first():
+            try:
+                cache.get("k", failing_load)
+            except OSError as err:
+                errors.append(err)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        started.wait(5.0)
+        results = []
+        waiter  = threading.Thread(target=lambda: results.append(cache.get("k", self._loader("v", 1))))
+        waiter.start()
+        release.set()
+        thread.join()
+        waiter.join()
+        assert len(errors) == 1 and results == ["v"]
+        assert cache.misses == 2
+
+    def test_memory_mapped_map_data_is_not_counted(self):
+        compiled, _ = _load_compiled_map("Colmac_CxV5_Single_Pass")
+        original    = _load_pkl_interpolator("Colmac_CxV5_Single_Pass")
+        assert _interpolator_nbytes(compiled) == 0
+        assert _interpolator_nbytes(original) > 0
+
+    def test_clear_resets_entries_and_counters(self):
+        cache = PerformanceMapCache(max_bytes=100)
+        cache.get("a", self._loader("A", 10))
+        cache.clear()
+        assert cache.stats()["entries"] == 0 and cache.misses == 0 and cache.nbytes == 0
+
+
+class TestPerformanceMapFlyweight:
+    def test_instances_share_model_data(self):
+        PerformanceMap.map_cache.clear()
+        pm1 = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP", num_units=1)
+        pm2 = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP", num_units=3,
+                                             design_inlet_temp_f=40.0)
+        assert pm1._interp is pm2._interp
+        assert pm1._inTs_outTs is pm2._inTs_outTs
+        assert PerformanceMap.map_cache.hits == 1 and PerformanceMap.map_cache.misses == 1
+        assert pm2.get_capacity_kbtuh(50.0, 150.0, 40.0) == pytest.approx(
+            3 * pm1.get_capacity_kbtuh(50.0, 150.0, 40.0)
+        )
+
+    def test_hpwhsim_instances_share_model_data(self):
+        pm1 = PerformanceMap.from_model_name("MODELS_SANCO2_43_R_SP")
+        pm2 = PerformanceMap.from_model_name("MODELS_SANCO2_43_R_SP", num_units=2)
+        assert isinstance(pm2, HPWHsimPerformanceMap)
+        assert pm1._perfmap is pm2._perfmap
+        assert pm2.num_units == 2
+
+    def test_unknown_model_is_not_cached(self):
+        with pytest.raises(ValueError):
+            PerformanceMap.from_model_name("NOT_A_MODEL")
+        assert "NOT_A_MODEL" not in PerformanceMap.map_cache
+
+
+# ---------------------------------------------------------------------------
+# HPWHsim compiled coefficient tables
+# ---------------------------------------------------------------------------
+
+class TestHPWHsimCompiledTables:
+    HPWHSIM_MODELS = sorted(name for name, entry in _load_maps_json().items() if "perfmap" in entry)
+
+    def test_bracketing_at_entry_boundaries(self):
+        perfmap = _load_maps_json()["MODELS_SANCO2_43_R_SP"]["perfmap"]
+        pm      = HPWHsimPerformanceMap("MODELS_SANCO2_43_R_SP", perfmap, 1, False, 100.0, 50.0)
+        t_f     = [e["T_F"] for e in perfmap]
+        # Exactly on an entry temperature: the bracket starting there is used,
+        # which evaluates to that entry's own curve.
+        for k in range(len(t_f) - 1):
+            cop = pm._quad(perfmap[k]["COP_coeffs"], 60.0)
+            pwr = pm._quad(perfmap[k]["inputPower_coeffs"], 60.0) / 1000.0
+            assert pm.get_capacity_kbtuh(t_f[k], 150.0, 60.0) == pytest.approx(cop * pwr * 3.41214, rel=1e-4)
+        # Below the first entry → ER fallback
+        assert pm.get_capacity_kbtuh(t_f[0] - 1.0, 150.0, 60.0) == pytest.approx(100.0)
+
+    @pytest.mark.parametrize("model", HPWHSIM_MODELS)
+    def test_batch_matches_scalar(self, model):
+        entry  = _load_maps_json()[model]
+        pm     = HPWHsimPerformanceMap(model, entry["perfmap"], 2, model.endswith("MP"), None, 50.0)
+        oats   = np.linspace(-25.0, 115.0, 29)
+        outs   = np.linspace(120.0, 170.0, 29)
+        inlets = np.linspace(40.0, 100.0, 29)
+        cap, pwr = pm.get_capacity_and_power_arrays(oats, outs, inlets)
+        for k in range(oats.size):
+            assert (cap[k], pwr[k]) == pytest.approx(
+                pm.get_capacity_and_power(oats[k], outs[k], inlets[k]), rel=1e-12
+            )
+
+
+# ---------------------------------------------------------------------------
+# Fallback snapping (_force_closest) and counters
+# ---------------------------------------------------------------------------
+
+class TestForceClosestSnapping:
+    """The bisect/searchsorted snapping must match the original linear scans."""
+
+    MODEL = "MODELS_ColmacCxV_5_C_SP"
+
+    @pytest.fixture(scope="class")
+    def pm(self):
+        return PerformanceMap.from_model_name(self.MODEL, nominal_capacity_kbtuh=100.0)
+
+    @staticmethod
+    def _scan_oat(pm, oat_f):
+        best, idx = abs(pm._unique_oats[0] - oat_f), 0
+        for i, u in enumerate(pm._unique_oats):
+            if abs(u - oat_f) < best:
+                best, idx = abs(u - oat_f), i
+        return idx
+
+    @staticmethod
+    def _scan_inlet(pm, oat_idx, inlet_t):
+        entries = pm._inTs_outTs[oat_idx]
+        best, closest = abs(entries[-1][0] - inlet_t), -1
+        for i, (t_in, _) in enumerate(entries):
+            if abs(t_in - inlet_t) < best and t_in >= inlet_t:
+                best, closest = abs(t_in - inlet_t), i
+        return closest
+
+    @staticmethod
+    def _scan_outlet(pm, oat_idx, inlet_idx, outlet_t):
+        outlets = pm._inTs_outTs[oat_idx][inlet_idx][1]
+        best, best_i = abs(pm._unique_oats[0] - outlet_t), 0
+        for i, o in enumerate(outlets):
+            if abs(o - outlet_t) < best:
+                best, best_i = abs(o - outlet_t), i
+        return outlets[best_i]
+
+    def test_snapping_matches_linear_scan(self, pm):
+        oats = list(pm._unique_oats) + list(np.linspace(pm.oat_min - 5.0, pm.oat_max + 5.0, 41))
+        for oat_f in oats:
+            oat_idx = pm._idx_nearest_oat(oat_f)
+            assert oat_idx == self._scan_oat(pm, oat_f)
+            inlets = [t for t, _ in pm._inTs_outTs[oat_idx]]
+            for inlet_t in inlets + list(np.linspace(inlets[0] - 10.0, inlets[-1] + 10.0, 9)):
+                inlet_idx = pm._idx_nearest_inlet(oat_idx, inlet_t)
+                assert inlet_idx == self._scan_inlet(pm, oat_idx, inlet_t)
+                for outlet_t in (100.0, 125.0, 140.0, 150.5, 160.0, 200.0):
+                    assert pm._nearest_outlet(oat_idx, inlet_idx, outlet_t) == \
+                        self._scan_outlet(pm, oat_idx, inlet_idx, outlet_t)
+
+    def test_batch_matches_scalar(self, pm):
+        rng    = np.random.default_rng(7)
+        oats   = rng.uniform(pm.oat_min, pm.oat_max, 200)
+        inlets = rng.uniform(20.0, 140.0, 200)
+        outs   = rng.uniform(100.0, 190.0, 200)
+        out_kw, inp_kw = pm._force_closest_array(inlets, outs, oats)
+        for k in range(200):
+            expected = pm._force_closest(inlets[k], outs[k], oats[k]) or (np.nan, np.nan)
+            np.testing.assert_allclose((out_kw[k], inp_kw[k]), expected, rtol=1e-12)
+
+    def test_fallback_counters(self):
+        pm = PerformanceMap.from_model_name(self.MODEL, nominal_capacity_kbtuh=100.0)
+        pm.get_capacity_and_power(pm.oat_min - 10.0, 150.0, 50.0)
+        pm.get_capacity_and_power(60.0, 150.0, 50.0)
+        pm.get_capacity_and_power(60.0, 150.0, 5.0)   # below map inlets → snapped
+        assert pm.fallback_counts["electric_resistance"] == 1
+        assert pm.fallback_counts["force_closest"] == 1
+
+        pm.get_capacity_and_power_arrays([pm.oat_min - 10.0, 60.0, 60.0], 150.0, [50.0, 50.0, 5.0])
+        assert pm.fallback_counts["electric_resistance"] == 2
+        assert pm.fallback_counts["force_closest"] == 2
+        assert pm.fallback_counts["last_resort"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Compiled-grid mode
+# ---------------------------------------------------------------------------
+
+class TestGridLookupTable:
+    @staticmethod
+    def _linear(pts):
+        return 2.0 * pts[:, 0] - pts[:, 1] + 0.5 * pts[:, 2], pts[:, 0] + pts[:, 1] + pts[:, 2]
+
+    def test_reproduces_linear_function(self):
+        table = GridLookupTable.sample(self._linear, (0.0, 10.0, -5.0), (4.0, 20.0, 5.0), (1.0, 3.0, 2.5))
+        pts   = np.array([[0.3, 11.1, -4.2], [4.0, 20.0, 5.0], [2.5, 15.0, 0.0]])
+        out, inp = table.lookup_array(pts)
+        ref_out, ref_inp = self._linear(pts)
+        np.testing.assert_allclose(out, ref_out)
+        np.testing.assert_allclose(inp, ref_inp)
+        for k, p in enumerate(pts):
+            assert table.lookup(tuple(p)) == pytest.approx((ref_out[k], ref_inp[k]))
+        assert table.max_error["output_max"] == pytest.approx(0.0, abs=1e-12)
+        assert table.hi == pytest.approx((4.0, 20.0, 5.0))
+
+    def test_nan_nodes_only_affect_touching_queries(self):
+        def func(pts):
+            out = np.where(pts[:, 0] > 1.5, np.nan, pts[:, 0])
+            return out, out
+
+        table = GridLookupTable.sample(func, (0.0, 0.0), (2.0, 1.0), (1.0, 1.0))
+        assert table.lookup((0.5, 0.5)) == pytest.approx((0.5, 0.5))
+        assert table.lookup((1.0, 0.5)) == pytest.approx((1.0, 1.0))   # on the face, NaN weight 0
+        assert np.isnan(table.lookup((1.5, 0.5))[0])
+        assert not table.contains((2.5, 0.5))
+
+    def test_rejects_non_positive_resolution(self):
+        with pytest.raises(ValueError):
+            GridLookupTable.sample(self._linear, (0.0,) * 3, (1.0,) * 3, (0.0, 1.0, 1.0))
+
+
+class TestPklGridMode:
+    MODEL = "MODELS_ColmacCxV_5_C_SP"
+
+    @pytest.fixture(scope="class")
+    def maps(self):
+        exact = PerformanceMap.from_model_name(self.MODEL, num_units=2, nominal_capacity_kbtuh=200.0)
+        grid  = PerformanceMap.from_model_name(self.MODEL, num_units=2, nominal_capacity_kbtuh=200.0)
+        grid.use_grid(5.0)
+        return exact, grid
+
+    def test_error_report(self, maps):
+        _, grid = maps
+        report  = grid.grid_max_error
+        assert set(report) == {"output_max", "input_max", "output_p99", "input_p99", "nan_mismatch"}
+        assert 0.0 <= report["output_p99"] <= report["output_max"]
+
+    def test_matches_exact_at_grid_nodes(self, maps):
+        exact, grid = maps
+        g = grid._grid
+        for node in [(3, 2, 4), (10, 5, 12), (0, 0, 0)]:
+            inlet, outlet, oat = (g.lo[k] + node[k] * g.step[k] for k in range(3))
+            assert grid.get_capacity_and_power(oat, outlet, inlet) == pytest.approx(
+                exact.get_capacity_and_power(oat, outlet, inlet)
+            )
+
+    def test_outside_grid_uses_exact_path(self, maps):
+        exact, grid = maps
+        for oat in (-20.0, grid.oat_max, grid.oat_max + 10.0):
+            assert grid.get_capacity_and_power(oat, 150.0, 50.0) == exact.get_capacity_and_power(oat, 150.0, 50.0)
+        assert grid.get_capacity_and_power(50.0, 150.0, 5.0) == exact.get_capacity_and_power(50.0, 150.0, 5.0)
+
+    def test_batch_matches_scalar(self, maps):
+        _, grid = maps
+        rng    = np.random.default_rng(3)
+        oats   = rng.uniform(-15.0, 110.0, 60)
+        outs   = rng.uniform(120.0, 180.0, 60)
+        inlets = rng.uniform(30.0, 130.0, 60)
+        cap, pwr = grid.get_capacity_and_power_arrays(oats, outs, inlets)
+        for k in range(60):
+            assert (cap[k], pwr[k]) == pytest.approx(grid.get_capacity_and_power(oats[k], outs[k], inlets[k]), rel=1e-12)
+
+    def test_grid_shared_between_instances_and_can_be_disabled(self, maps):
+        _, grid = maps
+        other   = PerformanceMap.from_model_name(self.MODEL)
+        other.use_grid(5.0)
+        assert other._grid is grid._grid
+        assert other.use_grid(None) == {}
+        assert other.grid_max_error is None
+
+    def test_two_input_resolution_and_report(self):
+        report = grid_error_report((5.0, 5.0), ["MODELS_ColmacCxV_5_C_MP"])
+        assert list(report) == ["MODELS_ColmacCxV_5_C_MP"]
+        pm = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_MP")
+        with pytest.raises(ValueError):
+            pm.use_grid((5.0, 5.0, 5.0))
+
+
+# ---------------------------------------------------------------------------
+# Fused capacity + power lookup
+# ---------------------------------------------------------------------------
+
+class TestCapacityAndPower:
+    @pytest.mark.parametrize("model", [
+        "MODELS_ColmacCxV_5_C_SP",
+        "MODELS_ColmacCxV_5_C_MP",
+        "MODELS_SANCO2_43_R_SP",
+        "MODELS_AOSmithHPTS50_R_MP",
+    ])
+    @pytest.mark.parametrize("oat_f", [-10.0, 47.0, 150.0])
+    def test_matches_separate_queries(self, model, oat_f):
+        pm = PerformanceMap.from_model_name(model, num_units=2, nominal_capacity_kbtuh=51.56)
+        cap, pwr = pm.get_capacity_and_power(oat_f, 150.0, 50.0)
+        assert cap == pytest.approx(pm.get_capacity_kbtuh(oat_f, 150.0, 50.0))
+        assert pwr == pytest.approx(pm.get_power_in_kw(oat_f, 150.0, 50.0))
+
+    def test_nominal_power_is_none(self):
+        assert NominalPerformanceMap(407.2).get_capacity_and_power(47.0, 150.0) == (407.2, None)
+
+
+# ---------------------------------------------------------------------------
+# Batch (array) queries — must match the scalar API point-by-point
+# ---------------------------------------------------------------------------
+
+def _scalar_reference(pm, oats, outlets, inlets):
+    cap = [pm.get_capacity_kbtuh(o, u, i) for o, u, i in zip(oats, outlets, inlets)]
+    pwr = [pm.get_power_in_kw(o, u, i) for o, u, i in zip(oats, outlets, inlets)]
+    return np.array(cap), np.array(pwr)
+
+
+class TestBatchQueries:
+    # Covers normal interpolation, high-OAT defaults, ER fallback (OAT < min)
+    # and both _force_closest snapping stages (outlet outside the map).
+    OATS    = np.array([47.0,  150.0, -10.0, 47.0,  47.0,  20.0,  90.0,  67.5])
+    OUTLETS = np.array([150.0, 150.0, 150.0, 190.0, 110.0, 180.0, 200.0, 140.0])
+    INLETS  = np.array([50.0,  50.0,  50.0,  50.0,  50.0,  80.0,  120.0, 60.0])
+
+    @pytest.mark.parametrize("model", [
+        "MODELS_ColmacCxV_5_C_SP",
+        "MODELS_ColmacCxV_5_C_MP",
+        "MODELS_SANCO2_43_R_SP",
+        "MODELS_AOSmithHPTS50_R_MP",
+    ])
+    def test_matches_scalar(self, model):
+        pm = PerformanceMap.from_model_name(model, num_units=2, nominal_capacity_kbtuh=51.56)
+        cap, pwr         = pm.get_capacity_and_power_arrays(self.OATS, self.OUTLETS, self.INLETS)
+        ref_cap, ref_pwr = _scalar_reference(pm, self.OATS, self.OUTLETS, self.INLETS)
+        assert cap == pytest.approx(ref_cap, rel=1e-12)
+        assert pwr == pytest.approx(ref_pwr, rel=1e-12)
+
+    def test_default_inlet_matches_scalar(self):
+        pm  = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP", design_inlet_temp_f=55.0)
+        cap = pm.get_capacity_kbtuh_array(self.OATS, self.OUTLETS)
+        ref = [pm.get_capacity_kbtuh(o, u) for o, u in zip(self.OATS, self.OUTLETS)]
+        assert cap == pytest.approx(ref, rel=1e-12)
+
+    def test_scalar_inputs_broadcast(self):
+        pm  = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP")
+        oat = np.linspace(0.0, 100.0, 12).reshape(3, 4)
+        pwr = pm.get_power_in_kw_array(oat, 150.0, 50.0)
+        assert pwr.shape == (3, 4)
+        assert pwr[1, 2] == pytest.approx(pm.get_power_in_kw(oat[1, 2], 150.0, 50.0))
+
+    def test_nominal_map_constant_capacity_no_power(self):
+        cap, pwr = NominalPerformanceMap(407.2).get_capacity_and_power_arrays(self.OATS, self.OUTLETS)
+        assert cap == pytest.approx(np.full(len(self.OATS), 407.2))
+        assert pwr is None
+
+    def test_none_oat_raises(self):
+        pm = PerformanceMap.from_model_name("MODELS_ColmacCxV_5_C_SP")
+        with pytest.raises(ValueError, match="oat_f is required"):
+            pm.get_capacity_and_power_arrays(None, 150.0)
+
+
+# ---------------------------------------------------------------------------
+# Catalog-wide capacity table
+# ---------------------------------------------------------------------------
+
+class TestCapacityTable:
+    MODELS  = ["MODELS_ColmacCxV_5_C_SP", "MODELS_ColmacCxV_5_C_MP", "MODELS_SANCO2_43_R_SP", "MODELS_AOSmithHPTS50_R_MP"]
+    OATS    = [5.0, 35.0, 67.0, 95.0]
+    INLETS  = [40.0, 50.0, 70.0]
+    OUTLETS = [120.0, 150.0]
+
+    @pytest.fixture(scope="class")
+    def table(self):
+        return CapacityTable.build(self.MODELS, self.OATS, self.INLETS, self.OUTLETS, max_workers=1)
+
+    def test_shape_and_dtype(self, table):
+        assert table.capacity_kbtuh.shape == (4, 4, 3, 2)
+        assert table.capacity_kbtuh.dtype == np.float32
+        assert len(table) == 4 and "MODELS_SANCO2_43_R_SP" in table
+
+    @pytest.mark.parametrize("model", MODELS)
+    def test_matches_scalar_queries(self, table, model):
+        pm = PerformanceMap.from_model_name(model)
+        for oat in self.OATS:
+            for inlet in self.INLETS:
+                for outlet in self.OUTLETS:
+                    cap, pwr, cop = table.lookup(model, oat, inlet, outlet)
+                    ref_cap, ref_pwr = pm.get_capacity_and_power(oat, outlet, inlet)
+                    assert cap == pytest.approx(ref_cap, rel=1e-6)
+                    assert pwr == pytest.approx(ref_pwr, rel=1e-6)
+                    assert cop == pytest.approx(pm.get_cop(oat, outlet, inlet), rel=1e-5)
+
+    def test_cop_array_matches_lookup(self, table):
+        k = table.model_names.index("MODELS_ColmacCxV_5_C_SP")
+        assert table.cop[k, 1, 1, 1] == pytest.approx(table.lookup("MODELS_ColmacCxV_5_C_SP", 35.0, 50.0, 150.0)[2])
+
+    def test_parallel_build_matches_serial(self, table):
+        parallel = CapacityTable.build(self.MODELS, self.OATS, self.INLETS, self.OUTLETS, max_workers=2)
+        np.testing.assert_array_equal(parallel.capacity_kbtuh, table.capacity_kbtuh)
+        np.testing.assert_array_equal(parallel.power_in_kw, table.power_in_kw)
+
+    def test_save_and_load_round_trip(self, table, tmp_path):
+        path = str(tmp_path / "capacity_table.npz")
+        table.save(path)
+        loaded = CapacityTable.load(path)
+        assert loaded.model_names == table.model_names
+        np.testing.assert_array_equal(loaded.oat_f, table.oat_f)
+        np.testing.assert_array_equal(loaded.capacity_kbtuh, table.capacity_kbtuh)
+        np.testing.assert_array_equal(loaded.power_in_kw, table.power_in_kw)
+
+    def test_off_grid_and_unknown_model_raise(self, table):
+        with pytest.raises(ValueError, match="not on the table grid"):
+            table.lookup("MODELS_ColmacCxV_5_C_SP", 36.0, 50.0, 150.0)
+        with pytest.raises(ValueError, match="not in the capacity table"):
+            table.lookup("MODELS_unknown_C_SP", 35.0, 50.0, 150.0)
+
+    def test_unsorted_axis_raises(self):
+        with pytest.raises(ValueError, match="strictly ascending"):
+            CapacityTable.build(self.MODELS[:1], [35.0, 5.0], self.INLETS, self.OUTLETS, max_workers=1)
+
+    def test_interface_filter_matches_list_of_models(self):
+        table = get_hpwh_capacity_table(
+            model_filter={"multi_pass": True}, oat_f=[35.0], inlet_water_temp_f=[50.0],
+            outlet_water_temp_f=[150.0], max_workers=1,
+        )
+        assert table.model_names == [code for code, _ in get_list_of_models(multi_pass=True)]
+
+    def test_output_capacity_uses_table(self, table):
+        args = ("MODELS_ColmacCxV_5_C_SP", 35.0, 50.0, 150.0, 2)
+        from_table = get_hpwh_output_capacity(*args, capacity_table=table)
+        assert from_table == pytest.approx(get_hpwh_output_capacity(*args), rel=1e-6)
+        # Off-grid conditions fall back to the performance map
+        off_grid = ("MODELS_ColmacCxV_5_C_SP", 36.0, 50.0, 150.0, 2)
+        assert get_hpwh_output_capacity(*off_grid, capacity_table=table) == get_hpwh_output_capacity(*off_grid)